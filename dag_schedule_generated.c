@@ -3,112 +3,110 @@
 // ============================================================
 
 // 初始入度表（编译期静态）
-static const int32_t g_initial_indegrees[94] = {
-    0, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 2, 1, 2,
-    3, 1, 1, 1, 1, 1, 2, 1, 2, 3, 1, 1, 1, 1, 1, 2,
-    2, 1, 1, 1, 1, 1, 4, 1, 2, 1, 1, 1, 1, 2, 1, 2,
-    1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1,
-    1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1,
-    2, 1, 1, 1, 1, 1, 1, 1, 6, 1, 1, 1, 1, 2
+static const int32_t g_initial_indegrees[92] = {
+    0, 1, 1, 1, 1, 4, 1, 2, 2, 1, 1, 1, 1, 4, 1, 2,
+    1, 2, 3, 1, 1, 1, 1, 4, 1, 2, 1, 2, 3, 1, 1, 1,
+    1, 4, 1, 2, 2, 1, 1, 1, 4, 2, 1, 2, 2, 1, 2, 1,
+    1, 1, 1, 4, 4, 4, 4, 4, 1, 1, 1, 1, 4, 4, 4, 4,
+    4, 1, 2, 1, 2, 1, 1, 1, 1, 4, 1, 1, 1, 1, 4, 4,
+    4, 4, 4, 1, 2, 1, 2, 1, 1, 6, 1, 2
 };
 
 // 后继节点邻接表
-static const int32_t g_successors_0[] = { 1 };
-static const int32_t g_successors_1[] = { 2 };
-static const int32_t g_successors_2[] = { 3 };
-static const int32_t g_successors_3[] = { 4 };
-static const int32_t g_successors_4[] = { 5, 6, 7 };
-static const int32_t g_successors_5[] = { 6 };
+static const int32_t g_successors_0[] = { 1, 2, 3, 4 };
+static const int32_t g_successors_1[] = { 5 };
+static const int32_t g_successors_2[] = { 5 };
+static const int32_t g_successors_3[] = { 5 };
+static const int32_t g_successors_4[] = { 5 };
+static const int32_t g_successors_5[] = { 6, 7, 8 };
 static const int32_t g_successors_6[] = { 7 };
 static const int32_t g_successors_7[] = { 8 };
-static const int32_t g_successors_8[] = { 9 };
-static const int32_t g_successors_9[] = { 10 };
-static const int32_t g_successors_10[] = { 11 };
-static const int32_t g_successors_11[] = { 12, 13, 16 };
+static const int32_t g_successors_8[] = { 9, 10, 11, 12 };
+static const int32_t g_successors_9[] = { 13 };
+static const int32_t g_successors_10[] = { 13 };
+static const int32_t g_successors_11[] = { 13 };
 static const int32_t g_successors_12[] = { 13 };
-static const int32_t g_successors_13[] = { 14, 15, 16 };
+static const int32_t g_successors_13[] = { 14, 15, 18 };
 static const int32_t g_successors_14[] = { 15 };
-static const int32_t g_successors_15[] = { 16 };
+static const int32_t g_successors_15[] = { 16, 17, 18 };
 static const int32_t g_successors_16[] = { 17 };
-static const int32_t g_successors_17[] = { 18, 47 };
-static const int32_t g_successors_18[] = { 19 };
-static const int32_t g_successors_19[] = { 20 };
-static const int32_t g_successors_20[] = { 21, 22, 25 };
-static const int32_t g_successors_21[] = { 22 };
-static const int32_t g_successors_22[] = { 23, 24, 25 };
-static const int32_t g_successors_23[] = { 24 };
+static const int32_t g_successors_17[] = { 18 };
+static const int32_t g_successors_18[] = { 19, 20, 21, 22, 44 };
+static const int32_t g_successors_19[] = { 23 };
+static const int32_t g_successors_20[] = { 23 };
+static const int32_t g_successors_21[] = { 23 };
+static const int32_t g_successors_22[] = { 23 };
+static const int32_t g_successors_23[] = { 24, 25, 28 };
 static const int32_t g_successors_24[] = { 25 };
-static const int32_t g_successors_25[] = { 26 };
-static const int32_t g_successors_26[] = { 27, 40 };
+static const int32_t g_successors_25[] = { 26, 27, 28 };
+static const int32_t g_successors_26[] = { 27 };
 static const int32_t g_successors_27[] = { 28 };
-static const int32_t g_successors_28[] = { 29 };
-static const int32_t g_successors_29[] = { 30, 31, 32 };
-static const int32_t g_successors_30[] = { 31 };
-static const int32_t g_successors_31[] = { 32 };
+static const int32_t g_successors_28[] = { 29, 30, 31, 32, 41 };
+static const int32_t g_successors_29[] = { 33 };
+static const int32_t g_successors_30[] = { 33 };
+static const int32_t g_successors_31[] = { 33 };
 static const int32_t g_successors_32[] = { 33 };
-static const int32_t g_successors_33[] = { 34 };
-static const int32_t g_successors_34[] = { 35, 38 };
-static const int32_t g_successors_35[] = { 36, 38 };
-static const int32_t g_successors_36[] = { 37, 38 };
-static const int32_t g_successors_37[] = { 38 };
-static const int32_t g_successors_38[] = { 39 };
-static const int32_t g_successors_39[] = { 40, 75 };
-static const int32_t g_successors_40[] = { 41 };
-static const int32_t g_successors_41[] = { 42 };
-static const int32_t g_successors_42[] = { 43, 45 };
-static const int32_t g_successors_43[] = { 44 };
-static const int32_t g_successors_44[] = { 45 };
+static const int32_t g_successors_33[] = { 34, 35, 36 };
+static const int32_t g_successors_34[] = { 35 };
+static const int32_t g_successors_35[] = { 36 };
+static const int32_t g_successors_36[] = { 37, 40 };
+static const int32_t g_successors_37[] = { 38, 40 };
+static const int32_t g_successors_38[] = { 39, 40 };
+static const int32_t g_successors_39[] = { 40 };
+static const int32_t g_successors_40[] = { 41, 84 };
+static const int32_t g_successors_41[] = { 42, 43 };
+static const int32_t g_successors_42[] = { 43 };
+static const int32_t g_successors_43[] = { 44, 66 };
+static const int32_t g_successors_44[] = { 45, 46 };
 static const int32_t g_successors_45[] = { 46 };
-static const int32_t g_successors_46[] = { 47, 61 };
-static const int32_t g_successors_47[] = { 48 };
-static const int32_t g_successors_48[] = { 49 };
-static const int32_t g_successors_49[] = { 50, 52 };
-static const int32_t g_successors_50[] = { 51 };
-static const int32_t g_successors_51[] = { 52 };
-static const int32_t g_successors_52[] = { 53 };
-static const int32_t g_successors_53[] = { 54, 57, 60 };
+static const int32_t g_successors_46[] = { 47, 48, 49, 50, 56, 57, 58, 59, 65 };
+static const int32_t g_successors_47[] = { 51, 52, 53, 54 };
+static const int32_t g_successors_48[] = { 51, 52, 53, 54 };
+static const int32_t g_successors_49[] = { 51, 52, 53, 54 };
+static const int32_t g_successors_50[] = { 51, 52, 53, 54 };
+static const int32_t g_successors_51[] = { 55 };
+static const int32_t g_successors_52[] = { 55 };
+static const int32_t g_successors_53[] = { 55 };
 static const int32_t g_successors_54[] = { 55 };
-static const int32_t g_successors_55[] = { 56 };
-static const int32_t g_successors_56[] = { 88 };
-static const int32_t g_successors_57[] = { 58 };
-static const int32_t g_successors_58[] = { 59 };
-static const int32_t g_successors_59[] = { 88 };
-static const int32_t g_successors_60[] = { 61 };
-static const int32_t g_successors_61[] = { 62 };
-static const int32_t g_successors_62[] = { 63 };
-static const int32_t g_successors_63[] = { 64, 66 };
-static const int32_t g_successors_64[] = { 65 };
+static const int32_t g_successors_55[] = { 89 };
+static const int32_t g_successors_56[] = { 60, 61, 62, 63 };
+static const int32_t g_successors_57[] = { 60, 61, 62, 63 };
+static const int32_t g_successors_58[] = { 60, 61, 62, 63 };
+static const int32_t g_successors_59[] = { 60, 61, 62, 63 };
+static const int32_t g_successors_60[] = { 64 };
+static const int32_t g_successors_61[] = { 64 };
+static const int32_t g_successors_62[] = { 64 };
+static const int32_t g_successors_63[] = { 64 };
+static const int32_t g_successors_64[] = { 89 };
 static const int32_t g_successors_65[] = { 66 };
-static const int32_t g_successors_66[] = { 67 };
-static const int32_t g_successors_67[] = { 68, 71, 74 };
-static const int32_t g_successors_68[] = { 69 };
-static const int32_t g_successors_69[] = { 70 };
-static const int32_t g_successors_70[] = { 88 };
-static const int32_t g_successors_71[] = { 72 };
+static const int32_t g_successors_66[] = { 67, 68 };
+static const int32_t g_successors_67[] = { 68 };
+static const int32_t g_successors_68[] = { 69, 70, 71, 72, 74, 75, 76, 77, 83 };
+static const int32_t g_successors_69[] = { 73 };
+static const int32_t g_successors_70[] = { 73 };
+static const int32_t g_successors_71[] = { 73 };
 static const int32_t g_successors_72[] = { 73 };
-static const int32_t g_successors_73[] = { 88 };
-static const int32_t g_successors_74[] = { 75 };
-static const int32_t g_successors_75[] = { 76 };
-static const int32_t g_successors_76[] = { 77 };
-static const int32_t g_successors_77[] = { 78, 80 };
-static const int32_t g_successors_78[] = { 79 };
-static const int32_t g_successors_79[] = { 80 };
-static const int32_t g_successors_80[] = { 81 };
-static const int32_t g_successors_81[] = { 82, 85 };
-static const int32_t g_successors_82[] = { 83 };
+static const int32_t g_successors_73[] = { 89 };
+static const int32_t g_successors_74[] = { 78, 79, 80, 81 };
+static const int32_t g_successors_75[] = { 78, 79, 80, 81 };
+static const int32_t g_successors_76[] = { 78, 79, 80, 81 };
+static const int32_t g_successors_77[] = { 78, 79, 80, 81 };
+static const int32_t g_successors_78[] = { 82 };
+static const int32_t g_successors_79[] = { 82 };
+static const int32_t g_successors_80[] = { 82 };
+static const int32_t g_successors_81[] = { 82 };
+static const int32_t g_successors_82[] = { 89 };
 static const int32_t g_successors_83[] = { 84 };
-static const int32_t g_successors_84[] = { 88 };
+static const int32_t g_successors_84[] = { 85, 86 };
 static const int32_t g_successors_85[] = { 86 };
-static const int32_t g_successors_86[] = { 87 };
-static const int32_t g_successors_87[] = { 88 };
-static const int32_t g_successors_88[] = { 89, 93 };
-static const int32_t g_successors_89[] = { 90 };
+static const int32_t g_successors_86[] = { 87, 88 };
+static const int32_t g_successors_87[] = { 89 };
+static const int32_t g_successors_88[] = { 89 };
+static const int32_t g_successors_89[] = { 90, 91 };
 static const int32_t g_successors_90[] = { 91 };
-static const int32_t g_successors_91[] = { 92 };
-static const int32_t g_successors_92[] = { 93 };
-static const int32_t g_successors_93[] = { -1 };  // 无后继（哨兵值）
+static const int32_t g_successors_91[] = { -1 };  // 无后继（哨兵值）
 
-static const int32_t* g_successors[94] = {
+static const int32_t* g_successors[92] = {
     g_successors_0,
     g_successors_1,
     g_successors_2,
@@ -201,16 +199,30 @@ static const int32_t* g_successors[94] = {
     g_successors_89,
     g_successors_90,
     g_successors_91,
-    g_successors_92,
-    g_successors_93,
 };
 
 // 后继节点数量
-static const int32_t g_successor_counts[94] = {
-    1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1,
-    1, 2, 1, 1, 3, 1, 3, 1, 1, 1, 2, 1, 1, 3, 1, 1,
-    1, 1, 2, 2, 2, 1, 1, 2, 1, 1, 2, 1, 1, 1, 2, 1,
-    1, 2, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2,
-    1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1,
-    1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 0
+static const int32_t g_successor_counts[92] = {
+    4, 1, 1, 1, 1, 3, 1, 1, 4, 1, 1, 1, 1, 3, 1, 3,
+    1, 1, 5, 1, 1, 1, 1, 3, 1, 3, 1, 1, 5, 1, 1, 1,
+    1, 3, 1, 1, 2, 2, 2, 1, 2, 2, 1, 2, 2, 1, 9, 4,
+    4, 4, 4, 1, 1, 1, 1, 1, 4, 4, 4, 4, 1, 1, 1, 1,
+    1, 1, 2, 1, 9, 1, 1, 1, 1, 1, 4, 4, 4, 4, 1, 1,
+    1, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 0
 };
+
+// 离线静态调度（HEFT）：每个 Worker 按序执行，估计 makespan 14075283462
+#define TVMRT_STATIC_WORKERS 4
+static const int32_t g_static_seq_0[] = { 0, 1, 5, 6, 7, 8, 9, 13, 14, 15, 16, 17, 18, 19, 23, 24, 25, 26, 27, 28, 29, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 65, 66, 67, 68, 83, 84, 85, 86, 88, 89, 90, 91 };
+static const int32_t g_static_seq_1[] = { 2, 10, 20, 30, 56, 59, 60, 63, 51, 54, 64, 87 };
+static const int32_t g_static_seq_2[] = { 3, 11, 21, 31, 57, 47, 49, 61, 69, 71, 52, 74, 76, 73, 81, 82 };
+static const int32_t g_static_seq_3[] = { 4, 12, 22, 32, 58, 48, 50, 62, 70, 72, 53, 75, 77, 78, 79, 80, 55 };
+
+static const int32_t* g_static_seqs[TVMRT_STATIC_WORKERS] = {
+    g_static_seq_0,
+    g_static_seq_1,
+    g_static_seq_2,
+    g_static_seq_3,
+};
+
+static const int32_t g_static_seq_lens[TVMRT_STATIC_WORKERS] = { 47, 12, 16, 17 };
@@ -1,957 +1,773 @@
 // ============================================================
-// SchedulableEntity 实体初始化
+// SchedulableEntity 实体模板与参数绑定
 // ============================================================
 
-// workspace 偏移量变量
-void* sid_1_let = (&(global_workspace_1_var[18078800]));
-void* sid_2_let = (&(global_workspace_1_var[6594624]));
-void* sid_3_let = (&(global_workspace_1_var[6594624]));
-void* sid_4_let = (&(global_workspace_1_var[9871424]));
-void* sid_5_let = (&(global_workspace_1_var[14786624]));
-void* sid_6_let = (&(global_workspace_1_var[13148224]));
-void* sid_7_let = (&(global_workspace_1_var[16425024]));
-void* sid_8_let = (&(global_workspace_1_var[16425024]));
-void* sid_9_let = (&(global_workspace_1_var[0]));
-void* sid_10_let = (&(global_workspace_1_var[4915200]));
-void* sid_11_let = (&(global_workspace_1_var[3317888]));
-void* sid_12_let = (&(global_workspace_1_var[4956288]));
-void* sid_13_let = (&(global_workspace_1_var[7413888]));
-void* sid_14_let = (&(global_workspace_1_var[6594688]));
-void* sid_15_let = (&(global_workspace_1_var[8233088]));
-void* sid_16_let = (&(global_workspace_1_var[8233088]));
-void* sid_17_let = (&(global_workspace_1_var[9052288]));
-void* sid_18_let = (&(global_workspace_1_var[9052288]));
-void* sid_19_let = (&(global_workspace_1_var[0]));
-void* sid_20_let = (&(global_workspace_1_var[13107200]));
-void* sid_21_let = (&(global_workspace_1_var[14745600]));
-void* sid_22_let = (&(global_workspace_1_var[15564800]));
-void* sid_23_let = (&(global_workspace_1_var[16793600]));
-void* sid_24_let = (&(global_workspace_1_var[16384000]));
-void* sid_25_let = (&(global_workspace_1_var[17203200]));
-void* sid_26_let = (&(global_workspace_1_var[17203200]));
-void* sid_27_let = (&(global_workspace_1_var[17612800]));
-void* sid_28_let = (&(global_workspace_1_var[17612800]));
-void* sid_29_let = (&(global_workspace_1_var[14745600]));
-void* sid_30_let = (&(global_workspace_1_var[16384000]));
-void* sid_31_let = (&(global_workspace_1_var[17612800]));
-void* sid_32_let = (&(global_workspace_1_var[17203200]));
-void* sid_33_let = (&(global_workspace_1_var[18022400]));
-void* sid_34_let = (&(global_workspace_1_var[17817600]));
-void* sid_35_let = (&(global_workspace_1_var[18227200]));
-void* sid_36_let = (&(global_workspace_1_var[18227200]));
-void* sid_37_let = (&(global_workspace_1_var[17203200]));
-void* sid_38_let = (&(global_workspace_1_var[17817600]));
-void* sid_39_let = (&(global_workspace_1_var[18227200]));
-void* sid_40_let = (&(global_workspace_1_var[18841600]));
-void* sid_41_let = (&(global_workspace_1_var[18636800]));
-void* sid_42_let = (&(global_workspace_1_var[18432000]));
-void* sid_43_let = (&(global_workspace_1_var[17203200]));
-void* sid_44_let = (&(global_workspace_1_var[19660800]));
-void* sid_45_let = (&(global_workspace_1_var[0]));
-void* sid_46_let = (&(global_workspace_1_var[14745600]));
-void* sid_47_let = (&(global_workspace_1_var[20480000]));
-void* sid_48_let = (&(global_workspace_1_var[20070400]));
-void* sid_49_let = (&(global_workspace_1_var[20889600]));
-void* sid_50_let = (&(global_workspace_1_var[20889600]));
-void* sid_51_let = (&(global_workspace_1_var[14745600]));
-void* sid_52_let = (&(global_workspace_1_var[16384000]));
-void* sid_53_let = (&(global_workspace_1_var[0]));
-void* sid_54_let = (&(global_workspace_1_var[4915200]));
-void* sid_55_let = (&(global_workspace_1_var[18022400]));
-void* sid_56_let = (&(global_workspace_1_var[17203200]));
-void* sid_57_let = (&(global_workspace_1_var[18841600]));
-void* sid_58_let = (&(global_workspace_1_var[18841600]));
-void* sid_59_let = (&(global_workspace_1_var[0]));
-void* sid_60_let = (&(global_workspace_1_var[10572800]));
-void* sid_61_let = (&(global_workspace_1_var[12211200]));
-void* sid_62_let = (&(global_workspace_1_var[12211200]));
-void* sid_63_let = (&(global_workspace_1_var[8934400]));
-void* sid_64_let = (&(global_workspace_1_var[2151680]));
-void* sid_65_let = (&(global_workspace_1_var[6886400]));
-void* sid_66_let = (&(global_workspace_1_var[4838400]));
-void* sid_67_let = (&(global_workspace_1_var[20070400]));
-void* sid_68_let = (&(global_workspace_1_var[10572800]));
-void* sid_69_let = (&(global_workspace_1_var[11801600]));
-void* sid_70_let = (&(global_workspace_1_var[20480000]));
-void* sid_71_let = (&(global_workspace_1_var[20070400]));
-void* sid_72_let = (&(global_workspace_1_var[20889600]));
-void* sid_73_let = (&(global_workspace_1_var[20889600]));
-void* sid_74_let = (&(global_workspace_1_var[10572800]));
-void* sid_75_let = (&(global_workspace_1_var[11801600]));
-void* sid_76_let = (&(global_workspace_1_var[20070400]));
-void* sid_77_let = (&(global_workspace_1_var[20480000]));
-void* sid_78_let = (&(global_workspace_1_var[20070400]));
-void* sid_79_let = (&(global_workspace_1_var[13185280]));
-void* sid_80_let = (&(global_workspace_1_var[13185280]));
-void* sid_81_let = (&(global_workspace_1_var[12620800]));
-void* sid_82_let = (&(global_workspace_1_var[20480000]));
-void* sid_83_let = (&(global_workspace_1_var[10572800]));
-void* sid_84_let = (&(global_workspace_1_var[20480000]));
-void* sid_85_let = (&(global_workspace_1_var[21094400]));
-void* sid_86_let = (&(global_workspace_1_var[20889600]));
-void* sid_87_let = (&(global_workspace_1_var[21299200]));
-void* sid_88_let = (&(global_workspace_1_var[21299200]));
-void* sid_89_let = (&(global_workspace_1_var[10572800]));
-void* sid_90_let = (&(global_workspace_1_var[20480000]));
-void* sid_91_let = (&(global_workspace_1_var[21013504]));
-void* sid_92_let = (&(global_workspace_1_var[21013504]));
-void* sid_93_let = (&(global_workspace_1_var[20889600]));
-void* sid_94_let = (&(global_workspace_1_var[20634880]));
-void* sid_95_let = (&(global_workspace_1_var[20634880]));
-void* sid_96_let = (&(global_workspace_1_var[20480000]));
-void* sid_97_let = (&(global_workspace_1_var[9676800]));
-void* sid_98_let = (&(global_workspace_1_var[4838400]));
-void* sid_99_let = (&(global_workspace_1_var[7526400]));
-void* sid_100_let = (&(global_workspace_1_var[9676800]));
-void* sid_101_let = (&(global_workspace_1_var[11827200]));
-void* sid_102_let = (&(global_workspace_1_var[13977600]));
+// 参数位置：>= 0 为 workspace 字节偏移，负值为模型输入/输出
+#define TVMRT_BIND_INPUT (-1LL)
+#define TVMRT_BIND_OUTPUT (-2LL)
 
-// 可调度实体数组
-SchedulableEntity g_entities[OP_COUNT] = {
-    { // [0] tvmgen_default_fused_layout_transform
-        .kernel = wrapped_tvmgen_default_fused_layout_transform,
-        .inputs = { images_buffer_var },
-        .outputs = { sid_1_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+typedef struct {
+    int64_t inputs[MAX_INPUTS];
+    int64_t outputs[MAX_OUTPUTS];
+} EntityBinding;
+
+static const EntityBinding g_entity_bindings[OP_COUNT] = {
+    { .inputs = { TVMRT_BIND_INPUT, 6553600LL }, .outputs = { 6553600LL, 0LL } }, // [0] images_buffer_var, sid_1_let -> sid_1_let, sid_2_let
+    { .inputs = { 0LL }, .outputs = { 6553600LL } }, // [1] sid_2_let -> sid_3_let
+    { .inputs = { 0LL }, .outputs = { 6553600LL } }, // [2] sid_2_let -> sid_3_let
+    { .inputs = { 0LL }, .outputs = { 6553600LL } }, // [3] sid_2_let -> sid_3_let
+    { .inputs = { 0LL }, .outputs = { 6553600LL } }, // [4] sid_2_let -> sid_3_let
+    { .inputs = { 6553600LL, 0LL }, .outputs = { 0LL, 6556224LL, 4915200LL } }, // [5] sid_3_let, sid_4_let -> sid_4_let, sid_5_let, sid_6_let
+    { .inputs = { 4915200LL }, .outputs = { 0LL } }, // [6] sid_6_let -> sid_7_let
+    { .inputs = { 0LL, 4915200LL }, .outputs = { 8194624LL } }, // [7] sid_7_let, sid_6_let -> sid_8_let
+    { .inputs = { 6556224LL, 4915200LL, 4915200LL, 8194624LL, 0LL }, .outputs = { 0LL, 4915200LL } }, // [8] sid_5_let, sid_6_let, sid_6_let, sid_8_let, sid_9_let -> sid_9_let, sid_10_let
+    { .inputs = { 4915200LL }, .outputs = { 0LL } }, // [9] sid_10_let -> sid_11_let
+    { .inputs = { 4915200LL }, .outputs = { 0LL } }, // [10] sid_10_let -> sid_11_let
+    { .inputs = { 4915200LL }, .outputs = { 0LL } }, // [11] sid_10_let -> sid_11_let
+    { .inputs = { 4915200LL }, .outputs = { 0LL } }, // [12] sid_10_let -> sid_11_let
+    { .inputs = { 0LL, 1638400LL }, .outputs = { 1638400LL, 4917888LL, 3276800LL } }, // [13] sid_11_let, sid_12_let -> sid_12_let, sid_13_let, sid_14_let
+    { .inputs = { 3276800LL }, .outputs = { 0LL } }, // [14] sid_14_let -> sid_15_let
+    { .inputs = { 0LL, 3276800LL }, .outputs = { 4097344LL } }, // [15] sid_15_let, sid_14_let -> sid_16_let
+    { .inputs = { 4097344LL }, .outputs = { 0LL } }, // [16] sid_16_let -> sid_17_let
+    { .inputs = { 0LL, 4097344LL }, .outputs = { 5737088LL } }, // [17] sid_17_let, sid_16_let -> sid_18_let
+    { .inputs = { 4917888LL, 3276800LL, 3276800LL, 4097344LL, 5737088LL, 0LL }, .outputs = { 0LL, 4915200LL } }, // [18] sid_13_let, sid_14_let, sid_14_let, sid_16_let, sid_18_let, sid_19_let -> sid_19_let, sid_20_let
+    { .inputs = { 4915200LL }, .outputs = { 0LL } }, // [19] sid_20_let -> sid_21_let
+    { .inputs = { 4915200LL }, .outputs = { 0LL } }, // [20] sid_20_let -> sid_21_let
+    { .inputs = { 4915200LL }, .outputs = { 0LL } }, // [21] sid_20_let -> sid_21_let
+    { .inputs = { 4915200LL }, .outputs = { 0LL } }, // [22] sid_20_let -> sid_21_let
+    { .inputs = { 0LL, 819200LL }, .outputs = { 819200LL, 2459008LL, 1638400LL } }, // [23] sid_21_let, sid_22_let -> sid_22_let, sid_23_let, sid_24_let
+    { .inputs = { 1638400LL }, .outputs = { 0LL } }, // [24] sid_24_let -> sid_25_let
+    { .inputs = { 0LL, 1638400LL }, .outputs = { 2048704LL } }, // [25] sid_25_let, sid_24_let -> sid_26_let
+    { .inputs = { 2048704LL }, .outputs = { 0LL } }, // [26] sid_26_let -> sid_27_let
+    { .inputs = { 0LL, 2048704LL }, .outputs = { 2868608LL } }, // [27] sid_27_let, sid_26_let -> sid_28_let
+    { .inputs = { 2459008LL, 1638400LL, 1638400LL, 2048704LL, 2868608LL, 0LL }, .outputs = { 0LL, 2457600LL } }, // [28] sid_23_let, sid_24_let, sid_24_let, sid_26_let, sid_28_let, sid_29_let -> sid_29_let, sid_30_let
+    { .inputs = { 2457600LL }, .outputs = { 3276800LL } }, // [29] sid_30_let -> sid_31_let
+    { .inputs = { 2457600LL }, .outputs = { 3276800LL } }, // [30] sid_30_let -> sid_31_let
+    { .inputs = { 2457600LL }, .outputs = { 3276800LL } }, // [31] sid_30_let -> sid_31_let
+    { .inputs = { 2457600LL }, .outputs = { 3276800LL } }, // [32] sid_30_let -> sid_31_let
+    { .inputs = { 3276800LL, 3686400LL }, .outputs = { 3686400LL, 4506368LL, 4096000LL } }, // [33] sid_31_let, sid_32_let -> sid_32_let, sid_33_let, sid_34_let
+    { .inputs = { 4096000LL }, .outputs = { 4301184LL } }, // [34] sid_34_let -> sid_35_let
+    { .inputs = { 4301184LL, 4096000LL }, .outputs = { 3891200LL } }, // [35] sid_35_let, sid_34_let -> sid_36_let
+    { .inputs = { 4506368LL, 4096000LL, 4096000LL, 3891200LL, 3276800LL, 3891200LL }, .outputs = { 3276800LL, 3891200LL, 4300800LL } }, // [36] sid_33_let, sid_34_let, sid_34_let, sid_36_let, sid_37_let, sid_38_let -> sid_37_let, sid_38_let, sid_39_let
+    { .inputs = { 4300800LL }, .outputs = { 4506304LL } }, // [37] sid_39_let -> sid_40_let
+    { .inputs = { 4506304LL }, .outputs = { 0LL } }, // [38] sid_40_let -> sid_41_let
+    { .inputs = { 0LL }, .outputs = { 4096000LL } }, // [39] sid_41_let -> sid_42_let
+    { .inputs = { 4300800LL, 4506304LL, 0LL, 4096000LL, 3276800LL }, .outputs = { 3276800LL, 14263296LL } }, // [40] sid_39_let, sid_40_let, sid_41_let, sid_42_let, sid_43_let -> sid_43_let, sid_44_let
+    { .inputs = { 14263296LL, 2457600LL, 0LL, 2457600LL }, .outputs = { 0LL, 2457600LL, 1639104LL, 1228800LL } }, // [41] sid_44_let, sid_30_let, sid_45_let, sid_46_let -> sid_45_let, sid_46_let, sid_47_let, sid_48_let
+    { .inputs = { 1228800LL, 0LL }, .outputs = { 0LL, 2048704LL } }, // [42] sid_48_let, sid_49_let -> sid_49_let, sid_50_let
+    { .inputs = { 1639104LL, 1228800LL, 1228800LL, 2048704LL, 0LL }, .outputs = { 0LL, 13033088LL } }, // [43] sid_47_let, sid_48_let, sid_48_let, sid_50_let, sid_51_let -> sid_51_let, sid_52_let
+    { .inputs = { 13033088LL, 4915200LL, 0LL, 4915200LL }, .outputs = { 0LL, 4915200LL, 3278144LL, 2457600LL } }, // [44] sid_52_let, sid_20_let, sid_53_let, sid_54_let -> sid_53_let, sid_54_let, sid_55_let, sid_56_let
+    { .inputs = { 2457600LL, 0LL }, .outputs = { 0LL, 4097344LL } }, // [45] sid_56_let, sid_57_let -> sid_57_let, sid_58_let
+    { .inputs = { 3278144LL, 2457600LL, 2457600LL, 4097344LL, 0LL }, .outputs = { 0LL, 6886400LL } }, // [46] sid_55_let, sid_56_let, sid_56_let, sid_58_let, sid_59_let -> sid_59_let, sid_60_let
+    { .inputs = { 6886400LL }, .outputs = { 8526144LL } }, // [47] sid_60_let -> sid_61_let
+    { .inputs = { 6886400LL }, .outputs = { 8526144LL } }, // [48] sid_60_let -> sid_61_let
+    { .inputs = { 6886400LL }, .outputs = { 8526144LL } }, // [49] sid_60_let -> sid_61_let
+    { .inputs = { 6886400LL }, .outputs = { 8526144LL } }, // [50] sid_60_let -> sid_61_let
+    { .inputs = { 8526144LL }, .outputs = { 10165888LL } }, // [51] sid_61_let -> sid_62_let
+    { .inputs = { 8526144LL }, .outputs = { 10165888LL } }, // [52] sid_61_let -> sid_62_let
+    { .inputs = { 8526144LL }, .outputs = { 10165888LL } }, // [53] sid_61_let -> sid_62_let
+    { .inputs = { 8526144LL }, .outputs = { 10165888LL } }, // [54] sid_61_let -> sid_62_let
+    { .inputs = { 10165888LL }, .outputs = { 8526144LL } }, // [55] sid_62_let -> sid_63_let
+    { .inputs = { 6886400LL }, .outputs = { 0LL } }, // [56] sid_60_let -> sid_64_let
+    { .inputs = { 6886400LL }, .outputs = { 0LL } }, // [57] sid_60_let -> sid_64_let
+    { .inputs = { 6886400LL }, .outputs = { 0LL } }, // [58] sid_60_let -> sid_64_let
+    { .inputs = { 6886400LL }, .outputs = { 0LL } }, // [59] sid_60_let -> sid_64_let
+    { .inputs = { 0LL }, .outputs = { 2049344LL } }, // [60] sid_64_let -> sid_65_let
+    { .inputs = { 0LL }, .outputs = { 2049344LL } }, // [61] sid_64_let -> sid_65_let
+    { .inputs = { 0LL }, .outputs = { 2049344LL } }, // [62] sid_64_let -> sid_65_let
+    { .inputs = { 0LL }, .outputs = { 2049344LL } }, // [63] sid_64_let -> sid_65_let
+    { .inputs = { 2049344LL }, .outputs = { 4838400LL } }, // [64] sid_65_let -> sid_66_let
+    { .inputs = { 6886400LL }, .outputs = { 13852288LL } }, // [65] sid_60_let -> sid_67_let
+    { .inputs = { 13852288LL, 13033088LL, 11804288LL, 13033088LL }, .outputs = { 11804288LL, 13033088LL, 13852288LL, 4097344LL } }, // [66] sid_67_let, sid_52_let, sid_68_let, sid_69_let -> sid_68_let, sid_69_let, sid_70_let, sid_71_let
+    { .inputs = { 4097344LL, 11804288LL }, .outputs = { 11804288LL, 13033088LL } }, // [67] sid_71_let, sid_72_let -> sid_72_let, sid_73_let
+    { .inputs = { 13852288LL, 4097344LL, 4097344LL, 13033088LL, 11804288LL }, .outputs = { 11804288LL, 13033088LL } }, // [68] sid_70_let, sid_71_let, sid_71_let, sid_73_let, sid_74_let -> sid_74_let, sid_75_let
+    { .inputs = { 13033088LL }, .outputs = { 13852992LL } }, // [69] sid_75_let -> sid_76_let
+    { .inputs = { 13033088LL }, .outputs = { 13852992LL } }, // [70] sid_75_let -> sid_76_let
+    { .inputs = { 13033088LL }, .outputs = { 13852992LL } }, // [71] sid_75_let -> sid_76_let
+    { .inputs = { 13033088LL }, .outputs = { 13852992LL } }, // [72] sid_75_let -> sid_76_let
+    { .inputs = { 13852992LL, 14673280LL }, .outputs = { 14673280LL, 13852992LL } }, // [73] sid_76_let, sid_77_let -> sid_77_let, sid_78_let
+    { .inputs = { 13033088LL }, .outputs = { 11804288LL } }, // [74] sid_75_let -> sid_79_let
+    { .inputs = { 13033088LL }, .outputs = { 11804288LL } }, // [75] sid_75_let -> sid_79_let
+    { .inputs = { 13033088LL }, .outputs = { 11804288LL } }, // [76] sid_75_let -> sid_79_let
+    { .inputs = { 13033088LL }, .outputs = { 11804288LL } }, // [77] sid_75_let -> sid_79_let
+    { .inputs = { 11804288LL }, .outputs = { 12316992LL } }, // [78] sid_79_let -> sid_80_let
+    { .inputs = { 11804288LL }, .outputs = { 12316992LL } }, // [79] sid_79_let -> sid_80_let
+    { .inputs = { 11804288LL }, .outputs = { 12316992LL } }, // [80] sid_79_let -> sid_80_let
+    { .inputs = { 11804288LL }, .outputs = { 12316992LL } }, // [81] sid_79_let -> sid_80_let
+    { .inputs = { 12316992LL }, .outputs = { 11804288LL } }, // [82] sid_80_let -> sid_81_let
+    { .inputs = { 13033088LL }, .outputs = { 15082880LL } }, // [83] sid_75_let -> sid_82_let
+    { .inputs = { 15082880LL, 14263296LL, 4097344LL, 14263296LL }, .outputs = { 4097344LL, 14263296LL, 15288064LL, 15082880LL } }, // [84] sid_82_let, sid_44_let, sid_83_let, sid_84_let -> sid_83_let, sid_84_let, sid_85_let, sid_86_let
+    { .inputs = { 15082880LL, 14263296LL }, .outputs = { 14263296LL, 14468480LL } }, // [85] sid_86_let, sid_87_let -> sid_87_let, sid_88_let
+    { .inputs = { 15288064LL, 15082880LL, 15082880LL, 14468480LL, 4097344LL }, .outputs = { 4097344LL, 14263296LL } }, // [86] sid_85_let, sid_86_let, sid_86_let, sid_88_let, sid_89_let -> sid_89_let, sid_90_let
+    { .inputs = { 14263296LL, 4225344LL, 4328128LL }, .outputs = { 4225344LL, 4328128LL, 15082880LL } }, // [87] sid_90_let, sid_91_let, sid_92_let -> sid_91_let, sid_92_let, sid_93_let
+    { .inputs = { 14263296LL, 12828992LL, 4097344LL }, .outputs = { 12828992LL, 4097344LL, 12828992LL } }, // [88] sid_90_let, sid_94_let, sid_95_let -> sid_94_let, sid_95_let, sid_96_let
+    { .inputs = { 8526144LL, 4838400LL, 13852992LL, 11804288LL, 15082880LL, 12828992LL }, .outputs = { 2688000LL, 0LL } }, // [89] sid_63_let, sid_66_let, sid_78_let, sid_81_let, sid_93_let, sid_96_let -> sid_97_let, sid_98_let
+    { .inputs = { 2688000LL, 0LL, 4838400LL, 2688000LL, 4838400LL }, .outputs = { 4838400LL, 2688000LL, 4838400LL, 2688000LL } }, // [90] sid_97_let, sid_98_let, sid_99_let, sid_100_let, sid_101_let -> sid_99_let, sid_100_let, sid_101_let, sid_102_let
+    { .inputs = { 2688000LL, 2688000LL, 0LL }, .outputs = { TVMRT_BIND_OUTPUT } }, // [91] sid_102_let, sid_97_let, sid_98_let -> output_buffer_var
+};
+
+// 可调度实体模板
+static const SchedulableEntity g_entity_templates[OP_COUNT] = {
+    { // [0] 线性链: tvmgen_default_fused_layout_transform -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply
+        .kernel = wrapped_chain_0,
+        .input_count = 2,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 91 },
         .id = 0
     },
-    { // [1] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply,
-        .inputs = { sid_1_let },
-        .outputs = { sid_2_let },
+    { // [1] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1 分块 0: [0, 320)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tile0,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 90 },
         .id = 1
     },
-    { // [2] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1,
-        .inputs = { sid_2_let },
-        .outputs = { sid_3_let },
+    { // [2] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1 分块 1: [320, 640)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tile1,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 89 },
         .id = 2
     },
-    { // [3] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_2
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_2,
-        .inputs = { sid_3_let },
-        .outputs = { sid_4_let },
+    { // [3] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1 分块 2: [640, 960)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tile2,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 88 },
         .id = 3
     },
-    { // [4] tvmgen_default_fused_split
-        .kernel = wrapped_tvmgen_default_fused_split,
-        .inputs = { sid_4_let },
-        .outputs = { sid_5_let, sid_6_let },
+    { // [4] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1 分块 3: [960, 1280)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tile3,
         .input_count = 1,
-        .output_count = 2,
-        .config = { .device_type = 0, .priority = 0 },
+        .output_count = 1,
+        .config = { .device_type = 0, .priority = 87 },
         .id = 4
     },
-    { // [5] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_3
+    { // [5] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_2 -> tvmgen_default_fused_split
+        .kernel = wrapped_chain_5,
+        .input_count = 2,
+        .output_count = 3,
+        .config = { .device_type = 0, .priority = 86 },
+        .id = 5
+    },
+    { // [6] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_3
         .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_3,
-        .inputs = { sid_6_let },
-        .outputs = { sid_7_let },
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
-        .id = 5
+        .config = { .device_type = 0, .priority = 85 },
+        .id = 6
     },
-    { // [6] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add
+    { // [7] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add
         .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add,
-        .inputs = { sid_7_let, sid_6_let },
-        .outputs = { sid_8_let },
         .input_count = 2,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
-        .id = 6
-    },
-    { // [7] tvmgen_default_fused_concatenate
-        .kernel = wrapped_tvmgen_default_fused_concatenate,
-        .inputs = { sid_5_let, sid_6_let, sid_6_let, sid_8_let },
-        .outputs = { sid_9_let },
-        .input_count = 4,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 84 },
         .id = 7
     },
-    { // [8] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_4
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_4,
-        .inputs = { sid_9_let },
-        .outputs = { sid_10_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [8] 线性链: tvmgen_default_fused_concatenate -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_4
+        .kernel = wrapped_chain_8,
+        .input_count = 5,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 83 },
         .id = 8
     },
-    { // [9] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5,
-        .inputs = { sid_10_let },
-        .outputs = { sid_11_let },
+    { // [9] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5 分块 0: [0, 320)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tile0,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 82 },
         .id = 9
     },
-    { // [10] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_6
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_6,
-        .inputs = { sid_11_let },
-        .outputs = { sid_12_let },
+    { // [10] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5 分块 1: [320, 640)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tile1,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 81 },
         .id = 10
     },
-    { // [11] tvmgen_default_fused_split_1
-        .kernel = wrapped_tvmgen_default_fused_split_1,
-        .inputs = { sid_12_let },
-        .outputs = { sid_13_let, sid_14_let },
+    { // [11] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5 分块 2: [640, 960)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tile2,
         .input_count = 1,
-        .output_count = 2,
-        .config = { .device_type = 0, .priority = 0 },
+        .output_count = 1,
+        .config = { .device_type = 0, .priority = 80 },
         .id = 11
     },
-    { // [12] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_7
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_7,
-        .inputs = { sid_14_let },
-        .outputs = { sid_15_let },
+    { // [12] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5 分块 3: [960, 1280)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tile3,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 79 },
         .id = 12
     },
-    { // [13] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_1
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_1,
-        .inputs = { sid_15_let, sid_14_let },
-        .outputs = { sid_16_let },
+    { // [13] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_6 -> tvmgen_default_fused_split_1
+        .kernel = wrapped_chain_13,
         .input_count = 2,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .output_count = 3,
+        .config = { .device_type = 0, .priority = 78 },
         .id = 13
     },
-    { // [14] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_8
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_8,
-        .inputs = { sid_16_let },
-        .outputs = { sid_17_let },
+    { // [14] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_7
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_7,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 77 },
         .id = 14
     },
-    { // [15] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_2
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_2,
-        .inputs = { sid_17_let, sid_16_let },
-        .outputs = { sid_18_let },
+    { // [15] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_1
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_1,
         .input_count = 2,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 76 },
         .id = 15
     },
-    { // [16] tvmgen_default_fused_concatenate_1
-        .kernel = wrapped_tvmgen_default_fused_concatenate_1,
-        .inputs = { sid_13_let, sid_14_let, sid_14_let, sid_16_let, sid_18_let },
-        .outputs = { sid_19_let },
-        .input_count = 5,
+    { // [16] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_8
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_8,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 75 },
         .id = 16
     },
-    { // [17] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_9
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_9,
-        .inputs = { sid_19_let },
-        .outputs = { sid_20_let },
-        .input_count = 1,
+    { // [17] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_2
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_2,
+        .input_count = 2,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 74 },
         .id = 17
     },
-    { // [18] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10,
-        .inputs = { sid_20_let },
-        .outputs = { sid_21_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [18] 线性链: tvmgen_default_fused_concatenate_1 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_9
+        .kernel = wrapped_chain_18,
+        .input_count = 6,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 73 },
         .id = 18
     },
-    { // [19] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_11
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_11,
-        .inputs = { sid_21_let },
-        .outputs = { sid_22_let },
+    { // [19] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10 分块 0: [0, 320)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tile0,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 72 },
         .id = 19
     },
-    { // [20] tvmgen_default_fused_split_2
-        .kernel = wrapped_tvmgen_default_fused_split_2,
-        .inputs = { sid_22_let },
-        .outputs = { sid_23_let, sid_24_let },
+    { // [20] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10 分块 1: [320, 640)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tile1,
         .input_count = 1,
-        .output_count = 2,
-        .config = { .device_type = 0, .priority = 0 },
+        .output_count = 1,
+        .config = { .device_type = 0, .priority = 71 },
         .id = 20
     },
-    { // [21] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_12
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_12,
-        .inputs = { sid_24_let },
-        .outputs = { sid_25_let },
+    { // [21] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10 分块 2: [640, 960)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tile2,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 70 },
         .id = 21
     },
-    { // [22] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_3
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_3,
-        .inputs = { sid_25_let, sid_24_let },
-        .outputs = { sid_26_let },
-        .input_count = 2,
+    { // [22] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10 分块 3: [960, 1280)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tile3,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 69 },
         .id = 22
     },
-    { // [23] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_13
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_13,
-        .inputs = { sid_26_let },
-        .outputs = { sid_27_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [23] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_11 -> tvmgen_default_fused_split_2
+        .kernel = wrapped_chain_23,
+        .input_count = 2,
+        .output_count = 3,
+        .config = { .device_type = 0, .priority = 68 },
         .id = 23
     },
-    { // [24] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_4
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_4,
-        .inputs = { sid_27_let, sid_26_let },
-        .outputs = { sid_28_let },
-        .input_count = 2,
+    { // [24] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_12
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_12,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 67 },
         .id = 24
     },
-    { // [25] tvmgen_default_fused_concatenate_2
-        .kernel = wrapped_tvmgen_default_fused_concatenate_2,
-        .inputs = { sid_23_let, sid_24_let, sid_24_let, sid_26_let, sid_28_let },
-        .outputs = { sid_29_let },
-        .input_count = 5,
+    { // [25] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_3
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_3,
+        .input_count = 2,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 66 },
         .id = 25
     },
-    { // [26] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_14
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_14,
-        .inputs = { sid_29_let },
-        .outputs = { sid_30_let },
+    { // [26] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_13
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_13,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 65 },
         .id = 26
     },
-    { // [27] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15,
-        .inputs = { sid_30_let },
-        .outputs = { sid_31_let },
-        .input_count = 1,
+    { // [27] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_4
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_4,
+        .input_count = 2,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 64 },
         .id = 27
     },
-    { // [28] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_16
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_16,
-        .inputs = { sid_31_let },
-        .outputs = { sid_32_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [28] 线性链: tvmgen_default_fused_concatenate_2 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_14
+        .kernel = wrapped_chain_28,
+        .input_count = 6,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 63 },
         .id = 28
     },
-    { // [29] tvmgen_default_fused_split_3
-        .kernel = wrapped_tvmgen_default_fused_split_3,
-        .inputs = { sid_32_let },
-        .outputs = { sid_33_let, sid_34_let },
+    { // [29] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15 分块 0: [0, 320)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tile0,
         .input_count = 1,
-        .output_count = 2,
-        .config = { .device_type = 0, .priority = 0 },
+        .output_count = 1,
+        .config = { .device_type = 0, .priority = 62 },
         .id = 29
     },
-    { // [30] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_17
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_17,
-        .inputs = { sid_34_let },
-        .outputs = { sid_35_let },
+    { // [30] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15 分块 1: [320, 640)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tile1,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 61 },
         .id = 30
     },
-    { // [31] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_5
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_5,
-        .inputs = { sid_35_let, sid_34_let },
-        .outputs = { sid_36_let },
-        .input_count = 2,
+    { // [31] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15 分块 2: [640, 960)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tile2,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 60 },
         .id = 31
     },
-    { // [32] tvmgen_default_fused_concatenate_3
-        .kernel = wrapped_tvmgen_default_fused_concatenate_3,
-        .inputs = { sid_33_let, sid_34_let, sid_34_let, sid_36_let },
-        .outputs = { sid_37_let },
-        .input_count = 4,
+    { // [32] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15 分块 3: [960, 1280)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tile3,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 59 },
         .id = 32
     },
-    { // [33] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_18
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_18,
-        .inputs = { sid_37_let },
-        .outputs = { sid_38_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [33] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_16 -> tvmgen_default_fused_split_3
+        .kernel = wrapped_chain_33,
+        .input_count = 2,
+        .output_count = 3,
+        .config = { .device_type = 0, .priority = 58 },
         .id = 33
     },
-    { // [34] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_19
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_19,
-        .inputs = { sid_38_let },
-        .outputs = { sid_39_let },
+    { // [34] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_17
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_17,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 57 },
         .id = 34
     },
-    { // [35] tvmgen_default_fused_nn_max_pool2d
-        .kernel = wrapped_tvmgen_default_fused_nn_max_pool2d,
-        .inputs = { sid_39_let },
-        .outputs = { sid_40_let },
-        .input_count = 1,
+    { // [35] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_5
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_5,
+        .input_count = 2,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 56 },
         .id = 35
     },
-    { // [36] tvmgen_default_fused_nn_max_pool2d_1
-        .kernel = wrapped_tvmgen_default_fused_nn_max_pool2d_1,
-        .inputs = { sid_40_let },
-        .outputs = { sid_41_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [36] 线性链: tvmgen_default_fused_concatenate_3 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_18 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_19
+        .kernel = wrapped_chain_36,
+        .input_count = 6,
+        .output_count = 3,
+        .config = { .device_type = 0, .priority = 55 },
         .id = 36
     },
-    { // [37] tvmgen_default_fused_nn_max_pool2d_2
-        .kernel = wrapped_tvmgen_default_fused_nn_max_pool2d_2,
-        .inputs = { sid_41_let },
-        .outputs = { sid_42_let },
+    { // [37] tvmgen_default_fused_nn_max_pool2d
+        .kernel = wrapped_tvmgen_default_fused_nn_max_pool2d,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 54 },
         .id = 37
     },
-    { // [38] tvmgen_default_fused_concatenate_4
-        .kernel = wrapped_tvmgen_default_fused_concatenate_4,
-        .inputs = { sid_39_let, sid_40_let, sid_41_let, sid_42_let },
-        .outputs = { sid_43_let },
-        .input_count = 4,
+    { // [38] tvmgen_default_fused_nn_max_pool2d_1
+        .kernel = wrapped_tvmgen_default_fused_nn_max_pool2d_1,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 53 },
         .id = 38
     },
-    { // [39] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_20
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_20,
-        .inputs = { sid_43_let },
-        .outputs = { sid_44_let },
+    { // [39] tvmgen_default_fused_nn_max_pool2d_2
+        .kernel = wrapped_tvmgen_default_fused_nn_max_pool2d_2,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 52 },
         .id = 39
     },
-    { // [40] tvmgen_default_fused_layout_transform_image_resize2d_layout_transform_concatenate_layout_transf_1bf4794317454c42_
-        .kernel = wrapped_tvmgen_default_fused_layout_transform_image_resize2d_layout_transform_concatenate_layout_transf_1bf4794317454c42_,
-        .inputs = { sid_44_let, sid_30_let },
-        .outputs = { sid_45_let },
-        .input_count = 2,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [40] 线性链: tvmgen_default_fused_concatenate_4 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_20
+        .kernel = wrapped_chain_40,
+        .input_count = 5,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 51 },
         .id = 40
     },
-    { // [41] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_21
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_21,
-        .inputs = { sid_45_let },
-        .outputs = { sid_46_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [41] 线性链: tvmgen_default_fused_layout_transform_image_resize2d_layout_transform_concatenate_layout_transf_1bf4794317454c42_ -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_21 -> tvmgen_default_fused_split_4
+        .kernel = wrapped_chain_41,
+        .input_count = 4,
+        .output_count = 4,
+        .config = { .device_type = 0, .priority = 50 },
         .id = 41
     },
-    { // [42] tvmgen_default_fused_split_4
-        .kernel = wrapped_tvmgen_default_fused_split_4,
-        .inputs = { sid_46_let },
-        .outputs = { sid_47_let, sid_48_let },
-        .input_count = 1,
+    { // [42] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_22 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_23
+        .kernel = wrapped_chain_42,
+        .input_count = 2,
         .output_count = 2,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 49 },
         .id = 42
     },
-    { // [43] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_22
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_22,
-        .inputs = { sid_48_let },
-        .outputs = { sid_49_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [43] 线性链: tvmgen_default_fused_concatenate_5 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_24
+        .kernel = wrapped_chain_43,
+        .input_count = 5,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 48 },
         .id = 43
     },
-    { // [44] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_23
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_23,
-        .inputs = { sid_49_let },
-        .outputs = { sid_50_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [44] 线性链: tvmgen_default_fused_layout_transform_image_resize2d_layout_transform_concatenate_layout_transf_1bf4794317454c42__1 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_25 -> tvmgen_default_fused_split_5
+        .kernel = wrapped_chain_44,
+        .input_count = 4,
+        .output_count = 4,
+        .config = { .device_type = 0, .priority = 47 },
         .id = 44
     },
-    { // [45] tvmgen_default_fused_concatenate_5
-        .kernel = wrapped_tvmgen_default_fused_concatenate_5,
-        .inputs = { sid_47_let, sid_48_let, sid_48_let, sid_50_let },
-        .outputs = { sid_51_let },
-        .input_count = 4,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [45] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_26 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_27
+        .kernel = wrapped_chain_45,
+        .input_count = 2,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 46 },
         .id = 45
     },
-    { // [46] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_24
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_24,
-        .inputs = { sid_51_let },
-        .outputs = { sid_52_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [46] 线性链: tvmgen_default_fused_concatenate_6 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_28
+        .kernel = wrapped_chain_46,
+        .input_count = 5,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 45 },
         .id = 46
     },
-    { // [47] tvmgen_default_fused_layout_transform_image_resize2d_layout_transform_concatenate_layout_transf_1bf4794317454c42__1
-        .kernel = wrapped_tvmgen_default_fused_layout_transform_image_resize2d_layout_transform_concatenate_layout_transf_1bf4794317454c42__1,
-        .inputs = { sid_52_let, sid_20_let },
-        .outputs = { sid_53_let },
-        .input_count = 2,
+    { // [47] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29 分块 0: [0, 320)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tile0,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 33 },
         .id = 47
     },
-    { // [48] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_25
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_25,
-        .inputs = { sid_53_let },
-        .outputs = { sid_54_let },
+    { // [48] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29 分块 1: [320, 640)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tile1,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 32 },
         .id = 48
     },
-    { // [49] tvmgen_default_fused_split_5
-        .kernel = wrapped_tvmgen_default_fused_split_5,
-        .inputs = { sid_54_let },
-        .outputs = { sid_55_let, sid_56_let },
+    { // [49] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29 分块 2: [640, 960)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tile2,
         .input_count = 1,
-        .output_count = 2,
-        .config = { .device_type = 0, .priority = 0 },
+        .output_count = 1,
+        .config = { .device_type = 0, .priority = 31 },
         .id = 49
     },
-    { // [50] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_26
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_26,
-        .inputs = { sid_56_let },
-        .outputs = { sid_57_let },
+    { // [50] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29 分块 3: [960, 1280)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tile3,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 30 },
         .id = 50
     },
-    { // [51] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_27
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_27,
-        .inputs = { sid_57_let },
-        .outputs = { sid_58_let },
+    { // [51] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30 分块 0: [0, 320)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tile0,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 19 },
         .id = 51
     },
-    { // [52] tvmgen_default_fused_concatenate_6
-        .kernel = wrapped_tvmgen_default_fused_concatenate_6,
-        .inputs = { sid_55_let, sid_56_let, sid_56_let, sid_58_let },
-        .outputs = { sid_59_let },
-        .input_count = 4,
+    { // [52] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30 分块 1: [320, 640)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tile1,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 18 },
         .id = 52
     },
-    { // [53] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_28
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_28,
-        .inputs = { sid_59_let },
-        .outputs = { sid_60_let },
+    { // [53] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30 分块 2: [640, 960)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tile2,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 17 },
         .id = 53
     },
-    { // [54] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29,
-        .inputs = { sid_60_let },
-        .outputs = { sid_61_let },
+    { // [54] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30 分块 3: [960, 1280)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tile3,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 16 },
         .id = 54
     },
-    { // [55] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30,
-        .inputs = { sid_61_let },
-        .outputs = { sid_62_let },
+    { // [55] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 4 },
         .id = 55
     },
-    { // [56] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add,
-        .inputs = { sid_62_let },
-        .outputs = { sid_63_let },
+    { // [56] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31 分块 0: [0, 400)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tile0,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 37 },
         .id = 56
     },
-    { // [57] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31,
-        .inputs = { sid_60_let },
-        .outputs = { sid_64_let },
+    { // [57] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31 分块 1: [400, 800)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tile1,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 36 },
         .id = 57
     },
-    { // [58] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32,
-        .inputs = { sid_64_let },
-        .outputs = { sid_65_let },
+    { // [58] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31 分块 2: [800, 1200)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tile2,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 35 },
         .id = 58
     },
-    { // [59] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_1
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_1,
-        .inputs = { sid_65_let },
-        .outputs = { sid_66_let },
+    { // [59] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31 分块 3: [1200, 1600)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tile3,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 34 },
         .id = 59
     },
-    { // [60] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_33
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_33,
-        .inputs = { sid_60_let },
-        .outputs = { sid_67_let },
+    { // [60] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32 分块 0: [0, 400)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tile0,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 28 },
         .id = 60
     },
-    { // [61] tvmgen_default_fused_concatenate_7
-        .kernel = wrapped_tvmgen_default_fused_concatenate_7,
-        .inputs = { sid_67_let, sid_52_let },
-        .outputs = { sid_68_let },
-        .input_count = 2,
+    { // [61] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32 分块 1: [400, 800)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tile1,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 27 },
         .id = 61
     },
-    { // [62] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_34
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_34,
-        .inputs = { sid_68_let },
-        .outputs = { sid_69_let },
+    { // [62] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32 分块 2: [800, 1200)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tile2,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 26 },
         .id = 62
     },
-    { // [63] tvmgen_default_fused_split_6
-        .kernel = wrapped_tvmgen_default_fused_split_6,
-        .inputs = { sid_69_let },
-        .outputs = { sid_70_let, sid_71_let },
+    { // [63] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32 分块 3: [1200, 1600)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tile3,
         .input_count = 1,
-        .output_count = 2,
-        .config = { .device_type = 0, .priority = 0 },
+        .output_count = 1,
+        .config = { .device_type = 0, .priority = 25 },
         .id = 63
     },
-    { // [64] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_35
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_35,
-        .inputs = { sid_71_let },
-        .outputs = { sid_72_let },
+    { // [64] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_1
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_1,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 9 },
         .id = 64
     },
-    { // [65] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_36
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_36,
-        .inputs = { sid_72_let },
-        .outputs = { sid_73_let },
+    { // [65] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_33
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_33,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 44 },
         .id = 65
     },
-    { // [66] tvmgen_default_fused_concatenate_8
-        .kernel = wrapped_tvmgen_default_fused_concatenate_8,
-        .inputs = { sid_70_let, sid_71_let, sid_71_let, sid_73_let },
-        .outputs = { sid_74_let },
+    { // [66] 线性链: tvmgen_default_fused_concatenate_7 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_34 -> tvmgen_default_fused_split_6
+        .kernel = wrapped_chain_66,
         .input_count = 4,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .output_count = 4,
+        .config = { .device_type = 0, .priority = 43 },
         .id = 66
     },
-    { // [67] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_37
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_37,
-        .inputs = { sid_74_let },
-        .outputs = { sid_75_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [67] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_35 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_36
+        .kernel = wrapped_chain_67,
+        .input_count = 2,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 42 },
         .id = 67
     },
-    { // [68] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38,
-        .inputs = { sid_75_let },
-        .outputs = { sid_76_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [68] 线性链: tvmgen_default_fused_concatenate_8 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_37
+        .kernel = wrapped_chain_68,
+        .input_count = 5,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 41 },
         .id = 68
     },
-    { // [69] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_39
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_39,
-        .inputs = { sid_76_let },
-        .outputs = { sid_77_let },
+    { // [69] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38 分块 0: [0, 160)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tile0,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 23 },
         .id = 69
     },
-    { // [70] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_2
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_2,
-        .inputs = { sid_77_let },
-        .outputs = { sid_78_let },
+    { // [70] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38 分块 1: [160, 320)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tile1,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 22 },
         .id = 70
     },
-    { // [71] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40,
-        .inputs = { sid_75_let },
-        .outputs = { sid_79_let },
+    { // [71] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38 分块 2: [320, 480)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tile2,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 21 },
         .id = 71
     },
-    { // [72] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41,
-        .inputs = { sid_79_let },
-        .outputs = { sid_80_let },
+    { // [72] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38 分块 3: [480, 640)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tile3,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 20 },
         .id = 72
     },
-    { // [73] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_3
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_3,
-        .inputs = { sid_80_let },
-        .outputs = { sid_81_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [73] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_39 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_2
+        .kernel = wrapped_chain_73,
+        .input_count = 2,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 10 },
         .id = 73
     },
-    { // [74] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_42
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_42,
-        .inputs = { sid_75_let },
-        .outputs = { sid_82_let },
+    { // [74] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40 分块 0: [0, 200)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tile0,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 14 },
         .id = 74
     },
-    { // [75] tvmgen_default_fused_concatenate_9
-        .kernel = wrapped_tvmgen_default_fused_concatenate_9,
-        .inputs = { sid_82_let, sid_44_let },
-        .outputs = { sid_83_let },
-        .input_count = 2,
+    { // [75] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40 分块 1: [200, 400)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tile1,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 13 },
         .id = 75
     },
-    { // [76] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_43
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_43,
-        .inputs = { sid_83_let },
-        .outputs = { sid_84_let },
+    { // [76] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40 分块 2: [400, 600)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tile2,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 12 },
         .id = 76
     },
-    { // [77] tvmgen_default_fused_split_7
-        .kernel = wrapped_tvmgen_default_fused_split_7,
-        .inputs = { sid_84_let },
-        .outputs = { sid_85_let, sid_86_let },
+    { // [77] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40 分块 3: [600, 800)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tile3,
         .input_count = 1,
-        .output_count = 2,
-        .config = { .device_type = 0, .priority = 0 },
+        .output_count = 1,
+        .config = { .device_type = 0, .priority = 11 },
         .id = 77
     },
-    { // [78] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_44
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_44,
-        .inputs = { sid_86_let },
-        .outputs = { sid_87_let },
+    { // [78] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41 分块 0: [0, 200)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tile0,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 8 },
         .id = 78
     },
-    { // [79] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_45
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_45,
-        .inputs = { sid_87_let },
-        .outputs = { sid_88_let },
+    { // [79] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41 分块 1: [200, 400)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tile1,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 7 },
         .id = 79
     },
-    { // [80] tvmgen_default_fused_concatenate_10
-        .kernel = wrapped_tvmgen_default_fused_concatenate_10,
-        .inputs = { sid_85_let, sid_86_let, sid_86_let, sid_88_let },
-        .outputs = { sid_89_let },
-        .input_count = 4,
+    { // [80] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41 分块 2: [400, 600)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tile2,
+        .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 6 },
         .id = 80
     },
-    { // [81] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_46
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_46,
-        .inputs = { sid_89_let },
-        .outputs = { sid_90_let },
+    { // [81] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41 分块 3: [600, 800)
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tile3,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 5 },
         .id = 81
     },
-    { // [82] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_47
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_47,
-        .inputs = { sid_90_let },
-        .outputs = { sid_91_let },
+    { // [82] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_3
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_3,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 3 },
         .id = 82
     },
-    { // [83] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_48
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_48,
-        .inputs = { sid_91_let },
-        .outputs = { sid_92_let },
+    { // [83] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_42
+        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_42,
         .input_count = 1,
         .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 40 },
         .id = 83
     },
-    { // [84] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_4
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_4,
-        .inputs = { sid_92_let },
-        .outputs = { sid_93_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [84] 线性链: tvmgen_default_fused_concatenate_9 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_43 -> tvmgen_default_fused_split_7
+        .kernel = wrapped_chain_84,
+        .input_count = 4,
+        .output_count = 4,
+        .config = { .device_type = 0, .priority = 39 },
         .id = 84
     },
-    { // [85] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_49
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_49,
-        .inputs = { sid_90_let },
-        .outputs = { sid_94_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [85] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_44 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_45
+        .kernel = wrapped_chain_85,
+        .input_count = 2,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 38 },
         .id = 85
     },
-    { // [86] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_50
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_50,
-        .inputs = { sid_94_let },
-        .outputs = { sid_95_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [86] 线性链: tvmgen_default_fused_concatenate_10 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_46
+        .kernel = wrapped_chain_86,
+        .input_count = 5,
+        .output_count = 2,
+        .config = { .device_type = 0, .priority = 29 },
         .id = 86
     },
-    { // [87] tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_5
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_5,
-        .inputs = { sid_95_let },
-        .outputs = { sid_96_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [87] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_47 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_48 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_4
+        .kernel = wrapped_chain_87,
+        .input_count = 3,
+        .output_count = 3,
+        .config = { .device_type = 0, .priority = 15 },
         .id = 87
     },
-    { // [88] tvmgen_default_fused_concatenate_layout_transform_reshape_concatenate_layout_transform_reshape__7c5ad37d2665c07f_
+    { // [88] 线性链: tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_49 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_50 -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_5
+        .kernel = wrapped_chain_88,
+        .input_count = 3,
+        .output_count = 3,
+        .config = { .device_type = 0, .priority = 24 },
+        .id = 88
+    },
+    { // [89] tvmgen_default_fused_concatenate_layout_transform_reshape_concatenate_layout_transform_reshape__7c5ad37d2665c07f_
         .kernel = wrapped_tvmgen_default_fused_concatenate_layout_transform_reshape_concatenate_layout_transform_reshape__7c5ad37d2665c07f_,
-        .inputs = { sid_63_let, sid_66_let, sid_78_let, sid_81_let, sid_93_let, sid_96_let },
-        .outputs = { sid_97_let, sid_98_let },
         .input_count = 6,
         .output_count = 2,
-        .config = { .device_type = 0, .priority = 0 },
-        .id = 88
-    },
-    { // [89] tvmgen_default_fused_reshape_transpose
-        .kernel = wrapped_tvmgen_default_fused_reshape_transpose,
-        .inputs = { sid_97_let, sid_98_let },
-        .outputs = { sid_99_let },
-        .input_count = 2,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+        .config = { .device_type = 0, .priority = 2 },
         .id = 89
     },
-    { // [90] tvmgen_default_fused_nn_softmax
-        .kernel = wrapped_tvmgen_default_fused_nn_softmax,
-        .inputs = { sid_99_let },
-        .outputs = { sid_100_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
+    { // [90] 线性链: tvmgen_default_fused_reshape_transpose -> tvmgen_default_fused_nn_softmax -> tvmgen_default_fused_transpose_layout_transform -> tvmgen_default_fused_nn_contrib_conv2d_NCHWc
+        .kernel = wrapped_chain_90,
+        .input_count = 5,
+        .output_count = 4,
+        .config = { .device_type = 0, .priority = 1 },
         .id = 90
     },
-    { // [91] tvmgen_default_fused_transpose_layout_transform
-        .kernel = wrapped_tvmgen_default_fused_transpose_layout_transform,
-        .inputs = { sid_100_let },
-        .outputs = { sid_101_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
-        .id = 91
-    },
-    { // [92] tvmgen_default_fused_nn_contrib_conv2d_NCHWc
-        .kernel = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc,
-        .inputs = { sid_101_let },
-        .outputs = { sid_102_let },
-        .input_count = 1,
-        .output_count = 1,
-        .config = { .device_type = 0, .priority = 0 },
-        .id = 92
-    },
-    { // [93] tvmgen_default_fused_layout_transform_reshape_strided_slice_subtract_strided_slice_add_add_divi_e52109f6a309057f_
+    { // [91] tvmgen_default_fused_layout_transform_reshape_strided_slice_subtract_strided_slice_add_add_divi_e52109f6a309057f_
         .kernel = wrapped_tvmgen_default_fused_layout_transform_reshape_strided_slice_subtract_strided_slice_add_add_divi_e52109f6a309057f_,
-        .inputs = { sid_102_let, sid_97_let, sid_98_let },
-        .outputs = { output_buffer_var },
         .input_count = 3,
         .output_count = 1,
         .config = { .device_type = 0, .priority = 0 },
-        .id = 93
+        .id = 91
     },
 };
+
+// 按给定 workspace 与模型输入/输出实例化实体表
+static void tvmrt_bind_entities(SchedulableEntity* entities, uint8_t* ws,
+                                void* input, void* output) {
+    for (int i = 0; i < OP_COUNT; i++) {
+        SchedulableEntity* e = &entities[i];
+        const EntityBinding* b = &g_entity_bindings[i];
+        *e = g_entity_templates[i];
+        for (int j = 0; j < e->input_count; j++) {
+            e->inputs[j] = b->inputs[j] == TVMRT_BIND_INPUT ? input :
+                           b->inputs[j] == TVMRT_BIND_OUTPUT ? output : (void*)(ws + b->inputs[j]);
+        }
+        for (int j = 0; j < e->output_count; j++) {
+            e->outputs[j] = b->outputs[j] == TVMRT_BIND_INPUT ? input :
+                            b->outputs[j] == TVMRT_BIND_OUTPUT ? output : (void*)(ws + b->outputs[j]);
+        }
+    }
+}
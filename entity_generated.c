@@ -1,12 +1,20 @@
 // ============================================================
 // 自动生成的 Scheduler-Worker 运行时数据结构
-// 算子数量: 94
+// 算子数量: 92
 // ============================================================
 
 // ============ 类型定义 ============
 #define MAX_INPUTS 8
-#define MAX_OUTPUTS 2
-#define OP_COUNT 94
+#define MAX_OUTPUTS 4
+#define OP_COUNT 92
+// 线性链合并前的源算子数量（g_op_names 按源算子编号索引）
+#define TVMRT_SOURCE_OP_COUNT 127
+// 每个 Worker 的私有 scratch arena 大小（内核内部 *_let 已重定位）
+#define TVMRT_SCRATCH_ARENA_SIZE 9830400
+// 每个推理上下文的 workspace 字节数与模型输入/输出 float 数
+#define TVMRT_WORKSPACE_SIZE 15492864
+#define TVMRT_INPUT_SIZE 1228800
+#define TVMRT_OUTPUT_SIZE 705600
 
 // 执行配置（预留扩展）
 typedef struct {
@@ -133,6 +141,18 @@ TVM_DLL int32_t tvmgen_default_fused_split_5();
 TVM_DLL int32_t tvmgen_default_fused_split_6();
 TVM_DLL int32_t tvmgen_default_fused_split_7();
 TVM_DLL int32_t tvmgen_default_fused_transpose_layout_transform();
+// 分块版本（由 merge_scheduler_code.py 生成）：额外接收 tile_begin, tile_end
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tiled();
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tiled();
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tiled();
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tiled();
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tiled();
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tiled();
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tiled();
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tiled();
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tiled();
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tiled();
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tiled();
 
 // ============ 包装函数 ============
 // 签名: (void** inputs, void** outputs, uint8_t* cws, uint8_t* ws)
@@ -513,18 +533,365 @@ static inline int32_t wrapped_tvmgen_default_fused_transpose_layout_transform(vo
     return tvmgen_default_fused_transpose_layout_transform(inputs[0], outputs[0], cws, ws);
 }
 
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tiled(inputs[0], outputs[0], cws, ws, 0, 320);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tiled(inputs[0], outputs[0], cws, ws, 320, 640);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tiled(inputs[0], outputs[0], cws, ws, 640, 960);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tiled(inputs[0], outputs[0], cws, ws, 960, 1280);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tiled(inputs[0], outputs[0], cws, ws, 0, 320);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tiled(inputs[0], outputs[0], cws, ws, 320, 640);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tiled(inputs[0], outputs[0], cws, ws, 640, 960);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10_tiled(inputs[0], outputs[0], cws, ws, 960, 1280);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tiled(inputs[0], outputs[0], cws, ws, 0, 320);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tiled(inputs[0], outputs[0], cws, ws, 320, 640);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tiled(inputs[0], outputs[0], cws, ws, 640, 960);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15_tiled(inputs[0], outputs[0], cws, ws, 960, 1280);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tiled(inputs[0], outputs[0], cws, ws, 0, 320);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tiled(inputs[0], outputs[0], cws, ws, 320, 640);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tiled(inputs[0], outputs[0], cws, ws, 640, 960);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29_tiled(inputs[0], outputs[0], cws, ws, 960, 1280);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tiled(inputs[0], outputs[0], cws, ws, 0, 320);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tiled(inputs[0], outputs[0], cws, ws, 320, 640);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tiled(inputs[0], outputs[0], cws, ws, 640, 960);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tiled(inputs[0], outputs[0], cws, ws, 960, 1280);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tiled(inputs[0], outputs[0], cws, ws, 0, 400);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tiled(inputs[0], outputs[0], cws, ws, 400, 800);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tiled(inputs[0], outputs[0], cws, ws, 800, 1200);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31_tiled(inputs[0], outputs[0], cws, ws, 1200, 1600);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tiled(inputs[0], outputs[0], cws, ws, 0, 400);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tiled(inputs[0], outputs[0], cws, ws, 400, 800);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tiled(inputs[0], outputs[0], cws, ws, 800, 1200);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32_tiled(inputs[0], outputs[0], cws, ws, 1200, 1600);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tiled(inputs[0], outputs[0], cws, ws, 0, 160);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tiled(inputs[0], outputs[0], cws, ws, 160, 320);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tiled(inputs[0], outputs[0], cws, ws, 320, 480);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38_tiled(inputs[0], outputs[0], cws, ws, 480, 640);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tiled(inputs[0], outputs[0], cws, ws, 0, 200);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tiled(inputs[0], outputs[0], cws, ws, 200, 400);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tiled(inputs[0], outputs[0], cws, ws, 400, 600);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40_tiled(inputs[0], outputs[0], cws, ws, 600, 800);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tiled(inputs[0], outputs[0], cws, ws, 0, 200);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tiled(inputs[0], outputs[0], cws, ws, 200, 400);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tiled(inputs[0], outputs[0], cws, ws, 400, 600);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41_tiled(inputs[0], outputs[0], cws, ws, 600, 800);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tile0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tiled(inputs[0], outputs[0], cws, ws, 0, 320);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tile1(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tiled(inputs[0], outputs[0], cws, ws, 320, 640);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tile2(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tiled(inputs[0], outputs[0], cws, ws, 640, 960);
+}
+
+static inline int32_t wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tile3(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    return tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5_tiled(inputs[0], outputs[0], cws, ws, 960, 1280);
+}
+
+static int32_t wrapped_chain_0(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_layout_transform(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply(inputs + 1, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_5(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_2(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_split(inputs + 1, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_8(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_4(inputs + 4, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_13(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_6(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_split_1(inputs + 1, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_18(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate_1(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_9(inputs + 5, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_23(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_11(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_split_2(inputs + 1, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_28(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate_2(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_14(inputs + 5, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_33(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_16(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_split_3(inputs + 1, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_36(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate_3(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_18(inputs + 4, outputs + 1, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_19(inputs + 5, outputs + 2, cws, ws);
+}
+
+static int32_t wrapped_chain_40(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate_4(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_20(inputs + 4, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_41(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_layout_transform_image_resize2d_layout_transform_concatenate_layout_transf_1bf4794317454c42_(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_21(inputs + 2, outputs + 1, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_split_4(inputs + 3, outputs + 2, cws, ws);
+}
+
+static int32_t wrapped_chain_42(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_22(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_23(inputs + 1, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_43(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate_5(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_24(inputs + 4, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_44(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_layout_transform_image_resize2d_layout_transform_concatenate_layout_transf_1bf4794317454c42__1(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_25(inputs + 2, outputs + 1, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_split_5(inputs + 3, outputs + 2, cws, ws);
+}
+
+static int32_t wrapped_chain_45(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_26(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_27(inputs + 1, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_46(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate_6(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_28(inputs + 4, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_66(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate_7(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_34(inputs + 2, outputs + 1, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_split_6(inputs + 3, outputs + 2, cws, ws);
+}
+
+static int32_t wrapped_chain_67(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_35(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_36(inputs + 1, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_68(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate_8(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_37(inputs + 4, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_73(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_39(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_2(inputs + 1, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_84(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate_9(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_43(inputs + 2, outputs + 1, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_split_7(inputs + 3, outputs + 2, cws, ws);
+}
+
+static int32_t wrapped_chain_85(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_44(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_45(inputs + 1, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_86(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_concatenate_10(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_46(inputs + 4, outputs + 1, cws, ws);
+}
+
+static int32_t wrapped_chain_87(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_47(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_48(inputs + 1, outputs + 1, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_4(inputs + 2, outputs + 2, cws, ws);
+}
+
+static int32_t wrapped_chain_88(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_49(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_50(inputs + 1, outputs + 1, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_5(inputs + 2, outputs + 2, cws, ws);
+}
+
+static int32_t wrapped_chain_90(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {
+    int32_t ret;
+    if ((ret = wrapped_tvmgen_default_fused_reshape_transpose(inputs + 0, outputs + 0, cws, ws)) != 0) return ret;
+    if ((ret = wrapped_tvmgen_default_fused_nn_softmax(inputs + 2, outputs + 1, cws, ws)) != 0) return ret;
+    if ((ret = wrapped_tvmgen_default_fused_transpose_layout_transform(inputs + 3, outputs + 2, cws, ws)) != 0) return ret;
+    return wrapped_tvmgen_default_fused_nn_contrib_conv2d_NCHWc(inputs + 4, outputs + 3, cws, ws);
+}
+
 // ============ 调试信息 ============
-static const char* const g_op_names[94] __attribute__((unused)) = {
+static const char* const g_op_names[TVMRT_SOURCE_OP_COUNT] __attribute__((unused)) = {
     "tvmgen_default_fused_layout_transform",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1#3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_2",
     "tvmgen_default_fused_split",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add",
     "tvmgen_default_fused_concatenate",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_4",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_5#3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_6",
     "tvmgen_default_fused_split_1",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_7",
@@ -533,7 +900,10 @@ static const char* const g_op_names[94] __attribute__((unused)) = {
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_2",
     "tvmgen_default_fused_concatenate_1",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_9",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_10#3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_11",
     "tvmgen_default_fused_split_2",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_12",
@@ -542,7 +912,10 @@ static const char* const g_op_names[94] __attribute__((unused)) = {
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_4",
     "tvmgen_default_fused_concatenate_2",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_14",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_15#3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_16",
     "tvmgen_default_fused_split_3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_17",
@@ -569,11 +942,23 @@ static const char* const g_op_names[94] __attribute__((unused)) = {
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_27",
     "tvmgen_default_fused_concatenate_6",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_28",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_29#3",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30#3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_31#3",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_32#3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_1",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_33",
     "tvmgen_default_fused_concatenate_7",
@@ -583,11 +968,20 @@ static const char* const g_op_names[94] __attribute__((unused)) = {
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_36",
     "tvmgen_default_fused_concatenate_8",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_37",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_38#3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_39",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_2",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40",
-    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_40#3",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41#0",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41#1",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41#2",
+    "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_41#3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_3",
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_42",
     "tvmgen_default_fused_concatenate_9",
@@ -610,3 +1004,129 @@ static const char* const g_op_names[94] __attribute__((unused)) = {
     "tvmgen_default_fused_nn_contrib_conv2d_NCHWc",
     "tvmgen_default_fused_layout_transform_reshape_strided_slice_subtract_strided_slice_add_add_divi_e52109f6a309057f_",
 };
+
+// 实体 -> 源算子映射（超实体依次执行多个源算子，追踪时据此还原算子名）
+static const int32_t g_entity_op_offsets[OP_COUNT + 1] __attribute__((unused)) = {
+    0, 2, 3, 4, 5, 6, 8, 9, 10, 12, 13, 14, 15, 16, 18, 19,
+    20, 21, 22, 24, 25, 26, 27, 28, 30, 31, 32, 33, 34, 36, 37, 38,
+    39, 40, 42, 43, 44, 47, 48, 49, 50, 52, 55, 57, 59, 62, 64, 66,
+    67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82,
+    83, 84, 85, 88, 90, 92, 93, 94, 95, 96, 98, 99, 100, 101, 102, 103,
+    104, 105, 106, 107, 108, 111, 113, 115, 118, 121, 122, 126, 127,
+};
+static const int32_t g_entity_ops[TVMRT_SOURCE_OP_COUNT] __attribute__((unused)) = {
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+    16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
+    32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47,
+    48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63,
+    64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79,
+    80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95,
+    96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111,
+    112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126,
+};
+
+// ============ 静态代价模型 ============
+// 由内核循环嵌套估计；cost = flops + 访存字节 * COST_BYTES_WEIGHT
+typedef struct {
+    int64_t macs;              // 乘加次数
+    int64_t flops;             // 浮点运算次数
+    int64_t const_bytes_read;  // 读取常量字节数
+    int64_t ws_bytes_read;     // 读取 workspace 字节数
+    int64_t ws_bytes_written;  // 写入 workspace 字节数
+    int64_t cost;              // 综合代价（相对单位）
+} OpCost;
+
+static const OpCost g_op_cost[92] __attribute__((unused)) = {
+    { 45875200LL, 99942400LL, 190054400LL, 383400972LL, 206453772LL, 294919686LL }, // [0]
+    { 29696000LL, 60416000LL, 119603200LL, 244981824LL, 127017024LL, 183316512LL }, // [1]
+    { 29696000LL, 60416000LL, 119603200LL, 244981824LL, 127017024LL, 183316512LL }, // [2]
+    { 29696000LL, 60416000LL, 119603200LL, 244981824LL, 127017024LL, 183316512LL }, // [3]
+    { 29696000LL, 60416000LL, 119603200LL, 244981824LL, 127017024LL, 183316512LL }, // [4]
+    { 27033600LL, 58163200LL, 111411200LL, 219545600LL, 114688000LL, 169574400LL }, // [5]
+    { 59392000LL, 120832000LL, 239206400LL, 478454016LL, 242524416LL, 360878208LL }, // [6]
+    { 59392000LL, 121241600LL, 239206400LL, 480092416LL, 242524416LL, 361697408LL }, // [7]
+    { 40140800LL, 84377600LL, 163840000LL, 326041600LL, 168755200LL, 249036800LL }, // [8]
+    { 29593600LL, 59699200LL, 118784000LL, 240476288LL, 122511488LL, 180142144LL }, // [9]
+    { 29593600LL, 59699200LL, 118784000LL, 240476288LL, 122511488LL, 180142144LL }, // [10]
+    { 29593600LL, 59699200LL, 118784000LL, 240476288LL, 122511488LL, 180142144LL }, // [11]
+    { 29593600LL, 59699200LL, 118784000LL, 240476288LL, 122511488LL, 180142144LL }, // [12]
+    { 26624000LL, 55296000LL, 108134400LL, 214630400LL, 109772800LL, 163430400LL }, // [13]
+    { 59187200LL, 119398400LL, 237568000LL, 475177472LL, 239247872LL, 357396736LL }, // [14]
+    { 59187200LL, 119603200LL, 237568000LL, 475996672LL, 239247872LL, 357806336LL }, // [15]
+    { 59187200LL, 119398400LL, 237568000LL, 475177472LL, 239247872LL, 357396736LL }, // [16]
+    { 59187200LL, 119603200LL, 237568000LL, 475996672LL, 239247872LL, 357806336LL }, // [17]
+    { 52838400LL, 107724800LL, 212992000LL, 425984000LL, 216268800LL, 321536000LL }, // [18]
+    { 29542400LL, 59340800LL, 118374400LL, 238223616LL, 120258816LL, 178555008LL }, // [19]
+    { 29542400LL, 59340800LL, 118374400LL, 238223616LL, 120258816LL, 178555008LL }, // [20]
+    { 29542400LL, 59340800LL, 118374400LL, 238223616LL, 120258816LL, 178555008LL }, // [21]
+    { 29542400LL, 59340800LL, 118374400LL, 238223616LL, 120258816LL, 178555008LL }, // [22]
+    { 26419200LL, 53862400LL, 106496000LL, 212172800LL, 107315200LL, 160358400LL }, // [23]
+    { 59084800LL, 118681600LL, 236748800LL, 473539584LL, 237609984LL, 355656192LL }, // [24]
+    { 59084800LL, 118784000LL, 236748800LL, 473949184LL, 237609984LL, 355860992LL }, // [25]
+    { 59084800LL, 118681600LL, 236748800LL, 473539584LL, 237609984LL, 355656192LL }, // [26]
+    { 59084800LL, 118784000LL, 236748800LL, 473949184LL, 237609984LL, 355860992LL }, // [27]
+    { 52633600LL, 106291200LL, 211353600LL, 422707200LL, 212992000LL, 318054400LL }, // [28]
+    { 29516800LL, 59161600LL, 118169600LL, 236995072LL, 119030272LL, 177710336LL }, // [29]
+    { 29516800LL, 59161600LL, 118169600LL, 236995072LL, 119030272LL, 177710336LL }, // [30]
+    { 29516800LL, 59161600LL, 118169600LL, 236995072LL, 119030272LL, 177710336LL }, // [31]
+    { 29516800LL, 59161600LL, 118169600LL, 236995072LL, 119030272LL, 177710336LL }, // [32]
+    { 26316800LL, 53145600LL, 105676800LL, 210944000LL, 106086400LL, 158822400LL }, // [33]
+    { 59033600LL, 118323200LL, 236339200LL, 472516608LL, 236587008LL, 354683904LL }, // [34]
+    { 59033600LL, 118374400LL, 236339200LL, 472721408LL, 236587008LL, 354786304LL }, // [35]
+    { 52582400LL, 105932800LL, 210944000LL, 421273600LL, 211558400LL, 316876800LL }, // [36]
+    { 0LL, 1280000LL, 0LL, 10240000LL, 5324800LL, 5171200LL }, // [37]
+    { 0LL, 1280000LL, 0LL, 10240000LL, 5324800LL, 5171200LL }, // [38]
+    { 0LL, 1280000LL, 0LL, 10240000LL, 5324800LL, 5171200LL }, // [39]
+    { 52531200LL, 105574400LL, 210534400LL, 421068800LL, 211353600LL, 316313600LL }, // [40]
+    { 78848000LL, 158720000LL, 316211200LL, 638976000LL, 324403200LL, 478617600LL }, // [41]
+    { 118169600LL, 237363200LL, 473497600LL, 947079168LL, 475219968LL, 711312384LL }, // [42]
+    { 39526400LL, 80076800LL, 158924800LL, 317440000LL, 160153600LL, 239206400LL }, // [43]
+    { 79052800LL, 160153600LL, 317849600LL, 648806400LL, 334233600LL, 485376000LL }, // [44]
+    { 118374400LL, 238796800LL, 475136000LL, 950354944LL, 478495744LL, 714793472LL }, // [45]
+    { 39731200LL, 81510400LL, 160563200LL, 320307200LL, 163020800LL, 242483200LL }, // [46]
+    { 59084800LL, 118681600LL, 236748800LL, 474809344LL, 238879744LL, 356291072LL }, // [47]
+    { 59084800LL, 118681600LL, 236748800LL, 474809344LL, 238879744LL, 356291072LL }, // [48]
+    { 59084800LL, 118681600LL, 236748800LL, 474809344LL, 238879744LL, 356291072LL }, // [49]
+    { 59084800LL, 118681600LL, 236748800LL, 474809344LL, 238879744LL, 356291072LL }, // [50]
+    { 59084800LL, 118681600LL, 236748800LL, 474809344LL, 238879744LL, 356291072LL }, // [51]
+    { 59084800LL, 118681600LL, 236748800LL, 474809344LL, 238879744LL, 356291072LL }, // [52]
+    { 59084800LL, 118681600LL, 236748800LL, 474809344LL, 238879744LL, 356291072LL }, // [53]
+    { 59084800LL, 118681600LL, 236748800LL, 474809344LL, 238879744LL, 356291072LL }, // [54]
+    { 26214400LL, 52838400LL, 106496000LL, 211353600LL, 108134400LL, 159334400LL }, // [55]
+    { 73856000LL, 148352000LL, 295936000LL, 593081344LL, 298169344LL, 445148672LL }, // [56]
+    { 73856000LL, 148352000LL, 295936000LL, 593081344LL, 298169344LL, 445148672LL }, // [57]
+    { 73856000LL, 148352000LL, 295936000LL, 593081344LL, 298169344LL, 445148672LL }, // [58]
+    { 73856000LL, 148352000LL, 295936000LL, 593081344LL, 298169344LL, 445148672LL }, // [59]
+    { 92288000LL, 185216000LL, 369664000LL, 740967680LL, 372327680LL, 555955840LL }, // [60]
+    { 92288000LL, 185216000LL, 369664000LL, 740967680LL, 372327680LL, 555955840LL }, // [61]
+    { 92288000LL, 185216000LL, 369664000LL, 740967680LL, 372327680LL, 555955840LL }, // [62]
+    { 92288000LL, 185216000LL, 369664000LL, 740967680LL, 372327680LL, 555955840LL }, // [63]
+    { 40960000LL, 82432000LL, 165888000LL, 329728000LL, 167936000LL, 248320000LL }, // [64]
+    { 59084800LL, 118681600LL, 236748800LL, 474767616LL, 238838016LL, 356270208LL }, // [65]
+    { 39526400LL, 80076800LL, 158924800LL, 318259200LL, 160972800LL, 239616000LL }, // [66]
+    { 118169600LL, 237363200LL, 473497600LL, 947079168LL, 475219968LL, 711312384LL }, // [67]
+    { 39526400LL, 80076800LL, 158924800LL, 317440000LL, 160153600LL, 239206400LL }, // [68]
+    { 29516800LL, 59161600LL, 118169600LL, 237139968LL, 119175168LL, 177782784LL }, // [69]
+    { 29516800LL, 59161600LL, 118169600LL, 237139968LL, 119175168LL, 177782784LL }, // [70]
+    { 29516800LL, 59161600LL, 118169600LL, 237139968LL, 119175168LL, 177782784LL }, // [71]
+    { 29516800LL, 59161600LL, 118169600LL, 237139968LL, 119175168LL, 177782784LL }, // [72]
+    { 65638400LL, 131891200LL, 263372800LL, 526377984LL, 264643584LL, 395489792LL }, // [73]
+    { 36896000LL, 73952000LL, 147712000LL, 296199168LL, 148743168LL, 222115584LL }, // [74]
+    { 36896000LL, 73952000LL, 147712000LL, 296199168LL, 148743168LL, 222115584LL }, // [75]
+    { 36896000LL, 73952000LL, 147712000LL, 296199168LL, 148743168LL, 222115584LL }, // [76]
+    { 36896000LL, 73952000LL, 147712000LL, 296199168LL, 148743168LL, 222115584LL }, // [77]
+    { 23072000LL, 46304000LL, 92416000LL, 185268480LL, 93108480LL, 139002240LL }, // [78]
+    { 23072000LL, 46304000LL, 92416000LL, 185268480LL, 93108480LL, 139002240LL }, // [79]
+    { 23072000LL, 46304000LL, 92416000LL, 185268480LL, 93108480LL, 139002240LL }, // [80]
+    { 23072000LL, 46304000LL, 92416000LL, 185268480LL, 93108480LL, 139002240LL }, // [81]
+    { 10240000LL, 20608000LL, 41472000LL, 82432000LL, 41984000LL, 62080000LL }, // [82]
+    { 59033600LL, 118323200LL, 236339200LL, 473129472LL, 237199872LL, 354990336LL }, // [83]
+    { 39424000LL, 79360000LL, 158105600LL, 316416000LL, 159129600LL, 237772800LL }, // [84]
+    { 118067200LL, 236646400LL, 472678400LL, 945033216LL, 473174016LL, 709367808LL }, // [85]
+    { 39424000LL, 79360000LL, 158105600LL, 316006400LL, 158720000LL, 237568000LL }, // [86]
+    { 75417600LL, 151116800LL, 301977600LL, 604062720LL, 302699520LL, 453301760LL }, // [87]
+    { 99392000LL, 199136000LL, 397952000LL, 795914496LL, 398730496LL, 597285248LL }, // [88]
+    { 0LL, 0LL, 0LL, 19353600LL, 19353600LL, 9676800LL }, // [89]
+    { 537600LL, 3763200LL, 2150400LL, 25939200LL, 15590400LL, 14683200LL }, // [90]
+    { 0LL, 2805600LL, 268800LL, 6518400LL, 6384000LL, 6098400LL }, // [91]
+};
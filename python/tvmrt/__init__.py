@@ -0,0 +1,299 @@
+"""
+tvmrt Python 绑定 - 通过 ctypes 加载 build/lib/lib<model>.so 驱动 Scheduler-Worker 运行时
+
+- 输入/输出直接使用调用者的 NumPy 数组（零拷贝）：要求 float32、C 连续、按元素自然对齐，
+  元素数等于模型输入/输出大小；empty_input() / empty_output() 分配 64 字节对齐的数组
+- ctypes.CDLL 调用期间释放 GIL：多个 Python 线程各持一个 Context 即可并发推理，
+  共享同一线程池（至多 TVMRT_MAX_INFLIGHT 次推理同时进行）
+- Context.run_batch() 在单线程内轮流提交多个上下文（异步流水线），benchmark() 测量延迟与吞吐
+
+使用方法:
+    import numpy as np
+    import tvmrt
+
+    rt = tvmrt.Runtime()                    # 默认加载 build/lib/lib*.so（或 TVMRT_LIBRARY）
+    with rt.context() as ctx:
+        images = rt.empty_input()
+        images[:] = np.random.rand(images.size)
+        output = ctx.run(images)            # 形状 (output_size,) 的 float32 数组
+
+    outputs = rt.run_batch(batch)           # batch: (N, input_size) 或 (N, 1, 3, H, W)
+    print(rt.benchmark(iterations=10, streams=2))
+
+调度模式、Worker 数等沿用运行时配置（tvmrt.conf / TVMRT_* 环境变量），
+也可在第一次推理前调用 Runtime.init(num_workers, mode) 显式启动线程池。
+"""
+
+import os
+import glob
+import time
+import ctypes
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+ALIGNMENT = 64          # 与运行时自有缓冲区（posix_memalign）一致
+TVMRT_BUSY = -2
+
+SCHED_MODES = {'closed_loop': 0, 'work_stealing': 1, 'static': 2}
+
+
+class TvmrtError(RuntimeError):
+    """运行时调用返回非 0 状态"""
+
+    def __init__(self, func: str, status: int):
+        super().__init__(f"{func} 失败（状态 {status}）")
+        self.status = status
+
+
+def find_library(project_root: Optional[str] = None) -> str:
+    """共享库路径：TVMRT_LIBRARY 环境变量，否则为 <项目根目录>/build/lib/lib*.so"""
+    path = os.environ.get('TVMRT_LIBRARY')
+    if path:
+        return path
+    if project_root is None:
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    candidates = sorted(glob.glob(os.path.join(project_root, 'build', 'lib', 'lib*.so')))
+    if not candidates:
+        raise FileNotFoundError(f"找不到 {project_root}/build/lib/lib*.so，请先运行 make")
+    return candidates[0]
+
+
+def empty_aligned(size: int, alignment: int = ALIGNMENT) -> np.ndarray:
+    """分配 alignment 字节对齐的一维 float32 数组"""
+    itemsize = np.dtype(np.float32).itemsize
+    raw = np.empty(size * itemsize + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset:offset + size * itemsize].view(np.float32)
+
+
+def _check_buffer(array: np.ndarray, size: int, name: str, writable: bool = False):
+    """零拷贝传给运行时前校验 dtype、连续性、对齐与元素数"""
+    if not isinstance(array, np.ndarray):
+        raise TypeError(f"{name} 必须是 numpy.ndarray，实际为 {type(array).__name__}")
+    if array.dtype != np.float32:
+        raise TypeError(f"{name} 的 dtype 必须是 float32，实际为 {array.dtype}")
+    if not array.flags.c_contiguous:
+        raise ValueError(f"{name} 必须是 C 连续数组（可用 np.ascontiguousarray）")
+    if not array.flags.aligned:
+        raise ValueError(f"{name} 未按 float32 对齐（可用 tvmrt.empty_aligned 分配）")
+    if array.size != size:
+        raise ValueError(f"{name} 的元素数必须为 {size}，实际为 {array.size}")
+    if writable and not array.flags.writeable:
+        raise ValueError(f"{name} 必须可写")
+
+
+def _percentile(samples: List[float], p: float) -> float:
+    """nearest-rank 分位数（与 test_main.c 一致，samples 已升序）"""
+    rank = min(max(int(np.ceil(p / 100.0 * len(samples))), 1), len(samples))
+    return samples[rank - 1]
+
+
+class Context:
+    """推理上下文：独立的 workspace 与实体表；同一上下文同一时刻只能有一次推理"""
+
+    def __init__(self, runtime: 'Runtime'):
+        self._rt = runtime
+        self._handle = runtime._lib.tvmrt_context_create()
+        if not self._handle:
+            raise MemoryError("tvmrt_context_create 失败（内存不足或常量权重加载失败，见 stderr）")
+        self._pending = None  # 异步推理期间持有输入/输出数组的引用
+
+    def close(self):
+        """等待进行中的推理后释放上下文"""
+        if self._handle:
+            self._rt._lib.tvmrt_context_destroy(self._handle)
+            self._handle = None
+            self._pending = None
+
+    def __enter__(self) -> 'Context':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def submit(self, images: np.ndarray, output: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        异步提交一次推理并立即返回输出数组（结果在 wait() 之后有效）
+
+        所有槽位都被占用时阻塞等待（背压）；images/output 在 wait() 之前不可修改
+        """
+        rt = self._rt
+        _check_buffer(images, rt.input_size, 'images')
+        if output is None:
+            output = rt.empty_output()
+        _check_buffer(output, rt.output_size, 'output', writable=True)
+        status = rt._lib.tvmrt_context_submit(self._handle, images.ctypes.data,
+                                              output.ctypes.data, None, None)
+        if status != 0:
+            raise TvmrtError('tvmrt_context_submit', status)
+        self._pending = (images, output)
+        return output
+
+    def wait(self):
+        """等待进行中的推理完成（无进行中的推理时立即返回）"""
+        status = self._rt._lib.tvmrt_context_wait(self._handle)
+        self._pending = None
+        if status != 0:
+            raise TvmrtError('tvmrt_context_wait', status)
+
+    def poll(self) -> bool:
+        """推理已完成（或未提交）时返回 True"""
+        return bool(self._rt._lib.tvmrt_context_poll(self._handle))
+
+    def run(self, images: np.ndarray, output: Optional[np.ndarray] = None) -> np.ndarray:
+        """同步执行一次推理，返回输出数组（未提供 output 时新分配）"""
+        output = self.submit(images, output)
+        self.wait()
+        return output
+
+
+class Runtime:
+    """已加载的模型共享库"""
+
+    def __init__(self, library: Optional[str] = None):
+        self.library = library or find_library()
+        lib = ctypes.CDLL(self.library)
+        ptr = ctypes.c_void_p
+        for name, restype, argtypes in [
+            ('tvmrt_init', ctypes.c_int32, [ctypes.c_int, ctypes.c_int]),
+            ('tvmrt_shutdown', None, []),
+            ('tvmrt_input_size', ctypes.c_int64, []),
+            ('tvmrt_output_size', ctypes.c_int64, []),
+            ('tvmrt_context_create', ptr, []),
+            ('tvmrt_context_destroy', None, [ptr]),
+            ('tvmrt_context_submit', ctypes.c_int32, [ptr, ptr, ptr, ptr, ptr]),
+            ('tvmrt_context_wait', ctypes.c_int32, [ptr]),
+            ('tvmrt_context_poll', ctypes.c_int32, [ptr]),
+        ]:
+            func = getattr(lib, name)
+            func.restype = restype
+            func.argtypes = argtypes
+        self._lib = lib
+        self.input_size = int(lib.tvmrt_input_size())
+        self.output_size = int(lib.tvmrt_output_size())
+
+    def init(self, num_workers: int = 0, mode: Optional[str] = None):
+        """
+        启动线程池（已启动时为空操作；切换配置需先 shutdown）
+
+        num_workers <= 0 / mode 为 None 时沿用运行时配置
+        """
+        if mode is not None and mode not in SCHED_MODES:
+            raise ValueError(f"未知的调度模式 {mode}（可选 {', '.join(SCHED_MODES)}）")
+        status = self._lib.tvmrt_init(num_workers, SCHED_MODES[mode] if mode else -1)
+        if status != 0:
+            raise TvmrtError('tvmrt_init', status)
+
+    def shutdown(self):
+        """等待进行中的推理结束后回收线程池；下一次推理重新读取运行时配置"""
+        self._lib.tvmrt_shutdown()
+
+    def context(self) -> Context:
+        return Context(self)
+
+    def empty_input(self) -> np.ndarray:
+        return empty_aligned(self.input_size)
+
+    def empty_output(self) -> np.ndarray:
+        return empty_aligned(self.output_size)
+
+    def run_batch(self, images: np.ndarray, outputs: Optional[np.ndarray] = None,
+                  depth: int = 2) -> np.ndarray:
+        """
+        逐帧推理一批输入：images 第 0 维为帧，其余维度共 input_size 个元素
+
+        depth 个上下文轮流异步提交（同一线程内的流水线），各帧直接读写 images/outputs 的切片
+        """
+        n = images.shape[0] if images.ndim > 0 else 0
+        _check_buffer(images, n * self.input_size, 'images')
+        if outputs is None:
+            outputs = empty_aligned(n * self.output_size).reshape(n, self.output_size)
+        _check_buffer(outputs, n * self.output_size, 'outputs', writable=True)
+        frames = images.reshape(n, self.input_size)
+        out_frames = outputs.reshape(n, self.output_size)
+        contexts = [self.context() for _ in range(max(1, min(depth, n)))]
+        try:
+            for i in range(n):
+                ctx = contexts[i % len(contexts)]
+                ctx.wait()
+                ctx.submit(frames[i], out_frames[i])
+            for ctx in contexts:
+                ctx.wait()
+        finally:
+            for ctx in contexts:
+                ctx.close()
+        return outputs
+
+    def benchmark(self, iterations: int = 10, warmup: int = 2, streams: int = 1) -> dict:
+        """
+        多线程计时：streams 个 Python 线程各持一个上下文同时推理（GIL 在推理期间释放）
+
+        返回字段与 test_main.c 的 JSON 一致：latency_ms（min/mean/p50/p90/p99/max）与 throughput_fps；
+        iterations/streams 必须 >= 1，warmup 必须 >= 0，否则抛 ValueError
+        """
+        if iterations < 1:
+            raise ValueError(f"iterations 必须 >= 1，实际为 {iterations}")
+        if streams < 1:
+            raise ValueError(f"streams 必须 >= 1，实际为 {streams}")
+        if warmup < 0:
+            raise ValueError(f"warmup 必须 >= 0，实际为 {warmup}")
+        rng = np.random.default_rng(0)
+        images = self.empty_input()
+        images[:] = rng.random(self.input_size, dtype=np.float32)
+        samples: List[List[float]] = [[] for _ in range(streams)]
+        errors: List[BaseException] = []
+        barrier = threading.Barrier(streams + 1)
+
+        def stream(k: int):
+            try:
+                with self.context() as ctx:
+                    output = self.empty_output()
+                    for _ in range(warmup):
+                        ctx.run(images, output)
+                    barrier.wait()
+                    for _ in range(iterations):
+                        t0 = time.perf_counter()
+                        ctx.run(images, output)
+                        samples[k].append((time.perf_counter() - t0) * 1000.0)
+            except BaseException as e:  # 交给主线程抛出
+                errors.append(e)
+                barrier.abort()
+
+        threads = [threading.Thread(target=stream, args=(k,)) for k in range(streams)]
+        for t in threads:
+            t.start()
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        t0 = time.perf_counter()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - t0
+        if errors:
+            raise errors[0]
+
+        latencies = sorted(s for per_stream in samples for s in per_stream)
+        return {
+            'library': self.library,
+            'streams': streams,
+            'iterations': iterations,
+            'latency_ms': {
+                'min': latencies[0],
+                'mean': sum(latencies) / len(latencies),
+                'p50': _percentile(latencies, 50.0),
+                'p90': _percentile(latencies, 90.0),
+                'p99': _percentile(latencies, 99.0),
+                'max': latencies[-1],
+            },
+            'throughput_fps': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        }
+
+
+__all__ = ['ALIGNMENT', 'SCHED_MODES', 'TvmrtError', 'Runtime', 'Context',
+           'find_library', 'empty_aligned']
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+自动调优脚本 - 为本机选择 Worker 数、调度策略与线程放置
+
+只构建一次（make），用基准测试驱动 build/<model>_test 扫描 Worker 数 × 调度模式 ×
+就绪派发顺序 × 线程放置（CPU 亲和性），剔除输出与串行不一致的配置，按目标
+（延迟 p50 最小 / 吞吐最大）选出最优配置，写出运行时启动时读取的配置文件（tvmrt.conf）。
+运行时在当前目录查找 tvmrt.conf（或 TVMRT_CONFIG 指定的路径），环境变量仍可覆盖其中的同名项。
+
+使用方法:
+    python3 scripts/autotune.py [--workers 1,2,3,4] [--modes closed_loop,work_stealing,static]
+                                [--policies priority,fifo] [--affinity 'none;cores']
+                                [--wait-spin 0,1024,16384]
+                                [--objective latency|throughput]
+                                [--streams N] [-n 迭代次数] [-w 预热次数]
+                                [--output tvmrt.conf] [--json FILE] [--no-build]
+
+选项:
+    --workers LIST    扫描的 Worker 数（逗号分隔，默认 1..CPU 核数）
+    --modes LIST      调度模式（默认 closed_loop,work_stealing,static；static 的 Worker 数
+                      固定为离线调度的 TVMRT_STATIC_WORKERS）
+    --policies LIST   就绪派发顺序（默认 priority,fifo；static 模式不适用）
+    --affinity LIST   线程放置（分号分隔，默认 none;cores；可选 l3 / numa / 显式 CPU 列表如 0-3,8）
+    --wait-spin LIST  自适应等待的自旋预算（逗号分隔，默认不扫描，沿用运行时默认值）
+    --objective OBJ   latency（p50 最小，默认）/ throughput（FPS 最大，宜配合 --streams）
+    --streams N       并发推理流数（默认 1）
+    -n N              每个配置的计时迭代次数（默认 10）
+    -w N              每个配置的预热次数（默认 2）
+    --output FILE     配置文件输出路径（默认项目根目录下的 tvmrt.conf）
+    --json FILE       写出全部配置的测量结果（可选）
+    --no-build        跳过 make，直接使用已有的可执行文件
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from typing import Optional
+
+from run_benchmark import run_command, find_test_binary, run_sweep
+
+MODES = ('closed_loop', 'work_stealing', 'static')
+POLICIES = ('priority', 'fifo')
+AFFINITIES = ('none', 'cores')
+
+
+def read_static_workers(project_root: str) -> Optional[int]:
+    """dag_schedule_generated.c 中离线静态调度的 Worker 数（未生成时为 None）"""
+    path = os.path.join(project_root, 'dag_schedule_generated.c')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        match = re.search(r'#define TVMRT_STATIC_WORKERS (\d+)', f.read())
+    return int(match.group(1)) if match else None
+
+
+def score(config: dict, objective: str) -> tuple:
+    """越小越好；相同时 Worker 数少者优先"""
+    if objective == 'throughput':
+        return (-config['throughput_fps'], config['workers'])
+    return (config['latency_ms']['p50'], config['workers'])
+
+
+def write_config(path: str, best: dict, baseline: dict, objective: str):
+    lat = best['latency_ms']
+    speedup = baseline['latency_ms']['p50'] / lat['p50'] if lat['p50'] else 0.0
+    lines = [
+        "# tvmrt 运行时配置（scripts/autotune.py 按本机实测生成）",
+        f"# 目标: {objective}，CPU 核数: {os.cpu_count()}，并发流数: {best['streams']}",
+        f"# 实测: p50 {lat['p50']:.2f} ms, p90 {lat['p90']:.2f} ms, p99 {lat['p99']:.2f} ms, "
+        f"{best['throughput_fps']:.2f} FPS，相对串行 {speedup:.2f}x",
+        f"num_workers = {best['workers']}",
+    ]
+    if best['workers'] > 0:
+        lines.append(f"sched_mode = {best['mode']}")
+        lines.append(f"ready_policy = {best['ready_policy']}")
+        lines.append(f"affinity = {best['affinity']}")
+        if best['wait_spin'] is not None:
+            lines.append(f"wait_spin = {best['wait_spin']}")
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Worker 数与调度策略自动调优')
+    parser.add_argument('--workers', help='扫描的 Worker 数（默认 1..CPU 核数）')
+    parser.add_argument('--modes', default=','.join(MODES), help='调度模式')
+    parser.add_argument('--policies', default=','.join(POLICIES), help='就绪派发顺序')
+    parser.add_argument('--affinity', default=';'.join(AFFINITIES),
+                        help='线程放置（分号分隔：none / cores / l3 / numa / CPU 列表）')
+    parser.add_argument('--wait-spin', help='自适应等待的自旋预算（逗号分隔）')
+    parser.add_argument('--objective', default='latency', choices=['latency', 'throughput'],
+                        help='优化目标')
+    parser.add_argument('--streams', type=int, default=1, help='并发推理流数')
+    parser.add_argument('-n', type=int, default=10, dest='iterations', help='计时迭代次数')
+    parser.add_argument('-w', type=int, default=2, dest='warmup', help='预热次数')
+    parser.add_argument('--output', help='配置文件输出路径（默认 tvmrt.conf）')
+    parser.add_argument('--json', help='全部配置的测量结果 JSON')
+    parser.add_argument('--no-build', action='store_true', help='跳过构建')
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    output = args.output or os.path.join(project_root, 'tvmrt.conf')
+    if args.workers:
+        workers = [int(w) for w in args.workers.split(',') if w.strip()]
+    else:
+        workers = list(range(1, (os.cpu_count() or 1) + 1))
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    policies = [p.strip() for p in args.policies.split(',') if p.strip()]
+    affinities = [a.strip() for a in args.affinity.split(';') if a.strip()]
+    spins = [int(x) for x in args.wait_spin.split(',') if x.strip()] if args.wait_spin else [None]
+    unknown = [m for m in modes if m not in MODES] + [p for p in policies if p not in POLICIES]
+    if unknown:
+        print(f"错误: 未知的模式/派发顺序 {unknown}")
+        return 1
+
+    print("=" * 60)
+    print(f"  自动调优（目标: {args.objective}）")
+    print("=" * 60)
+
+    if not args.no_build:
+        print("\n[1/3] 构建 ...")
+        ret = run_command(['make', f'-j{os.cpu_count() or 1}'], cwd=project_root)
+        if ret != 0:
+            print("错误: 编译失败")
+            return ret
+
+    binary = find_test_binary(project_root)
+    if not binary:
+        print("错误: 找不到测试可执行文件，请先运行 scripts/build_scheduler.py")
+        return 1
+
+    # 扫描期间忽略已有的 tvmrt.conf，只由环境变量决定配置
+    base_env = {'TVMRT_CONFIG': os.devnull}
+
+    print("\n[2/3] 串行基线 ...")
+    serial = run_sweep(binary, project_root, [0], args.iterations, args.warmup, 'random',
+                       base_env, args.streams)
+    if serial is None:
+        return 1
+    configs = [dict(mode='serial', ready_policy='-', affinity='-', wait_spin=None,
+                    **serial['results'][0])]
+
+    print("\n[3/3] 配置扫描 ...")
+    static_workers = read_static_workers(project_root)
+    for mode in modes:
+        if mode == 'static':
+            if static_workers is None:
+                print("    跳过 static：未生成离线静态调度（operator_staticizer.py --static-workers）")
+                continue
+            sweeps = [('priority', affinity, spin, [static_workers])
+                      for affinity in affinities for spin in spins]
+        else:
+            sweeps = [(policy, affinity, spin, workers)
+                      for policy in policies for affinity in affinities for spin in spins]
+        for policy, affinity, spin, counts in sweeps:
+            env = dict(base_env, TVMRT_SCHED_MODE=mode, TVMRT_READY_POLICY=policy,
+                       TVMRT_AFFINITY=affinity)
+            if spin is not None:
+                env['TVMRT_WAIT_SPIN'] = str(spin)
+            report = run_sweep(binary, project_root, counts, args.iterations, args.warmup,
+                               'random', env, args.streams)
+            if report is None:
+                return 1
+            configs.extend(dict(mode=mode, ready_policy=policy, affinity=affinity,
+                                wait_spin=spin, **r)
+                           for r in report['results'])
+
+    reference = configs[0]['checksum']
+    valid = [c for c in configs if c['checksum'] == reference]
+    best = min(valid, key=lambda c: score(c, args.objective))
+
+    print()
+    print("=" * 60)
+    print(f"{'mode':<14} {'policy':<9} {'affinity':<9} {'spin':>6} {'workers':>7} {'p50(ms)':>10} "
+          f"{'p90(ms)':>10} {'FPS':>8}")
+    for c in sorted(configs, key=lambda c: score(c, args.objective)):
+        flag = ''
+        if c is best:
+            flag = '  <- 最优'
+        elif c['checksum'] != reference:
+            flag = '  ! 输出与串行不一致，已剔除'
+        lat = c['latency_ms']
+        spin = '-' if c['wait_spin'] is None else c['wait_spin']
+        print(f"{c['mode']:<14} {c['ready_policy']:<9} {c['affinity']:<9} {spin:>6} {c['workers']:>7} "
+              f"{lat['p50']:>10.2f} {lat['p90']:>10.2f} {c['throughput_fps']:>8.2f}{flag}")
+    print("=" * 60)
+
+    write_config(output, best, configs[0], args.objective)
+    print(f"    -> {output}")
+    print("    运行时从当前目录读取 tvmrt.conf（或 TVMRT_CONFIG 指定的路径），环境变量可覆盖")
+
+    if args.json:
+        summary = {
+            'model': serial['model'],
+            'objective': args.objective,
+            'streams': args.streams,
+            'iterations': args.iterations,
+            'warmup': args.warmup,
+            'cpu_count': os.cpu_count(),
+            'best': best,
+            'configs': configs,
+        }
+        with open(args.json, 'w') as f:
+            json.dump(summary, f, indent=2)
+            f.write('\n')
+        print(f"    -> {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,17 +8,53 @@
 3. 合并代码到 src/lib1.c
 4. 编译生成可执行文件
 
+构建是增量的：每个生成阶段对其输入（init/ 源文件、脚本、运行时模板、选项）计算内容哈希，
+记录在 build/.build_state.json 中，输入未变化且输出齐全时跳过该阶段；各脚本只在内容变化时
+重写输出文件，make 据时间戳只重编译受影响的目标文件。
+
 使用方法:
-    python3 scripts/build_scheduler.py [--serial]
+    python3 scripts/build_scheduler.py [--serial] [--shared-scratch] [--trace] [--tile-count N]
+                                       [--static-workers N] [--coarsen-max-share F]
+                                       [--memory-plan parallel|serial|tvm]
+                                       [--kernel-units N] [--kernel-hints] [--simd-pragma ivdep|omp]
+                                       [--weights-blob] [-j N] [--force] [--clean]
     
 选项:
-    --serial  仅生成串行调度（不含 DAG 调度器）
+    --serial          仅生成串行调度（不含 DAG 调度器）
+    --shared-scratch  内核 scratch 保留在共享 workspace（不使用每 Worker 私有 arena）
+    --tile-count N    重算子的算子内分块数（默认 4，1 表示不分块）
+    --static-workers N  离线静态调度的 Worker 数（默认 4，0 表示不生成）
+    --coarsen-max-share F  线性链合并为超实体时的最大代价占比（默认 1.0 即整条链合并，0 表示不合并）
+    --memory-plan P   workspace 布局：parallel（默认，任意并行调度安全）/ serial（更小，补边降低并行度）/ tvm（原始偏移）
+    --trace           开启算子级执行追踪（make TRACE=1），退出时写出 Chrome trace JSON
+    --kernel-units N  算子实现拆分成的编译单元数（默认 8，0 表示每个内核一个文件）
+    --kernel-hints    内核源码加 restrict / 对齐 / 最内层循环向量化 pragma（对比报告见
+                      merge_scheduler_code.py --vec-report）
+    --simd-pragma P   --kernel-hints 使用的循环 pragma：ivdep（默认）/ omp
+    --weights-blob    常量抽取到 <model>_weights.bin，运行时只读 mmap（不再编译进 lib0.c）
+    -j N              make 并行编译任务数（默认 CPU 核数）
+    --force           忽略阶段哈希，重新运行全部生成阶段
+    --clean           编译前先 make clean（完全重编译）
 """
 
 import os
 import sys
+import json
+import hashlib
 import subprocess
 import argparse
+from typing import Dict, List
+
+# 阶段哈希记录（build/ 不入库）
+BUILD_STATE_FILE = os.path.join('build', '.build_state.json')
+
+# operator_staticizer.py 的输出
+GENERATED_FILES = ['entity_generated.c', 'dag_schedule_generated.c', 'entities_generated.c',
+                   'op_cost_generated.json']
+
+# merge_scheduler_code.py 的输出（src/kernels_NN.c 的个数随 --kernel-units 变化，不逐一检查）
+MERGED_FILES = ['src/lib0.c', 'src/lib1.c', 'Makefile', 'test/test_main.c']
+
 
 def run_command(cmd: list, cwd: str = None) -> int:
     """运行命令并返回退出码"""
@@ -26,9 +62,77 @@ def run_command(cmd: list, cwd: str = None) -> int:
     result = subprocess.run(cmd, cwd=cwd)
     return result.returncode
 
+
+def hash_inputs(project_root: str, paths: List[str], options: list) -> str:
+    """对阶段输入文件内容（按相对路径）与选项计算 SHA-256"""
+    h = hashlib.sha256()
+    for rel in paths:
+        h.update(rel.encode() + b'\0')
+        path = os.path.join(project_root, rel)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        else:
+            h.update(b'<missing>')
+        h.update(b'\0')
+    h.update(json.dumps(options).encode())
+    return h.hexdigest()
+
+
+def load_build_state(project_root: str) -> Dict[str, str]:
+    path = os.path.join(project_root, BUILD_STATE_FILE)
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_build_state(project_root: str, state: Dict[str, str]):
+    path = os.path.join(project_root, BUILD_STATE_FILE)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def run_stage(project_root: str, state: Dict[str, str], name: str, cmd: list,
+              inputs: List[str], options: list, outputs: List[str], force: bool) -> int:
+    """输入哈希未变化且输出齐全时跳过阶段，否则运行并记录新哈希"""
+    digest = hash_inputs(project_root, inputs, options)
+    outputs_present = all(os.path.exists(os.path.join(project_root, p)) for p in outputs)
+    if not force and state.get(name) == digest and outputs_present:
+        print(f"    输入未变化，跳过 ({digest[:12]})")
+        return 0
+    state.pop(name, None)
+    ret = run_command(cmd, cwd=project_root)
+    if ret != 0:
+        save_build_state(project_root, state)
+        return ret
+    state[name] = digest
+    save_build_state(project_root, state)
+    return 0
+
 def main():
     parser = argparse.ArgumentParser(description='Scheduler-Worker 构建脚本')
     parser.add_argument('--serial', action='store_true', help='仅串行模式')
+    parser.add_argument('--shared-scratch', action='store_true', help='内核 scratch 不使用私有 arena')
+    parser.add_argument('--tile-count', type=int, help='重算子的算子内分块数（1 表示不分块）')
+    parser.add_argument('--memory-plan', choices=['parallel', 'serial', 'tvm'],
+                        help='workspace 中 sid 张量的布局')
+    parser.add_argument('--static-workers', type=int, help='离线静态调度的 Worker 数（0 表示不生成）')
+    parser.add_argument('--coarsen-max-share', type=float,
+                        help='线性链合并为超实体时的最大代价占比（0 表示不合并）')
+    parser.add_argument('--trace', action='store_true', help='开启算子级执行追踪')
+    parser.add_argument('--kernel-units', type=int, help='算子实现拆分成的编译单元数（0 表示每个内核一个文件）')
+    parser.add_argument('--kernel-hints', action='store_true',
+                        help='内核加 restrict / 对齐 / 向量化 pragma')
+    parser.add_argument('--simd-pragma', choices=['ivdep', 'omp'], help='--kernel-hints 的循环 pragma')
+    parser.add_argument('--weights-blob', action='store_true', help='常量抽取到权重文件由运行时 mmap')
+    parser.add_argument('-j', type=int, default=os.cpu_count() or 1, dest='jobs',
+                        help='make 并行编译任务数')
+    parser.add_argument('--force', action='store_true', help='忽略阶段哈希，重新生成')
+    parser.add_argument('--clean', action='store_true', help='编译前先 make clean')
     args = parser.parse_args()
     
     # 获取项目根目录
@@ -42,10 +146,26 @@ def main():
     print(f"模式: {'串行' if args.serial else '并行 (Scheduler-Worker)'}")
     print()
     
+    state = load_build_state(project_root)
+    model_name = os.path.basename(project_root)
+    
     # 1. 运行算子静态化脚本
     print("[1/3] 解析算子并生成调度数据结构 ...")
     staticizer_script = os.path.join(script_dir, 'operator_staticizer.py')
-    ret = run_command([sys.executable, staticizer_script], cwd=project_root)
+    staticizer_cmd = [sys.executable, staticizer_script]
+    if args.shared_scratch:
+        staticizer_cmd.append('--shared-scratch')
+    if args.tile_count is not None:
+        staticizer_cmd += ['--tile-count', str(args.tile_count)]
+    if args.memory_plan is not None:
+        staticizer_cmd += ['--memory-plan', args.memory_plan]
+    if args.static_workers is not None:
+        staticizer_cmd += ['--static-workers', str(args.static_workers)]
+    if args.coarsen_max_share is not None:
+        staticizer_cmd += ['--coarsen-max-share', str(args.coarsen_max_share)]
+    ret = run_stage(project_root, state, 'staticizer', staticizer_cmd,
+                    inputs=['init/lib1.c', 'scripts/operator_staticizer.py'],
+                    options=staticizer_cmd[2:], outputs=GENERATED_FILES, force=args.force)
     if ret != 0:
         print("错误: 算子静态化失败")
         return ret
@@ -53,15 +173,39 @@ def main():
     # 2. 运行合并脚本
     print("\n[2/3] 合并代码到 src/lib1.c ...")
     merge_script = os.path.join(script_dir, 'merge_scheduler_code.py')
-    ret = run_command([sys.executable, merge_script], cwd=project_root)
+    # 合并脚本复用 operator_staticizer.py 的解析/分块函数，故后者也是此阶段的输入
+    merge_cmd = [sys.executable, merge_script]
+    if args.kernel_units is not None:
+        merge_cmd += ['--kernel-units', str(args.kernel_units)]
+    if args.kernel_hints:
+        merge_cmd.append('--kernel-hints')
+        if args.simd_pragma is not None:
+            merge_cmd += ['--simd-pragma', args.simd_pragma]
+    merged_files = list(MERGED_FILES)
+    if args.weights_blob:
+        merge_cmd.append('--weights-blob')
+        merged_files.append(f'{model_name}_weights.bin')
+    ret = run_stage(project_root, state, 'merge', merge_cmd,
+                    inputs=['init/lib0.c', 'init/lib1.c', 'init/devc.c'] + GENERATED_FILES +
+                           ['scripts/merge_scheduler_code.py', 'scripts/operator_staticizer.py',
+                            'scripts/templates/scheduler_runtime.c'],
+                    options=[model_name] + merge_cmd[2:], outputs=merged_files, force=args.force)
     if ret != 0:
         print("错误: 代码合并失败")
         return ret
     
     # 3. 编译
     print("\n[3/3] 编译 ...")
-    ret = run_command(['make', 'clean'], cwd=project_root)
-    ret = run_command(['make'], cwd=project_root)
+    if args.clean:
+        ret = run_command(['make', 'clean'], cwd=project_root)
+        if ret != 0:
+            print("错误: make clean 失败")
+            return ret
+        save_build_state(project_root, state)  # make clean 删除了 build/，重新写回阶段记录
+    make_cmd = ['make', f'-j{args.jobs}']
+    if args.trace:
+        make_cmd.append('TRACE=1')
+    ret = run_command(make_cmd, cwd=project_root)
     if ret != 0:
         print("错误: 编译失败")
         return ret
@@ -71,10 +215,29 @@ def main():
     print("  ✅ 构建完成")
     print("=" * 60)
     print()
-    model_name = os.path.basename(project_root)
     print("运行测试:")
     print(f"  串行模式: TVMRT_NUM_WORKERS=0 ./build/{model_name}_test")
     print(f"  并行模式: TVMRT_NUM_WORKERS=3 ./build/{model_name}_test")
+    print(f"  Work-stealing: TVMRT_SCHED_MODE=work_stealing TVMRT_NUM_WORKERS=3 ./build/{model_name}_test")
+    print(f"  静态调度: TVMRT_SCHED_MODE=static ./build/{model_name}_test"
+          f"  (Worker 数固定为 --static-workers，默认 4，不受 TVMRT_NUM_WORKERS 影响)")
+    print(f"  绑核（每物理核一个 Worker）: TVMRT_AFFINITY=cores TVMRT_NUM_WORKERS=3 ./build/{model_name}_test")
+    print(f"  FIFO 派发对比: TVMRT_READY_POLICY=fifo TVMRT_NUM_WORKERS=3 ./build/{model_name}_test")
+    print(f"  Worker 数扫描: ./build/{model_name}_test -n 20 -w 3 -s 0,1,2,4 -j bench.json")
+    print("  模式对比: python3 scripts/run_benchmark.py --workers 1,2,4")
+    print("  自动调优: python3 scripts/autotune.py --objective latency  (写出 tvmrt.conf，运行时启动时读取)")
+    print("  加速比预测: python3 scripts/dag_simulator.py --serial-ms <串行延迟> --max-workers 8")
+    print(f"  多路并发: TVMRT_NUM_WORKERS=4 ./build/{model_name}_test -n 10 -c 4")
+    print(f"  异步流水线: TVMRT_NUM_WORKERS=4 ./build/{model_name}_test -n 10 -q 3")
+    print(f"  Python 绑定: PYTHONPATH=python python3 -c 'import tvmrt; print(tvmrt.Runtime().benchmark(streams=2))'"
+          f"  (加载 build/lib/lib{model_name}.so)")
+    if args.weights_blob:
+        print(f"  常量权重: {model_name}_weights.bin（构建时的绝对路径；移动后用 TVMRT_WEIGHTS=<路径> 指定，"
+              f"TVMRT_WEIGHTS_POPULATE=1 预读入）")
+    if args.trace:
+        print(f"  执行追踪: TVMRT_TRACE_FILE=trace.json TVMRT_NUM_WORKERS=3 ./build/{model_name}_test"
+              f"  (用 chrome://tracing 或 ui.perfetto.dev 打开)")
+        print("  追踪分析: python3 scripts/trace_analyzer.py trace.json --csv trace_ops.csv")
     
     return 0
 
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+离散事件模拟 - 预测给定 Worker 数下的 DAG 加速比
+
+读取 dag_schedule_generated.c 的 DAG 表（g_successors / g_initial_indegrees）与算子代价表
+（operator_staticizer.py 的静态估计 op_cost_generated.json，或 trace_analyzer.py --costs-out
+导出的实测代价），对 1..N 个 Worker 模拟运行时的各调度策略，报告预测的 makespan、
+相对串行的加速比与 Worker 利用率曲线，用于在新机器上部署前判断多少个 Worker 值得使用。
+
+模拟的策略（与 scheduler_runtime.c 对应）:
+    closed_loop       Scheduler 线程 + Ready Queue，按 priority（关键路径名次）派发（默认）
+    closed_loop_fifo  同上，按就绪先后派发（TVMRT_READY_POLICY=fifo）
+    work_stealing     完成者原子递减后继入度并推入自己的双端队列，空闲 Worker 窃取
+    static            离线 HEFT 列表调度序列（按各 Worker 数重新计算），自旋等待前驱
+
+开销模型（us）:
+    --edge-us      每条依赖边的处理开销：递减后继入度并放行。闭环模式下由单个 Scheduler
+                   线程串行处理，其余模式由完成该算子的 Worker 承担
+    --dispatch-us  就绪任务被空闲 Worker 取走（唤醒 / 出队 / 窃取）的延迟；
+                   work_stealing 弹出自己队列与 static 按序执行不计此项
+    两者可参考 trace_analyzer.py 报告的“调度延迟”中位数标定
+
+使用方法:
+    python3 scripts/dag_simulator.py [--dag FILE] [--costs FILE] [--serial-ms T] [--max-workers N]
+                                     [--policies LIST] [--edge-us X] [--dispatch-us X] [--json FILE]
+
+选项:
+    --dag FILE         DAG 表（默认项目根目录下的 dag_schedule_generated.c）
+    --costs FILE       代价表（默认 op_cost_generated.json；实测代价 JSON 带 "unit": "us"）
+    --serial-ms T      把代价按串行总时间 T ms 归一化（静态估计无时间单位，默认 1000）
+    --max-workers N    模拟 1..N 个 Worker（默认 8）
+    --policies LIST    逗号分隔的策略（默认全部）
+    --edge-us X        每条依赖边的开销（默认 1.0）
+    --dispatch-us X    每次派发的延迟（默认 5.0）
+    --efficiency X     推荐 Worker 数：makespan 在最优值 (1+X) 倍以内的最小 Worker 数（默认 0.05）
+    --json FILE        写出各策略的曲线（JSON）
+"""
+
+import os
+import sys
+import json
+import heapq
+import argparse
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional
+
+from operator_staticizer import (
+    DAGInfo, compute_bottom_levels, compute_priorities, list_schedule, load_op_costs
+)
+from trace_analyzer import parse_dag_tables
+
+POLICIES = ('closed_loop', 'closed_loop_fifo', 'work_stealing', 'static')
+
+# 静态估计代价没有时间单位，默认按此串行总时间归一化
+DEFAULT_SERIAL_MS = 1000.0
+
+
+# ============================================================
+# 数据结构定义
+# ============================================================
+
+@dataclass
+class SimResult:
+    """一次模拟的结果（时间单位 us）"""
+    policy: str
+    workers: int
+    makespan: float
+    speedup: float          # 串行总时间 / makespan
+    utilization: float      # 算子执行时间之和 / (workers x makespan)
+
+
+@dataclass
+class SimConfig:
+    edge_us: float
+    dispatch_us: float
+
+
+# ============================================================
+# 代价表
+# ============================================================
+
+def load_costs_us(path: str, num_ops: int, serial_ms: Optional[float]) -> List[float]:
+    """读取代价表并换算为 us（实测代价直接使用，静态估计按串行总时间归一化）"""
+    with open(path, 'r') as f:
+        unit = json.load(f).get('unit')
+    costs = load_op_costs(path, num_ops)
+    total = sum(costs)
+    if unit == 'us' and serial_ms is None:
+        return costs
+    target = (serial_ms if serial_ms is not None else DEFAULT_SERIAL_MS) * 1000.0
+    return [c * target / total for c in costs] if total else costs
+
+
+# ============================================================
+# 各调度策略的模拟
+# ============================================================
+
+def simulate_closed_loop(dag: DAGInfo, costs: List[float], priorities: List[int],
+                         num_workers: int, cfg: SimConfig, fifo: bool) -> float:
+    """
+    闭环模式：Worker 从 Ready Queue 取任务；完成事件交给单个 Scheduler 线程，
+    后者逐条边递减入度，入度归零的后继依次进入 Ready Queue
+    """
+    indegree = [len(dag.predecessors[i]) for i in range(dag.num_ops)]
+    events = []             # (时间, 序号, 类型, 数据)
+    ready = []              # 优先级: (-priority, 序号, op)；FIFO: (序号, 0, op)
+    idle = list(range(num_workers))
+    seq = 0
+    sched_free = 0.0
+    makespan = 0.0
+
+    def push_event(t, kind, data):
+        nonlocal seq
+        heapq.heappush(events, (t, seq, kind, data))
+        seq += 1
+
+    for op in range(dag.num_ops):
+        if indegree[op] == 0:
+            push_event(0.0, 'ready', op)
+
+    while events:
+        t, _, kind, data = heapq.heappop(events)
+        if kind == 'ready':
+            key = (seq, 0, data) if fifo else (-priorities[data], seq, data)
+            seq += 1
+            heapq.heappush(ready, key)
+        else:
+            worker, op = data
+            idle.append(worker)
+            makespan = max(makespan, t)
+            start = max(sched_free, t)
+            for j, succ in enumerate(sorted(dag.successors[op])):
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    push_event(start + cfg.edge_us * (j + 1), 'ready', succ)
+            sched_free = start + cfg.edge_us * len(dag.successors[op])
+
+        # 空闲 Worker 取走就绪任务
+        idle.sort()
+        while idle and ready:
+            op = heapq.heappop(ready)[2]
+            worker = idle.pop(0)
+            push_event(t + cfg.dispatch_us + costs[op], 'finish', (worker, op))
+    return makespan
+
+
+def simulate_work_stealing(dag: DAGInfo, costs: List[float], priorities: List[int],
+                           num_workers: int, cfg: SimConfig) -> float:
+    """
+    Work-stealing：完成者递减后继入度，就绪后继按 priority 升序推入自己的队列，
+    自己 LIFO 弹出（先执行最关键的），其余空闲 Worker 从队首窃取
+    """
+    indegree = [len(dag.predecessors[i]) for i in range(dag.num_ops)]
+    deques: List[List[int]] = [[] for _ in range(num_workers)]
+    inject = [op for op in range(dag.num_ops) if indegree[op] == 0]
+    events = []             # (时间, 序号, Worker, 完成的算子或 -1)
+    idle = set()
+    seq = 0
+    makespan = 0.0
+
+    def push_event(t, worker, op):
+        nonlocal seq
+        heapq.heappush(events, (t, seq, worker, op))
+        seq += 1
+
+    def find_work(worker):
+        if deques[worker]:
+            return deques[worker].pop(), 0.0
+        if inject:
+            return inject.pop(0), cfg.dispatch_us
+        for k in range(1, num_workers):
+            victim = deques[(worker + k) % num_workers]
+            if victim:
+                return victim.pop(0), cfg.dispatch_us
+        return None, 0.0
+
+    def start_work(t, worker):
+        op, delay = find_work(worker)
+        if op is None:
+            idle.add(worker)
+            return
+        push_event(t + delay + costs[op], worker, op)
+
+    for worker in range(num_workers):
+        push_event(0.0, worker, -1)
+
+    while events:
+        t, _, worker, op = heapq.heappop(events)
+        if op >= 0:
+            makespan = max(makespan, t)
+            succs = sorted(dag.successors[op])
+            released = []
+            for succ in succs:
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    released.append(succ)
+            released.sort(key=lambda s: priorities[s])
+            deques[worker].extend(released)
+            t += cfg.edge_us * len(succs)
+            # 自己取走一个，多出的唤醒其他空闲 Worker
+            for other in sorted(idle)[:max(len(released) - 1, 0)]:
+                idle.discard(other)
+                start_work(t, other)
+        start_work(t, worker)
+    return makespan
+
+
+def simulate_static(dag: DAGInfo, costs: List[float], num_workers: int,
+                    cfg: SimConfig) -> float:
+    """静态调度：各 Worker 按 HEFT 序列依次执行，前驱完成（含边开销）后立即开始"""
+    schedule = list_schedule(dag, costs, num_workers)
+    ready_at = [0.0] * dag.num_ops      # 最后一个前驱递减入度的时刻
+    remaining = [len(dag.predecessors[i]) for i in range(dag.num_ops)]
+    pos = [0] * schedule.num_workers
+    free = [0.0] * schedule.num_workers
+    makespan = 0.0
+    progress = True
+    while progress:
+        progress = False
+        for w, seq in enumerate(schedule.sequences):
+            while pos[w] < len(seq) and remaining[seq[pos[w]]] == 0:
+                op = seq[pos[w]]
+                finish = max(free[w], ready_at[op]) + costs[op]
+                makespan = max(makespan, finish)
+                for j, succ in enumerate(sorted(dag.successors[op])):
+                    remaining[succ] -= 1
+                    ready_at[succ] = max(ready_at[succ], finish + cfg.edge_us * (j + 1))
+                free[w] = finish + cfg.edge_us * len(dag.successors[op])
+                pos[w] += 1
+                progress = True
+    if any(p < len(seq) for p, seq in zip(pos, schedule.sequences)):
+        raise ValueError("静态调度序列存在循环等待")
+    return makespan
+
+
+def simulate(policy: str, dag: DAGInfo, costs: List[float], priorities: List[int],
+             num_workers: int, cfg: SimConfig) -> SimResult:
+    if policy == 'closed_loop':
+        makespan = simulate_closed_loop(dag, costs, priorities, num_workers, cfg, fifo=False)
+    elif policy == 'closed_loop_fifo':
+        makespan = simulate_closed_loop(dag, costs, priorities, num_workers, cfg, fifo=True)
+    elif policy == 'work_stealing':
+        makespan = simulate_work_stealing(dag, costs, priorities, num_workers, cfg)
+    elif policy == 'static':
+        makespan = simulate_static(dag, costs, num_workers, cfg)
+    else:
+        raise ValueError(f"未知策略: {policy}")
+    work = sum(costs)
+    return SimResult(
+        policy=policy,
+        workers=num_workers,
+        makespan=makespan,
+        speedup=work / makespan if makespan else 0.0,
+        utilization=work / (num_workers * makespan) if makespan else 0.0,
+    )
+
+
+def recommend_workers(results: List[SimResult], efficiency: float) -> SimResult:
+    """makespan 在最优值 (1 + efficiency) 倍以内的最小 Worker 数"""
+    best = min(r.makespan for r in results)
+    return min((r for r in results if r.makespan <= best * (1.0 + efficiency)),
+               key=lambda r: r.workers)
+
+
+# ============================================================
+# 主函数
+# ============================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='DAG 调度离散事件模拟')
+    parser.add_argument('--dag', help='DAG 表（默认 dag_schedule_generated.c）')
+    parser.add_argument('--costs', help='代价表（默认 op_cost_generated.json）')
+    parser.add_argument('--serial-ms', type=float, help='按串行总时间归一化代价（ms）')
+    parser.add_argument('--max-workers', type=int, default=8, help='模拟的最大 Worker 数')
+    parser.add_argument('--policies', default=','.join(POLICIES), help='逗号分隔的调度策略')
+    parser.add_argument('--edge-us', type=float, default=1.0, help='每条依赖边的开销（us）')
+    parser.add_argument('--dispatch-us', type=float, default=5.0, help='每次派发的延迟（us）')
+    parser.add_argument('--efficiency', type=float, default=0.05, help='推荐 Worker 数的容差')
+    parser.add_argument('--json', help='曲线 JSON 输出路径')
+    args = parser.parse_args()
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    dag_path = args.dag or os.path.join(project_root, 'dag_schedule_generated.c')
+    costs_path = args.costs or os.path.join(project_root, 'op_cost_generated.json')
+    policies = [p.strip() for p in args.policies.split(',') if p.strip()]
+    unknown = [p for p in policies if p not in POLICIES]
+    if unknown:
+        print(f"错误: 未知策略 {unknown}（可选: {', '.join(POLICIES)}）")
+        return 1
+
+    dag = parse_dag_tables(dag_path)
+    costs = load_costs_us(costs_path, dag.num_ops, args.serial_ms)
+    priorities = compute_priorities(dag, costs)
+    cfg = SimConfig(edge_us=args.edge_us, dispatch_us=args.dispatch_us)
+
+    work = sum(costs)
+    cp_length = max(compute_bottom_levels(dag, costs), default=0.0)
+    edges = sum(len(s) for s in dag.successors.values())
+    print(f"[dag_simulator] DAG: {dag_path} ({dag.num_ops} 个算子, {edges} 条边)")
+    print(f"[dag_simulator] 代价: {costs_path}（串行总时间 {work / 1000:.3f} ms）")
+    print(f"[dag_simulator] 开销: 每边 {cfg.edge_us} us, 每次派发 {cfg.dispatch_us} us")
+    print(f"[dag_simulator] 关键路径下界 {cp_length / 1000:.3f} ms，"
+          f"可用并行度 (work/cp) {work / cp_length if cp_length else 0:.2f}")
+
+    curves: Dict[str, List[SimResult]] = {}
+    for policy in policies:
+        results = [simulate(policy, dag, costs, priorities, n, cfg)
+                   for n in range(1, args.max_workers + 1)]
+        curves[policy] = results
+        best = recommend_workers(results, args.efficiency)
+        print(f"\n== {policy} ==")
+        print(f"  {'workers':>7} {'makespan(ms)':>13} {'speedup':>8} {'util':>6}")
+        for r in results:
+            mark = '  <- 推荐' if r is best else ''
+            print(f"  {r.workers:>7} {r.makespan / 1000:>13.3f} {r.speedup:>7.2f}x "
+                  f"{r.utilization * 100:>5.1f}%{mark}")
+
+    print("\n== 汇总 ==")
+    for policy, results in curves.items():
+        best = recommend_workers(results, args.efficiency)
+        top = max(results, key=lambda r: r.speedup)
+        print(f"  {policy:<17} 最高 {top.speedup:.2f}x ({top.workers} Worker)，"
+              f"推荐 {best.workers} 个 Worker（{best.speedup:.2f}x，利用率 {best.utilization * 100:.1f}%）")
+
+    if args.json:
+        report = {
+            'dag': dag_path,
+            'costs': costs_path,
+            'op_count': dag.num_ops,
+            'serial_us': work,
+            'critical_path_us': cp_length,
+            'edge_us': cfg.edge_us,
+            'dispatch_us': cfg.dispatch_us,
+            'policies': {
+                policy: {
+                    'recommended_workers': recommend_workers(results, args.efficiency).workers,
+                    'curve': [asdict(r) for r in results],
+                }
+                for policy, results in curves.items()
+            },
+        }
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\n    -> {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
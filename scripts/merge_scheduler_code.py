@@ -5,17 +5,58 @@
 此脚本：
 1. 从 init/ 复制原始 lib0.c 和 lib1.c 到 src/
 2. 修改 lib1.c 头部，添加运行时类型定义
-3. 提取算子函数实现（保留）
-4. 替换 tvmgen_default___tvm_main__ 函数为新的入口
+3. 提取算子函数实现（保留），按源码量均衡分组写入 src/kernels_NN.c 编译单元
+4. 替换 tvmgen_default___tvm_main__ 函数为新的入口（与运行时一起留在 src/lib1.c）
+
+算子实现与运行时分属不同的编译单元，make -j 可并行编译；只改运行时模板时仅重编译 lib1.o。
 
 使用方法:
-    python3 scripts/merge_scheduler_code.py
+    python3 scripts/merge_scheduler_code.py [--kernel-units N] [--kernel-hints] [--simd-pragma ivdep|omp]
+                                            [--vec-report FILE] [--weights-blob [FILE]]
+
+选项:
+    --kernel-units N  算子实现拆分成的编译单元数（默认 8，0 表示每个内核一个文件）
+    --kernel-hints    源码改写：不别名的指针参数加 restrict，*_let 加 __builtin_assume_aligned，
+                      写下标关于循环变量仿射（系数为非零常数）的最内层循环加 #pragma GCC ivdep（或 omp simd）
+    --simd-pragma P   最内层循环的 pragma：ivdep（默认）/ omp（#pragma omp simd，CFLAGS 加 -fopenmp-simd）
+    --vec-report FILE 编译加提示前后的算子实现，按 -fopt-info-vec 统计每个内核向量化的循环，写出 JSON
+    --weights-blob [FILE]
+                      常量（global_const_workspace）抽取到二进制权重文件（默认 <model>_weights.bin），
+                      lib0.c 不再含常量数组，运行时只读 mmap（多进程共享页缓存）
 """
 
 import os
 import re
+import ast
 import sys
+import glob
+import argparse
+import filecmp
 import shutil
+import json
+import zlib
+import struct
+import tempfile
+import subprocess
+
+from operator_staticizer import (
+    parse_kernel_functions, plan_scratch_arena, make_tiled_kernel, _extract_function_body,
+    _match_bracket, parse_main_function, write_if_changed, MODEL_INPUT, MODEL_OUTPUT
+)
+
+# 算子实现默认拆分成的编译单元数
+KERNEL_UNITS = 8
+
+# 算子实现编译单元的文件头（内核只依赖这些头文件与 expf 等数学函数）
+KERNEL_UNIT_PRELUDE = [
+    "// tvm target: c -keys=cpu",
+    "#define TVM_DLL",
+    "#define TVM_EXPORTS",
+    "#include <stdint.h>",
+    "#include <math.h>",
+    "#include <stdbool.h>",
+]
+
 
 def copy_init_to_src(project_root: str):
     """从 init/ 复制源文件到 src/"""
@@ -24,20 +65,22 @@ def copy_init_to_src(project_root: str):
     
     os.makedirs(src_dir, exist_ok=True)
     
-    files_to_copy = ['lib0.c', 'lib1.c', 'devc.c']
+    # lib0.c / lib1.c 由后续步骤从 init/ 直接生成，不经复制，避免每次刷新时间戳
+    files_to_copy = ['devc.c']
     for fname in files_to_copy:
         src_file = os.path.join(init_dir, fname)
         dst_file = os.path.join(src_dir, fname)
-        if os.path.exists(src_file):
-            shutil.copy2(src_file, dst_file)
-            print(f"    复制: {fname}")
+        if not os.path.exists(src_file):
+            continue
+        if os.path.exists(dst_file) and filecmp.cmp(src_file, dst_file, shallow=False):
+            print(f"    未变化: {fname}")
+            continue
+        shutil.copy2(src_file, dst_file)
+        print(f"    复制: {fname}")
 
 
-def modify_lib0_header(lib0_path: str):
-    """修改 lib0.c 头部以去除 TVM 依赖"""
-    with open(lib0_path, 'r') as f:
-        content = f.read()
-    
+def rewrite_lib0(content: str) -> str:
+    """去除 lib0.c 的 TVM 依赖：替换头文件、移除 section 属性与 static、移走 tvmgen_default_run"""
     # 替换 TVM 头文件
     old_header = '#include "tvm/runtime/c_runtime_api.h"'
     new_header = '#define TVM_DLL\n#include <stdint.h>'
@@ -74,9 +117,137 @@ def modify_lib0_header(lib0_path: str):
 struct tvmgen_default_outputs { void* output; };''',
         content
     )
-    
-    with open(lib0_path, 'w') as f:
-        f.write(content)
+    return content
+
+
+def modify_lib0_header(init_lib0_path: str, lib0_path: str, strip_consts: bool = False) -> bool:
+    """
+    修改 lib0.c 头部以去除 TVM 依赖（读取 init/ 原文件，内容变化时才写入 src/）
+
+    strip_consts 时去掉常量定义，由运行时从常量权重文件 mmap（--weights-blob）
+    """
+    with open(init_lib0_path, 'r') as f:
+        content = rewrite_lib0(f.read())
+    if strip_consts:
+        content = strip_const_workspace(content)
+    return write_if_changed(lib0_path, content)
+
+
+# ============================================================
+# 常量权重文件（--weights-blob）
+# ============================================================
+# global_const_workspace 不再编译进 lib0.c，而是抽取成二进制文件，运行时只读 mmap：
+#   文件头 64 字节（小端）: magic | version | header_size | data_offset | data_size | crc32 | 保留 | 模型名
+#   填充到 data_offset（页对齐，映射后常量区与原数组一样至少 16 字节对齐）
+#   data_size 字节常量（与 sizeof(global_const_workspace) 逐字节一致）
+# data_size 与 crc32 同时编译进 lib1.c，运行时据此拒绝与本次构建不匹配的文件
+
+WEIGHTS_MAGIC = b'TVMRTWB\0'
+WEIGHTS_VERSION = 1
+WEIGHTS_HEADER = struct.Struct('<8sIIQQII24s')
+WEIGHTS_DATA_OFFSET = 4096
+
+WEIGHTS_DUMP_MAIN = '''
+#include <stdio.h>
+int main(void) {
+  // 常量可能由静态初始化器或构造函数给出，运行到 main 时均已就绪
+  fwrite(&global_const_workspace, 1, sizeof(global_const_workspace), stdout);
+  return 0;
+}
+'''
+
+
+def _top_level_item_end(content: str, start: int) -> int:
+    """从 start 开始的顶层声明/函数定义的结束位置（函数止于函数体的 '}'，其余止于顶层 ';'）"""
+    depth = 0
+    is_function = None
+    for pos in range(start, len(content)):
+        ch = content[pos]
+        if ch == '{':
+            if depth == 0 and is_function is None:
+                is_function = content[start:pos].rstrip().endswith(')')
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0 and is_function:
+                return pos + 1
+        elif ch == ';' and depth == 0:
+            return pos + 1
+    raise ValueError("lib0.c 顶层声明不完整")
+
+
+def strip_const_workspace(content: str) -> str:
+    """删除 global_const_workspace 的定义（结构体 + 初始化器或数组）以及引用它的函数（如填充常量的构造函数）"""
+    first = None
+    while True:
+        match = re.search(r'\bglobal_const_workspace\b', content)
+        if not match:
+            break
+        start = [m.start() for m in re.finditer(r'(?m)^[A-Za-z_]', content[:match.start() + 1])][-1]
+        end = _top_level_item_end(content, start)
+        if content.startswith('\n', end):
+            end += 1
+        content = content[:start] + content[end:]
+        first = start if first is None else min(first, start)
+    if first is None:
+        return content
+    note = "// global_const_workspace 由运行时从常量权重文件 mmap（TVMRT_WEIGHTS_MMAP）\n"
+    return content[:first] + note + content[first:]
+
+
+def dump_const_workspace(lib0_content: str) -> bytes:
+    """编译并运行 lib0.c + 导出 main，取得 global_const_workspace 的原始字节"""
+    cc = os.environ.get('CC', 'cc')
+    with tempfile.TemporaryDirectory() as tmp:
+        src_path = os.path.join(tmp, 'weights_dump.c')
+        bin_path = os.path.join(tmp, 'weights_dump')
+        with open(src_path, 'w') as f:
+            f.write(lib0_content + WEIGHTS_DUMP_MAIN)
+        cmd = [cc, '-O0', '-w', src_path, '-o', bin_path]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"编译失败: {' '.join(cmd)}\n{result.stderr[-2000:]}")
+        return subprocess.run([bin_path], capture_output=True, check=True).stdout
+
+
+def read_weights_header(path: str):
+    """读取常量权重文件头，格式不符时返回 None"""
+    with open(path, 'rb') as f:
+        raw = f.read(WEIGHTS_HEADER.size)
+    if len(raw) != WEIGHTS_HEADER.size:
+        return None
+    magic, version, header_size, data_offset, data_size, crc, _, model = WEIGHTS_HEADER.unpack(raw)
+    if magic != WEIGHTS_MAGIC or version != WEIGHTS_VERSION or header_size != WEIGHTS_HEADER.size:
+        return None
+    if os.path.getsize(path) != data_offset + data_size:
+        return None
+    return {'data_offset': data_offset, 'size': data_size, 'crc32': crc,
+            'model': model.rstrip(b'\0').decode()}
+
+
+def write_weights_blob(init_lib0_path: str, blob_path: str, model_name: str) -> dict:
+    """
+    抽取 lib0.c 的常量写成权重文件，返回 {path, size, crc32, changed}
+
+    文件比 init/lib0.c 新且文件头完整时直接复用（常量抽取需编译整个 lib0.c）
+    """
+    if (os.path.exists(blob_path)
+            and os.path.getmtime(blob_path) >= os.path.getmtime(init_lib0_path)):
+        header = read_weights_header(blob_path)
+        if header and header['model'] == model_name:
+            return dict(header, path=blob_path, changed=False)
+
+    with open(init_lib0_path, 'r') as f:
+        data = dump_const_workspace(rewrite_lib0(f.read()))
+    crc = zlib.crc32(data) & 0xffffffff
+    header = WEIGHTS_HEADER.pack(WEIGHTS_MAGIC, WEIGHTS_VERSION, WEIGHTS_HEADER.size,
+                                 WEIGHTS_DATA_OFFSET, len(data), crc, 0, model_name.encode())
+    tmp_path = blob_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header.ljust(WEIGHTS_DATA_OFFSET, b'\0'))
+        f.write(data)
+    os.replace(tmp_path, blob_path)
+    return {'path': blob_path, 'size': len(data), 'crc32': crc, 'changed': True}
 
 
 def read_generated_files(project_root: str):
@@ -140,17 +311,469 @@ def extract_operator_implementations(lib1_content: str) -> str:
     return implementations
 
 
+def relocate_kernel_scratch(operators_impl: str, layouts: dict) -> str:
+    """
+    将内核内部的 workspace *_let 重定位到私有 scratch arena
+
+    形如 void* data_pad_let = (&(global_workspace_5_var[13148224]));
+    的偏移替换为 arena 内偏移；运行时对每个 Worker 传入各自的 arena 作为 ws 参数
+    """
+    def_pattern = r'TVM_DLL\s+int32_t\s+(tvmgen_default_fused_[a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{'
+    let_pattern = r'(void\*\s+(\w+)\s*=\s*\(\&\(global_workspace_\d+_var\[)(\d+)(\]\)\);)'
+
+    matches = list(re.finditer(def_pattern, operators_impl))
+    pieces = [operators_impl[:matches[0].start()] if matches else operators_impl]
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(operators_impl)
+        segment = operators_impl[match.start():end]
+        layout = layouts.get(match.group(1), {})
+
+        def rebind(let_match):
+            offset = layout.get(let_match.group(2))
+            if offset is None:
+                return let_match.group(0)
+            return f"{let_match.group(1)}{offset}{let_match.group(4)}"
+
+        pieces.append(re.sub(let_pattern, rebind, segment))
+    return ''.join(pieces)
+
+
+def append_tiled_kernels(operators_impl: str, func_names: list) -> str:
+    """
+    为分块实体生成 <func>_tiled 内核（在 scratch 重定位之后复制，继承 arena 偏移）
+    """
+    tiled_sources = []
+    for func_name in func_names:
+        match = re.search(rf'TVM_DLL\s+int32_t\s+{func_name}\s*\([^)]*\)\s*\{{', operators_impl)
+        if match is None:
+            raise ValueError(f"找不到内核定义: {func_name}")
+        body = _extract_function_body(operators_impl, match.end())
+        func_src = operators_impl[match.start():match.end() + len(body) + 1]
+        tiled_sources.append(make_tiled_kernel(func_src, func_name))
+    return operators_impl.rstrip('\n') + '\n\n' + '\n\n'.join(tiled_sources) + '\n'
+
+# ============================================================
+# 内核向量化提示（--kernel-hints）
+# ============================================================
+
+# 基址对齐：常量 workspace 为 TVM 生成的 aligned(16)，私有 scratch arena 为 64 字节对齐；
+# 共享 scratch 时 *_let 位于 workspace 内，按两种入口中较小的 16 字节计
+CWS_ALIGN = 16
+ARENA_ALIGN = 64
+SHARED_WS_ALIGN = 16
+SIMD_PRAGMAS = {'ivdep': '#pragma GCC ivdep', 'omp': '#pragma omp simd'}
+SIMD_CFLAGS = {'ivdep': '', 'omp': '-fopenmp-simd'}
+
+KERNEL_DEF_PATTERN = r'TVM_DLL\s+int32_t\s+(tvmgen_default_fused_[a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{'
+LET_PATTERN = r'(void\*\s+\w+\s*=\s*)\((\&\(global_(const_)?workspace_\d+_var\[(\d+)\]\))\);'
+INNER_LOOP_PATTERN = r'(?m)^([ \t]*)for \(int32_t (\w+) = (-?\d+); \2 < (-?\d+); \+\+\2\) \{'
+ACCESS_PATTERN = r'\(\(float\*\)(\w+)\)\[|\b(\w+)\['
+
+
+def parse_binding_offsets(entities_code: str) -> dict:
+    """从 entities_generated.c 的绑定表还原 sid 变量 -> workspace 字节偏移（即最终内存规划）"""
+    pattern = r'\.inputs = \{ ([^}]*) \}, \.outputs = \{ ([^}]*) \} \}, // \[\d+\] (.*?) -> (.*)'
+    offsets = {}
+    for match in re.finditer(pattern, entities_code):
+        values = [v.strip() for v in (match.group(1) + ',' + match.group(2)).split(',') if v.strip()]
+        names = [v.strip() for v in (match.group(3) + ',' + match.group(4)).split(',') if v.strip()]
+        for name, value in zip(names, values):
+            if re.fullmatch(r'\d+LL', value):
+                offsets[name] = int(value[:-2])
+    return offsets
+
+
+def plan_restrict_params(operators: list, kernels: dict, var_offsets: dict,
+                         private_scratch: bool) -> dict:
+    """
+    每个内核可加 restrict 的指针参数
+
+    每个调用点上，参数的读/写范围按实参映射到模型输入、模型输出或 workspace 字节区间；
+    参数与其它参数（共享 scratch 时还有 *_let）的访问范围在有写入的一方上互不相交才算不别名，
+    所有调用点都满足才加。常量 workspace 只读，总是加；私有 scratch arena 与上下文缓冲区是
+    不同的分配，私有 scratch 下 ws 参数也加
+    """
+    safe = {}
+    for name, kernel in kernels.items():
+        safe[name] = set(kernel.params[:-1])
+        if private_scratch:
+            safe[name].add(kernel.params[-1])
+
+    for op in operators:
+        kernel = kernels[op.func_name]
+        bases = {}
+        for param, arg in zip(kernel.params, op.all_params):
+            if arg in (MODEL_INPUT, MODEL_OUTPUT):
+                bases[param] = (arg, 0)
+            else:
+                bases[param] = ('ws', var_offsets[arg]) if arg in var_offsets else (None, 0)
+        if not private_scratch:
+            bases.update((let, ('ws', offset)) for let, offset in kernel.ws_lets.items())
+
+        regions = {}
+        for acc in kernel.accesses:
+            if acc.buffer in bases:
+                space, base = bases[acc.buffer]
+                regions.setdefault(acc.buffer, []).append(
+                    (space, base + acc.lo * 4, base + (acc.hi + 1) * 4, acc.is_write))
+
+        def conflict(a: list, b: list) -> bool:
+            return any((x[3] or y[3]) and (x[0] is None or y[0] is None or
+                                           (x[0] == y[0] and x[1] < y[2] and y[1] < x[2]))
+                       for x in a for y in b)
+
+        for param in kernel.params[:-2]:
+            mine = regions.get(param, [])
+            if bases.get(param, (None, 0))[0] is None or any(
+                    conflict(mine, other) for buf, other in regions.items() if buf != param):
+                safe[op.func_name].discard(param)
+    return safe
+
+
+def _affine_coefficient(node: ast.AST, var: str):
+    """
+    表达式中循环变量的系数：表达式须为「常数 × var」项与不含 var 的项之和，否则返回 None
+
+    var 出现在 /、%、三目、比较、函数调用或与非常数相乘之下时都不是仿射的；
+    不含 var 的子表达式对最内层循环是不变量，可以任意
+    """
+    def constant(n):
+        if isinstance(n, ast.Constant) and type(n.value) is int:
+            return n.value
+        if isinstance(n, ast.UnaryOp) and isinstance(n.op, (ast.USub, ast.UAdd)):
+            value = constant(n.operand)
+            return None if value is None else (-value if isinstance(n.op, ast.USub) else value)
+        if isinstance(n, ast.BinOp) and isinstance(n.op, (ast.Add, ast.Sub, ast.Mult)):
+            a, b = constant(n.left), constant(n.right)
+            if a is None or b is None:
+                return None
+            return a + b if isinstance(n.op, ast.Add) else a - b if isinstance(n.op, ast.Sub) else a * b
+        return None
+
+    if not any(isinstance(n, ast.Name) and n.id == var for n in ast.walk(node)):
+        return 0
+    if isinstance(node, ast.Name):
+        return 1
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        coef = _affine_coefficient(node.operand, var)
+        return None if coef is None else (-coef if isinstance(node.op, ast.USub) else coef)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+        a, b = _affine_coefficient(node.left, var), _affine_coefficient(node.right, var)
+        if a is None or b is None:
+            return None
+        return a + b if isinstance(node.op, ast.Add) else a - b
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+        for scale, other in ((constant(node.left), node.right), (constant(node.right), node.left)):
+            if scale is not None:
+                coef = _affine_coefficient(other, var)
+                return None if coef is None else scale * coef
+    return None
+
+
+def _index_injective(index: str, var: str) -> bool:
+    """下标表达式对循环变量单射：关于 var 仿射且系数为非零常数（C 三目等无法解析的表达式视为否）"""
+    try:
+        tree = ast.parse(index, mode='eval')
+    except SyntaxError:
+        return False
+    coef = _affine_coefficient(tree.body, var)
+    return coef is not None and coef != 0
+
+
+def inner_loop_vectorizable(var: str, body: str, may_alias) -> bool:
+    """
+    最内层循环能否安全地加 ivdep / omp simd：没有跨迭代的内存依赖
+
+    循环体只允许局部 int32_t/float 变量、if/else 与数组赋值；每个被写的缓冲区只用同一个
+    下标读写，且该下标关于循环变量仿射、系数为非零常数（因而单射）；被写的缓冲区与循环内
+    访问的其它缓冲区不别名
+    """
+    locals_ = {}
+    scalars = set()
+    store_lines = []
+    for line in (l.strip() for l in body.strip().split('\n')):
+        match = re.fullmatch(r'int32_t (\w+) = (.*);', line)
+        if match:
+            locals_[match.group(1)] = re.sub(
+                r'\b\w+\b', lambda m: f"({locals_[m.group(0)]})" if m.group(0) in locals_ else m.group(0),
+                match.group(2))
+            continue
+        match = re.fullmatch(r'float (\w+)(?: = .*)?;', line)
+        if match:
+            scalars.add(match.group(1))
+            continue
+        if line in ('}', '} else {') or re.fullmatch(r'if \(.*\) \{', line):
+            continue
+        match = re.fullmatch(r'(\w+) = .*;', line)
+        if match and match.group(1) in scalars:
+            continue
+        if re.match(ACCESS_PATTERN, line) and '] = ' in line:
+            store_lines.append(line)
+            continue
+        return False
+    if not store_lines:
+        return False
+
+    def expand(text: str) -> str:
+        return re.sub(r'\b\w+\b', lambda m: f"({locals_[m.group(0)]})" if m.group(0) in locals_ else m.group(0),
+                      text).replace(' ', '')
+
+    def accesses(text: str):
+        for match in re.finditer(ACCESS_PATTERN, text):
+            close = _match_bracket(text, match.end() - 1)
+            yield match.group(1) or match.group(2), expand(text[match.end():close])
+
+    stores = {}
+    for line in store_lines:
+        buffer, index = next(accesses(line))
+        if stores.setdefault(buffer, index) != index:
+            return False
+        if not re.search(rf'\b{var}\b', index) or not _index_injective(index, var):
+            return False
+    for buffer, index in accesses(body):
+        for written, store_index in stores.items():
+            if buffer == written and index != store_index:
+                return False
+            if buffer != written and may_alias(written, buffer):
+                return False
+    return True
+
+
+def add_kernel_hints(operators_impl: str, restrict: dict, private_scratch: bool,
+                     simd_pragma: str = 'ivdep'):
+    """
+    给内核源码加编译器提示，返回 (新源码, 统计)
+
+    1. 不别名的指针参数加 restrict（plan_restrict_params）
+    2. *_let 包一层 __builtin_assume_aligned（基址对齐与偏移的最大公共 2 的幂，至少 16 才加）
+    3. 无跨迭代依赖（写下标关于循环变量仿射且系数非零）的最内层循环前加 #pragma GCC ivdep（或 omp simd）
+    <func>_tiled 沿用 <func> 的分析结果
+    """
+    pragma = SIMD_PRAGMAS[simd_pragma]
+    ws_align = ARENA_ALIGN if private_scratch else SHARED_WS_ALIGN
+    stats = {'restrict_params': 0, 'pointer_params': 0, 'aligned_lets': 0,
+             'inner_loops': 0, 'pragma_loops': 0}
+
+    def align_let(match):
+        base = CWS_ALIGN if match.group(3) else ws_align
+        offset = int(match.group(4))
+        align = min(base, offset & -offset) if offset else base
+        if align < 16:
+            return match.group(0)
+        stats['aligned_lets'] += 1
+        return f"{match.group(1)}__builtin_assume_aligned({match.group(2)}, {align});"
+
+    matches = list(re.finditer(KERNEL_DEF_PATTERN, operators_impl))
+    pieces = [operators_impl[:matches[0].start()] if matches else operators_impl]
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(operators_impl)
+        name = match.group(1)
+        base_name = name[:-len('_tiled')] if name.endswith('_tiled') else name
+        noalias = restrict.get(base_name, set())
+
+        def qualify(param):
+            stats['pointer_params'] += 1
+            if param.group(2) not in noalias:
+                return param.group(0)
+            stats['restrict_params'] += 1
+            return f"{param.group(1)}* restrict {param.group(2)}"
+
+        header = re.sub(r'(\w+)\*\s+(\w+)', qualify, match.group(0))
+        segment = operators_impl[match.end():end]
+        lets = set(re.findall(r'void\*\s+(\w+)\s*=', segment))
+        cws_lets = set(re.findall(r'void\*\s+(\w+)\s*=\s*\(\&\(global_const_workspace', segment))
+        segment = re.sub(LET_PATTERN, align_let, segment)
+
+        def may_alias(written: str, other: str) -> bool:
+            if written in noalias or other in noalias or other in cws_lets:
+                return False
+            if written in lets and other in lets:
+                return False  # 同一内核内不同的 *_let 互不重叠（TVM 规划 / arena 顺序排布）
+            return not (private_scratch and (written in lets) != (other in lets))
+
+        inserts = []
+        for loop in re.finditer(INNER_LOOP_PATTERN, segment):
+            body = _extract_function_body(segment, loop.end())
+            if 'for (' in body:
+                continue
+            stats['inner_loops'] += 1
+            if inner_loop_vectorizable(loop.group(2), body, may_alias):
+                inserts.append(loop.start())
+        for pos in reversed(inserts):
+            indent = re.match(r'[ \t]*', segment[pos:]).group(0)
+            segment = segment[:pos] + indent + pragma + '\n' + segment[pos:]
+        stats['pragma_loops'] += len(inserts)
+        pieces.append(header + segment)
+    return ''.join(pieces), stats
+
+
+VEC_INFO_PATTERNS = [
+    ('vectorized', r'optimized: loop vectorized'),
+    ('versioned', r'optimized: +loop versioned for vectorization because of possible aliasing'),
+    ('library_calls', r'optimized: Loop \d+ distributed: split to \d+ loops and (\d+) library calls'),
+    ('slp', r'optimized: basic block part vectorized'),
+]
+
+
+def compile_vectorization_info(units: list, cflags: list) -> dict:
+    """
+    编译各单元，按 -fopt-info-vec-loop-optimized 统计每个内核的向量化情况：
+    vectorized（向量化的循环行号）、versioned（因可能别名而生成运行时检查的循环数）、
+    library_calls（循环分布成 memcpy/memset 的调用数）、slp（基本块向量化次数）
+    """
+    cc = os.environ.get('CC', 'cc')
+    info = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, unit in enumerate(units):
+            src = render_kernel_unit(unit)
+            src_path = os.path.join(tmp, f'kernels_{i:02d}.c')
+            log_path = src_path + '.vec'
+            with open(src_path, 'w') as f:
+                f.write(src)
+            cmd = [cc] + cflags + ['-fopt-info-vec-loop-optimized=' + log_path, '-c', src_path,
+                                   '-o', os.devnull]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"编译失败: {' '.join(cmd)}\n{result.stderr[-2000:]}")
+            # 行号 -> 所在内核
+            starts = [(src.count('\n', 0, m.start()) + 1, m.group(1))
+                      for m in re.finditer(KERNEL_DEF_PATTERN, src)]
+            with open(log_path, 'r') as f:
+                for line in f:
+                    match = re.match(r'[^:]+:(\d+):\d+: (.*)', line)
+                    if not match:
+                        continue
+                    lineno = int(match.group(1))
+                    owner = [name for start, name in starts if start <= lineno]
+                    if not owner:
+                        continue
+                    entry = info.setdefault(owner[-1], {'vectorized': [], 'versioned': 0,
+                                                        'library_calls': 0, 'slp': 0})
+                    for key, pattern in VEC_INFO_PATTERNS:
+                        found = re.match(pattern, match.group(2))
+                        if not found:
+                            continue
+                        if key == 'vectorized':
+                            entry[key].append(lineno)
+                        else:
+                            entry[key] += int(found.group(1)) if found.groups() else 1
+    return info
+
+
+def write_vectorization_report(path: str, before: dict, after: dict, stats: dict):
+    """写出加提示前后的向量化对比（JSON）并打印汇总与变化最大的内核"""
+    empty = {'vectorized': [], 'versioned': 0, 'library_calls': 0, 'slp': 0}
+    kernels = []
+    for name in sorted(set(before) | set(after)):
+        b, a = before.get(name, empty), after.get(name, empty)
+        kernels.append({
+            'name': name,
+            'before': dict(b, vectorized=len(b['vectorized']), vectorized_lines=sorted(b['vectorized'])),
+            'after': dict(a, vectorized=len(a['vectorized']), vectorized_lines=sorted(a['vectorized'])),
+        })
+    totals = {side: {key: sum(k[side][key] for k in kernels) for key, _ in VEC_INFO_PATTERNS}
+              for side in ('before', 'after')}
+    report = {'hints': stats, 'totals': totals, 'kernels': kernels}
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+    b, a = totals['before'], totals['after']
+    print(f"    向量化循环 {b['vectorized']} -> {a['vectorized']}（其中运行时别名检查 "
+          f"{b['versioned']} -> {a['versioned']}），memcpy/memset {b['library_calls']} -> {a['library_calls']}，"
+          f"基本块向量化 {b['slp']} -> {a['slp']}")
+    changed = [k for k in kernels if k['before'] != k['after']]
+    for k in sorted(changed, key=lambda k: k['before']['vectorized'] - k['after']['vectorized'])[:5]:
+        print(f"      {k['name']}: 向量化循环 {k['before']['vectorized']} -> {k['after']['vectorized']}")
+    print(f"    -> {path}")
+
+
+def split_kernel_definitions(operators_impl: str) -> list:
+    """将算子实现代码拆成 [(函数名, 源码)]，每段带 extern "C" 包装"""
+    def_pattern = r'TVM_DLL\s+int32_t\s+(tvmgen_default_fused_[a-zA-Z0-9_]+)\s*\([^)]*\)\s*\{'
+    kernels = []
+    pos = 0
+    for match in re.finditer(def_pattern, operators_impl):
+        if match.start() < pos:
+            continue
+        gap = operators_impl[pos:match.start()]
+        leftover = re.sub(r'#ifdef __cplusplus\s*extern "C"\s*#endif', '', gap).strip()
+        if leftover:
+            raise ValueError(f"内核 {match.group(1)} 之前存在无法归属的代码: {leftover[:80]!r}")
+        body = _extract_function_body(operators_impl, match.end())
+        pos = match.end() + len(body) + 1
+        src = operators_impl[match.start():pos]
+        kernels.append((match.group(1),
+                        '#ifdef __cplusplus\nextern "C"\n#endif\n' + src + '\n'))
+    leftover = re.sub(r'#ifdef __cplusplus\s*extern "C"\s*#endif', '', operators_impl[pos:]).strip()
+    if leftover:
+        raise ValueError(f"最后一个内核之后存在无法归属的代码: {leftover[:80]!r}")
+    return kernels
+
+
+def group_kernel_units(kernels: list, num_units: int) -> list:
+    """
+    按源码量把内核均衡分配到 num_units 个编译单元（最长处理时间优先），
+    <func>_tiled 与 <func> 放在同一单元；单元内保持原始顺序。num_units 为 0 时每个内核一个单元
+    """
+    families = {}
+    for idx, (name, src) in enumerate(kernels):
+        base = name[:-len('_tiled')] if name.endswith('_tiled') else name
+        families.setdefault(base, []).append((idx, name, src))
+    family_list = sorted(families.values(),
+                         key=lambda fam: (-sum(len(src) for _, _, src in fam), fam[0][0]))
+    if num_units <= 0 or num_units > len(family_list):
+        num_units = len(family_list)
+
+    units = [[] for _ in range(num_units)]
+    loads = [0] * num_units
+    for fam in family_list:
+        target = min(range(num_units), key=lambda u: (loads[u], u))
+        units[target].extend(fam)
+        loads[target] += sum(len(src) for _, _, src in fam)
+    return [[(name, src) for _, name, src in sorted(unit)] for unit in units if unit]
+
+
+def render_kernel_unit(unit: list) -> str:
+    """一个算子实现编译单元的完整源码"""
+    lines = list(KERNEL_UNIT_PRELUDE)
+    lines.append("")
+    lines.append(f"// ============ 算子实现 ({len(unit)} 个内核) ============")
+    lines.append("")
+    lines.extend(src for _, src in unit)
+    return '\n'.join(lines)
+
+
+def write_kernel_units(project_root: str, units: list) -> list:
+    """写出 src/kernels_NN.c（内容不变时不重写），删除多余的旧单元，返回相对 src/ 的文件名"""
+    src_dir = os.path.join(project_root, 'src')
+    names = []
+    for i, unit in enumerate(units):
+        fname = f'kernels_{i:02d}.c'
+        write_if_changed(os.path.join(src_dir, fname), render_kernel_unit(unit))
+        names.append(fname)
+    for stale in glob.glob(os.path.join(src_dir, 'kernels_*.c')):
+        if os.path.basename(stale) not in names:
+            os.remove(stale)
+            print(f"    删除旧单元: {os.path.basename(stale)}")
+    return names
+
+
 def build_new_lib1(
     orig_lib1_content: str,
     generated_files: dict,
-    operators_impl: str
+    weights: dict = None
 ) -> str:
-    """构建新的 lib1.c 内容"""
+    """
+    构建新的 lib1.c 内容（数据结构、调度表、运行时与入口；算子实现在 kernels_NN.c）
+
+    weights 为 write_weights_blob 的结果时，常量改由运行时从权重文件 mmap
+    """
     
     lines = []
     
     # 1. 新头部
     lines.append("// tvm target: c -keys=cpu")
+    lines.append("#define _GNU_SOURCE // 运行时线程放置：cpu_set_t / pthread_attr_setaffinity_np / sched_getcpu")
     lines.append("#define TVM_DLL")
     lines.append("#define TVM_EXPORTS")
     lines.append("#include <stdint.h>")
@@ -165,7 +788,14 @@ def build_new_lib1(
     
     # 2. 外部变量声明（来自 lib0.c）
     lines.append("// 外部变量声明（来自 lib0.c）")
-    lines.append("extern uint8_t global_const_workspace[];")
+    if weights:
+        lines.append("// global_const_workspace 改由常量权重文件 mmap（merge_scheduler_code.py --weights-blob）")
+        lines.append("#define TVMRT_WEIGHTS_MMAP 1")
+        lines.append(f"#define TVMRT_WEIGHTS_FILE {json.dumps(weights['path'])}")
+        lines.append(f"#define TVMRT_CONST_WORKSPACE_SIZE {weights['size']}ULL")
+        lines.append(f"#define TVMRT_WEIGHTS_CRC32 0x{weights['crc32']:08x}u")
+    else:
+        lines.append("extern uint8_t global_const_workspace[];")
     lines.append("extern uint8_t global_workspace[];")
     lines.append("")
     
@@ -177,16 +807,15 @@ def build_new_lib1(
     if 'dag' in generated_files:
         lines.append(generated_files['dag'])
     
+    # 4.1 实体模板与 workspace 相对绑定表
+    if 'entities' in generated_files:
+        lines.append(generated_files['entities'])
+    
     # 5. 运行时代码
     if 'runtime' in generated_files:
         lines.append(generated_files['runtime'])
     
-    # 6. 算子实现代码
-    lines.append("")
-    lines.append("// ============ 算子实现 ============")
-    lines.append(operators_impl)
-    
-    # 7. 新的入口函数
+    # 6. 新的入口函数
     lines.append("")
     lines.append("// ============ 模型入口函数 ============")
     lines.append("")
@@ -198,22 +827,16 @@ def build_new_lib1(
     lines.append("    float* output_buffer_var,")
     lines.append("    uint8_t* global_const_workspace_0_var,")
     lines.append("    uint8_t* global_workspace_1_var) {")
-    lines.append("")
-    
-    # 注入 entities 初始化代码（包含 sid 定义和 g_entities 数组）
-    if 'entities' in generated_files:
-        entities_content = generated_files['entities']
-        for line in entities_content.split('\n'):
-            if line.strip():
-                lines.append("    " + line)
-    
+    lines.append("    // 按传入的 workspace 与输入/输出实例化实体表")
+    lines.append("    SchedulableEntity entities[OP_COUNT];")
+    lines.append("    tvmrt_bind_entities(entities, global_workspace_1_var, images_buffer_var, output_buffer_var);")
     lines.append("")
     lines.append("    // 运行 Scheduler-Worker 调度")
-    lines.append("    return tvmrt_run(global_const_workspace_0_var, global_workspace_1_var, g_entities);")
+    lines.append("    return tvmrt_run(global_const_workspace_0_var, global_workspace_1_var, entities, NULL);")
     lines.append("}")
     lines.append("")
     
-    # 8. tvmgen_default_run 封装函数
+    # 7. tvmgen_default_run 封装函数
     lines.append("// ============ 兼容接口 ============")
     lines.append("")
     lines.append("struct tvmgen_default_inputs { void* images; };")
@@ -225,10 +848,12 @@ def build_new_lib1(
     lines.append("TVM_DLL int32_t tvmgen_default_run(")
     lines.append("    struct tvmgen_default_inputs* inputs,")
     lines.append("    struct tvmgen_default_outputs* outputs) {")
+    lines.append("    uint8_t* cws = tvmrt_const_workspace();")
+    lines.append("    if (!cws) return -1;")
     lines.append("    return tvmgen_default___tvm_main__(")
     lines.append("        (float*)inputs->images,")
     lines.append("        (float*)outputs->output,")
-    lines.append("        global_const_workspace,")
+    lines.append("        cws,")
     lines.append("        global_workspace);")
     lines.append("}")
     lines.append("")
@@ -236,12 +861,15 @@ def build_new_lib1(
     return '\n'.join(lines)
 
 
-def generate_makefile(project_root: str, model_name: str, op_count: int):
-    """生成 Makefile"""
+def generate_makefile(project_root: str, model_name: str, op_count: int, kernel_units: list,
+                      extra_cflags: str = ''):
+    """生成 Makefile（算子实现与运行时分属不同目标文件，支持 make -j 并行编译）"""
+    kernel_srcs = ' \\\n       '.join(f'$(SRC_DIR)/{name}' for name in kernel_units)
     makefile_content = f'''# ============================================================
 # 自动生成的 Makefile
 # 模型: {model_name}
 # 算子数量: {op_count}
+# 并行编译: make -j$(nproc)
 # ============================================================
 
 CC ?= gcc
@@ -249,10 +877,15 @@ CXX ?= g++
 AR ?= ar
 
 # 编译选项
-CFLAGS = -O3 -Wall -fPIC -pthread 
+CFLAGS = -O3 -Wall -fPIC -pthread {extra_cflags}
 CXXFLAGS = -O3 -Wall -fPIC -pthread 
 LDFLAGS = -lm -pthread 
 
+# 算子级执行追踪: make TRACE=1（退出时写出 Chrome trace JSON）
+ifeq ($(TRACE),1)
+CFLAGS += -DTVMRT_TRACE
+endif
+
 # 构建目录
 BUILD_DIR = build
 OBJ_DIR = $(BUILD_DIR)/obj
@@ -262,19 +895,21 @@ LIB_DIR = $(BUILD_DIR)/lib
 SRC_DIR = src
 TEST_DIR = test
 
-# 源文件列表
-SRCS = $(SRC_DIR)/lib0.c $(SRC_DIR)/lib1.c 
+# 源文件列表（lib1.c 为数据结构、调度表与运行时；kernels_NN.c 为算子实现）
+KERNEL_SRCS = {kernel_srcs}
+SRCS = $(SRC_DIR)/lib0.c $(SRC_DIR)/lib1.c $(KERNEL_SRCS)
 OBJS = $(SRCS:$(SRC_DIR)/%.c=$(OBJ_DIR)/%.o)
 
-# 库文件
+# 库文件（共享库供 Python 绑定 python/tvmrt 通过 ctypes 加载）
 STATIC_LIB = $(LIB_DIR)/lib{model_name}.a
+SHARED_LIB = $(LIB_DIR)/lib{model_name}.so
 
 # 测试可执行文件
 TEST_BIN = $(BUILD_DIR)/{model_name}_test
 
 # 默认目标
 .PHONY: all
-all: $(STATIC_LIB) $(TEST_BIN)
+all: $(STATIC_LIB) $(SHARED_LIB) $(TEST_BIN)
 
 # 创建目录
 $(OBJ_DIR):
@@ -283,19 +918,30 @@ $(OBJ_DIR):
 $(LIB_DIR):
 \t@mkdir -p $(LIB_DIR)
 
+# 编译选项戳：CFLAGS（如 TRACE=1）变化时才更新，使目标文件随之重编译
+CFLAGS_STAMP = $(OBJ_DIR)/.cflags
+
+.PHONY: FORCE
+$(CFLAGS_STAMP): FORCE | $(OBJ_DIR)
+\t@echo '$(CC) $(CFLAGS)' | cmp -s - $@ || echo '$(CC) $(CFLAGS)' > $@
+
 # 编译源文件
-$(OBJ_DIR)/%.o: $(SRC_DIR)/%.c | $(OBJ_DIR)
+$(OBJ_DIR)/%.o: $(SRC_DIR)/%.c $(CFLAGS_STAMP) | $(OBJ_DIR)
 \t$(CC) $(CFLAGS) -c $< -o $@
 
 # 生成静态库
 $(STATIC_LIB): $(OBJS) | $(LIB_DIR)
 \t$(AR) rcs $@ $^
 
+# 生成共享库
+$(SHARED_LIB): $(OBJS) | $(LIB_DIR)
+\t$(CC) -shared -o $@ $^ $(LDFLAGS)
+
 # 编译测试
 $(TEST_BIN): $(OBJS) $(OBJ_DIR)/test_main.o | $(BUILD_DIR)
 \t$(CC) -o $@ $^ $(LDFLAGS)
 
-$(OBJ_DIR)/test_main.o: $(TEST_DIR)/test_main.c | $(OBJ_DIR)
+$(OBJ_DIR)/test_main.o: $(TEST_DIR)/test_main.c $(CFLAGS_STAMP) | $(OBJ_DIR)
 \t$(CC) $(CFLAGS) -c $< -o $@
 
 # 运行测试
@@ -304,9 +950,9 @@ run: $(TEST_BIN)
 \t@echo "Running {model_name} test..."
 \t./$(TEST_BIN)
 
-# 仅编译静态库
+# 仅编译静态库与共享库
 .PHONY: lib
-lib: $(STATIC_LIB)
+lib: $(STATIC_LIB) $(SHARED_LIB)
 
 # 仅编译测试
 .PHONY: test
@@ -317,29 +963,40 @@ test: $(TEST_BIN)
 clean:
 \trm -rf $(BUILD_DIR)
 
-# 调试编译
+# 调试编译（先 clean 再 all，顺序执行以兼容 make -j）
 .PHONY: debug
-debug: CFLAGS = -g -O0 -Wall -fPIC 
-debug: clean all
+debug:
+\t$(MAKE) clean
+\t$(MAKE) all CFLAGS="-g -O0 -Wall -fPIC -pthread"
 '''
     makefile_path = os.path.join(project_root, 'Makefile')
-    with open(makefile_path, 'w') as f:
-        f.write(makefile_content)
+    write_if_changed(makefile_path, makefile_content)
     return makefile_path
 
 
 def generate_test_main(project_root: str, model_name: str, input_size: int, output_size: int):
-    """生成 test_main.c（全0输入，打印前20个输出）"""
+    """生成 test_main.c（基准测试驱动：预热、墙钟计时、分位数统计、Worker 数扫描、JSON 输出）"""
     input_kb = input_size * 4 / 1024
     output_kb = output_size * 4 / 1024
     
     test_content = f'''/**
- * 自动生成的测试入口文件
+ * 自动生成的测试入口文件（基准测试驱动）
  * 模型: {model_name}
  * 输入大小: {input_size} floats ({input_kb:.1f} KB)
  * 输出大小: {output_size} floats ({output_kb:.1f} KB)
+ *
+ * 用法: {model_name}_test [-n 迭代次数] [-w 预热次数] [-s 0,1,2,4] [-c 并发流数]
+ *                        [-q 流水线深度] [-i random|zero] [-j result.json] [-v]
+ *   -s  依次以给定 Worker 数运行（0 = 串行），未指定时沿用运行时配置（tvmrt.conf / TVMRT_NUM_WORKERS）
+ *   -c  多路并发：每路一个线程 + 独立推理上下文（tvmrt_context_*），共享线程池，
+ *       延迟统计汇总所有路，吞吐为总推理次数 / 墙钟时间
+ *   -q  单线程异步流水线：深度 D 个上下文轮流 tvmrt_context_submit / wait，
+ *       延迟为提交到完成回调的时间
+ *   计时使用 CLOCK_MONOTONIC 墙钟时间；CPU 时间（clock()，所有线程之和）仅用于计算 CPU 利用率
  */
 
+#include <math.h>
+#include <pthread.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <stdint.h>
@@ -357,6 +1014,47 @@ struct tvmgen_default_outputs {{
 
 // 模型运行函数声明
 int32_t tvmgen_default_run(struct tvmgen_default_inputs*, struct tvmgen_default_outputs*);
+// 关闭 Worker 线程池（扫描时用于切换 Worker 数）
+void tvmrt_shutdown(void);
+// 推理实际使用的 Worker 数（串行为 0；static 模式固定为离线调度的 Worker 数）
+int32_t tvmrt_num_workers(void);
+// 实际采用的调度模式 / 就绪派发顺序（含 tvmrt.conf 中的设置）
+const char* tvmrt_sched_mode_name(void);
+const char* tvmrt_ready_policy_name(void);
+
+// 自适应等待各阶段命中次数（调整 TVMRT_WAIT_SPIN / TVMRT_WAIT_YIELD 用）
+typedef struct {{
+    uint64_t immediate, spin, yield, block;
+}} TvmrtWaitStats;
+void tvmrt_get_wait_stats(TvmrtWaitStats* stats);
+void tvmrt_reset_wait_stats(void);
+
+// 推理上下文（多路并发）
+typedef struct TvmrtContext TvmrtContext;
+TvmrtContext* tvmrt_context_create(void);
+void tvmrt_context_destroy(TvmrtContext* ctx);
+float* tvmrt_context_input(TvmrtContext* ctx);
+float* tvmrt_context_output(TvmrtContext* ctx);
+int32_t tvmrt_context_run(TvmrtContext* ctx);
+typedef void (*TvmrtDoneCallback)(TvmrtContext* ctx, int32_t status, void* user_data);
+int32_t tvmrt_context_submit(TvmrtContext* ctx, float* input, float* output,
+                             TvmrtDoneCallback callback, void* user_data);
+int32_t tvmrt_context_wait(TvmrtContext* ctx);
+
+#define MAX_SWEEP 32
+#define MAX_STREAMS 64
+
+typedef struct {{
+    int workers;          // 实际使用的 Worker 数（tvmrt_num_workers，0 表示串行）
+    int streams;          // 并发推理流数
+    int depth;            // 异步流水线深度（1 表示同步）
+    int iterations;
+    double min, mean, p50, p90, p99, max, stddev;  // ms
+    double throughput;    // 推理次数 / 秒
+    double cpu_util;      // CPU 时间 / 墙钟时间
+    double checksum;
+    TvmrtWaitStats waits; // 本配置（含预热）的等待阶段统计
+}} BenchResult;
 
 // 打印前 N 个元素
 void print_first_elements(const char* name, float* data, int count) {{
@@ -366,96 +1064,458 @@ void print_first_elements(const char* name, float* data, int count) {{
     }}
 }}
 
+static double now_ms(void) {{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec * 1000.0 + ts.tv_nsec / 1e6;
+}}
+
+static int compare_double(const void* a, const void* b) {{
+    double x = *(const double*)a, y = *(const double*)b;
+    return (x > y) - (x < y);
+}}
+
+// nearest-rank 分位数（samples 已升序）
+static double percentile(const double* samples, int n, double p) {{
+    int rank = (int)ceil(p / 100.0 * n);
+    if (rank < 1) rank = 1;
+    if (rank > n) rank = n;
+    return samples[rank - 1];
+}}
+
+// 固定种子的伪随机输入 [0, 1)，避免全 0 输入掩盖数据相关的性能差异
+static void fill_random(float* data, int count) {{
+    uint32_t state = 0x12345678u;
+    for (int i = 0; i < count; i++) {{
+        state = state * 1664525u + 1013904223u;
+        data[i] = (float)(state >> 8) / 16777216.0f;
+    }}
+}}
+
+static double output_checksum(const float* data, int count) {{
+    double sum = 0.0;
+    for (int i = 0; i < count; i++) {{
+        sum += data[i];
+    }}
+    return sum;
+}}
+
+// 计算延迟统计（samples 原地排序）与吞吐
+static void summarize(double* samples, int count, double wall_total, double cpu_total,
+                      BenchResult* r) {{
+    double sum = 0.0;
+    for (int i = 0; i < count; i++) sum += samples[i];
+    r->mean = sum / count;
+    double var = 0.0;
+    for (int i = 0; i < count; i++) var += (samples[i] - r->mean) * (samples[i] - r->mean);
+    r->stddev = sqrt(var / count);
+
+    qsort(samples, count, sizeof(double), compare_double);
+    r->iterations = count;
+    r->min = samples[0];
+    r->p50 = percentile(samples, count, 50.0);
+    r->p90 = percentile(samples, count, 90.0);
+    r->p99 = percentile(samples, count, 99.0);
+    r->max = samples[count - 1];
+    r->throughput = wall_total > 0 ? count * 1000.0 / wall_total : 0.0;
+    r->cpu_util = wall_total > 0 ? cpu_total / wall_total : 0.0;
+}}
+
+static int run_bench(struct tvmgen_default_inputs* inputs, struct tvmgen_default_outputs* outputs,
+                     int warmup, int iterations, int verbose, double* samples, BenchResult* r) {{
+    for (int i = 0; i < warmup; i++) {{
+        int ret = tvmgen_default_run(inputs, outputs);
+        if (ret != 0) {{
+            fprintf(stderr, "Warmup %d failed with error: %d\\n", i + 1, ret);
+            return ret;
+        }}
+    }}
+
+    clock_t cpu_start = clock();
+    double wall_start = now_ms();
+    for (int i = 0; i < iterations; i++) {{
+        double start = now_ms();
+        int ret = tvmgen_default_run(inputs, outputs);
+        samples[i] = now_ms() - start;
+        if (ret != 0) {{
+            fprintf(stderr, "Inference %d failed with error: %d\\n", i + 1, ret);
+            return ret;
+        }}
+        if (verbose) {{
+            printf("  Iteration %d: %.2f ms\\n", i + 1, samples[i]);
+        }}
+    }}
+    double wall_total = now_ms() - wall_start;
+    double cpu_total = (double)(clock() - cpu_start) / CLOCKS_PER_SEC * 1000.0;
+
+    summarize(samples, iterations, wall_total, cpu_total, r);
+    r->checksum = output_checksum((const float*)outputs->output, {output_size});
+    return 0;
+}}
+
+typedef struct {{
+    TvmrtContext* ctx;
+    int warmup;
+    int iterations;
+    double* samples;
+    int ret;
+}} StreamArg;
+
+static void* stream_loop(void* arg) {{
+    StreamArg* sa = (StreamArg*)arg;
+    for (int i = 0; i < sa->warmup + sa->iterations; i++) {{
+        double start = now_ms();
+        int ret = tvmrt_context_run(sa->ctx);
+        if (ret != 0) {{
+            sa->ret = ret;
+            return NULL;
+        }}
+        if (i >= sa->warmup) {{
+            sa->samples[i - sa->warmup] = now_ms() - start;
+        }}
+    }}
+    return NULL;
+}}
+
+// 多路并发：每路独立上下文（同一输入），各路输出须一致
+static int run_streams(int streams, const float* input, int warmup, int iterations,
+                       double* samples, BenchResult* r) {{
+    TvmrtContext* ctxs[MAX_STREAMS] = {{ NULL }};
+    StreamArg args[MAX_STREAMS];
+    pthread_t threads[MAX_STREAMS];
+    int ret = 0;
+    for (int c = 0; c < streams; c++) {{
+        ctxs[c] = tvmrt_context_create();
+        if (!ctxs[c]) {{
+            fprintf(stderr, "Failed to create context %d\\n", c);
+            ret = 1;
+            goto cleanup;
+        }}
+        memcpy(tvmrt_context_input(ctxs[c]), input, {input_size} * sizeof(float));
+        args[c] = (StreamArg){{ ctxs[c], warmup, iterations, samples + (size_t)c * iterations, 0 }};
+    }}
+
+    clock_t cpu_start = clock();
+    double wall_start = now_ms();
+    for (int c = 0; c < streams; c++) {{
+        pthread_create(&threads[c], NULL, stream_loop, &args[c]);
+    }}
+    for (int c = 0; c < streams; c++) {{
+        pthread_join(threads[c], NULL);
+    }}
+    double wall_total = now_ms() - wall_start;
+    double cpu_total = (double)(clock() - cpu_start) / CLOCKS_PER_SEC * 1000.0;
+
+    for (int c = 0; c < streams; c++) {{
+        if (args[c].ret != 0) {{
+            fprintf(stderr, "Stream %d failed with error: %d\\n", c, args[c].ret);
+            ret = args[c].ret;
+            goto cleanup;
+        }}
+    }}
+
+    summarize(samples, streams * iterations, wall_total, cpu_total, r);
+    r->iterations = iterations;
+    r->checksum = output_checksum(tvmrt_context_output(ctxs[0]), {output_size});
+    for (int c = 1; c < streams; c++) {{
+        double checksum = output_checksum(tvmrt_context_output(ctxs[c]), {output_size});
+        if (checksum != r->checksum) {{
+            fprintf(stderr, "Stream %d output mismatch: %.9g vs %.9g\\n", c, checksum, r->checksum);
+            ret = 1;
+        }}
+    }}
+
+cleanup:
+    for (int c = 0; c < streams; c++) {{
+        tvmrt_context_destroy(ctxs[c]);
+    }}
+    return ret;
+}}
+
+typedef struct {{
+    double submit_ms;
+    double done_ms;
+}} PendingFrame;
+
+static void frame_done(TvmrtContext* ctx, int32_t status, void* user_data) {{
+    (void)ctx;
+    (void)status;
+    ((PendingFrame*)user_data)->done_ms = now_ms();
+}}
+
+// 单线程异步流水线：第 i 帧提交到上下文 i % depth，提交前先回收该上下文的上一帧
+static int run_pipeline(int depth, const float* input, int warmup, int iterations,
+                        double* samples, BenchResult* r) {{
+    TvmrtContext* ctxs[MAX_STREAMS] = {{ NULL }};
+    PendingFrame frames[MAX_STREAMS];
+    int ret = 0;
+    for (int c = 0; c < depth; c++) {{
+        ctxs[c] = tvmrt_context_create();
+        if (!ctxs[c]) {{
+            fprintf(stderr, "Failed to create context %d\\n", c);
+            ret = 1;
+            goto cleanup;
+        }}
+        memcpy(tvmrt_context_input(ctxs[c]), input, {input_size} * sizeof(float));
+    }}
+    for (int i = 0; i < warmup && ret == 0; i++) {{
+        ret = tvmrt_context_run(ctxs[0]);
+    }}
+    if (ret != 0) {{
+        fprintf(stderr, "Warmup failed with error: %d\\n", ret);
+        goto cleanup;
+    }}
+
+    clock_t cpu_start = clock();
+    double wall_start = now_ms();
+    for (int i = 0; i < iterations + depth; i++) {{
+        int c = i % depth;
+        if (i >= depth && i - depth < iterations) {{
+            ret = tvmrt_context_wait(ctxs[c]);
+            if (ret != 0) {{
+                fprintf(stderr, "Inference %d failed with error: %d\\n", i - depth + 1, ret);
+                goto cleanup;
+            }}
+            samples[i - depth] = frames[c].done_ms - frames[c].submit_ms;
+        }}
+        if (i < iterations) {{
+            frames[c].submit_ms = now_ms();
+            ret = tvmrt_context_submit(ctxs[c], NULL, NULL, frame_done, &frames[c]);
+            if (ret != 0) {{
+                fprintf(stderr, "Submit %d failed with error: %d\\n", i + 1, ret);
+                goto cleanup;
+            }}
+        }}
+    }}
+    double wall_total = now_ms() - wall_start;
+    double cpu_total = (double)(clock() - cpu_start) / CLOCKS_PER_SEC * 1000.0;
+
+    summarize(samples, iterations, wall_total, cpu_total, r);
+    r->checksum = output_checksum(tvmrt_context_output(ctxs[0]), {output_size});
+    for (int c = 1; c < depth && c < iterations; c++) {{
+        double checksum = output_checksum(tvmrt_context_output(ctxs[c]), {output_size});
+        if (checksum != r->checksum) {{
+            fprintf(stderr, "Context %d output mismatch: %.9g vs %.9g\\n", c, checksum, r->checksum);
+            ret = 1;
+        }}
+    }}
+
+cleanup:
+    for (int c = 0; c < depth; c++) {{
+        tvmrt_context_destroy(ctxs[c]);
+    }}
+    return ret;
+}}
+
+static void write_json(const char* path, const char* input_mode, int warmup,
+                       const BenchResult* results, int count) {{
+    FILE* f = fopen(path, "w");
+    if (!f) {{
+        fprintf(stderr, "Failed to open %s\\n", path);
+        return;
+    }}
+    fprintf(f, "{{\\n");
+    fprintf(f, "  \\"model\\": \\"{model_name}\\",\\n");
+    fprintf(f, "  \\"input\\": \\"%s\\",\\n", input_mode);
+    fprintf(f, "  \\"sched_mode\\": \\"%s\\",\\n", tvmrt_sched_mode_name());
+    fprintf(f, "  \\"ready_policy\\": \\"%s\\",\\n", tvmrt_ready_policy_name());
+    fprintf(f, "  \\"warmup\\": %d,\\n", warmup);
+    fprintf(f, "  \\"results\\": [\\n");
+    for (int i = 0; i < count; i++) {{
+        const BenchResult* r = &results[i];
+        fprintf(f, "    {{\\"workers\\": %d, \\"streams\\": %d, \\"depth\\": %d, "
+                   "\\"iterations\\": %d, "
+                   "\\"latency_ms\\": {{\\"min\\": %.4f, \\"mean\\": %.4f, \\"p50\\": %.4f, "
+                   "\\"p90\\": %.4f, \\"p99\\": %.4f, \\"max\\": %.4f, \\"stddev\\": %.4f}}, "
+                   "\\"throughput_fps\\": %.4f, \\"cpu_util\\": %.3f, \\"checksum\\": %.9g, "
+                   "\\"waits\\": {{\\"immediate\\": %llu, \\"spin\\": %llu, \\"yield\\": %llu, \\"block\\": %llu}}}}%s\\n",
+                r->workers, r->streams, r->depth, r->iterations, r->min, r->mean, r->p50, r->p90, r->p99, r->max,
+                r->stddev, r->throughput, r->cpu_util, r->checksum,
+                (unsigned long long)r->waits.immediate, (unsigned long long)r->waits.spin,
+                (unsigned long long)r->waits.yield, (unsigned long long)r->waits.block,
+                i + 1 < count ? "," : "");
+    }}
+    fprintf(f, "  ]\\n}}\\n");
+    fclose(f);
+}}
+
 int main(int argc, char* argv[]) {{
     // 解析命令行参数
-    int iterations = 1;
+    int iterations = 10;
+    int warmup = 2;
+    int verbose = 0;
+    const char* input_mode = "random";
+    const char* json_path = NULL;
+    int streams = 1;
+    int depth = 1;
+    int sweep[MAX_SWEEP];
+    int sweep_count = 0;
     for (int i = 1; i < argc; i++) {{
         if (strcmp(argv[i], "-n") == 0 && i + 1 < argc) {{
             iterations = atoi(argv[++i]);
+        }} else if (strcmp(argv[i], "-w") == 0 && i + 1 < argc) {{
+            warmup = atoi(argv[++i]);
+        }} else if (strcmp(argv[i], "-i") == 0 && i + 1 < argc) {{
+            input_mode = argv[++i];
+        }} else if (strcmp(argv[i], "-j") == 0 && i + 1 < argc) {{
+            json_path = argv[++i];
+        }} else if (strcmp(argv[i], "-s") == 0 && i + 1 < argc) {{
+            for (char* tok = strtok(argv[++i], ","); tok && sweep_count < MAX_SWEEP; tok = strtok(NULL, ",")) {{
+                sweep[sweep_count++] = atoi(tok);
+            }}
+        }} else if (strcmp(argv[i], "-c") == 0 && i + 1 < argc) {{
+            streams = atoi(argv[++i]);
+        }} else if (strcmp(argv[i], "-q") == 0 && i + 1 < argc) {{
+            depth = atoi(argv[++i]);
+        }} else if (strcmp(argv[i], "-v") == 0) {{
+            verbose = 1;
+        }} else {{
+            fprintf(stderr, "Usage: %s [-n iters] [-w warmup] [-s 0,1,2,4] [-c streams] [-q depth] [-i random|zero] [-j out.json] [-v]\\n", argv[0]);
+            return 1;
         }}
     }}
+    if (iterations < 1) iterations = 1;
+    if (warmup < 0) warmup = 0;
+    if (streams < 1) streams = 1;
+    if (streams > MAX_STREAMS) streams = MAX_STREAMS;
+    if (depth < 1) depth = 1;
+    if (depth > MAX_STREAMS) depth = MAX_STREAMS;
+    if (sweep_count == 0) {{
+        sweep[sweep_count++] = -1;
+    }}
 
-    // 分配输入内存（全0）
+    // 分配输入内存
     float* input = (float*)calloc({input_size}, sizeof(float));
     if (!input) {{
         fprintf(stderr, "Failed to allocate input memory\\n");
         return 1;
     }}
+    if (strcmp(input_mode, "zero") != 0) {{
+        input_mode = "random";
+        fill_random(input, {input_size});
+    }}
 
     // 分配输出内存
     float* output = (float*)calloc({output_size}, sizeof(float));
-    if (!output) {{
+    double* samples = (double*)malloc((size_t)streams * iterations * sizeof(double));
+    if (!output || !samples) {{
         fprintf(stderr, "Failed to allocate output memory\\n");
         free(input);
+        free(output);
+        free(samples);
         return 1;
     }}
 
     struct tvmgen_default_inputs inputs = {{ .images = input }};
     struct tvmgen_default_outputs outputs = {{ .output = output }};
 
-    printf("=== {model_name} Test ===\\n");
-    printf("Input size: {input_size} floats ({input_kb:.1f} KB)\\n");
+    printf("=== {model_name} Benchmark ===\\n");
+    printf("Input size: {input_size} floats ({input_kb:.1f} KB), input: %s\\n", input_mode);
     printf("Output size: {output_size} floats ({output_kb:.1f} KB)\\n");
-    printf("Iterations: %d\\n", iterations);
-
-    printf("\\nRunning inference...\\n");
-    double total_time = 0.0;
-
-    for (int i = 0; i < iterations; i++) {{
-        clock_t start = clock();
-        int ret = tvmgen_default_run(&inputs, &outputs);
-        clock_t end = clock();
-        double elapsed = (double)(end - start) / CLOCKS_PER_SEC * 1000.0;
-        total_time += elapsed;
+    printf("Warmup: %d, Iterations: %d, Streams: %d, Pipeline depth: %d\\n",
+           warmup, iterations, streams, depth);
 
+    BenchResult results[MAX_SWEEP];
+    int ret = 0;
+    for (int s = 0; s < sweep_count; s++) {{
+        BenchResult* r = &results[s];
+        r->streams = streams;
+        r->depth = depth;
+        if (sweep[s] >= 0) {{
+            // 切换 Worker 数：更新环境变量并关闭旧线程池，下一次推理按新配置重建
+            char buf[16];
+            snprintf(buf, sizeof(buf), "%d", sweep[s]);
+            setenv("TVMRT_NUM_WORKERS", buf, 1);
+            tvmrt_shutdown();
+        }}
+        tvmrt_reset_wait_stats();
+        // 记录运行时实际采用的 Worker 数（static 模式不随 -s 变化）
+        r->workers = tvmrt_num_workers();
+        if (r->workers == 0) {{
+            printf("\\nRunning inference (serial)...\\n");
+        }} else {{
+            printf("\\nRunning inference (%d workers)...\\n", r->workers);
+        }}
+        if (depth > 1) {{
+            ret = run_pipeline(depth, input, warmup, iterations, samples, r);
+        }} else if (streams > 1) {{
+            ret = run_streams(streams, input, warmup, iterations, samples, r);
+        }} else {{
+            ret = run_bench(&inputs, &outputs, warmup, iterations, verbose, samples, r);
+        }}
         if (ret != 0) {{
-            fprintf(stderr, "Inference %d failed with error: %d\\n", i + 1, ret);
-            free(input);
-            free(output);
-            return ret;
+            break;
         }}
-        printf("  Iteration %d: %.2f ms\\n", i + 1, elapsed);
+        tvmrt_get_wait_stats(&r->waits);
+        printf("  latency ms: min %.2f  mean %.2f  p50 %.2f  p90 %.2f  p99 %.2f  max %.2f  (stddev %.2f)\\n",
+               r->min, r->mean, r->p50, r->p90, r->p99, r->max, r->stddev);
+        printf("  throughput: %.2f FPS, CPU utilization: %.2f, checksum: %.9g\\n",
+               r->throughput, r->cpu_util, r->checksum);
+        printf("  waits: immediate %llu, spin %llu, yield %llu, block %llu\\n",
+               (unsigned long long)r->waits.immediate, (unsigned long long)r->waits.spin,
+               (unsigned long long)r->waits.yield, (unsigned long long)r->waits.block);
     }}
 
-    double avg_time = total_time / iterations;
-    printf("\\n=== Results ===\\n");
-    printf("Total time: %.2f ms\\n", total_time);
-    printf("Average time: %.2f ms\\n", avg_time);
-    printf("FPS: %.1f\\n", 1000.0 / avg_time);
+    if (ret == 0) {{
+        printf("\\n=== Results ===\\n");
+        printf("%8s %10s %10s %10s %10s %10s\\n", "workers", "p50(ms)", "p90(ms)", "p99(ms)", "FPS", "speedup");
+        for (int s = 0; s < sweep_count; s++) {{
+            const BenchResult* r = &results[s];
+            printf("%8d %10.2f %10.2f %10.2f %10.2f %9.2fx\\n", r->workers, r->p50, r->p90, r->p99,
+                   r->throughput, r->p50 > 0 ? results[0].p50 / r->p50 : 0.0);
+        }}
+        if (json_path) {{
+            write_json(json_path, input_mode, warmup, results, sweep_count);
+            printf("JSON: %s\\n", json_path);
+        }}
 
-    // 打印前20个输出元素
-    print_first_elements("Output", output, 20);
+        // 打印前20个输出元素
+        print_first_elements("Output", output, 20);
+        printf("\\nTest completed successfully!\\n");
+    }}
 
     free(input);
     free(output);
-
-    printf("\\nTest completed successfully!\\n");
-    return 0;
+    free(samples);
+    return ret;
 }}
 '''
     test_dir = os.path.join(project_root, 'test')
     os.makedirs(test_dir, exist_ok=True)
     test_path = os.path.join(test_dir, 'test_main.c')
-    with open(test_path, 'w') as f:
-        f.write(test_content)
+    write_if_changed(test_path, test_content)
     return test_path
 
 
-def parse_io_sizes(lib1_path: str):
-    """从 lib1.c 解析输入输出大小"""
-    with open(lib1_path, 'r') as f:
-        content = f.read()
-    
+def parse_io_sizes(entity_content: str):
+    """从 entity_generated.c 的 TVMRT_INPUT_SIZE / TVMRT_OUTPUT_SIZE 解析输入输出大小"""
     # 默认值（YOLOv8n）
     input_size = 1228800   # 3*640*640
-    output_size = 2714985  # 从模型推断
+    output_size = 705600   # 84*8400
     
-    # 尝试从 __tvm_main__ 函数参数推断
-    # 这里使用默认值，因为精确解析比较复杂
+    match = re.search(r'#define TVMRT_INPUT_SIZE (\d+)', entity_content)
+    if match:
+        input_size = int(match.group(1))
+    match = re.search(r'#define TVMRT_OUTPUT_SIZE (\d+)', entity_content)
+    if match:
+        output_size = int(match.group(1))
     return input_size, output_size
 
 
 def main():
+    parser = argparse.ArgumentParser(description='合并调度代码到 src/')
+    parser.add_argument('--kernel-units', type=int, default=KERNEL_UNITS,
+                        help=f'算子实现拆分成的编译单元数（默认 {KERNEL_UNITS}，0 表示每个内核一个文件）')
+    parser.add_argument('--kernel-hints', action='store_true',
+                        help='给内核加 restrict / 对齐 / 最内层循环向量化 pragma')
+    parser.add_argument('--simd-pragma', choices=sorted(SIMD_PRAGMAS), default='ivdep',
+                        help='最内层循环使用的 pragma（默认 ivdep；omp 需 -fopenmp-simd，自动加入 CFLAGS）')
+    parser.add_argument('--vec-report', metavar='FILE',
+                        help='编译对比加提示前后的向量化循环（-fopt-info-vec），写出 JSON 报告')
+    parser.add_argument('--weights-blob', nargs='?', const='', metavar='FILE',
+                        help='常量抽取到权重文件由运行时 mmap（默认 <model>_weights.bin）')
+    args = parser.parse_args()
+
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     model_name = os.path.basename(project_root)
     
@@ -469,7 +1529,16 @@ def main():
     # 2. 修改 lib0.c
     print("\\n[2/6] 修改 lib0.c 头部 ...")
     lib0_path = os.path.join(project_root, 'src', 'lib0.c')
-    modify_lib0_header(lib0_path)
+    init_lib0_path = os.path.join(project_root, 'init', 'lib0.c')
+    weights = None
+    if args.weights_blob is not None:
+        blob_path = os.path.abspath(args.weights_blob or
+                                    os.path.join(project_root, f'{model_name}_weights.bin'))
+        weights = write_weights_blob(init_lib0_path, blob_path, model_name)
+        print(f"    常量权重: {blob_path}{'' if weights['changed'] else '（未变化）'} "
+              f"({weights['size'] / 1024 / 1024:.2f} MB, crc32 {weights['crc32']:08x})")
+    changed = modify_lib0_header(init_lib0_path, lib0_path, strip_consts=weights is not None)
+    print(f"    写入: {lib0_path}{'' if changed else '（未变化）'}")
     
     # 3. 读取生成的代码
     print("\\n[3/6] 读取生成的代码文件 ...")
@@ -490,17 +1559,63 @@ def main():
     
     operators_impl = extract_operator_implementations(orig_content)
     print(f"    提取了 {len(operators_impl)} 字节的算子实现代码")
+
+    # 内核私有 scratch 重定位（由 operator_staticizer 生成的 TVMRT_SCRATCH_ARENA_SIZE 决定）
+    arena_match = re.search(r'#define TVMRT_SCRATCH_ARENA_SIZE (\d+)',
+                            generated_files.get('entity', ''))
+    if arena_match:
+        layouts, arena_size = plan_scratch_arena(parse_kernel_functions(init_lib1_path))
+        if arena_size != int(arena_match.group(1)):
+            print("错误: scratch arena 布局与 entity_generated.c 不一致，请重新运行 operator_staticizer.py")
+            return 1
+        operators_impl = relocate_kernel_scratch(operators_impl, layouts)
+        relocated = sum(len(layout) for layout in layouts.values())
+        print(f"    重定位 {relocated} 个内核 scratch 到私有 arena")
+        print(f"    额外内存: 每个 Worker {arena_size / 1024 / 1024:.2f} MB "
+              f"(N 个 Worker 共 N x {arena_size} 字节，串行模式 1 份)")
+
+    # 算子内分块（entity_generated.c 中声明的 <func>_tiled）
+    tiled_funcs = re.findall(r'TVM_DLL int32_t (\w+)_tiled\(\);', generated_files.get('entity', ''))
+    if tiled_funcs:
+        operators_impl = append_tiled_kernels(operators_impl, tiled_funcs)
+        print(f"    生成 {len(tiled_funcs)} 个分块内核 (*_tiled)")
+    
+    # 内核向量化提示：restrict / __builtin_assume_aligned / 最内层循环 pragma
+    plain_impl = operators_impl
+    if args.kernel_hints:
+        call_sites, _ = parse_main_function(init_lib1_path)
+        var_offsets = parse_binding_offsets(generated_files.get('entities', ''))
+        restrict = plan_restrict_params(call_sites, parse_kernel_functions(init_lib1_path),
+                                        var_offsets, arena_match is not None)
+        operators_impl, hint_stats = add_kernel_hints(operators_impl, restrict,
+                                                      arena_match is not None, args.simd_pragma)
+        print(f"    向量化提示: restrict {hint_stats['restrict_params']}/{hint_stats['pointer_params']} 个指针参数，"
+              f"对齐 {hint_stats['aligned_lets']} 个 *_let，"
+              f"{SIMD_PRAGMAS[args.simd_pragma]} {hint_stats['pragma_loops']}/{hint_stats['inner_loops']} 个最内层循环")
     
-    # 5. 构建新的 lib1.c
-    print("\\n[5/6] 构建新的 lib1.c ...")
-    new_content = build_new_lib1(orig_content, generated_files, operators_impl)
+    # 5. 构建新的 lib1.c 与算子实现编译单元
+    print("\\n[5/6] 构建新的 lib1.c 与算子编译单元 ...")
+    kernels = split_kernel_definitions(operators_impl)
+    units = group_kernel_units(kernels, args.kernel_units)
+    kernel_units = write_kernel_units(project_root, units)
+    print(f"    {len(kernels)} 个内核 -> {len(kernel_units)} 个编译单元 (src/kernels_NN.c)")
+    extra_cflags = SIMD_CFLAGS[args.simd_pragma] if args.kernel_hints else ''
+
+    if args.vec_report:
+        print("    编译分析向量化（-fopt-info-vec）...")
+        cflags = ['-O3', '-fPIC', '-pthread'] + extra_cflags.split()
+        plain_units = group_kernel_units(split_kernel_definitions(plain_impl), args.kernel_units)
+        before = compile_vectorization_info(plain_units, cflags)
+        after = compile_vectorization_info(units, cflags) if args.kernel_hints else before
+        write_vectorization_report(args.vec_report, before, after,
+                                   hint_stats if args.kernel_hints else {})
+    new_content = build_new_lib1(orig_content, generated_files, weights)
     
     # 写入 src/lib1.c
     src_lib1_path = os.path.join(project_root, 'src', 'lib1.c')
-    with open(src_lib1_path, 'w') as f:
-        f.write(new_content)
+    changed = write_if_changed(src_lib1_path, new_content)
     
-    print(f"    写入: {src_lib1_path}")
+    print(f"    写入: {src_lib1_path}{'' if changed else '（未变化）'}")
     print(f"    新文件大小: {len(new_content)} 字节")
     
     # 6. 生成 Makefile 和测试文件
@@ -517,9 +1632,9 @@ def main():
             op_count = int(match.group(1))
     
     # 获取输入输出大小
-    input_size, output_size = parse_io_sizes(init_lib1_path)
+    input_size, output_size = parse_io_sizes(generated_files.get('entity', ''))
     
-    makefile_path = generate_makefile(project_root, model_name, op_count)
+    makefile_path = generate_makefile(project_root, model_name, op_count, kernel_units, extra_cflags)
     print(f"    生成: {makefile_path}")
     
     test_path = generate_test_main(project_root, model_name, input_size, output_size)
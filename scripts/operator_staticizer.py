@@ -6,12 +6,28 @@ TVM 算子静态化脚本 - 生成 SchedulableEntity 和相关数据结构
 提取算子调用序列和依赖关系，生成符合建议书规范的调度数据结构。
 
 使用方法:
-    python3 scripts/operator_staticizer.py
+    python3 scripts/operator_staticizer.py [--shared-scratch] [--op-costs FILE]
+                                           [--tile-count N] [--tile-min-share F]
+                                           [--coarsen-max-share F] [--dag-report FILE] [--dag-dot FILE]
+
+选项:
+    --shared-scratch  内核 scratch 保留在共享 global_workspace 中（不使用每 Worker 私有 arena）
+    --op-costs FILE   使用实测代价计算优先级（JSON，格式同 op_cost_generated.json 的 ops[].id/cost）
+    --tile-count N    代价占比高的算子按最外层独立循环拆成 N 个实体（默认 4，1 表示不分块）
+    --tile-min-share F  参与分块的最小代价占比（默认 0.02）
+    --coarsen-max-share F  线性链合并为超实体时单个超实体的最大代价占比（默认 1.0 即整条链合并，0 表示不合并）
+    --dag-report FILE 写出最终实体 DAG 的分析 JSON：拓扑分层与层宽、每层代价、关键路径与
+                      理论最大加速比（总代价 / 关键路径代价）、各实体 slack、串行与逐层并行
+                      两种顺序下 workspace 的存活字节
+    --dag-dot FILE    写出 Graphviz DOT（同层同行，按代价着色，关键路径标红）
 """
 
 import re
 import os
 import sys
+import ast
+import json
+import argparse
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Tuple, Optional
 
@@ -27,6 +43,39 @@ class OperatorInfo:
     inputs: List[str]                # 输入变量名列表
     outputs: List[str]               # 输出变量名列表（从参数推断）
     all_params: List[str]            # 所有参数（不含 cws, ws）
+    tile: Optional[Tuple[int, int, int]] = None  # 算子内分块: (分块序号, 起始迭代, 结束迭代)
+    members: List['OperatorInfo'] = field(default_factory=list)  # 线性链合并后依次执行的源实体
+
+@dataclass
+class BufferAccess:
+    """内核对某个缓冲区的访问范围（float 元素下标，闭区间）"""
+    buffer: str                      # 参数名或 *_let 名
+    is_write: bool
+    lo: int
+    hi: int
+    count: int = 1                   # 动态访问次数（外层循环迭代数之积）
+
+@dataclass
+class KernelInfo:
+    """单个 tvmgen_default_fused_* 内核的解析结果"""
+    func_name: str
+    params: List[str]                              # 全部参数名（含 cws, ws）
+    ws_param: str                                  # global_workspace_N_var
+    ws_lets: Dict[str, int] = field(default_factory=dict)   # *_let -> ws 字节偏移
+    cws_lets: Dict[str, int] = field(default_factory=dict)  # *_let -> cws 字节偏移（权重）
+    accesses: List[BufferAccess] = field(default_factory=list)
+    macs: int = 0                    # 乘加次数
+    flops: int = 0                   # 浮点运算次数（含 expf）
+
+@dataclass
+class OpCost:
+    """单个算子的静态代价估计"""
+    macs: int
+    flops: int
+    const_bytes_read: int            # 读取常量（权重）字节数
+    ws_bytes_read: int               # 读取 workspace / 输入输出字节数
+    ws_bytes_written: int            # 写入 workspace / 输入输出字节数
+    cost: int                        # 综合代价（相对单位，见 COST_BYTES_WEIGHT）
 
 @dataclass 
 class DAGInfo:
@@ -35,6 +84,7 @@ class DAGInfo:
     predecessors: Dict[int, Set[int]]   # op_idx -> 前驱算子集合
     successors: Dict[int, Set[int]]     # op_idx -> 后继算子集合
     indegrees: Dict[int, int]           # op_idx -> 初始入度
+    hazard_edges: Dict[str, int] = field(default_factory=dict)  # 内存冲突补边统计
 
 
 # ============================================================
@@ -129,11 +179,464 @@ def parse_main_function(lib1_path: str) -> Tuple[List[OperatorInfo], Dict[str, s
     return operators, sid_definitions
 
 
-def build_dag(operators: List[OperatorInfo]) -> DAGInfo:
+# ============================================================
+# 解析算子内核（访存范围）
+# ============================================================
+
+Interval = Tuple[int, int]
+
+
+def _eval_interval(node: ast.AST, env: Dict[str, Interval]) -> Interval:
+    """对下标表达式做区间求值（保守上界）"""
+    if isinstance(node, ast.Expression):
+        return _eval_interval(node.body, env)
+    if isinstance(node, ast.Constant):
+        return (int(node.value), int(node.value))
+    if isinstance(node, ast.Name):
+        if node.id not in env:
+            raise ValueError(f"未知变量: {node.id}")
+        return env[node.id]
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        lo, hi = _eval_interval(node.operand, env)
+        return (-hi, -lo)
+    if isinstance(node, ast.BinOp):
+        a_lo, a_hi = _eval_interval(node.left, env)
+        b_lo, b_hi = _eval_interval(node.right, env)
+        if isinstance(node.op, ast.Add):
+            return (a_lo + b_lo, a_hi + b_hi)
+        if isinstance(node.op, ast.Sub):
+            return (a_lo - b_hi, a_hi - b_lo)
+        if isinstance(node.op, ast.Mult):
+            products = [a_lo * b_lo, a_lo * b_hi, a_hi * b_lo, a_hi * b_hi]
+            return (min(products), max(products))
+        if b_lo != b_hi or b_lo <= 0:
+            raise ValueError("除数/模数/移位量必须为正常量")
+        c = b_lo
+        if isinstance(node.op, ast.FloorDiv):
+            return (a_lo // c, a_hi // c)
+        if isinstance(node.op, ast.Mod):
+            if a_lo >= 0 and a_hi - a_lo < c and a_lo % c <= a_hi % c:
+                return (a_lo % c, a_hi % c)
+            return (0, c - 1) if a_lo >= 0 else (-(c - 1), c - 1)
+        if isinstance(node.op, ast.RShift):
+            return (a_lo >> c, a_hi >> c)
+        if isinstance(node.op, ast.BitAnd):
+            return (0, min(c, a_hi) if a_lo >= 0 else c)
+    raise ValueError(f"不支持的表达式: {ast.dump(node)}")
+
+
+def eval_index_interval(expr: str, env: Dict[str, Interval]) -> Interval:
+    """C 下标表达式 -> 区间；下标均非负，'/' 按整除处理"""
+    py_expr = expr.replace('/', '//')
+    return _eval_interval(ast.parse(py_expr, mode='eval'), env)
+
+
+def _match_bracket(text: str, open_pos: int) -> int:
+    """返回与 text[open_pos] 处 '[' 匹配的 ']' 位置"""
+    depth = 0
+    for pos in range(open_pos, len(text)):
+        if text[pos] == '[':
+            depth += 1
+        elif text[pos] == ']':
+            depth -= 1
+            if depth == 0:
+                return pos
+    raise ValueError("下标括号不匹配")
+
+
+def _extract_function_body(content: str, body_start: int) -> str:
+    """从 '{' 之后开始按花括号计数提取函数体"""
+    brace_count = 1
+    end_pos = body_start
+    while brace_count > 0 and end_pos < len(content):
+        if content[end_pos] == '{':
+            brace_count += 1
+        elif content[end_pos] == '}':
+            brace_count -= 1
+        end_pos += 1
+    return content[body_start:end_pos - 1]
+
+
+_FLOAT_LITERAL = re.compile(r'\d+\.\d+e[+-]\d+f')
+_BINARY_MINUS = re.compile(r'(?<=[\w)\]])\s*-')
+
+
+def _strip_subscripts(text: str) -> str:
+    """去掉 [...] 下标和指针强制转换，仅保留浮点运算部分"""
+    text = text.replace('(float*)', '')
+    out = []
+    depth = 0
+    for ch in text:
+        if ch == '[':
+            depth += 1
+        elif ch == ']':
+            depth -= 1
+        elif depth == 0:
+            out.append(ch)
+    return ''.join(out)
+
+
+def count_float_ops(statement: str) -> Tuple[int, int]:
+    """
+    统计一条浮点赋值语句右侧的运算数
+
+    Returns:
+        (乘加数, 浮点运算数)；乘加数取 '*' 与 '+' 次数的较小值，expf 计 1 次运算
+    """
+    rhs = _strip_subscripts(statement.split('=', 1)[1])
+    rhs = _FLOAT_LITERAL.sub('0', rhs)
+    muls = rhs.count('*')
+    adds = rhs.count('+') + len(_BINARY_MINUS.findall(rhs))
+    other = rhs.count('/') + rhs.count('?') + rhs.count('expf(')
+    return min(muls, adds), muls + adds + other
+
+
+def analyze_kernel_body(func_name: str, params: List[str], body: str,
+                        loop_ranges: Optional[Dict[str, Interval]] = None) -> KernelInfo:
+    """
+    逐行扫描内核函数体，跟踪循环变量和 cse_var 的取值区间，
+    记录每个缓冲区访问（参数或 workspace 中的 *_let）的下标范围和读写属性，
+    并按外层循环迭代数累计访问次数与浮点运算量
+
+    loop_ranges 可将指定循环变量限定在某个迭代区间（闭区间），用于分析分块后的内核
+    """
+    ws_param = next(p for p in params if re.match(r'global_workspace_\d+_var$', p))
+    kernel = KernelInfo(func_name=func_name, params=params, ws_param=ws_param)
+
+    let_pattern = re.compile(r'void\*\s+(\w+_let(?:_\d+)?)\s*=\s*\(\&\((\w+)\[(\d+)\]\)\);')
+    for_pattern = re.compile(r'for \(int32_t (\w+) = 0; \1 < (\d+); \+\+\1\)')
+    cse_pattern = re.compile(r'int32_t (cse_var_\d+) = (.+);$')
+    access_pattern = re.compile(r'\(\(float\*\)(\w+)\)\[|\b(\w+)\[')
+
+    float_stmt_pattern = re.compile(r'(\(\(float\*\)\w+\)\[|\w+\[|condval =|float v_+ =)')
+
+    buffers = set(params)
+    scopes: List[Tuple[int, str]] = []      # (所在深度, 循环变量)
+    env: Dict[str, Interval] = {}
+    depth = 0
+    trips = 1                               # 当前语句的执行次数
+
+    for raw_line in body.split('\n'):
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        let_match = let_pattern.match(line)
+        if let_match:
+            let_name, base, offset = let_match.groups()
+            buffers.add(let_name)
+            if base == ws_param:
+                kernel.ws_lets[let_name] = int(offset)
+            else:
+                kernel.cws_lets[let_name] = int(offset)
+            continue
+
+        for_match = for_pattern.match(line)
+        if for_match:
+            var, bound = for_match.group(1), int(for_match.group(2))
+            env[var] = loop_ranges[var] if loop_ranges and var in loop_ranges else (0, bound - 1)
+            scopes.append((depth + 1, var))
+            trips *= env[var][1] - env[var][0] + 1
+        else:
+            cse_match = cse_pattern.match(line)
+            if cse_match:
+                env[cse_match.group(1)] = eval_index_interval(cse_match.group(2), env)
+
+            for i, acc in enumerate(access_pattern.finditer(line)):
+                name = acc.group(1) or acc.group(2)
+                if name not in buffers:
+                    continue
+                close = _match_bracket(line, acc.end() - 1)
+                lo, hi = eval_index_interval(line[acc.end():close], env)
+                is_write = (i == 0 and acc.start() == 0 and
+                            re.match(r'\s*=(?!=)', line[close + 1:]) is not None)
+                kernel.accesses.append(BufferAccess(name, is_write, max(lo, 0), hi, trips))
+
+            if float_stmt_pattern.match(line) and re.search(r'[^=!<>]=[^=]', line):
+                macs, flops = count_float_ops(line)
+                kernel.macs += macs * trips
+                kernel.flops += flops * trips
+
+        depth += line.count('{') - line.count('}')
+        while scopes and scopes[-1][0] > depth:
+            var = scopes.pop()[1]
+            trips //= env[var][1] - env[var][0] + 1
+            env.pop(var, None)
+
+    return kernel
+
+
+def iter_kernel_definitions(content: str):
+    """遍历 tvmgen_default_fused_* 内核定义，产出 (函数名, 参数名列表, 函数体)"""
+    def_pattern = r'TVM_DLL\s+int32_t\s+(tvmgen_default_fused_\w+)\s*\(([^)]*)\)\s*\{'
+    for match in re.finditer(def_pattern, content):
+        params = [p.strip().split()[-1].lstrip('*') for p in match.group(2).split(',')]
+        yield match.group(1), params, _extract_function_body(content, match.end())
+
+
+def parse_kernel_functions(lib1_path: str) -> Dict[str, KernelInfo]:
+    """解析所有 tvmgen_default_fused_* 内核定义的访存信息"""
+    with open(lib1_path, 'r') as f:
+        content = f.read()
+
+    kernels: Dict[str, KernelInfo] = {}
+    for func_name, params, body in iter_kernel_definitions(content):
+        kernels[func_name] = analyze_kernel_body(func_name, params, body)
+
+    print(f"[operator_staticizer] 解析到 {len(kernels)} 个内核的访存范围")
+    return kernels
+
+
+# 综合代价 = 浮点运算数 + 访存字节数 * COST_BYTES_WEIGHT（一次 float 访问约折合一次运算）
+COST_BYTES_WEIGHT = 0.25
+
+
+def compute_op_cost(kernel: KernelInfo) -> OpCost:
+    """根据内核循环嵌套的解析结果估计算子代价"""
+    const_read = ws_read = ws_written = 0
+    for acc in kernel.accesses:
+        nbytes = acc.count * 4
+        if acc.buffer in kernel.cws_lets:
+            const_read += nbytes
+        elif acc.is_write:
+            ws_written += nbytes
+        else:
+            ws_read += nbytes
+    cost = kernel.flops + int((const_read + ws_read + ws_written) * COST_BYTES_WEIGHT)
+    return OpCost(
+        macs=kernel.macs,
+        flops=kernel.flops,
+        const_bytes_read=const_read,
+        ws_bytes_read=ws_read,
+        ws_bytes_written=ws_written,
+        cost=max(cost, 1)
+    )
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    """内容与磁盘上一致时不重写文件（保留时间戳，避免 make 无谓重编译），返回是否写入"""
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            if f.read() == content:
+                return False
+    with open(path, 'w') as f:
+        f.write(content)
+    return True
+
+
+def write_cost_report(path: str, operators: List[OperatorInfo], costs: List[OpCost]) -> bool:
+    """写出机器可读的算子代价报告（JSON）"""
+    total = sum(c.cost for c in costs)
+    report = {
+        'op_count': len(operators),
+        'cost_bytes_weight': COST_BYTES_WEIGHT,
+        'total': {
+            'macs': sum(c.macs for c in costs),
+            'flops': sum(c.flops for c in costs),
+            'const_bytes_read': sum(c.const_bytes_read for c in costs),
+            'ws_bytes_read': sum(c.ws_bytes_read for c in costs),
+            'ws_bytes_written': sum(c.ws_bytes_written for c in costs),
+            'cost': total,
+        },
+        'ops': [
+            dict(id=op.exec_idx, name=op.func_name, **vars(c),
+                 cost_share=round(c.cost / total, 6) if total else 0.0,
+                 **({'tile': list(op.tile)} if op.tile is not None else {}),
+                 **({'members': [entity_label(p) for p in op.members]} if len(op.members) > 1 else {}))
+            for op, c in zip(operators, costs)
+        ],
+    }
+    return write_if_changed(path, json.dumps(report, indent=2) + '\n')
+
+
+SCRATCH_ALIGN = 64
+
+
+def scratch_let_sizes(kernel: KernelInfo) -> Dict[str, int]:
+    """内核内部 workspace *_let 的字节大小（按访问到的最大下标）"""
+    sizes = {let: 0 for let in kernel.ws_lets}
+    for acc in kernel.accesses:
+        if acc.buffer in sizes:
+            sizes[acc.buffer] = max(sizes[acc.buffer], (acc.hi + 1) * 4)
+    return sizes
+
+
+def plan_scratch_arena(kernels: Dict[str, KernelInfo]) -> Tuple[Dict[str, Dict[str, int]], int]:
+    """
+    为每个内核的私有 scratch 重新分配 arena 内偏移
+
+    内核内部的 *_let 只在内核执行期间有效，按 SCRATCH_ALIGN 对齐顺序排布；
+    arena 大小取所有内核中的最大值，每个 Worker 一份
+
+    Returns:
+        layouts: func_name -> {let_name: arena 偏移}
+        arena_size: 单个 arena 的字节数
+    """
+    layouts: Dict[str, Dict[str, int]] = {}
+    arena_size = 0
+    for func_name, kernel in sorted(kernels.items()):
+        offset = 0
+        layout: Dict[str, int] = {}
+        for let, size in scratch_let_sizes(kernel).items():
+            layout[let] = offset
+            offset += (size + SCRATCH_ALIGN - 1) // SCRATCH_ALIGN * SCRATCH_ALIGN
+        layouts[func_name] = layout
+        arena_size = max(arena_size, offset)
+    return layouts, arena_size
+
+
+MODEL_INPUT = 'images_buffer_var'
+MODEL_OUTPUT = 'output_buffer_var'
+
+
+def compute_buffer_sizes(
+    operators: List[OperatorInfo],
+    kernels: Dict[str, KernelInfo],
+    sid_definitions: Dict[str, str],
+    private_scratch: bool = True
+) -> Tuple[int, int, int]:
+    """
+    按内核访存范围计算每个推理上下文需要的缓冲区大小
+
+    Returns:
+        (workspace 字节数（按 SCRATCH_ALIGN 对齐）, 模型输入 float 数, 模型输出 float 数)
+    """
+    ws_end = 0
+    io_sizes = {MODEL_INPUT: 0, MODEL_OUTPUT: 0}
+    for op in operators:
+        kernel = kernels[op.func_name]
+        reads, writes = compute_op_regions(op, kernel, sid_definitions,
+                                           include_scratch=not private_scratch)
+        ws_end = max([ws_end] + [hi for _, hi in reads + writes])
+        for param, arg in zip(kernel.params, op.all_params):
+            if arg in io_sizes:
+                io_sizes[arg] = max([io_sizes[arg]] +
+                                    [acc.hi + 1 for acc in kernel.accesses if acc.buffer == param])
+    ws_size = (ws_end + SCRATCH_ALIGN - 1) // SCRATCH_ALIGN * SCRATCH_ALIGN
+    return ws_size, io_sizes[MODEL_INPUT], io_sizes[MODEL_OUTPUT]
+
+
+def compute_op_regions(
+    op: OperatorInfo,
+    kernel: KernelInfo,
+    sid_definitions: Dict[str, str],
+    include_scratch: bool = True
+) -> Tuple[List[Interval], List[Interval]]:
+    """
+    计算算子在 global_workspace 中的读/写字节区间（左闭右开）
+
+    参数通过调用实参映射到 sid 偏移，内核内部的 *_let 直接使用自身偏移；
+    模型输入输出（images/output）不在 workspace 中，忽略。
+    include_scratch=False 时 *_let 已迁移到私有 arena，不参与冲突检测
+    """
+    bases: Dict[str, int] = dict(kernel.ws_lets) if include_scratch else {}
+    for param, arg in zip(kernel.params, op.all_params):
+        if arg in sid_definitions:
+            bases[param] = int(sid_definitions[arg])
+
+    hulls: Dict[Tuple[str, bool], Interval] = {}
+    for acc in kernel.accesses:
+        key = (acc.buffer, acc.is_write)
+        if key in hulls:
+            lo, hi = hulls[key]
+            hulls[key] = (min(lo, acc.lo), max(hi, acc.hi))
+        else:
+            hulls[key] = (acc.lo, acc.hi)
+
+    reads: List[Interval] = []
+    writes: List[Interval] = []
+    for (buffer, is_write), (lo, hi) in hulls.items():
+        if buffer not in bases:
+            continue
+        region = (bases[buffer] + lo * 4, bases[buffer] + (hi + 1) * 4)
+        (writes if is_write else reads).append(region)
+    return reads, writes
+
+
+def _regions_overlap(a: List[Interval], b: List[Interval]) -> bool:
+    return any(x_lo < y_hi and y_lo < x_hi for x_lo, x_hi in a for y_lo, y_hi in b)
+
+
+def compute_dag_levels(num_ops: int, predecessors: Dict[int, Set[int]]) -> List[int]:
+    """按最长路径计算拓扑层号（算子下标已是拓扑序）"""
+    levels = [0] * num_ops
+    for i in range(num_ops):
+        if predecessors[i]:
+            levels[i] = max(levels[p] for p in predecessors[i]) + 1
+    return levels
+
+
+def describe_parallel_width(num_ops: int, predecessors: Dict[int, Set[int]]) -> str:
+    levels = compute_dag_levels(num_ops, predecessors)
+    num_levels = max(levels) + 1 if levels else 0
+    widths = [levels.count(l) for l in range(num_levels)]
+    max_width = max(widths) if widths else 0
+    avg_width = num_ops / num_levels if num_levels else 0.0
+    return f"层数 {num_levels}, 最大并行宽度 {max_width}, 平均宽度 {avg_width:.2f}"
+
+
+def add_memory_hazard_edges(
+    operators: List[OperatorInfo],
+    kernels: Dict[str, KernelInfo],
+    sid_definitions: Dict[str, str],
+    predecessors: Dict[int, Set[int]],
+    successors: Dict[int, Set[int]],
+    private_scratch: bool = False
+) -> Dict[str, int]:
+    """
+    按 workspace 字节区间补充 RAW/WAR/WAW 边
+
+    TVM 的内存规划会复用重叠偏移，内核内部的 scratch（data_pad_let 等）
+    也写在 workspace 的固定位置；串行顺序下无害，并发执行时会互相覆盖。
+    对串行顺序中 i < j 且区间冲突、但 DAG 中尚不可达的算子对补边 i -> j。
+    """
+    num_ops = len(operators)
+    regions = [compute_op_regions(op, kernels[op.func_name], sid_definitions,
+                                  include_scratch=not private_scratch)
+               for op in operators]
+
+    # 祖先集合（位掩码），算子下标即串行拓扑序
+    ancestors = [0] * num_ops
+    stats = {'RAW': 0, 'WAR': 0, 'WAW': 0}
+
+    for j in range(num_ops):
+        for p in predecessors[j]:
+            ancestors[j] |= ancestors[p] | (1 << p)
+
+        reads_j, writes_j = regions[j]
+        # 由近及远，近处的边往往已传递覆盖远处的冲突
+        for i in range(j - 1, -1, -1):
+            if ancestors[j] >> i & 1:
+                continue
+            reads_i, writes_i = regions[i]
+            if _regions_overlap(writes_i, reads_j):
+                kind = 'RAW'
+            elif _regions_overlap(writes_i, writes_j):
+                kind = 'WAW'
+            elif _regions_overlap(reads_i, writes_j):
+                kind = 'WAR'
+            else:
+                continue
+            predecessors[j].add(i)
+            successors[i].add(j)
+            ancestors[j] |= ancestors[i] | (1 << i)
+            stats[kind] += 1
+
+    return stats
+
+
+def build_dag(
+    operators: List[OperatorInfo],
+    sid_definitions: Optional[Dict[str, str]] = None,
+    kernels: Optional[Dict[str, KernelInfo]] = None,
+    private_scratch: bool = False
+) -> DAGInfo:
     """
     根据算子的输入输出依赖关系构建 DAG
     
     规则：如果算子 B 的输入包含算子 A 的输出，则 A -> B
+    提供 kernels 时，再按 workspace 字节区间补充内存冲突边；
+    private_scratch=True 表示内核 scratch 已迁移到每 Worker 私有 arena
     """
     num_ops = len(operators)
     
@@ -163,6 +666,17 @@ def build_dag(operators: List[OperatorInfo]) -> DAGInfo:
                     predecessors[op.exec_idx].add(pred_idx)
                     successors[pred_idx].add(op.exec_idx)
     
+    hazard_edges: Dict[str, int] = {}
+    if kernels is not None:
+        print(f"[operator_staticizer] 数据依赖 DAG: {describe_parallel_width(num_ops, predecessors)}")
+        hazard_edges = add_memory_hazard_edges(
+            operators, kernels, sid_definitions or {}, predecessors, successors,
+            private_scratch)
+        total = sum(hazard_edges.values())
+        detail = ', '.join(f"{k} {v}" for k, v in hazard_edges.items())
+        print(f"[operator_staticizer] 内存冲突补边: {total} 条 ({detail})")
+        print(f"[operator_staticizer] 补边后 DAG: {describe_parallel_width(num_ops, predecessors)}")
+
     # 计算入度
     indegrees = {i: len(predecessors[i]) for i in range(num_ops)}
     
@@ -180,10 +694,817 @@ def build_dag(operators: List[OperatorInfo]) -> DAGInfo:
         num_ops=num_ops,
         predecessors=predecessors,
         successors=successors,
-        indegrees=indegrees
+        indegrees=indegrees,
+        hazard_edges=hazard_edges
+    )
+
+
+# ============================================================
+# workspace 内存重规划（基于生命周期）
+# ============================================================
+
+MEMORY_PLANS = ('parallel', 'serial', 'tvm')
+
+
+@dataclass
+class WorkspaceTensor:
+    """global_workspace 中的一个 sid 张量"""
+    name: str
+    size: int                        # 字节（覆盖所有访问，按 SCRATCH_ALIGN 对齐）
+    users: List[int]                 # 读写该张量的算子（exec_idx 升序）
+    writers: List[int]               # 写该张量的算子
+
+
+def collect_workspace_tensors(
+    operators: List[OperatorInfo],
+    kernels: Dict[str, KernelInfo],
+    sid_definitions: Dict[str, str]
+) -> List[WorkspaceTensor]:
+    """按内核访存范围统计每个 sid 张量的大小与读写算子"""
+    sizes: Dict[str, int] = {}
+    users: Dict[str, Set[int]] = {}
+    writers: Dict[str, Set[int]] = {}
+    for op in operators:
+        kernel = kernels[op.func_name]
+        for param, arg in zip(kernel.params, op.all_params):
+            if arg not in sid_definitions:
+                continue
+            for acc in kernel.accesses:
+                if acc.buffer != param:
+                    continue
+                # 带条件的 pad 读取按区间分析会略微越界，按全部访问取上界
+                sizes[arg] = max(sizes.get(arg, 0), (acc.hi + 1) * 4)
+                users.setdefault(arg, set()).add(op.exec_idx)
+                if acc.is_write:
+                    writers.setdefault(arg, set()).add(op.exec_idx)
+    return [
+        WorkspaceTensor(
+            name=name,
+            size=(size + SCRATCH_ALIGN - 1) // SCRATCH_ALIGN * SCRATCH_ALIGN,
+            users=sorted(users[name]),
+            writers=sorted(writers.get(name, ()))
+        )
+        for name, size in sizes.items()
+    ]
+
+
+def dataflow_descendants(operators: List[OperatorInfo]) -> List[int]:
+    """纯数据依赖（RAW）DAG 中每个算子的后代集合（位掩码，不含自身）"""
+    producers = {var: op.exec_idx for op in operators for var in op.outputs}
+    descendants = [0] * len(operators)
+    consumers: Dict[int, Set[int]] = {i: set() for i in range(len(operators))}
+    for op in operators:
+        for var in op.inputs:
+            if var in producers and producers[var] != op.exec_idx:
+                consumers[producers[var]].add(op.exec_idx)
+    for i in range(len(operators) - 1, -1, -1):
+        for c in consumers[i]:
+            descendants[i] |= descendants[c] | (1 << c)
+    return descendants
+
+
+def _tensor_before(a: WorkspaceTensor, b: WorkspaceTensor, plan: str,
+                   descendants: List[int]) -> bool:
+    """a 的全部访问是否一定先于 b 的首次写入（两者可共用内存）"""
+    if not a.users or not b.writers:
+        return False
+    if plan == 'serial':
+        return a.users[-1] < b.writers[0]
+    writers_mask = sum(1 << w for w in b.writers)
+    return all(descendants[u] & writers_mask == writers_mask for u in a.users)
+
+
+def plan_workspace(
+    tensors: List[WorkspaceTensor],
+    plan: str,
+    descendants: List[int]
+) -> Tuple[Dict[str, str], int]:
+    """
+    best-fit 重新分配 sid 张量在 workspace 中的偏移
+
+    plan='serial'：按串行执行顺序的生命周期区间判断能否共用内存；
+    plan='parallel'：仅当一个张量的所有访问者在数据依赖 DAG 中都先于另一个张量的
+    写入者时才共用，任意满足 DAG 的并行调度都不会产生新的内存冲突。
+    张量按大小降序放置，每个张量放入与其冲突的已放置张量之间最小的足够空隙。
+
+    Returns:
+        (sid -> 新偏移, workspace 字节数)
+    """
+    placed: List[Tuple[int, WorkspaceTensor]] = []
+    offsets: Dict[str, str] = {}
+    for tensor in sorted(tensors, key=lambda t: (-t.size, t.name)):
+        conflicts = sorted(
+            (offset, offset + other.size) for offset, other in placed
+            if not (_tensor_before(other, tensor, plan, descendants) or
+                    _tensor_before(tensor, other, plan, descendants))
+        )
+        best: Optional[Tuple[int, int]] = None   # (空隙大小, 偏移)
+        cursor = 0
+        for lo, hi in conflicts:
+            gap = lo - cursor
+            if gap >= tensor.size and (best is None or gap < best[0]):
+                best = (gap, cursor)
+            cursor = max(cursor, hi)
+        offset = best[1] if best else cursor
+        placed.append((offset, tensor))
+        offsets[tensor.name] = str(offset)
+    size = max((offset + t.size for offset, t in placed), default=0)
+    return offsets, size
+
+
+def serial_live_peak(tensors: List[WorkspaceTensor], num_ops: int) -> int:
+    """串行执行时同时存活张量的字节数峰值（任何布局的下界）"""
+    live = [0] * num_ops
+    for t in tensors:
+        for i in range(t.users[0], t.users[-1] + 1):
+            live[i] += t.size
+    return max(live, default=0)
+
+
+def replan_workspace(
+    operators: List[OperatorInfo],
+    kernels: Dict[str, KernelInfo],
+    sid_definitions: Dict[str, str],
+    plan: str
+) -> Dict[str, str]:
+    """
+    报告 TVM 原始布局与 serial/parallel 两种重规划的 workspace 大小，
+    返回所选方案的 sid 偏移（plan='tvm' 或重规划未变小时返回原偏移）
+    """
+    tensors = collect_workspace_tensors(operators, kernels, sid_definitions)
+    descendants = dataflow_descendants(operators)
+    tvm_size = max((int(sid_definitions[t.name]) + t.size for t in tensors), default=0)
+    plans = {name: plan_workspace(tensors, name, descendants) for name in ('parallel', 'serial')}
+
+    mb = 1024 * 1024
+    print(f"[operator_staticizer] workspace 规划: {len(tensors)} 个 sid 张量，"
+          f"串行存活峰值 {serial_live_peak(tensors, len(operators)) / mb:.2f} MB")
+    print(f"    tvm      {tvm_size / mb:6.2f} MB（TVM 原始偏移）")
+    print(f"    parallel {plans['parallel'][1] / mb:6.2f} MB（任意并行调度安全）")
+    print(f"    serial   {plans['serial'][1] / mb:6.2f} MB（按串行顺序复用，补边后并行度降低）")
+
+    if plan == 'tvm':
+        return sid_definitions
+    offsets, size = plans[plan]
+    if size >= tvm_size:
+        print(f"[operator_staticizer] {plan} 规划未小于 TVM 原始布局，保留原偏移")
+        return sid_definitions
+    print(f"[operator_staticizer] 采用 {plan} 规划: 每个上下文节省 {(tvm_size - size) / mb:.2f} MB")
+    remapped = dict(sid_definitions)
+    remapped.update(offsets)
+    return remapped
+
+
+# ============================================================
+# 算子内分块（intra-op tiling）
+# ============================================================
+
+# 默认对综合代价占比不低于 TILE_MIN_SHARE 的算子分块
+TILE_MIN_SHARE = 0.02
+TILE_COUNT = 4
+
+
+@dataclass
+class TilePlan:
+    """单个内核的分块方案：按最外层独立循环的迭代区间切成若干实体"""
+    func_name: str
+    loop_var: str                    # 被切分的顶层循环变量
+    bound: int                       # 循环总迭代数
+    ranges: List[Interval]           # 每个分块的迭代区间（左闭右开）
+    tile_kernels: List[KernelInfo]   # 每个分块的访存/代价分析结果
+
+
+_TOP_FOR = re.compile(r'for \(int32_t (\w+) = 0; \1 < (\d+); \+\+\1\) \{')
+
+
+def find_tile_loop(body: str) -> Optional[Tuple[str, int, int]]:
+    """
+    找到内核函数体中最后一个顶层 for 循环（其后只能是 return 0;）
+
+    Returns:
+        (循环变量, 迭代数, 循环在 body 中的起始位置)；不满足结构要求时返回 None
+    """
+    depth = 0
+    pos = 0
+    last = None
+    after_last: List[str] = []
+    for raw_line in body.split('\n'):
+        line = raw_line.strip()
+        if depth == 0 and line:
+            match = _TOP_FOR.match(line)
+            if match:
+                last = (match.group(1), int(match.group(2)), pos + raw_line.index('for'))
+                after_last = []
+            elif last is not None:
+                after_last.append(line)
+        depth += line.count('{') - line.count('}')
+        pos += len(raw_line) + 1
+    if last is None or after_last != ['return 0;']:
+        return None
+    # 循环变量名在函数内唯一，分块时只改写这一个循环头
+    if len(re.findall(rf'for \(int32_t {last[0]} = ', body)) != 1:
+        return None
+    return last
+
+
+def plan_kernel_tiling(func_name: str, params: List[str], body: str,
+                       num_tiles: int) -> Optional[TilePlan]:
+    """
+    检查内核能否按最外层循环分块并给出分块方案
+
+    要求：
+    1. 循环之前的部分（如 data_pad 填充）只写内核私有 scratch，可在每个分块中重复执行
+    2. 循环内不写循环外声明的 scratch（无跨迭代状态）
+    3. 各分块对参数缓冲区（输入/输出）的写区间互不相交，且不读其他分块写的区间
+    """
+    found = find_tile_loop(body)
+    if found is None:
+        return None
+    var, bound, loop_start = found
+    num_tiles = min(num_tiles, bound)
+    if num_tiles < 2:
+        return None
+
+    prologue = analyze_kernel_body(func_name, params, body[:loop_start])
+    if any(acc.is_write and acc.buffer in params for acc in prologue.accesses):
+        return None
+    outer_lets = set(prologue.ws_lets)
+    skip = len(prologue.accesses)
+
+    ranges = [(bound * t // num_tiles, bound * (t + 1) // num_tiles) for t in range(num_tiles)]
+    tile_kernels = [analyze_kernel_body(func_name, params, body, {var: (lo, hi - 1)})
+                    for lo, hi in ranges]
+
+    hulls: List[Dict[Tuple[str, bool], Interval]] = []
+    for kernel in tile_kernels:
+        hull: Dict[Tuple[str, bool], Interval] = {}
+        for acc in kernel.accesses[skip:]:
+            if acc.is_write and acc.buffer in outer_lets:
+                return None
+            if acc.buffer not in params:
+                continue
+            key = (acc.buffer, acc.is_write)
+            lo, hi = hull.get(key, (acc.lo, acc.hi))
+            hull[key] = (min(lo, acc.lo), max(hi, acc.hi))
+        hulls.append(hull)
+
+    for a in range(num_tiles):
+        for b in range(num_tiles):
+            if a == b:
+                continue
+            for (buffer, is_write), (lo, hi) in hulls[a].items():
+                if not is_write:
+                    continue
+                for key in ((buffer, True), (buffer, False)):
+                    if key in hulls[b] and lo <= hulls[b][key][1] and hulls[b][key][0] <= hi:
+                        return None
+
+    return TilePlan(func_name, var, bound, ranges, tile_kernels)
+
+
+def plan_tiling(lib1_path: str, operators: List[OperatorInfo], op_costs: List[OpCost],
+                kernels: Dict[str, KernelInfo], sid_definitions: Dict[str, str],
+                num_tiles: int = TILE_COUNT, min_share: float = TILE_MIN_SHARE) -> Dict[str, TilePlan]:
+    """
+    为代价占比不低于 min_share 的算子所用内核生成分块方案
+
+    TVM 的内存规划可能让输出复用输入的 workspace（输入只在 data_pad 中读取一次），
+    这类算子的分块会在后续分块重复前置部分时读到已被覆盖的输入，不做分块
+    """
+    if num_tiles < 2:
+        return {}
+    total = sum(c.cost for c in op_costs)
+    heavy = {op.func_name for op, c in zip(operators, op_costs) if c.cost >= total * min_share}
+    for op in operators:
+        if op.func_name not in heavy:
+            continue
+        reads, writes = compute_op_regions(op, kernels[op.func_name], sid_definitions,
+                                           include_scratch=False)
+        if _regions_overlap(reads, writes):
+            print(f"[operator_staticizer] 跳过分块（输出与输入共享 workspace）: {op.func_name}")
+            heavy.discard(op.func_name)
+
+    with open(lib1_path, 'r') as f:
+        content = f.read()
+
+    plans: Dict[str, TilePlan] = {}
+    for func_name, params, body in iter_kernel_definitions(content):
+        if func_name not in heavy:
+            continue
+        plan = plan_kernel_tiling(func_name, params, body, num_tiles)
+        if plan is None:
+            print(f"[operator_staticizer] 跳过分块（循环结构不满足独立性要求）: {func_name}")
+            continue
+        plans[func_name] = plan
+    return plans
+
+
+def make_tiled_kernel(func_src: str, func_name: str) -> str:
+    """
+    由内核定义生成分块版本 <func>_tiled(..., int32_t tile_begin, int32_t tile_end)
+
+    只改写函数名、参数列表和最外层分块循环的循环头，其余代码（含已重定位的 scratch）保持不变
+    """
+    header = re.match(rf'TVM_DLL\s+int32_t\s+{func_name}\s*\(([^)]*)\)\s*\{{', func_src)
+    if header is None:
+        raise ValueError(f"找不到内核定义: {func_name}")
+    found = find_tile_loop(_extract_function_body(func_src, header.end()))
+    if found is None:
+        raise ValueError(f"内核不可分块: {func_name}")
+    var, bound, _ = found
+
+    tiled = (f"TVM_DLL int32_t {func_name}_tiled({header.group(1)}, "
+             f"int32_t tile_begin, int32_t tile_end) {{") + func_src[header.end():]
+    return tiled.replace(f"for (int32_t {var} = 0; {var} < {bound}; ++{var}) {{",
+                         f"for (int32_t {var} = tile_begin; {var} < tile_end; ++{var}) {{", 1)
+
+
+def expand_tiled_operators(
+    operators: List[OperatorInfo],
+    dag: DAGInfo,
+    plans: Dict[str, TilePlan]
+) -> Tuple[List[OperatorInfo], DAGInfo]:
+    """
+    将分块算子展开为多个实体，并把算子级 DAG 映射到实体级
+
+    同一算子的分块之间没有边（写区间不相交、scratch 为每 Worker 私有），
+    每个分块继承原算子的全部前驱和后继
+    """
+    entities: List[OperatorInfo] = []
+    members: List[List[int]] = []
+    for op in operators:
+        plan = plans.get(op.func_name)
+        tiles = [(t, lo, hi) for t, (lo, hi) in enumerate(plan.ranges)] if plan else [None]
+        ids = []
+        for tile in tiles:
+            ids.append(len(entities))
+            entities.append(OperatorInfo(
+                exec_idx=len(entities),
+                func_name=op.func_name,
+                inputs=op.inputs,
+                outputs=op.outputs,
+                all_params=op.all_params,
+                tile=tile,
+            ))
+        members.append(ids)
+
+    num_entities = len(entities)
+    predecessors: Dict[int, Set[int]] = {i: set() for i in range(num_entities)}
+    successors: Dict[int, Set[int]] = {i: set() for i in range(num_entities)}
+    for op_idx in range(dag.num_ops):
+        for succ in dag.successors[op_idx]:
+            for a in members[op_idx]:
+                for b in members[succ]:
+                    successors[a].add(b)
+                    predecessors[b].add(a)
+
+    return entities, DAGInfo(
+        num_ops=num_entities,
+        predecessors=predecessors,
+        successors=successors,
+        indegrees={i: len(predecessors[i]) for i in range(num_entities)},
+        hazard_edges=dag.hazard_edges,
+    )
+
+
+def entity_cost(op: OperatorInfo, kernels: Dict[str, KernelInfo],
+                plans: Dict[str, TilePlan]) -> OpCost:
+    """实体的静态代价：分块实体按自身迭代区间（含重复执行的前置部分）估计"""
+    if op.tile is None:
+        return compute_op_cost(kernels[op.func_name])
+    return compute_op_cost(plans[op.func_name].tile_kernels[op.tile[0]])
+
+
+def entity_label(op: OperatorInfo) -> str:
+    """实体名称（调试/追踪用）：分块实体追加 #分块序号"""
+    return op.func_name if op.tile is None else f"{op.func_name}#{op.tile[0]}"
+
+
+# ============================================================
+# 线性链合并（超实体）
+# ============================================================
+
+COARSEN_MAX_SHARE = 1.0
+
+
+def entity_parts(op: OperatorInfo) -> List[OperatorInfo]:
+    """实体依次执行的源实体（exec_idx 为合并前的编号）；未合并时为自身"""
+    return op.members or [op]
+
+
+def entity_wrapper(op: OperatorInfo) -> str:
+    """源实体的包装函数名"""
+    if op.tile is None:
+        return f"wrapped_{op.func_name}"
+    return f"wrapped_{op.func_name}_tile{op.tile[0]}"
+
+
+def find_linear_chains(dag: DAGInfo) -> List[List[int]]:
+    """
+    把实体划分为极大线性链（单个实体也是长度为 1 的链）
+
+    链内相邻两个实体 a -> b 满足：a 的唯一后继是 b，b 的唯一前驱是 a（依赖边含内存冲突补边），
+    因此链内实体本来就只能依次执行，合并不损失并行度
+    """
+    def single(edges: Set[int]) -> Optional[int]:
+        return next(iter(edges)) if len(edges) == 1 else None
+
+    chains = []
+    for i in range(dag.num_ops):
+        pred = single(dag.predecessors[i])
+        if pred is not None and single(dag.successors[pred]) == i:
+            continue  # 不是链头
+        chain = [i]
+        succ = single(dag.successors[i])
+        while succ is not None and single(dag.predecessors[succ]) == chain[-1]:
+            chain.append(succ)
+            succ = single(dag.successors[succ])
+        chains.append(chain)
+    return chains
+
+
+def split_chain(chain: List[int], costs: List[float], max_cost: float) -> List[List[int]]:
+    """按代价上限把链贪心切成若干段（单个实体超过上限时独占一段）"""
+    groups = [[chain[0]]]
+    acc = costs[chain[0]]
+    for i in chain[1:]:
+        if acc + costs[i] > max_cost:
+            groups.append([i])
+            acc = costs[i]
+        else:
+            groups[-1].append(i)
+            acc += costs[i]
+    return groups
+
+
+def coarsen_chains(
+    operators: List[OperatorInfo],
+    dag: DAGInfo,
+    costs: List[float],
+    max_share: float = COARSEN_MAX_SHARE
+) -> Tuple[List[OperatorInfo], DAGInfo]:
+    """
+    把线性链合并为超实体：一次派发、在同一 Worker 上依次执行链上的内核
+
+    超实体的 inputs/outputs 为各成员参数的拼接，members 保留合并前的实体（含原编号），
+    用于生成链包装函数与实体 -> 源算子映射。超实体按链头的串行位置排序：
+    跨段的边只能从段尾指向段头，因此新编号仍是拓扑序
+    """
+    total = sum(costs)
+    max_cost = max_share * total if max_share < 1.0 else float('inf')
+    groups: List[List[int]] = []
+    for chain in find_linear_chains(dag):
+        groups.extend(split_chain(chain, costs, max_cost))
+    groups.sort(key=lambda g: g[0])
+
+    group_of = {}
+    entities: List[OperatorInfo] = []
+    for new_idx, group in enumerate(groups):
+        parts = [operators[i] for i in group]
+        for i in group:
+            group_of[i] = new_idx
+        entities.append(OperatorInfo(
+            exec_idx=new_idx,
+            func_name=parts[0].func_name,
+            inputs=[v for p in parts for v in p.inputs],
+            outputs=[v for p in parts for v in p.outputs],
+            all_params=[v for p in parts for v in p.all_params],
+            tile=parts[0].tile if len(parts) == 1 else None,
+            members=parts,
+        ))
+
+    num_entities = len(entities)
+    predecessors: Dict[int, Set[int]] = {i: set() for i in range(num_entities)}
+    successors: Dict[int, Set[int]] = {i: set() for i in range(num_entities)}
+    for op_idx in range(dag.num_ops):
+        for succ in dag.successors[op_idx]:
+            a, b = group_of[op_idx], group_of[succ]
+            if a != b:
+                successors[a].add(b)
+                predecessors[b].add(a)
+
+    return entities, DAGInfo(
+        num_ops=num_entities,
+        predecessors=predecessors,
+        successors=successors,
+        indegrees={i: len(predecessors[i]) for i in range(num_entities)},
+        hazard_edges=dag.hazard_edges,
+    )
+
+
+def sum_op_costs(costs: List[OpCost]) -> OpCost:
+    """超实体的静态代价：成员代价逐项相加"""
+    return OpCost(
+        macs=sum(c.macs for c in costs),
+        flops=sum(c.flops for c in costs),
+        const_bytes_read=sum(c.const_bytes_read for c in costs),
+        ws_bytes_read=sum(c.ws_bytes_read for c in costs),
+        ws_bytes_written=sum(c.ws_bytes_written for c in costs),
+        cost=sum(c.cost for c in costs),
     )
 
 
+# ============================================================
+# 调度优先级（关键路径）
+# ============================================================
+
+def compute_bottom_levels(dag: DAGInfo, costs: List[float]) -> List[float]:
+    """bottom level：从算子开始到 DAG 出口的最长代价路径（含自身）"""
+    blevels = [0.0] * dag.num_ops
+    for i in range(dag.num_ops - 1, -1, -1):
+        tail = max((blevels[s] for s in dag.successors[i]), default=0.0)
+        blevels[i] = costs[i] + tail
+    return blevels
+
+
+def compute_priorities(dag: DAGInfo, costs: List[float]) -> List[int]:
+    """
+    按 bottom level 计算 ExecConfig.priority
+
+    priority 为 bottom level 的名次（0 ~ num_ops-1，越大越关键），
+    bottom level 相同时串行顺序靠前的优先
+    """
+    blevels = compute_bottom_levels(dag, costs)
+    order = sorted(range(dag.num_ops), key=lambda i: (blevels[i], -i))
+    priorities = [0] * dag.num_ops
+    for rank, op_idx in enumerate(order):
+        priorities[op_idx] = rank
+    return priorities
+
+
+def critical_path(dag: DAGInfo, costs: List[float]) -> List[int]:
+    """沿 bottom level 最大的后继走出的关键路径"""
+    blevels = compute_bottom_levels(dag, costs)
+    sources = [i for i in range(dag.num_ops) if not dag.predecessors[i]]
+    if not sources:
+        return []
+    path = [max(sources, key=lambda i: blevels[i])]
+    while dag.successors[path[-1]]:
+        path.append(max(dag.successors[path[-1]], key=lambda i: blevels[i]))
+    return path
+
+
+# ============================================================
+# DAG 静态分析（并行度与内存压力）
+# ============================================================
+
+@dataclass
+class DAGAnalysis:
+    """最终实体 DAG 的静态分析（代价单位同 costs）"""
+    levels: List[int]                # 实体 -> 拓扑层号（ASAP，按最长边数）
+    level_widths: List[int]          # 每层实体数
+    level_costs: List[float]         # 每层代价之和
+    total_cost: float                # 总工作量 T1
+    path: List[int]                  # 关键路径
+    path_cost: float                 # 关键路径代价 T∞
+    top_levels: List[float]          # 入口到实体开始的最长代价路径
+    bottom_levels: List[float]       # 实体开始到出口的最长代价路径（含自身）
+    serial_live: List[int]           # 按实体编号串行执行时每个实体执行期间存活的 workspace 字节
+    level_live: List[int]            # 逐层并行执行（层间同步）时每层存活的 workspace 字节
+    max_speedup: float               # 理论最大加速比 T1 / T∞（无限 Worker、零调度开销）
+
+
+def compute_top_levels(dag: DAGInfo, costs: List[float]) -> List[float]:
+    """top level：从 DAG 入口到算子开始的最长代价路径（不含自身）"""
+    tlevels = [0.0] * dag.num_ops
+    for i in range(dag.num_ops):
+        tlevels[i] = max((tlevels[p] + costs[p] for p in dag.predecessors[i]), default=0.0)
+    return tlevels
+
+
+def live_bytes_profile(entity_tensors: List[Set[str]], sizes: Dict[str, int],
+                       steps: List[int], num_steps: int) -> List[int]:
+    """张量从首个访问它的实体所在步存活到最后一个访问它的实体所在步，返回每步存活字节数"""
+    spans: Dict[str, Tuple[int, int]] = {}
+    for entity, names in enumerate(entity_tensors):
+        step = steps[entity]
+        for name in names:
+            lo, hi = spans.get(name, (step, step))
+            spans[name] = (min(lo, step), max(hi, step))
+    live = [0] * num_steps
+    for name, (lo, hi) in spans.items():
+        for step in range(lo, hi + 1):
+            live[step] += sizes[name]
+    return live
+
+
+def analyze_dag(operators: List[OperatorInfo], dag: DAGInfo, costs: List[float],
+                tensors: List[WorkspaceTensor]) -> DAGAnalysis:
+    """
+    拓扑分层、层宽与每层代价、关键路径与理论加速比，以及两种执行顺序下的 workspace 存活字节
+
+    存活字节按实体粒度统计 sid 张量（不含输入/输出与内核私有 scratch）：
+    超实体内部的中间张量在整个超实体执行期间都计为存活
+    """
+    levels = compute_dag_levels(dag.num_ops, dag.predecessors)
+    num_levels = max(levels) + 1 if levels else 0
+    level_widths = [0] * num_levels
+    level_costs = [0.0] * num_levels
+    for i, level in enumerate(levels):
+        level_widths[level] += 1
+        level_costs[level] += costs[i]
+    path = critical_path(dag, costs)
+
+    total_cost = sum(costs)
+    path_cost = sum(costs[i] for i in path)
+
+    sizes = {t.name: t.size for t in tensors}
+    entity_tensors = [{arg for arg in op.all_params if arg in sizes} for op in operators]
+    return DAGAnalysis(
+        levels=levels,
+        level_widths=level_widths,
+        level_costs=level_costs,
+        total_cost=total_cost,
+        path=path,
+        path_cost=path_cost,
+        top_levels=compute_top_levels(dag, costs),
+        bottom_levels=compute_bottom_levels(dag, costs),
+        serial_live=live_bytes_profile(entity_tensors, sizes, list(range(dag.num_ops)), dag.num_ops),
+        level_live=live_bytes_profile(entity_tensors, sizes, levels, num_levels),
+        max_speedup=total_cost / path_cost if path_cost else 1.0,
+    )
+
+
+def print_dag_analysis(analysis: DAGAnalysis, dag: DAGInfo, workspace_size: int):
+    """打印分析摘要"""
+    num_levels = len(analysis.level_widths)
+    num_edges = sum(len(s) for s in dag.successors.values())
+    histogram: Dict[int, int] = {}
+    for width in analysis.level_widths:
+        histogram[width] = histogram.get(width, 0) + 1
+    share = analysis.path_cost / analysis.total_cost * 100 if analysis.total_cost else 0.0
+    mb = 1024 * 1024
+
+    print(f"[operator_staticizer] DAG 分析: {dag.num_ops} 个实体, {num_edges} 条边, {num_levels} 层")
+    print(f"    层宽: 最大 {max(analysis.level_widths, default=0)}, "
+          f"平均 {dag.num_ops / num_levels if num_levels else 0.0:.2f}; "
+          f"宽度分布 {', '.join(f'{w}:{n}' for w, n in sorted(histogram.items()))}（宽度:层数）")
+    print(f"    关键路径: {len(analysis.path)} 个实体, 代价 {analysis.path_cost:.0f} / "
+          f"总代价 {analysis.total_cost:.0f}（占比 {share:.1f}%）")
+    print(f"    理论最大加速比 T1/T∞ = {analysis.max_speedup:.2f}x（无限 Worker、零调度开销）")
+    if analysis.serial_live:
+        serial_peak = max(analysis.serial_live)
+        level_peak = max(analysis.level_live)
+        print(f"    workspace 存活峰值: 串行 {serial_peak / mb:.2f} MB"
+              f"（实体 {analysis.serial_live.index(serial_peak)}），"
+              f"逐层并行 {level_peak / mb:.2f} MB（第 {analysis.level_live.index(level_peak)} 层），"
+              f"实际分配 {workspace_size / mb:.2f} MB")
+
+
+def write_dag_report(path: str, operators: List[OperatorInfo], dag: DAGInfo,
+                     costs: List[float], analysis: DAGAnalysis, workspace_size: int):
+    """写出 DAG 分析的 JSON 报告"""
+    on_path = set(analysis.path)
+    total = analysis.total_cost
+    levels = [
+        {'level': level, 'width': width, 'cost': cost,
+         'live_bytes': analysis.level_live[level] if analysis.level_live else 0,
+         'entities': [i for i, l in enumerate(analysis.levels) if l == level]}
+        for level, (width, cost) in enumerate(zip(analysis.level_widths, analysis.level_costs))
+    ]
+    entities = [
+        {'id': i, 'name': entity_label(op), 'level': analysis.levels[i], 'cost': costs[i],
+         'cost_share': round(costs[i] / total, 6) if total else 0.0,
+         'top_level': analysis.top_levels[i], 'bottom_level': analysis.bottom_levels[i],
+         'slack': analysis.path_cost - analysis.top_levels[i] - analysis.bottom_levels[i],
+         'critical': i in on_path,
+         'serial_live_bytes': analysis.serial_live[i] if analysis.serial_live else 0,
+         'predecessors': sorted(dag.predecessors[i]), 'successors': sorted(dag.successors[i]),
+         **({'members': [entity_label(p) for p in op.members]} if len(op.members) > 1 else {})}
+        for i, op in enumerate(operators)
+    ]
+    report = {
+        'entity_count': dag.num_ops,
+        'edge_count': sum(len(s) for s in dag.successors.values()),
+        'level_count': len(analysis.level_widths),
+        'max_width': max(analysis.level_widths, default=0),
+        'total_cost': total,
+        'critical_path': {'cost': analysis.path_cost, 'entities': analysis.path},
+        'max_speedup': analysis.max_speedup,
+        'memory': {
+            'workspace_bytes': workspace_size,
+            'serial_peak_bytes': max(analysis.serial_live, default=0),
+            'level_parallel_peak_bytes': max(analysis.level_live, default=0),
+        },
+        'levels': levels,
+        'entities': entities,
+    }
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+
+
+def write_dag_dot(path: str, operators: List[OperatorInfo], dag: DAGInfo,
+                  costs: List[float], analysis: DAGAnalysis):
+    """
+    写出 Graphviz DOT：同层实体排在同一行，填充色按代价由白到红，关键路径加粗标红
+
+    渲染: dot -Tsvg dag.dot -o dag.svg
+    """
+    on_path = set(analysis.path)
+    max_cost = max(costs, default=0.0) or 1.0
+    total = analysis.total_cost or 1.0
+    lines = [
+        'digraph dag {',
+        '  rankdir=TB;',
+        '  node [shape=box, style="rounded,filled", fontname="Helvetica", fontsize=10];',
+        '  edge [color="#888888"];',
+    ]
+    for i, op in enumerate(operators):
+        name = entity_label(op).replace('tvmgen_default_fused_', '')
+        if len(op.members) > 1:
+            name += f' (+{len(op.members) - 1})'
+        attrs = [f'label="{i}: {name}\\n{costs[i] / total * 100:.1f}%"',
+                 f'fillcolor="0.000 {min(costs[i] / max_cost, 1.0):.3f} 1.000"']
+        if i in on_path:
+            attrs.append('color=red, penwidth=2.5')
+        lines.append(f'  n{i} [{", ".join(attrs)}];')
+    for level in range(len(analysis.level_widths)):
+        members = ' '.join(f'n{i};' for i, l in enumerate(analysis.levels) if l == level)
+        lines.append(f'  {{ rank=same; {members} }}')
+    path_edges = set(zip(analysis.path, analysis.path[1:]))
+    for i in range(dag.num_ops):
+        for succ in sorted(dag.successors[i]):
+            style = ' [color=red, penwidth=2]' if (i, succ) in path_edges else ''
+            lines.append(f'  n{i} -> n{succ}{style};')
+    lines.append('}')
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+# ============================================================
+# 离线静态调度（HEFT 列表调度）
+# ============================================================
+
+STATIC_WORKERS = 4
+
+
+@dataclass
+class StaticSchedule:
+    """离线列表调度结果：每个 Worker 依次执行的实体序列"""
+    num_workers: int
+    sequences: List[List[int]]
+    start: List[float]                  # 估计开始时间（代价单位）
+    finish: List[float]
+    makespan: float
+
+
+def list_schedule(dag: DAGInfo, costs: List[float], num_workers: int) -> StaticSchedule:
+    """
+    HEFT 列表调度（同构 Worker，忽略通信代价）
+
+    按 upward rank（bottom level）降序取算子，放到能最早完成它的 Worker 上，
+    允许插入该 Worker 已排程算子之间的空闲间隙。代价至少取 1，保证前驱的
+    估计完成时间严格早于后继开始，各 Worker 按开始时间执行不会互相死等。
+    没有分到算子的 Worker 被去掉。
+    """
+    costs = [max(c, 1.0) for c in costs]
+    blevels = compute_bottom_levels(dag, costs)
+    order = sorted(range(dag.num_ops), key=lambda i: (-blevels[i], i))
+
+    slots: List[List[Tuple[float, float, int]]] = [[] for _ in range(num_workers)]
+    start = [0.0] * dag.num_ops
+    finish = [0.0] * dag.num_ops
+    for op_idx in order:
+        ready = max((finish[p] for p in dag.predecessors[op_idx]), default=0.0)
+        best = None
+        for w, busy in enumerate(slots):
+            # 第一个能容纳该算子的空闲间隙（含末尾）
+            t = ready
+            pos = len(busy)
+            for k, (b_start, b_finish, _) in enumerate(busy):
+                if t + costs[op_idx] <= b_start:
+                    pos = k
+                    break
+                t = max(t, b_finish)
+            if best is None or t + costs[op_idx] < best[0]:
+                best = (t + costs[op_idx], w, pos, t)
+        end, w, pos, t = best
+        slots[w].insert(pos, (t, end, op_idx))
+        start[op_idx] = t
+        finish[op_idx] = end
+
+    sequences = [[op for _, _, op in busy] for busy in slots if busy]
+    return StaticSchedule(
+        num_workers=len(sequences),
+        sequences=sequences,
+        start=start,
+        finish=finish,
+        makespan=max(finish, default=0.0)
+    )
+
+
+def load_op_costs(path: str, num_ops: int) -> List[float]:
+    """读取实测/外部代价（JSON: {"ops": [{"id": .., "cost": ..}, ...]}）"""
+    with open(path, 'r') as f:
+        report = json.load(f)
+    costs = [0.0] * num_ops
+    for entry in report['ops']:
+        if 0 <= entry['id'] < num_ops:
+            costs[entry['id']] = float(entry['cost'])
+    return costs
+
+
 # ============================================================
 # 代码生成
 # ============================================================
@@ -210,10 +1531,17 @@ def generate_schedulable_entity_code(
     operators: List[OperatorInfo],
     dag: DAGInfo,
     sid_definitions: Dict[str, str],
-    func_names: List[str]
+    func_names: List[str],
+    scratch_arena_size: int = 0,
+    op_costs: Optional[List[OpCost]] = None,
+    buffer_sizes: Optional[Tuple[int, int, int]] = None
 ) -> str:
     """生成 SchedulableEntity 相关的 C 代码（符合建议书规范）"""
     
+    sources = sorted((p for op in operators for p in entity_parts(op)), key=lambda p: p.exec_idx)
+    max_inputs = max([8] + [len(op.inputs) for op in operators])
+    max_outputs = max([2] + [len(op.outputs) for op in operators])
+
     lines = []
     lines.append("// ============================================================")
     lines.append("// 自动生成的 Scheduler-Worker 运行时数据结构")
@@ -223,9 +1551,20 @@ def generate_schedulable_entity_code(
     
     # 1. 类型定义
     lines.append("// ============ 类型定义 ============")
-    lines.append("#define MAX_INPUTS 8")
-    lines.append("#define MAX_OUTPUTS 2")
+    lines.append(f"#define MAX_INPUTS {max_inputs}")
+    lines.append(f"#define MAX_OUTPUTS {max_outputs}")
     lines.append(f"#define OP_COUNT {len(operators)}")
+    lines.append("// 线性链合并前的源算子数量（g_op_names 按源算子编号索引）")
+    lines.append(f"#define TVMRT_SOURCE_OP_COUNT {len(sources)}")
+    if scratch_arena_size > 0:
+        lines.append("// 每个 Worker 的私有 scratch arena 大小（内核内部 *_let 已重定位）")
+        lines.append(f"#define TVMRT_SCRATCH_ARENA_SIZE {scratch_arena_size}")
+    if buffer_sizes is not None:
+        ws_size, input_size, output_size = buffer_sizes
+        lines.append("// 每个推理上下文的 workspace 字节数与模型输入/输出 float 数")
+        lines.append(f"#define TVMRT_WORKSPACE_SIZE {ws_size}")
+        lines.append(f"#define TVMRT_INPUT_SIZE {input_size}")
+        lines.append(f"#define TVMRT_OUTPUT_SIZE {output_size}")
     lines.append("")
     
     # 执行配置结构体
@@ -270,6 +1609,11 @@ def generate_schedulable_entity_code(
     lines.append("// ============ TVM 算子函数声明 ============")
     for func_name in func_names:
         lines.append(f"TVM_DLL int32_t {func_name}();")
+    tiled_funcs = sorted({op.func_name for op in sources if op.tile is not None})
+    if tiled_funcs:
+        lines.append("// 分块版本（由 merge_scheduler_code.py 生成）：额外接收 tile_begin, tile_end")
+        for func_name in tiled_funcs:
+            lines.append(f"TVM_DLL int32_t {func_name}_tiled();")
     lines.append("")
     
     # 3. 包装函数（新签名：inputs[], outputs[], cws, ws）
@@ -279,7 +1623,7 @@ def generate_schedulable_entity_code(
     
     # 收集所有用到的函数及其参数模式
     func_param_patterns: Dict[str, OperatorInfo] = {}
-    for op in operators:
+    for op in sources:
         if op.func_name not in func_param_patterns:
             func_param_patterns[op.func_name] = op
     
@@ -302,19 +1646,86 @@ def generate_schedulable_entity_code(
         lines.append(f"    return {func_name}({', '.join(call_args)});")
         lines.append("}")
         lines.append("")
+
+    # 分块实体的包装函数：迭代区间编译期固定
+    tile_wrappers = sorted({(op.func_name, op.tile) for op in sources if op.tile is not None})
+    for func_name, (t, lo, hi) in tile_wrappers:
+        op = func_param_patterns[func_name]
+        call_args = ([f"inputs[{i}]" for i in range(len(op.inputs))] +
+                     [f"outputs[{i}]" for i in range(len(op.outputs))] +
+                     ["cws", "ws", str(lo), str(hi)])
+        lines.append(f"static inline int32_t wrapped_{func_name}_tile{t}(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {{")
+        lines.append(f"    return {func_name}_tiled({', '.join(call_args)});")
+        lines.append("}")
+        lines.append("")
+
+    # 超实体（合并的线性链）的包装函数：按链序调用成员，参数为各成员参数的拼接
+    for op in operators:
+        parts = entity_parts(op)
+        if len(parts) < 2:
+            continue
+        lines.append(f"static int32_t wrapped_chain_{op.exec_idx}(void** inputs, void** outputs, uint8_t* cws, uint8_t* ws) {{")
+        lines.append("    int32_t ret;")
+        in_off = out_off = 0
+        for k, part in enumerate(parts):
+            call = f"{entity_wrapper(part)}(inputs + {in_off}, outputs + {out_off}, cws, ws)"
+            if k == len(parts) - 1:
+                lines.append(f"    return {call};")
+            else:
+                lines.append(f"    if ((ret = {call}) != 0) return ret;")
+            in_off += len(part.inputs)
+            out_off += len(part.outputs)
+        lines.append("}")
+        lines.append("")
     
     # 4. 函数名表（用于调试）
     lines.append("// ============ 调试信息 ============")
-    lines.append(f"static const char* const g_op_names[{len(operators)}] __attribute__((unused)) = {{")
+    lines.append(f"static const char* const g_op_names[TVMRT_SOURCE_OP_COUNT] __attribute__((unused)) = {{")
+    for op in sources:
+        lines.append(f'    "{entity_label(op)}",')
+    lines.append("};")
+    lines.append("")
+
+    # 实体 -> 源算子：实体 i 依次执行 g_entity_ops[g_entity_op_offsets[i] .. g_entity_op_offsets[i + 1])
+    lines.append("// 实体 -> 源算子映射（超实体依次执行多个源算子，追踪时据此还原算子名）")
+    offsets = [0]
     for op in operators:
-        lines.append(f'    "{op.func_name}",')
+        offsets.append(offsets[-1] + len(entity_parts(op)))
+    lines.append(f"static const int32_t g_entity_op_offsets[OP_COUNT + 1] __attribute__((unused)) = {{")
+    for k in range(0, len(offsets), 16):
+        lines.append(f"    {', '.join(str(x) for x in offsets[k:k + 16])},")
+    lines.append("};")
+    lines.append(f"static const int32_t g_entity_ops[TVMRT_SOURCE_OP_COUNT] __attribute__((unused)) = {{")
+    flat = [p.exec_idx for op in operators for p in entity_parts(op)]
+    for k in range(0, len(flat), 16):
+        lines.append(f"    {', '.join(str(x) for x in flat[k:k + 16])},")
     lines.append("};")
     lines.append("")
+
+    # 5. 静态代价表
+    if op_costs is not None:
+        lines.append("// ============ 静态代价模型 ============")
+        lines.append("// 由内核循环嵌套估计；cost = flops + 访存字节 * COST_BYTES_WEIGHT")
+        lines.append("typedef struct {")
+        lines.append("    int64_t macs;              // 乘加次数")
+        lines.append("    int64_t flops;             // 浮点运算次数")
+        lines.append("    int64_t const_bytes_read;  // 读取常量字节数")
+        lines.append("    int64_t ws_bytes_read;     // 读取 workspace 字节数")
+        lines.append("    int64_t ws_bytes_written;  // 写入 workspace 字节数")
+        lines.append("    int64_t cost;              // 综合代价（相对单位）")
+        lines.append("} OpCost;")
+        lines.append("")
+        lines.append(f"static const OpCost g_op_cost[{len(operators)}] __attribute__((unused)) = {{")
+        for op, c in zip(operators, op_costs):
+            lines.append(f"    {{ {c.macs}LL, {c.flops}LL, {c.const_bytes_read}LL, "
+                         f"{c.ws_bytes_read}LL, {c.ws_bytes_written}LL, {c.cost}LL }}, // [{op.exec_idx}]")
+        lines.append("};")
+        lines.append("")
     
     return '\n'.join(lines)
 
 
-def generate_dag_schedule_code(dag: DAGInfo) -> str:
+def generate_dag_schedule_code(dag: DAGInfo, schedule: Optional[StaticSchedule] = None) -> str:
     """生成 DAG 调度相关的 C 代码"""
     
     lines = []
@@ -373,52 +1784,118 @@ def generate_dag_schedule_code(dag: DAGInfo) -> str:
         lines.append(f"    {', '.join(row)}")
     lines.append("};")
     lines.append("")
+
+    # 3. 离线静态调度（TVMRT_SCHED_MODE=static）
+    if schedule is not None:
+        lines.append(f"// 离线静态调度（HEFT）：每个 Worker 按序执行，估计 makespan {schedule.makespan:.0f}")
+        lines.append(f"#define TVMRT_STATIC_WORKERS {schedule.num_workers}")
+        for w, seq in enumerate(schedule.sequences):
+            lines.append(f"static const int32_t g_static_seq_{w}[] = {{ {', '.join(str(i) for i in seq)} }};")
+        lines.append("")
+        lines.append("static const int32_t* g_static_seqs[TVMRT_STATIC_WORKERS] = {")
+        for w in range(schedule.num_workers):
+            lines.append(f"    g_static_seq_{w},")
+        lines.append("};")
+        lines.append("")
+        lens_str = ', '.join(str(len(seq)) for seq in schedule.sequences)
+        lines.append(f"static const int32_t g_static_seq_lens[TVMRT_STATIC_WORKERS] = {{ {lens_str} }};")
+        lines.append("")
     
     return '\n'.join(lines)
 
 
 def generate_entities_code(
     operators: List[OperatorInfo],
-    sid_definitions: Dict[str, str]
+    sid_definitions: Dict[str, str],
+    priorities: Optional[List[int]] = None
 ) -> str:
-    """生成统一的 g_entities[] 数组初始化代码"""
+    """
+    生成实体模板与 workspace 相对的参数绑定表
+
+    实体参数不再是指向 global_workspace 的绝对指针，而是 workspace 内的字节偏移
+    （或模型输入/输出），由 tvmrt_bind_entities() 按每个上下文的 workspace 实例化
+    """
     
     lines = []
     lines.append("// ============================================================")
-    lines.append("// SchedulableEntity 实体初始化")
+    lines.append("// SchedulableEntity 实体模板与参数绑定")
     lines.append("// ============================================================")
     lines.append("")
-    
-    # 1. sid 变量定义
-    lines.append("// workspace 偏移量变量")
-    for sid_name in sorted(sid_definitions.keys(), key=lambda x: int(re.search(r'\d+', x).group())):
-        offset = sid_definitions[sid_name]
-        lines.append(f"void* {sid_name} = (&(global_workspace_1_var[{offset}]));")
+
+    def binding(var: str) -> str:
+        if var == MODEL_INPUT:
+            return "TVMRT_BIND_INPUT"
+        if var == MODEL_OUTPUT:
+            return "TVMRT_BIND_OUTPUT"
+        return f"{sid_definitions[var]}LL"
+
+    # 1. 绑定表
+    lines.append("// 参数位置：>= 0 为 workspace 字节偏移，负值为模型输入/输出")
+    lines.append("#define TVMRT_BIND_INPUT (-1LL)")
+    lines.append("#define TVMRT_BIND_OUTPUT (-2LL)")
     lines.append("")
-    
-    # 2. g_entities 初始化表
-    lines.append("// 可调度实体数组")
-    lines.append("SchedulableEntity g_entities[OP_COUNT] = {")
+    lines.append("typedef struct {")
+    lines.append("    int64_t inputs[MAX_INPUTS];")
+    lines.append("    int64_t outputs[MAX_OUTPUTS];")
+    lines.append("} EntityBinding;")
+    lines.append("")
+    lines.append("static const EntityBinding g_entity_bindings[OP_COUNT] = {")
+    for op in operators:
+        inputs_str = ', '.join(binding(v) for v in op.inputs)
+        outputs_str = ', '.join(binding(v) for v in op.outputs)
+        lines.append(f"    {{ .inputs = {{ {inputs_str} }}, .outputs = {{ {outputs_str} }} }}, "
+                     f"// [{op.exec_idx}] {', '.join(op.inputs)} -> {', '.join(op.outputs)}")
+    lines.append("};")
+    lines.append("")
+
+    # 2. 实体模板（参数指针由绑定填入）
+    lines.append("// 可调度实体模板")
+    lines.append("static const SchedulableEntity g_entity_templates[OP_COUNT] = {")
     
     for op in operators:
         in_count = len(op.inputs)
         out_count = len(op.outputs)
         
-        inputs_str = ', '.join(op.inputs)
-        outputs_str = ', '.join(op.outputs)
-        
-        lines.append(f"    {{ // [{op.exec_idx}] {op.func_name}")
-        lines.append(f"        .kernel = wrapped_{op.func_name},")
-        lines.append(f"        .inputs = {{ {inputs_str} }},")
-        lines.append(f"        .outputs = {{ {outputs_str} }},")
+        parts = entity_parts(op)
+        if len(parts) > 1:
+            lines.append(f"    {{ // [{op.exec_idx}] 线性链: {' -> '.join(entity_label(p) for p in parts)}")
+            lines.append(f"        .kernel = wrapped_chain_{op.exec_idx},")
+        elif op.tile is None:
+            lines.append(f"    {{ // [{op.exec_idx}] {op.func_name}")
+            lines.append(f"        .kernel = wrapped_{op.func_name},")
+        else:
+            t, lo, hi = op.tile
+            lines.append(f"    {{ // [{op.exec_idx}] {op.func_name} 分块 {t}: [{lo}, {hi})")
+            lines.append(f"        .kernel = wrapped_{op.func_name}_tile{t},")
         lines.append(f"        .input_count = {in_count},")
         lines.append(f"        .output_count = {out_count},")
-        lines.append(f"        .config = {{ .device_type = 0, .priority = 0 }},")
+        priority = priorities[op.exec_idx] if priorities else 0
+        lines.append(f"        .config = {{ .device_type = 0, .priority = {priority} }},")
         lines.append(f"        .id = {op.exec_idx}")
         lines.append("    },")
     
     lines.append("};")
     lines.append("")
+
+    # 3. 实例化
+    lines.append("// 按给定 workspace 与模型输入/输出实例化实体表")
+    lines.append("static void tvmrt_bind_entities(SchedulableEntity* entities, uint8_t* ws,")
+    lines.append("                                void* input, void* output) {")
+    lines.append("    for (int i = 0; i < OP_COUNT; i++) {")
+    lines.append("        SchedulableEntity* e = &entities[i];")
+    lines.append("        const EntityBinding* b = &g_entity_bindings[i];")
+    lines.append("        *e = g_entity_templates[i];")
+    lines.append("        for (int j = 0; j < e->input_count; j++) {")
+    lines.append("            e->inputs[j] = b->inputs[j] == TVMRT_BIND_INPUT ? input :")
+    lines.append("                           b->inputs[j] == TVMRT_BIND_OUTPUT ? output : (void*)(ws + b->inputs[j]);")
+    lines.append("        }")
+    lines.append("        for (int j = 0; j < e->output_count; j++) {")
+    lines.append("            e->outputs[j] = b->outputs[j] == TVMRT_BIND_INPUT ? input :")
+    lines.append("                            b->outputs[j] == TVMRT_BIND_OUTPUT ? output : (void*)(ws + b->outputs[j]);")
+    lines.append("        }")
+    lines.append("    }")
+    lines.append("}")
+    lines.append("")
     
     return '\n'.join(lines)
 
@@ -428,6 +1905,28 @@ def generate_entities_code(
 # ============================================================
 
 def main():
+    parser = argparse.ArgumentParser(description='TVM 算子静态化')
+    parser.add_argument('--shared-scratch', action='store_true',
+                        help='内核 scratch 保留在共享 global_workspace 中')
+    parser.add_argument('--op-costs', metavar='FILE',
+                        help='用于计算优先级的实测代价 JSON（默认使用静态代价模型）')
+    parser.add_argument('--tile-count', type=int, default=TILE_COUNT,
+                        help=f'重算子的分块数（默认 {TILE_COUNT}，1 表示不分块）')
+    parser.add_argument('--tile-min-share', type=float, default=TILE_MIN_SHARE,
+                        help=f'参与分块的算子最小代价占比（默认 {TILE_MIN_SHARE}）')
+    parser.add_argument('--coarsen-max-share', type=float, default=COARSEN_MAX_SHARE,
+                        help=f'线性链合并后单个超实体的最大代价占比（默认 {COARSEN_MAX_SHARE}，0 表示不合并）')
+    parser.add_argument('--memory-plan', choices=MEMORY_PLANS, default='parallel',
+                        help='workspace 中 sid 张量的布局（默认 parallel，tvm 保留原始偏移）')
+    parser.add_argument('--static-workers', type=int, default=STATIC_WORKERS,
+                        help=f'离线静态调度的 Worker 数（默认 {STATIC_WORKERS}，0 表示不生成）')
+    parser.add_argument('--dag-report', metavar='FILE',
+                        help='写出 DAG 分析（分层、层宽、关键路径、workspace 存活字节）的 JSON')
+    parser.add_argument('--dag-dot', metavar='FILE',
+                        help='写出按代价着色、标出关键路径的 Graphviz DOT')
+    args = parser.parse_args()
+    private_scratch = not args.shared_scratch
+
     # 路径配置
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     init_lib1 = os.path.join(project_root, 'init', 'lib1.c')
@@ -444,37 +1943,104 @@ def main():
     print("\n[1/4] 解析 lib1.c ...")
     operators, sid_definitions = parse_main_function(init_lib1)
     func_names = extract_function_declarations(init_lib1)
+    kernels = parse_kernel_functions(init_lib1)
     
     # 2. 构建 DAG
     print("\n[2/4] 构建 DAG ...")
-    dag = build_dag(operators)
+    if private_scratch:
+        sid_definitions = replan_workspace(operators, kernels, sid_definitions, args.memory_plan)
+    elif args.memory_plan != 'tvm':
+        print("[operator_staticizer] --shared-scratch 下内核 scratch 使用 TVM 原始偏移，跳过 workspace 重规划")
+    dag = build_dag(operators, sid_definitions, kernels, private_scratch)
+
+    scratch_arena_size = 0
+    if private_scratch:
+        _, scratch_arena_size = plan_scratch_arena(kernels)
+        shared_bytes = sum(sum(scratch_let_sizes(k).values()) for k in kernels.values())
+        print(f"[operator_staticizer] 私有 scratch arena: 每个 Worker {scratch_arena_size} 字节 "
+              f"({scratch_arena_size / 1024 / 1024:.2f} MB)，"
+              f"内核 scratch 总量 {shared_bytes / 1024 / 1024:.2f} MB")
+    
+    buffer_sizes = compute_buffer_sizes(operators, kernels, sid_definitions, private_scratch)
+    print(f"[operator_staticizer] 每个上下文: workspace {buffer_sizes[0]} 字节 "
+          f"({buffer_sizes[0] / 1024 / 1024:.2f} MB)，输入 {buffer_sizes[1]} / 输出 {buffer_sizes[2]} floats")
+
+    tensors = collect_workspace_tensors(operators, kernels, sid_definitions)
+
+    # 算子内分块：重算子按最外层独立循环拆成多个实体（并发分块依赖私有 scratch）
+    op_costs = [compute_op_cost(kernels[op.func_name]) for op in operators]
+    tile_plans: Dict[str, TilePlan] = {}
+    if args.tile_count > 1 and not private_scratch:
+        print("[operator_staticizer] --shared-scratch 下分块会共享内核 scratch，跳过算子内分块")
+    elif args.tile_count > 1:
+        tile_plans = plan_tiling(init_lib1, operators, op_costs, kernels, sid_definitions,
+                                 args.tile_count, args.tile_min_share)
+    if tile_plans:
+        num_ops = len(operators)
+        operators, dag = expand_tiled_operators(operators, dag, tile_plans)
+        print(f"[operator_staticizer] 算子内分块: {len(tile_plans)} 个内核 x {args.tile_count} 块，"
+              f"{num_ops} 个算子 -> {len(operators)} 个实体")
+        print(f"[operator_staticizer] 分块后 DAG: {describe_parallel_width(dag.num_ops, dag.predecessors)}")
+        op_costs = [entity_cost(op, kernels, tile_plans) for op in operators]
+
+    # 线性链合并：唯一前驱/唯一后继串起的实体合并为超实体，省去链内的派发往返
+    if args.coarsen_max_share > 0:
+        num_entities = len(operators)
+        operators, dag = coarsen_chains(operators, dag, [float(c.cost) for c in op_costs],
+                                        args.coarsen_max_share)
+        op_costs = [sum_op_costs([op_costs[p.exec_idx] for p in entity_parts(op)]) for op in operators]
+        fused = sum(1 for op in operators if len(op.members) > 1)
+        print(f"[operator_staticizer] 线性链合并: {fused} 个超实体，"
+              f"{num_entities} 个实体 -> {len(operators)} 个实体")
+        print(f"[operator_staticizer] 合并后 DAG: {describe_parallel_width(dag.num_ops, dag.predecessors)}")
     
     # 3. 生成 SchedulableEntity 代码
     print("\n[3/4] 生成代码 ...")
-    entity_code = generate_schedulable_entity_code(operators, dag, sid_definitions, func_names)
-    dag_code = generate_dag_schedule_code(dag)
-    entities_init_code = generate_entities_code(operators, sid_definitions)
+    if args.op_costs:
+        rank_costs = load_op_costs(args.op_costs, len(operators))
+        print(f"[operator_staticizer] 优先级使用实测代价: {args.op_costs}")
+    else:
+        rank_costs = [float(c.cost) for c in op_costs]
+    priorities = compute_priorities(dag, rank_costs)
+    analysis = analyze_dag(operators, dag, rank_costs, tensors)
+    print_dag_analysis(analysis, dag, buffer_sizes[0])
+    if args.dag_report:
+        write_dag_report(args.dag_report, operators, dag, rank_costs, analysis, buffer_sizes[0])
+        print(f"    -> {args.dag_report}")
+    if args.dag_dot:
+        write_dag_dot(args.dag_dot, operators, dag, rank_costs, analysis)
+        print(f"    -> {args.dag_dot}（dot -Tsvg {args.dag_dot} -o dag.svg）")
+
+    schedule = None
+    if args.static_workers > 0:
+        schedule = list_schedule(dag, rank_costs, args.static_workers)
+        serial_cost = sum(max(c, 1.0) for c in rank_costs)
+        print(f"[operator_staticizer] 静态调度: {schedule.num_workers} 个 Worker，"
+              f"估计 makespan {schedule.makespan:.0f}（串行 {serial_cost:.0f}，"
+              f"加速比 {serial_cost / schedule.makespan if schedule.makespan else 0:.2f}x）")
+
+    entity_code = generate_schedulable_entity_code(operators, dag, sid_definitions, func_names,
+                                                   scratch_arena_size, op_costs, buffer_sizes)
+    dag_code = generate_dag_schedule_code(dag, schedule)
+    entities_init_code = generate_entities_code(operators, sid_definitions, priorities)
     
     # 4. 写入输出文件
     print("\n[4/4] 写入文件 ...")
     
-    # 实体和函数表
-    entity_output = os.path.join(output_dir, 'entity_generated.c')
-    with open(entity_output, 'w') as f:
-        f.write(entity_code)
-    print(f"    -> {entity_output}")
-    
-    # DAG 调度表
-    dag_output = os.path.join(output_dir, 'dag_schedule_generated.c')
-    with open(dag_output, 'w') as f:
-        f.write(dag_code)
-    print(f"    -> {dag_output}")
-    
-    # 实体初始化表
-    entities_output = os.path.join(output_dir, 'entities_generated.c')
-    with open(entities_output, 'w') as f:
-        f.write(entities_init_code)
-    print(f"    -> {entities_output}")
+    outputs = [
+        ('entity_generated.c', entity_code),            # 实体和函数表
+        ('dag_schedule_generated.c', dag_code),         # DAG 调度表
+        ('entities_generated.c', entities_init_code),   # 实体初始化表
+    ]
+    for name, code in outputs:
+        path = os.path.join(output_dir, name)
+        changed = write_if_changed(path, code)
+        print(f"    -> {path}{'' if changed else '（未变化）'}")
+
+    # 算子代价报告
+    cost_output = os.path.join(output_dir, 'op_cost_generated.json')
+    changed = write_cost_report(cost_output, operators, op_costs)
+    print(f"    -> {cost_output}{'' if changed else '（未变化）'}")
     
     print("\n[operator_staticizer] 完成!")
     return 0
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+基准测试脚本 - 串行 vs. DAG 调度模式对比
+
+只构建一次（make），然后对每种调度模式运行 build/<model>_test 的 Worker 数扫描，
+汇总各配置的延迟分位数、吞吐与相对串行的加速比，并写出合并后的 JSON。
+
+使用方法:
+    python3 scripts/run_benchmark.py [--workers 1,2,3,4] [--modes closed_loop,work_stealing]
+                                     [-n 迭代次数] [-w 预热次数] [--streams N] [--input random|zero]
+                                     [--output benchmark_results.json] [--no-build]
+
+选项:
+    --workers LIST   DAG 模式扫描的 Worker 数（逗号分隔，默认 1,2,3,4）
+    --modes LIST     DAG 调度模式（TVMRT_SCHED_MODE，默认 closed_loop,work_stealing）
+    -n N             每个配置的计时迭代次数（默认 10）
+    -w N             每个配置的预热次数（默认 2）
+    --streams N      并发推理流数（每路独立上下文，默认 1）
+    --input MODE     输入数据（random / zero，默认 random）
+    --output FILE    汇总 JSON 输出路径（默认 benchmark_results.json）
+    --no-build       跳过 make，直接使用已有的可执行文件
+"""
+
+import os
+import sys
+import json
+import glob
+import argparse
+import subprocess
+import tempfile
+from typing import List, Dict, Optional
+
+
+def run_command(cmd: list, cwd: str = None, env: Dict[str, str] = None) -> int:
+    """运行命令并返回退出码"""
+    print(f"$ {' '.join(cmd)}")
+    result = subprocess.run(cmd, cwd=cwd, env=env)
+    return result.returncode
+
+
+def find_test_binary(project_root: str) -> Optional[str]:
+    """查找 build 目录下的 *_test 可执行文件"""
+    candidates = sorted(glob.glob(os.path.join(project_root, 'build', '*_test')))
+    return candidates[0] if candidates else None
+
+
+def run_sweep(binary: str, project_root: str, workers: List[int], iterations: int,
+              warmup: int, input_mode: str, env_overrides: Dict[str, str],
+              streams: int = 1) -> Optional[dict]:
+    """运行一次 Worker 数扫描，返回测试程序写出的 JSON"""
+    env = dict(os.environ)
+    env.update(env_overrides)
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp:
+        json_path = tmp.name
+    try:
+        cmd = [binary, '-n', str(iterations), '-w', str(warmup), '-i', input_mode,
+               '-s', ','.join(str(w) for w in workers), '-c', str(streams), '-j', json_path]
+        ret = run_command(cmd, cwd=project_root, env=env)
+        if ret != 0:
+            print(f"错误: 基准测试失败（退出码 {ret}）")
+            return None
+        with open(json_path, 'r') as f:
+            return json.load(f)
+    finally:
+        os.unlink(json_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='串行 vs. DAG 模式基准测试')
+    parser.add_argument('--workers', default='1,2,3,4', help='DAG 模式扫描的 Worker 数')
+    parser.add_argument('--modes', default='closed_loop,work_stealing', help='DAG 调度模式')
+    parser.add_argument('-n', type=int, default=10, dest='iterations', help='计时迭代次数')
+    parser.add_argument('-w', type=int, default=2, dest='warmup', help='预热次数')
+    parser.add_argument('--streams', type=int, default=1, help='并发推理流数')
+    parser.add_argument('--input', default='random', choices=['random', 'zero'], help='输入数据')
+    parser.add_argument('--output', default='benchmark_results.json', help='汇总 JSON 输出路径')
+    parser.add_argument('--no-build', action='store_true', help='跳过构建')
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    workers = [int(w) for w in args.workers.split(',') if w.strip()]
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+
+    print("=" * 60)
+    print("  基准测试: 串行 vs. DAG 调度")
+    print("=" * 60)
+
+    if not args.no_build:
+        print("\n[1/3] 构建 ...")
+        ret = run_command(['make', f'-j{os.cpu_count() or 1}'], cwd=project_root)
+        if ret != 0:
+            print("错误: 编译失败")
+            return ret
+
+    binary = find_test_binary(project_root)
+    if not binary:
+        print("错误: 找不到测试可执行文件，请先运行 scripts/build_scheduler.py")
+        return 1
+
+    # 串行基线
+    print("\n[2/3] 串行基线 ...")
+    serial = run_sweep(binary, project_root, [0], args.iterations, args.warmup, args.input, {},
+                       args.streams)
+    if serial is None:
+        return 1
+    configs = [dict(mode='serial', **serial['results'][0])]
+
+    # 各 DAG 调度模式的 Worker 数扫描
+    print("\n[3/3] DAG 模式扫描 ...")
+    for mode in modes:
+        report = run_sweep(binary, project_root, workers, args.iterations, args.warmup,
+                           args.input, {'TVMRT_SCHED_MODE': mode}, args.streams)
+        if report is None:
+            return 1
+        configs.extend(dict(mode=mode, **r) for r in report['results'])
+
+    baseline = configs[0]['latency_ms']['p50']
+    reference = configs[0]['checksum']
+    for c in configs:
+        p50 = c['latency_ms']['p50']
+        c['speedup_p50'] = round(baseline / p50, 4) if p50 else 0.0
+        c['output_matches_serial'] = c['checksum'] == reference
+
+    print()
+    print("=" * 60)
+    print(f"{'mode':<14} {'workers':>7} {'p50(ms)':>10} {'p90(ms)':>10} {'p99(ms)':>10} "
+          f"{'FPS':>8} {'speedup':>8} {'cpu':>5}")
+    for c in configs:
+        lat = c['latency_ms']
+        flag = '' if c['output_matches_serial'] else '  ! 输出与串行不一致'
+        print(f"{c['mode']:<14} {c['workers']:>7} {lat['p50']:>10.2f} {lat['p90']:>10.2f} "
+              f"{lat['p99']:>10.2f} {c['throughput_fps']:>8.2f} {c['speedup_p50']:>7.2f}x "
+              f"{c['cpu_util']:>5.2f}{flag}")
+    print("=" * 60)
+
+    summary = {
+        'model': serial['model'],
+        'input': args.input,
+        'iterations': args.iterations,
+        'warmup': args.warmup,
+        'streams': args.streams,
+        'cpu_count': os.cpu_count(),
+        'configs': configs,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(summary, f, indent=2)
+        f.write('\n')
+    print(f"    -> {args.output}")
+
+    mismatched = [c for c in configs if not c['output_matches_serial']]
+    return 1 if mismatched else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -27,7 +27,7 @@ if [ -z "$TEST_BIN" ]; then
     exit 1
 fi
 echo "运行: $TEST_BIN"
-TVMRT_NUM_WORKERS=0 "$TEST_BIN"
+TVMRT_NUM_WORKERS=0 "$TEST_BIN" -n 1 -w 0
 
 echo ""
 echo "======================================"
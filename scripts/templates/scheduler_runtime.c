@@ -1,34 +1,213 @@
 // ============================================================
 // Scheduler-Worker 运行时核心代码
 // 基于建议书 3.3.4 节的闭环调度模型
+// 另提供无 Scheduler 线程的 work-stealing 模式与离线静态调度模式（TVMRT_SCHED_MODE）
 // ============================================================
 
 #include <pthread.h>
+#include <sched.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
 #include <time.h>
 
+#ifdef TVMRT_WEIGHTS_MMAP
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+// ============ 并发推理 ============
+// 线程池同时承载至多 TVMRT_MAX_INFLIGHT 次推理（各自独立的 workspace），
+// 队列中的任务编号为 slot * OP_COUNT + op_id，slot 为推理槽位
+#ifndef TVMRT_MAX_INFLIGHT
+#define TVMRT_MAX_INFLIGHT 8
+#endif
+
+#define TVMRT_BUSY (-2) // 非阻塞提交时槽位已满 / 上下文已有进行中的推理
+
+#define TASK_COUNT (OP_COUNT * TVMRT_MAX_INFLIGHT)
+#define TASK_ID(slot, op) ((slot) * OP_COUNT + (op))
+#define TASK_SLOT(task) ((task) / OP_COUNT)
+#define TASK_OP(task) ((task) % OP_COUNT)
+
+// ============ 自适应等待 ============
+// Worker / Scheduler 等待任务时先自旋 wait_spin 次（pause 指令），再 sched_yield
+// wait_yield 次，条件仍未满足才阻塞（条件变量，futex 睡眠-唤醒）；亚毫秒级算子的
+// 交接多数在前两个阶段完成。预算来自运行时配置（wait_spin / wait_yield，
+// TVMRT_WAIT_SPIN / TVMRT_WAIT_YIELD），均为 0 时退化为直接阻塞。
+// 各阶段命中次数累计到 g_wait_counts（tvmrt_get_wait_stats），用于按机器调整预算
+
+#ifndef TVMRT_WAIT_SPIN
+#define TVMRT_WAIT_SPIN 1024
+#endif
+#ifndef TVMRT_WAIT_YIELD
+#define TVMRT_WAIT_YIELD 16
+#endif
+
+typedef enum {
+  TVMRT_WAIT_IMMEDIATE = 0, // 进入等待时条件已满足
+  TVMRT_WAIT_SPUN = 1,      // 自旋阶段满足
+  TVMRT_WAIT_YIELDED = 2,   // 让出 CPU 阶段满足
+  TVMRT_WAIT_BLOCKED = 3,   // 进入阻塞阶段
+  TVMRT_WAIT_PHASES = 4
+} TvmrtWaitPhase;
+
+typedef struct {
+  uint64_t immediate;
+  uint64_t spin;
+  uint64_t yield;
+  uint64_t block;
+} TvmrtWaitStats;
+
+static int g_wait_spin = TVMRT_WAIT_SPIN;
+static int g_wait_yield = TVMRT_WAIT_YIELD;
+static uint64_t g_wait_counts[TVMRT_WAIT_PHASES];
+
+static inline void cpu_relax(void) {
+#if defined(__x86_64__) || defined(__i386__)
+  __builtin_ia32_pause();
+#elif defined(__aarch64__)
+  __asm__ volatile("yield");
+#endif
+}
+
+static inline int wait_satisfied(const int *value, int nonzero) {
+  return (__atomic_load_n(value, __ATOMIC_ACQUIRE) != 0) == nonzero;
+}
+
+// 等待 *value 非 0（nonzero=1）或归 0（nonzero=0），返回满足时所处的阶段；
+// 超出预算返回 TVMRT_WAIT_BLOCKED，由调用者阻塞。yield_forever 时不进入阻塞阶段
+static int wait_adaptive(const int *value, int nonzero, int yield_forever) {
+  if (wait_satisfied(value, nonzero))
+    return TVMRT_WAIT_IMMEDIATE;
+  for (int i = 0; i < g_wait_spin; i++) {
+    cpu_relax();
+    if (wait_satisfied(value, nonzero))
+      return TVMRT_WAIT_SPUN;
+  }
+  for (int i = 0; yield_forever || i < g_wait_yield; i++) {
+    sched_yield();
+    if (wait_satisfied(value, nonzero))
+      return TVMRT_WAIT_YIELDED;
+  }
+  return TVMRT_WAIT_BLOCKED;
+}
+
+static inline void wait_record(int phase) {
+  __atomic_fetch_add(&g_wait_counts[phase], 1, __ATOMIC_RELAXED);
+}
+
+// 累计的各阶段命中次数
+TVM_DLL void tvmrt_get_wait_stats(TvmrtWaitStats *stats) {
+  stats->immediate =
+      __atomic_load_n(&g_wait_counts[TVMRT_WAIT_IMMEDIATE], __ATOMIC_RELAXED);
+  stats->spin = __atomic_load_n(&g_wait_counts[TVMRT_WAIT_SPUN], __ATOMIC_RELAXED);
+  stats->yield =
+      __atomic_load_n(&g_wait_counts[TVMRT_WAIT_YIELDED], __ATOMIC_RELAXED);
+  stats->block =
+      __atomic_load_n(&g_wait_counts[TVMRT_WAIT_BLOCKED], __ATOMIC_RELAXED);
+}
+
+TVM_DLL void tvmrt_reset_wait_stats(void) {
+  for (int i = 0; i < TVMRT_WAIT_PHASES; i++) {
+    __atomic_store_n(&g_wait_counts[i], 0, __ATOMIC_RELAXED);
+  }
+}
+
 // ============ 线程安全队列 ============
+// 默认 FIFO；设置 priority 表（按 op_id 索引）后为二叉堆优先队列
+// （priority 大者先出，同优先级按入队顺序，终止信号 -1 最后出）；
+// 另设置 run_order 表（按槽位索引）时先按推理提交顺序，早提交的先出，
+// 后提交推理的算子只填补空闲 Worker
+
+#define QUEUE_CAP (TASK_COUNT + 16) // 预留终止信号空间
 
 typedef struct {
-  int32_t data[OP_COUNT + 16]; // 预留终止信号空间
+  int32_t data[QUEUE_CAP];
+  uint32_t seq[QUEUE_CAP]; // 优先级模式下的入队序号
   int head;
   int tail;
   int count;
+  int sleepers;              // 阻塞在 not_empty 上的等待者数（lock 保护）
+  const int32_t *priority;   // NULL 表示 FIFO
+  const uint32_t *run_order; // NULL 表示不区分推理
+  uint32_t next_seq;
   pthread_mutex_t lock;
   pthread_cond_t not_empty;
 } SafeQueue;
 
 static void queue_init(SafeQueue *q) {
   memset(q->data, 0, sizeof(q->data));
+  memset(q->seq, 0, sizeof(q->seq));
   q->head = 0;
   q->tail = 0;
   q->count = 0;
+  q->sleepers = 0;
+  q->priority = NULL;
+  q->run_order = NULL;
+  q->next_seq = 0;
   pthread_mutex_init(&q->lock, NULL);
   pthread_cond_init(&q->not_empty, NULL);
 }
 
+// 堆中位置 a 是否应排在位置 b 之前
+static int queue_heap_before(const SafeQueue *q, int a, int b) {
+  if (q->run_order && q->data[a] >= 0 && q->data[b] >= 0) {
+    uint32_t oa = q->run_order[TASK_SLOT(q->data[a])];
+    uint32_t ob = q->run_order[TASK_SLOT(q->data[b])];
+    if (oa != ob)
+      return (int32_t)(oa - ob) < 0;
+  }
+  int32_t pa = q->data[a] < 0 ? INT32_MIN : q->priority[TASK_OP(q->data[a])];
+  int32_t pb = q->data[b] < 0 ? INT32_MIN : q->priority[TASK_OP(q->data[b])];
+  if (pa != pb)
+    return pa > pb;
+  return (int32_t)(q->seq[a] - q->seq[b]) < 0;
+}
+
+static void queue_heap_swap(SafeQueue *q, int a, int b) {
+  int32_t value = q->data[a];
+  uint32_t seq = q->seq[a];
+  q->data[a] = q->data[b];
+  q->seq[a] = q->seq[b];
+  q->data[b] = value;
+  q->seq[b] = seq;
+}
+
+static void queue_heap_push(SafeQueue *q, int32_t value) {
+  int i = q->count;
+  q->data[i] = value;
+  q->seq[i] = q->next_seq++;
+  while (i > 0 && queue_heap_before(q, i, (i - 1) / 2)) {
+    queue_heap_swap(q, i, (i - 1) / 2);
+    i = (i - 1) / 2;
+  }
+}
+
+static int32_t queue_heap_pop(SafeQueue *q) {
+  int32_t value = q->data[0];
+  int last = q->count - 1;
+  q->data[0] = q->data[last];
+  q->seq[0] = q->seq[last];
+  int i = 0;
+  while (1) {
+    int best = i;
+    int l = 2 * i + 1;
+    int r = l + 1;
+    if (l < last && queue_heap_before(q, l, best))
+      best = l;
+    if (r < last && queue_heap_before(q, r, best))
+      best = r;
+    if (best == i)
+      break;
+    queue_heap_swap(q, i, best);
+    i = best;
+  }
+  return value;
+}
+
 static void queue_destroy(SafeQueue *q) {
   pthread_mutex_destroy(&q->lock);
   pthread_cond_destroy(&q->not_empty);
@@ -36,60 +215,445 @@ static void queue_destroy(SafeQueue *q) {
 
 static void queue_push(SafeQueue *q, int32_t value) {
   pthread_mutex_lock(&q->lock);
-  q->data[q->tail] = value;
-  q->tail = (q->tail + 1) % (OP_COUNT + 16);
+  if (q->priority) {
+    queue_heap_push(q, value);
+  } else {
+    q->data[q->tail] = value;
+    q->tail = (q->tail + 1) % QUEUE_CAP;
+  }
   q->count++;
-  pthread_cond_signal(&q->not_empty);
+  // 自旋中的等待者无需唤醒，只有已阻塞的才付出一次 futex 唤醒
+  if (q->sleepers > 0)
+    pthread_cond_signal(&q->not_empty);
   pthread_mutex_unlock(&q->lock);
 }
 
+// 调用者持有 q->lock 且 q->count > 0
+static int32_t queue_take_locked(SafeQueue *q) {
+  int32_t value;
+  if (q->priority) {
+    value = queue_heap_pop(q);
+  } else {
+    value = q->data[q->head];
+    q->head = (q->head + 1) % QUEUE_CAP;
+  }
+  q->count--;
+  return value;
+}
+
 static int32_t queue_pop(SafeQueue *q) {
+  // 先无锁观察 count 自旋 / 让出，预算用尽或任务被其他等待者取走时阻塞
+  int phase = wait_adaptive(&q->count, 1, 0);
   pthread_mutex_lock(&q->lock);
   while (q->count == 0) {
+    phase = TVMRT_WAIT_BLOCKED;
+    q->sleepers++;
     pthread_cond_wait(&q->not_empty, &q->lock);
+    q->sleepers--;
   }
-  int32_t value = q->data[q->head];
-  q->head = (q->head + 1) % (OP_COUNT + 16);
-  q->count--;
+  wait_record(phase);
+  int32_t value = queue_take_locked(q);
   pthread_mutex_unlock(&q->lock);
   return value;
 }
 
+// 非阻塞出队，队列为空时返回 -1
+static int32_t queue_try_pop(SafeQueue *q) {
+  pthread_mutex_lock(&q->lock);
+  int32_t value = q->count > 0 ? queue_take_locked(q) : -1;
+  pthread_mutex_unlock(&q->lock);
+  return value;
+}
+
+// ============ 内核私有 scratch arena ============
+// TVMRT_SCRATCH_ARENA_SIZE 由 operator_staticizer 生成：内核内部的
+// workspace *_let 已重定位到 [0, TVMRT_SCRATCH_ARENA_SIZE)，执行时以
+// 当前 Worker 的 arena 作为 ws 参数，不同 Worker 的内核互不覆盖 scratch
+#ifndef TVMRT_SCRATCH_ARENA_SIZE
+#define TVMRT_SCRATCH_ARENA_SIZE 0
+#endif
+
+#if TVMRT_SCRATCH_ARENA_SIZE > 0
+// 未指定 scratch 的串行推理（tvmgen_default___tvm_main__）共用，g_serial_lock 保护
+static uint8_t g_serial_scratch[TVMRT_SCRATCH_ARENA_SIZE]
+    __attribute__((aligned(64)));
+static pthread_mutex_t g_serial_lock = PTHREAD_MUTEX_INITIALIZER;
+#endif
+
+// ============ Work-Stealing 双端队列 (Chase-Lev) ============
+// 所有者在 bottom 端 push/pop，其他 Worker 从 top 端 steal
+// 所有进行中的推理最多同时入队 TASK_COUNT 个任务，固定容量无需扩容
+
+#ifndef WS_DEQUE_CAP
+#define WS_DEQUE_CAP 4096 // 必须为 2 的幂
+#endif
+#if TASK_COUNT > WS_DEQUE_CAP
+#error "WS_DEQUE_CAP must be >= OP_COUNT * TVMRT_MAX_INFLIGHT"
+#endif
+
+#define WS_EMPTY (-1) // 队列为空
+#define WS_ABORT (-2) // steal 竞争失败，可重试
+
+typedef struct {
+  int64_t top;
+  int64_t bottom;
+  int32_t buf[WS_DEQUE_CAP];
+} __attribute__((aligned(64))) WsDeque;
+
+static void ws_deque_init(WsDeque *d) {
+  d->top = 0;
+  d->bottom = 0;
+  memset(d->buf, 0, sizeof(d->buf));
+}
+
+// 仅所有者调用
+static void ws_deque_push(WsDeque *d, int32_t value) {
+  int64_t b = __atomic_load_n(&d->bottom, __ATOMIC_RELAXED);
+  __atomic_store_n(&d->buf[b & (WS_DEQUE_CAP - 1)], value, __ATOMIC_RELAXED);
+  __atomic_thread_fence(__ATOMIC_RELEASE);
+  __atomic_store_n(&d->bottom, b + 1, __ATOMIC_RELAXED);
+}
+
+// 仅所有者调用
+static int32_t ws_deque_pop(WsDeque *d) {
+  int64_t b = __atomic_load_n(&d->bottom, __ATOMIC_RELAXED) - 1;
+  __atomic_store_n(&d->bottom, b, __ATOMIC_RELAXED);
+  __atomic_thread_fence(__ATOMIC_SEQ_CST);
+  int64_t t = __atomic_load_n(&d->top, __ATOMIC_RELAXED);
+
+  if (t > b) {
+    __atomic_store_n(&d->bottom, b + 1, __ATOMIC_RELAXED);
+    return WS_EMPTY;
+  }
+
+  int32_t value =
+      __atomic_load_n(&d->buf[b & (WS_DEQUE_CAP - 1)], __ATOMIC_RELAXED);
+  if (t == b) {
+    // 最后一个元素，与 thief 竞争
+    if (!__atomic_compare_exchange_n(&d->top, &t, t + 1, 0, __ATOMIC_SEQ_CST,
+                                     __ATOMIC_RELAXED)) {
+      value = WS_EMPTY;
+    }
+    __atomic_store_n(&d->bottom, b + 1, __ATOMIC_RELAXED);
+  }
+  return value;
+}
+
+// 任意线程调用
+static int32_t ws_deque_steal(WsDeque *d) {
+  int64_t t = __atomic_load_n(&d->top, __ATOMIC_ACQUIRE);
+  __atomic_thread_fence(__ATOMIC_SEQ_CST);
+  int64_t b = __atomic_load_n(&d->bottom, __ATOMIC_ACQUIRE);
+
+  if (t >= b) {
+    return WS_EMPTY;
+  }
+
+  int32_t value =
+      __atomic_load_n(&d->buf[t & (WS_DEQUE_CAP - 1)], __ATOMIC_RELAXED);
+  if (!__atomic_compare_exchange_n(&d->top, &t, t + 1, 0, __ATOMIC_SEQ_CST,
+                                   __ATOMIC_RELAXED)) {
+    return WS_ABORT;
+  }
+  return value;
+}
+
+// ============ 执行追踪（-DTVMRT_TRACE 启用）============
+// 预分配环形缓冲区记录每个算子的就绪/开始/结束时间（CLOCK_MONOTONIC），
+// 进程退出时写出 Chrome/Perfetto trace JSON（路径取 TVMRT_TRACE_FILE，
+// 默认 tvmrt_trace.json），也可调用 tvmrt_trace_dump() 主动写出。
+// 未定义 TVMRT_TRACE 时下列宏均为空，不产生任何开销。
+// tid 0 为调用线程（串行模式在此执行），tid i+1 为 Worker i
+
+#ifdef TVMRT_TRACE
+
+#ifndef TVMRT_TRACE_CAPACITY
+#define TVMRT_TRACE_CAPACITY 65536
+#endif
+
+#define TRACE_RUN_OP (-1) // 整次推理的区间事件
+
+typedef struct {
+  int32_t op_id;
+  int32_t tid;
+  int32_t run_id;
+  int64_t ready_ns;
+  int64_t start_ns;
+  int64_t end_ns;
+} TraceEvent;
+
+static TraceEvent g_trace_events[TVMRT_TRACE_CAPACITY];
+static uint64_t g_trace_next = 0;
+static int32_t g_trace_run_id = 0;
+static int64_t g_trace_ready_ns[TASK_COUNT]; // 按任务编号索引
+
+static inline int64_t tvmrt_trace_now(void) {
+  struct timespec ts;
+  clock_gettime(CLOCK_MONOTONIC, &ts);
+  return (int64_t)ts.tv_sec * 1000000000LL + ts.tv_nsec;
+}
+
+static void trace_record(int32_t op_id, int32_t tid, int32_t run_id,
+                         int64_t ready_ns, int64_t start_ns, int64_t end_ns) {
+  uint64_t idx = __atomic_fetch_add(&g_trace_next, 1, __ATOMIC_RELAXED);
+  TraceEvent *ev = &g_trace_events[idx % TVMRT_TRACE_CAPACITY];
+  ev->op_id = op_id;
+  ev->tid = tid;
+  ev->run_id = run_id;
+  ev->ready_ns = ready_ns;
+  ev->start_ns = start_ns;
+  ev->end_ns = end_ns;
+}
+
+// 写出 Chrome trace JSON（时间单位 us，以最早事件为 0 点）
+TVM_DLL int32_t tvmrt_trace_dump(const char *path) {
+  FILE *f = fopen(path, "w");
+  if (!f)
+    return -1;
+
+  uint64_t total = __atomic_load_n(&g_trace_next, __ATOMIC_ACQUIRE);
+  uint64_t begin =
+      total > TVMRT_TRACE_CAPACITY ? total - TVMRT_TRACE_CAPACITY : 0;
+
+  int64_t t0 = INT64_MAX;
+  int32_t max_tid = 0;
+  for (uint64_t i = begin; i < total; i++) {
+    TraceEvent *ev = &g_trace_events[i % TVMRT_TRACE_CAPACITY];
+    if (ev->ready_ns < t0)
+      t0 = ev->ready_ns;
+    if (ev->tid > max_tid)
+      max_tid = ev->tid;
+  }
+
+  fprintf(f, "{\"traceEvents\": [\n");
+  fprintf(f, "  {\"name\": \"thread_name\", \"ph\": \"M\", \"pid\": 0, "
+             "\"tid\": 0, \"args\": {\"name\": \"caller\"}}");
+  for (int32_t tid = 1; tid <= max_tid; tid++) {
+    fprintf(f,
+            ",\n  {\"name\": \"thread_name\", \"ph\": \"M\", \"pid\": 0, "
+            "\"tid\": %d, \"args\": {\"name\": \"worker %d\"}}",
+            tid, tid - 1);
+  }
+  for (uint64_t i = begin; i < total; i++) {
+    TraceEvent *ev = &g_trace_events[i % TVMRT_TRACE_CAPACITY];
+    // 超实体（合并的线性链）以首个源算子命名，args.ops 列出全部源算子编号
+    int32_t first = ev->op_id >= 0 ? g_entity_op_offsets[ev->op_id] : 0;
+    int32_t count = ev->op_id >= 0 ? g_entity_op_offsets[ev->op_id + 1] - first : 0;
+    const char *name =
+        ev->op_id >= 0 ? g_op_names[g_entity_ops[first]] : "tvmgen_default_run";
+    fprintf(f,
+            ",\n  {\"name\": \"%s%s\", \"cat\": \"%s\", \"ph\": \"X\", "
+            "\"pid\": 0, \"tid\": %d, \"ts\": %.3f, \"dur\": %.3f, "
+            "\"args\": {\"op_id\": %d, \"run\": %d, \"queue_wait_us\": %.3f",
+            name, count > 1 ? " (chain)" : "", ev->op_id >= 0 ? "op" : "run",
+            ev->tid, (ev->start_ns - t0) / 1000.0,
+            (ev->end_ns - ev->start_ns) / 1000.0, ev->op_id, ev->run_id,
+            (ev->start_ns - ev->ready_ns) / 1000.0);
+    if (count > 1) {
+      fprintf(f, ", \"ops\": [");
+      for (int32_t k = 0; k < count; k++)
+        fprintf(f, "%s%d", k ? ", " : "", g_entity_ops[first + k]);
+      fprintf(f, "]");
+    }
+    fprintf(f, "}}");
+  }
+  fprintf(f, "\n],\n\"displayTimeUnit\": \"ms\",\n");
+  fprintf(f, "\"otherData\": {\"dropped_events\": %llu}}\n",
+          (unsigned long long)begin);
+  fclose(f);
+  return 0;
+}
+
+static void tvmrt_trace_dump_at_exit(void) {
+  const char *path = getenv("TVMRT_TRACE_FILE");
+  if (tvmrt_trace_dump(path ? path : "tvmrt_trace.json") != 0) {
+    fprintf(stderr, "[tvmrt] failed to write trace file\n");
+  }
+}
+
+static int32_t trace_next_run(void) {
+  static int atexit_registered = 0;
+  if (!__atomic_exchange_n(&atexit_registered, 1, __ATOMIC_ACQ_REL)) {
+    atexit(tvmrt_trace_dump_at_exit);
+  }
+  return __atomic_add_fetch(&g_trace_run_id, 1, __ATOMIC_RELAXED);
+}
+
+// TRACE_END 用于经队列派发的任务（排队时间取 TRACE_MARK_READY 的时刻），
+// TRACE_SPAN 用于串行执行的算子与整次推理（无排队）
+#define TRACE_NEXT_RUN() trace_next_run()
+#define TRACE_NOW() tvmrt_trace_now()
+#define TRACE_MARK_READY(task) (g_trace_ready_ns[(task)] = tvmrt_trace_now())
+#define TRACE_BEGIN(var) int64_t var = tvmrt_trace_now()
+#define TRACE_END(task, tid, run, start)                                       \
+  trace_record(TASK_OP(task), (tid), (run), g_trace_ready_ns[(task)], (start), \
+               tvmrt_trace_now())
+#define TRACE_SPAN(op, tid, run, start)                                        \
+  trace_record((op), (tid), (run), (start), (start), tvmrt_trace_now())
+
+#else
+
+#define TRACE_NEXT_RUN() 0
+#define TRACE_NOW() 0
+#define TRACE_MARK_READY(task) ((void)0)
+#define TRACE_BEGIN(var) ((void)0)
+#define TRACE_END(task, tid, run, start) ((void)0)
+#define TRACE_SPAN(op, tid, run, start) ((void)0)
+
+#endif
+
 // ============ 运行时上下文 ============
 
+// 就绪算子的派发顺序（TVMRT_READY_POLICY）
+typedef enum {
+  TVMRT_READY_PRIORITY = 0, // 按 ExecConfig.priority（关键路径名次）大者优先
+  TVMRT_READY_FIFO = 1      // 按就绪先后
+} TvmrtReadyPolicy;
+
+// 调度模式
+typedef enum {
+  TVMRT_SCHED_CLOSED_LOOP = 0,   // Scheduler 线程 + Ready/Complete Queue
+  TVMRT_SCHED_WORK_STEALING = 1, // Worker 原子更新入度 + 每 Worker 双端队列
+  TVMRT_SCHED_STATIC = 2         // Worker 按离线调度序列执行，自旋等待前驱
+} TvmrtSchedMode;
+
 typedef struct {
   int32_t current_indegree; // 当前剩余依赖数（动态）
                             // int32_t status;         // 暂不使用
 } RuntimeState;
 
+// 推理完成回调（在完成最后一个算子的运行时线程中调用，槽位已释放）
+typedef void (*RunDoneFn)(void *arg, int32_t error);
+
+// 同步等待一次推理完成
 typedef struct {
-  // 静态数据
-  int total_ops;
+  pthread_mutex_t lock;
+  pthread_cond_t cond;
+  int done;
+  int32_t error;
+} RunWaiter;
 
-  // 动态状态
-  RuntimeState *states;
-  SafeQueue ready_queue;
-  SafeQueue complete_queue;
+static void run_waiter_init(RunWaiter *w) {
+  pthread_mutex_init(&w->lock, NULL);
+  pthread_cond_init(&w->cond, NULL);
+  w->done = 0;
+  w->error = 0;
+}
+
+static void run_waiter_destroy(RunWaiter *w) {
+  pthread_mutex_destroy(&w->lock);
+  pthread_cond_destroy(&w->cond);
+}
+
+static void run_waiter_done(void *arg, int32_t error) {
+  RunWaiter *w = (RunWaiter *)arg;
+  pthread_mutex_lock(&w->lock);
+  w->error = error;
+  w->done = 1;
+  pthread_cond_broadcast(&w->cond);
+  pthread_mutex_unlock(&w->lock);
+}
+
+static int32_t run_waiter_wait(RunWaiter *w) {
+  pthread_mutex_lock(&w->lock);
+  while (!w->done) {
+    pthread_cond_wait(&w->cond, &w->lock);
+  }
+  int32_t error = w->error;
+  pthread_mutex_unlock(&w->lock);
+  return error;
+}
+
+// 一次进行中的推理（线程池中的一个槽位）
+typedef struct {
+  // 动态状态（每次推理仅重置入度表）
+  RuntimeState states[OP_COUNT];
 
-  // 工作空间
+  // 工作空间（每次推理绑定）
   uint8_t *cws;
   uint8_t *ws;
   SchedulableEntity *entities;
 
+  int completed_ops;
+  volatile int error;
+  RunDoneFn on_done; // 完成通知
+  void *on_done_arg;
+  int32_t trace_run_id;
+  int in_use; // 由 g_pool_lock 保护
+} RunState;
+
+typedef struct {
+  // 静态数据
+  int total_ops;
+
+  // 进行中的推理
+  RunState runs[TVMRT_MAX_INFLIGHT];
+  SafeQueue ready_queue;
+  SafeQueue complete_queue;
+
   // 控制
   int num_workers;
-  volatile int completed_ops;
-  volatile int error;
 
   // 同步
   pthread_mutex_t indegree_lock; // 保护入度更新
+
+  // 各槽位推理的提交序号（闭环模式优先级派发时早提交的先执行）
+  uint32_t run_order[TVMRT_MAX_INFLIGHT];
+
+  // 就绪派发顺序（启动时从 g_entity_templates[].config.priority 拷贝）
+  TvmrtReadyPolicy ready_policy;
+  int32_t priorities[OP_COUNT];
+  int32_t initial_ops[OP_COUNT]; // 初始入度为 0 的算子（按派发顺序）
+  int initial_count;
+
+  // Work-stealing 模式
+  TvmrtSchedMode mode;
+  WsDeque *deques;        // 每个 Worker 一个
+  SafeQueue inject_queue; // 新推理的初始任务，Worker 非阻塞领取
+  int ready_count;        // 已就绪未领取的任务数（休眠判断用）
+  int idle_waiters;       // 休眠中的 Worker 数
+  int stop;
+  pthread_mutex_t idle_lock;
+  pthread_cond_t idle_cond;
+
+  // 静态调度模式（复用 idle_lock/idle_cond/stop 等待新推理）
+  int32_t static_ring[TVMRT_MAX_INFLIGHT]; // 第 k 次提交的推理所在槽位
+  uint32_t static_submitted;               // 已提交推理数
 } RuntimeContext;
 
 typedef struct {
   RuntimeContext *ctx;
   int worker_id;
+  uint8_t *scratch; // 私有 scratch arena（未启用时为 NULL，使用推理的 ws）
 } WorkerArg;
 
+// 执行任务对应的算子；所属推理已出错时跳过执行，仅推进 DAG
+static void run_task(RuntimeContext *ctx, WorkerArg *wa, int32_t task) {
+  RunState *run = &ctx->runs[TASK_SLOT(task)];
+  if (run->error == 0) {
+    SchedulableEntity *entity = &run->entities[TASK_OP(task)];
+    uint8_t *kernel_ws = wa->scratch ? wa->scratch : run->ws;
+    TRACE_BEGIN(trace_start);
+    int ret =
+        entity->kernel(entity->inputs, entity->outputs, run->cws, kernel_ws);
+    TRACE_END(task, wa->worker_id + 1, run->trace_run_id, trace_start);
+    if (ret != 0) {
+      run->error = ret;
+    }
+  }
+}
+
+static void run_release_slot(int slot);
+
+// 推理全部算子完成：先释放槽位（回调中可以立即提交下一次推理），再通知提交者
+static void run_complete(RuntimeContext *ctx, RunState *run) {
+  RunDoneFn on_done = run->on_done;
+  void *on_done_arg = run->on_done_arg;
+  int32_t error = run->error;
+  run_release_slot((int)(run - ctx->runs));
+  on_done(on_done_arg, error);
+}
+
 // ============ Worker 线程 ============
 
 static void *worker_loop(void *arg) {
@@ -97,44 +661,217 @@ static void *worker_loop(void *arg) {
   RuntimeContext *ctx = wa->ctx;
 
   while (1) {
-    // A. 从 Ready Queue 获取任务
-    int32_t op_id = queue_pop(&ctx->ready_queue);
+    // A. 从 Ready Queue 获取任务（空闲时阻塞在此，推理间隙常驻）
+    int32_t task = queue_pop(&ctx->ready_queue);
 
     // B. 终止信号检测
-    if (op_id < 0) {
+    if (task < 0) {
       break;
     }
 
     // C. 执行算子（直接从实体调用 kernel）
-    SchedulableEntity *entity = &ctx->entities[op_id];
-    int ret =
-        entity->kernel(entity->inputs, entity->outputs, ctx->cws, ctx->ws);
-    if (ret != 0) {
-      ctx->error = ret;
-    }
+    run_task(ctx, wa, task);
 
     // D. 上报完成
-    queue_push(&ctx->complete_queue, op_id);
+    queue_push(&ctx->complete_queue, task);
   }
 
   return NULL;
 }
 
+// ============ Work-Stealing Worker 线程 ============
+
+// 新增就绪任务后唤醒休眠中的 Worker
+static void ws_wake_idle(RuntimeContext *ctx, int count) {
+  if (__atomic_load_n(&ctx->idle_waiters, __ATOMIC_SEQ_CST) == 0)
+    return;
+  pthread_mutex_lock(&ctx->idle_lock);
+  if (count > 1)
+    pthread_cond_broadcast(&ctx->idle_cond);
+  else
+    pthread_cond_signal(&ctx->idle_cond);
+  pthread_mutex_unlock(&ctx->idle_lock);
+}
+
+// 依次尝试：自己的队列 -> 新推理的初始任务 -> 其他 Worker 的队列
+static int32_t ws_find_work(RuntimeContext *ctx, int self) {
+  int32_t task = ws_deque_pop(&ctx->deques[self]);
+  if (task >= 0)
+    return task;
+
+  if (__atomic_load_n(&ctx->inject_queue.count, __ATOMIC_ACQUIRE) > 0) {
+    task = queue_try_pop(&ctx->inject_queue);
+    if (task >= 0)
+      return task;
+  }
+
+  int n = ctx->num_workers;
+  for (int k = 1; k < n; k++) {
+    WsDeque *victim = &ctx->deques[(self + k) % n];
+    do {
+      task = ws_deque_steal(victim);
+    } while (task == WS_ABORT);
+    if (task >= 0)
+      return task;
+  }
+  return WS_EMPTY;
+}
+
+static void *ws_worker_loop(void *arg) {
+  WorkerArg *wa = (WorkerArg *)arg;
+  RuntimeContext *ctx = wa->ctx;
+  int self = wa->worker_id;
+
+  while (!__atomic_load_n(&ctx->stop, __ATOMIC_ACQUIRE)) {
+    // A. 获取任务，没有就绪任务时休眠
+    int32_t task = ws_find_work(ctx, self);
+    if (task < 0) {
+      // 先自旋 / 让出等待新的就绪任务，预算用尽才休眠
+      int phase = wait_adaptive(&ctx->ready_count, 1, 0);
+      if (phase != TVMRT_WAIT_BLOCKED) {
+        wait_record(phase);
+        continue;
+      }
+      wait_record(TVMRT_WAIT_BLOCKED);
+      pthread_mutex_lock(&ctx->idle_lock);
+      __atomic_fetch_add(&ctx->idle_waiters, 1, __ATOMIC_SEQ_CST);
+      while (__atomic_load_n(&ctx->ready_count, __ATOMIC_SEQ_CST) == 0 &&
+             !__atomic_load_n(&ctx->stop, __ATOMIC_ACQUIRE)) {
+        pthread_cond_wait(&ctx->idle_cond, &ctx->idle_lock);
+      }
+      __atomic_fetch_sub(&ctx->idle_waiters, 1, __ATOMIC_SEQ_CST);
+      pthread_mutex_unlock(&ctx->idle_lock);
+      continue;
+    }
+    __atomic_fetch_sub(&ctx->ready_count, 1, __ATOMIC_SEQ_CST);
+
+    // B. 执行算子
+    run_task(ctx, wa, task);
+
+    // C. 原子递减后继入度，就绪的推入自己的队列
+    //    优先级模式下按 priority 升序入队，所有者 LIFO 弹出时先执行最关键的
+    int slot = TASK_SLOT(task);
+    int32_t op_id = TASK_OP(task);
+    RunState *run = &ctx->runs[slot];
+    int32_t num_succ = g_successor_counts[op_id];
+    const int32_t *successors = g_successors[op_id];
+    int32_t ready[OP_COUNT];
+    int pushed = 0;
+    for (int i = 0; i < num_succ; i++) {
+      int32_t succ_id = successors[i];
+      if (__atomic_sub_fetch(&run->states[succ_id].current_indegree, 1,
+                             __ATOMIC_ACQ_REL) == 0) {
+        int j = pushed++;
+        if (ctx->ready_policy == TVMRT_READY_PRIORITY) {
+          while (j > 0 &&
+                 ctx->priorities[ready[j - 1]] > ctx->priorities[succ_id]) {
+            ready[j] = ready[j - 1];
+            j--;
+          }
+        }
+        ready[j] = succ_id;
+      }
+    }
+    for (int i = 0; i < pushed; i++) {
+      int32_t succ_task = TASK_ID(slot, ready[i]);
+      TRACE_MARK_READY(succ_task);
+      __atomic_fetch_add(&ctx->ready_count, 1, __ATOMIC_SEQ_CST);
+      ws_deque_push(&ctx->deques[self], succ_task);
+    }
+    // 自己会取走一个，多出的交给其他 Worker
+    if (pushed > 1)
+      ws_wake_idle(ctx, pushed - 1);
+
+    // D. 本次推理全部算子完成，通知提交者
+    if (__atomic_add_fetch(&run->completed_ops, 1, __ATOMIC_ACQ_REL) ==
+        ctx->total_ops) {
+      run_complete(ctx, run);
+    }
+  }
+
+  return NULL;
+}
+
+// ============ 静态调度 Worker 线程 ============
+// 每个 Worker 依次执行 g_static_seqs[worker_id] 中的算子，以入度计数归零作为
+// 前驱完成标志：无 Scheduler 线程、无队列。各推理按提交顺序逐个执行，
+// 推理也按提交顺序完成，因此 static_ring 不会在 Worker 读取前被覆盖
+
+#ifdef TVMRT_STATIC_WORKERS
+
+// 自旋 wait_spin 次后每次检查前让出 CPU（无阻塞阶段）
+static void static_wait_ready(const int32_t *indegree) {
+  wait_record(wait_adaptive(indegree, 0, 1));
+}
+
+static void *static_worker_loop(void *arg) {
+  WorkerArg *wa = (WorkerArg *)arg;
+  RuntimeContext *ctx = wa->ctx;
+  const int32_t *seq = g_static_seqs[wa->worker_id];
+  int32_t len = g_static_seq_lens[wa->worker_id];
+
+  for (uint32_t k = 0;; k++) {
+    // A. 等待第 k 次提交的推理（推理间隙阻塞在此）
+    pthread_mutex_lock(&ctx->idle_lock);
+    while (ctx->static_submitted == k && !ctx->stop) {
+      pthread_cond_wait(&ctx->idle_cond, &ctx->idle_lock);
+    }
+    int idle = ctx->static_submitted == k;
+    int slot = ctx->static_ring[k % TVMRT_MAX_INFLIGHT];
+    pthread_mutex_unlock(&ctx->idle_lock);
+    if (idle) {
+      break; // tvmrt_shutdown
+    }
+
+    RunState *run = &ctx->runs[slot];
+    for (int32_t i = 0; i < len; i++) {
+      // B. 等待前驱全部完成后执行
+      int32_t op_id = seq[i];
+      static_wait_ready(&run->states[op_id].current_indegree);
+      run_task(ctx, wa, TASK_ID(slot, op_id));
+
+      // C. 递减后继入度
+      int32_t num_succ = g_successor_counts[op_id];
+      const int32_t *successors = g_successors[op_id];
+      for (int j = 0; j < num_succ; j++) {
+        if (__atomic_sub_fetch(&run->states[successors[j]].current_indegree,
+                               1, __ATOMIC_ACQ_REL) == 0) {
+          TRACE_MARK_READY(TASK_ID(slot, successors[j]));
+        }
+      }
+
+      // D. 本次推理全部算子完成（必为本 Worker 的最后一个算子），通知提交者
+      if (__atomic_add_fetch(&run->completed_ops, 1, __ATOMIC_ACQ_REL) ==
+          ctx->total_ops) {
+        run_complete(ctx, run);
+      }
+    }
+  }
+
+  return NULL;
+}
+
+#endif
+
 // ============ Scheduler 线程 ============
 
 static void *scheduler_loop(void *arg) {
   RuntimeContext *ctx = (RuntimeContext *)arg;
 
-  while (ctx->completed_ops < ctx->total_ops) {
+  while (1) {
     // A. 从 Complete Queue 获取完成事件
-    int32_t finished_op_id = queue_pop(&ctx->complete_queue);
+    int32_t finished_task = queue_pop(&ctx->complete_queue);
 
-    if (finished_op_id < 0)
-      break; // 终止信号
+    if (finished_task < 0)
+      break; // 终止信号（tvmrt_shutdown）
 
-    __atomic_fetch_add(&ctx->completed_ops, 1, __ATOMIC_SEQ_CST);
+    int slot = TASK_SLOT(finished_task);
+    RunState *run = &ctx->runs[slot];
+    int completed =
+        __atomic_add_fetch(&run->completed_ops, 1, __ATOMIC_SEQ_CST);
 
     // B. 更新后继节点入度
+    int32_t finished_op_id = TASK_OP(finished_task);
     int32_t num_succ = g_successor_counts[finished_op_id];
     const int32_t *successors = g_successors[finished_op_id];
 
@@ -143,136 +880,1137 @@ static void *scheduler_loop(void *arg) {
 
       // 原子递减入度
       pthread_mutex_lock(&ctx->indegree_lock);
-      ctx->states[succ_id].current_indegree--;
-      int32_t new_indegree = ctx->states[succ_id].current_indegree;
+      run->states[succ_id].current_indegree--;
+      int32_t new_indegree = run->states[succ_id].current_indegree;
       pthread_mutex_unlock(&ctx->indegree_lock);
 
       // C. 入度为 0，推入 Ready Queue
       if (new_indegree == 0) {
-        queue_push(&ctx->ready_queue, succ_id);
+        int32_t succ_task = TASK_ID(slot, succ_id);
+        TRACE_MARK_READY(succ_task);
+        queue_push(&ctx->ready_queue, succ_task);
       }
     }
 
-    // 错误检测
-    if (ctx->error != 0)
+    // D. 本次推理全部算子完成，通知提交者
+    if (completed == ctx->total_ops) {
+      run_complete(ctx, run);
+    }
+  }
+
+  return NULL;
+}
+
+// ============ 常驻线程池 ============
+
+typedef struct {
+  RuntimeContext ctx;
+  pthread_t sched_thread;
+  pthread_t *workers;
+  WorkerArg *worker_args;
+  int initialized;
+  int active_runs;     // 占用中的推理槽位数
+  int stopping;        // tvmrt_shutdown 进行中，新推理等待其完成
+  uint32_t next_order; // 下一次推理的提交序号
+} RuntimePool;
+
+static RuntimePool g_pool;
+// 保护 init/shutdown 与推理槽位分配
+static pthread_mutex_t g_pool_lock = PTHREAD_MUTEX_INITIALIZER;
+// 槽位释放 / shutdown 完成通知
+static pthread_cond_t g_slot_cond = PTHREAD_COND_INITIALIZER;
+static int g_atexit_registered = 0;
+
+// ============ 运行时配置 ============
+// 首次推理（或 tvmrt_shutdown 后的下一次推理）时读取一次，之后不再每次调用读取环境变量：
+// 1. 配置文件：TVMRT_CONFIG 指定路径，默认当前目录下的 tvmrt.conf
+//    （scripts/autotune.py 按本机实测结果生成；每行 key = value，# 开头为注释）
+// 2. 环境变量 TVMRT_NUM_WORKERS / TVMRT_SCHED_MODE / TVMRT_READY_POLICY /
+//    TVMRT_AFFINITY / TVMRT_WAIT_SPIN / TVMRT_WAIT_YIELD / TVMRT_WEIGHTS* 覆盖同名项
+
+#ifndef TVMRT_CONFIG_FILE
+#define TVMRT_CONFIG_FILE "tvmrt.conf"
+#endif
+#ifndef TVMRT_WEIGHTS_FILE
+#define TVMRT_WEIGHTS_FILE ""
+#endif
+
+typedef struct {
+  int num_workers; // 0 = 串行
+  TvmrtSchedMode sched_mode;
+  TvmrtReadyPolicy ready_policy;
+  char affinity[128]; // 线程放置：none / cores / l3 / numa / CPU 列表（见下文）
+  int wait_spin;      // 自适应等待的自旋次数
+  int wait_yield;     // 自适应等待的让出次数
+  char weights[512];  // 常量权重文件（仅 TVMRT_WEIGHTS_MMAP 构建使用，见下文）
+  int weights_populate; // mmap 时 MAP_POPULATE 预先读入全部页
+  int weights_hugepage; // madvise(MADV_HUGEPAGE)
+  int weights_verify;   // 映射后校验 CRC32
+} TvmrtConfig;
+
+static TvmrtConfig g_config;
+static int g_config_loaded = 0;
+static pthread_mutex_t g_config_lock = PTHREAD_MUTEX_INITIALIZER;
+
+static void config_set(TvmrtConfig *cfg, const char *key, const char *value) {
+  if (strcmp(key, "num_workers") == 0) {
+    cfg->num_workers = atoi(value);
+  } else if (strcmp(key, "sched_mode") == 0) {
+    if (strcmp(value, "work_stealing") == 0 || strcmp(value, "ws") == 0)
+      cfg->sched_mode = TVMRT_SCHED_WORK_STEALING;
+#ifdef TVMRT_STATIC_WORKERS
+    else if (strcmp(value, "static") == 0)
+      cfg->sched_mode = TVMRT_SCHED_STATIC;
+#endif
+    else
+      cfg->sched_mode = TVMRT_SCHED_CLOSED_LOOP;
+  } else if (strcmp(key, "ready_policy") == 0) {
+    cfg->ready_policy =
+        strcmp(value, "fifo") == 0 ? TVMRT_READY_FIFO : TVMRT_READY_PRIORITY;
+  } else if (strcmp(key, "wait_spin") == 0) {
+    cfg->wait_spin = atoi(value) > 0 ? atoi(value) : 0;
+  } else if (strcmp(key, "wait_yield") == 0) {
+    cfg->wait_yield = atoi(value) > 0 ? atoi(value) : 0;
+  } else if (strcmp(key, "affinity") == 0) {
+    snprintf(cfg->affinity, sizeof(cfg->affinity), "%s", value);
+  } else if (strcmp(key, "weights") == 0) {
+    snprintf(cfg->weights, sizeof(cfg->weights), "%s", value);
+  } else if (strcmp(key, "weights_populate") == 0) {
+    cfg->weights_populate = atoi(value) != 0;
+  } else if (strcmp(key, "weights_hugepage") == 0) {
+    cfg->weights_hugepage = atoi(value) != 0;
+  } else if (strcmp(key, "weights_verify") == 0) {
+    cfg->weights_verify = atoi(value) != 0;
+  } else {
+    fprintf(stderr, "[tvmrt] unknown config key: %s\n", key);
+  }
+}
+
+static char *config_trim(char *s) {
+  while (*s == ' ' || *s == '\t')
+    s++;
+  char *end = s + strlen(s);
+  while (end > s && (end[-1] == ' ' || end[-1] == '\t' || end[-1] == '\n' ||
+                     end[-1] == '\r'))
+    *--end = '\0';
+  return s;
+}
+
+static void config_load_file(TvmrtConfig *cfg, const char *path, int required) {
+  FILE *f = fopen(path, "r");
+  if (!f) {
+    if (required)
+      fprintf(stderr, "[tvmrt] failed to open config file %s\n", path);
+    return;
+  }
+  char line[256];
+  while (fgets(line, sizeof(line), f)) {
+    char *eq = strchr(line, '=');
+    char *key = config_trim(line);
+    if (*key == '#' || !eq)
+      continue;
+    *eq = '\0';
+    config_set(cfg, config_trim(key), config_trim(eq + 1));
+  }
+  fclose(f);
+}
+
+static const TvmrtConfig *tvmrt_config(void) {
+  if (!__atomic_load_n(&g_config_loaded, __ATOMIC_ACQUIRE)) {
+    pthread_mutex_lock(&g_config_lock);
+    if (!g_config_loaded) {
+      TvmrtConfig cfg = {0, TVMRT_SCHED_CLOSED_LOOP, TVMRT_READY_PRIORITY,
+                         "none", TVMRT_WAIT_SPIN, TVMRT_WAIT_YIELD,
+                         TVMRT_WEIGHTS_FILE, 0, 0, 1};
+      const char *path = getenv("TVMRT_CONFIG");
+      config_load_file(&cfg, path ? path : TVMRT_CONFIG_FILE, path != NULL);
+      static const char *const overrides[][2] = {
+          {"TVMRT_NUM_WORKERS", "num_workers"},
+          {"TVMRT_SCHED_MODE", "sched_mode"},
+          {"TVMRT_READY_POLICY", "ready_policy"},
+          {"TVMRT_AFFINITY", "affinity"},
+          {"TVMRT_WAIT_SPIN", "wait_spin"},
+          {"TVMRT_WAIT_YIELD", "wait_yield"},
+          {"TVMRT_WEIGHTS", "weights"},
+          {"TVMRT_WEIGHTS_POPULATE", "weights_populate"},
+          {"TVMRT_WEIGHTS_HUGEPAGE", "weights_hugepage"},
+          {"TVMRT_WEIGHTS_VERIFY", "weights_verify"},
+      };
+      for (size_t i = 0; i < sizeof(overrides) / sizeof(overrides[0]); i++) {
+        const char *env = getenv(overrides[i][0]);
+        if (env)
+          config_set(&cfg, overrides[i][1], env);
+      }
+      g_config = cfg;
+      __atomic_store_n(&g_config_loaded, 1, __ATOMIC_RELEASE);
+    }
+    pthread_mutex_unlock(&g_config_lock);
+  }
+  return &g_config;
+}
+
+// tvmrt_shutdown 后重新读取（扫描工具修改环境变量后重建线程池）
+static void tvmrt_config_invalidate(void) {
+  pthread_mutex_lock(&g_config_lock);
+  __atomic_store_n(&g_config_loaded, 0, __ATOMIC_RELEASE);
+  pthread_mutex_unlock(&g_config_lock);
+}
+
+// 配置未指定 Worker 数（串行）时线程池回退到 OMP_NUM_THREADS，再回退到 3
+static int config_pool_workers(const TvmrtConfig *cfg) {
+  if (cfg->num_workers > 0)
+    return cfg->num_workers;
+  const char *env = getenv("OMP_NUM_THREADS");
+  int num_workers = env ? atoi(env) : 3;
+  if (num_workers < 1)
+    num_workers = 1;
+  return num_workers;
+}
+
+// ============ 常量权重 ============
+// 默认常量（global_const_workspace）编译在 lib0.c 中。merge_scheduler_code.py
+// --weights-blob 把常量抽取成二进制权重文件，lib0.c 不再含常量数组
+// （TVMRT_WEIGHTS_MMAP）：首次需要常量时（创建上下文 / tvmgen_default_run）
+// 以 PROT_READ + MAP_SHARED 映射整个文件，之后直到进程退出都不解除映射，
+// 同一模型的多个进程共享同一份页缓存。
+// 文件格式与 merge_scheduler_code.py 一致：64 字节文件头 + 填充至 data_offset（页对齐）
+// + data_size 字节常量；文件头的大小与 CRC32 必须与构建时写入 lib1.c 的一致。
+// 配置项（只在首次映射时读取）：
+//   weights           文件路径，默认为构建时的 TVMRT_WEIGHTS_FILE
+//   weights_populate  1 = MAP_POPULATE，映射时读入全部页（避免首次推理缺页）
+//   weights_hugepage  1 = madvise(MADV_HUGEPAGE)（需内核支持文件页透明大页）
+//   weights_verify    1（默认）= 映射后校验常量区 CRC32（会读入全部页）
+
+#ifdef TVMRT_WEIGHTS_MMAP
+
+#define TVMRT_WEIGHTS_MAGIC "TVMRTWB"
+#define TVMRT_WEIGHTS_VERSION 1
+
+typedef struct {
+  char magic[8];
+  uint32_t version;
+  uint32_t header_size;
+  uint64_t data_offset;
+  uint64_t data_size;
+  uint32_t crc32;
+  uint32_t reserved;
+  char model[24];
+} TvmrtWeightsHeader;
+
+static uint8_t *g_weights; // 映射后的常量区
+static pthread_mutex_t g_weights_lock = PTHREAD_MUTEX_INITIALIZER;
+
+// CRC-32（IEEE 802.3，与 Python zlib.crc32 一致）
+static uint32_t weights_crc32(const uint8_t *data, uint64_t size) {
+  uint32_t table[256];
+  for (uint32_t i = 0; i < 256; i++) {
+    uint32_t c = i;
+    for (int k = 0; k < 8; k++)
+      c = (c & 1) ? 0xEDB88320u ^ (c >> 1) : c >> 1;
+    table[i] = c;
+  }
+  uint32_t crc = 0xFFFFFFFFu;
+  for (uint64_t i = 0; i < size; i++)
+    crc = table[(crc ^ data[i]) & 0xFF] ^ (crc >> 8);
+  return crc ^ 0xFFFFFFFFu;
+}
+
+static uint8_t *weights_map(const TvmrtConfig *cfg) {
+  const char *path = cfg->weights;
+  int fd = open(path, O_RDONLY | O_CLOEXEC);
+  if (fd < 0) {
+    fprintf(stderr, "[tvmrt] failed to open weights file %s\n", path);
+    return NULL;
+  }
+  struct stat st;
+  TvmrtWeightsHeader header;
+  int ok = fstat(fd, &st) == 0 &&
+           pread(fd, &header, sizeof(header), 0) == (ssize_t)sizeof(header);
+  if (!ok || memcmp(header.magic, TVMRT_WEIGHTS_MAGIC, 8) != 0 ||
+      header.version != TVMRT_WEIGHTS_VERSION ||
+      header.header_size != sizeof(header) ||
+      header.data_offset % (uint64_t)sysconf(_SC_PAGESIZE) != 0 ||
+      header.data_offset + header.data_size != (uint64_t)st.st_size) {
+    fprintf(stderr, "[tvmrt] %s is not a valid weights file\n", path);
+    close(fd);
+    return NULL;
+  }
+  if (header.data_size != TVMRT_CONST_WORKSPACE_SIZE ||
+      header.crc32 != TVMRT_WEIGHTS_CRC32) {
+    fprintf(stderr,
+            "[tvmrt] weights file %s (model %.24s, %llu bytes, crc32 %08x) does "
+            "not match this build (%llu bytes, crc32 %08x)\n",
+            path, header.model, (unsigned long long)header.data_size,
+            header.crc32, (unsigned long long)TVMRT_CONST_WORKSPACE_SIZE,
+            TVMRT_WEIGHTS_CRC32);
+    close(fd);
+    return NULL;
+  }
+
+  int flags = MAP_SHARED;
+#ifdef MAP_POPULATE
+  if (cfg->weights_populate)
+    flags |= MAP_POPULATE;
+#endif
+  void *base = mmap(NULL, (size_t)st.st_size, PROT_READ, flags, fd, 0);
+  close(fd); // 映射建立后不再需要文件描述符
+  if (base == MAP_FAILED) {
+    fprintf(stderr, "[tvmrt] failed to mmap weights file %s\n", path);
+    return NULL;
+  }
+  if (cfg->weights_hugepage) {
+#ifdef MADV_HUGEPAGE
+    if (madvise(base, (size_t)st.st_size, MADV_HUGEPAGE) != 0)
+      fprintf(stderr, "[tvmrt] MADV_HUGEPAGE not supported for %s\n", path);
+#else
+    fprintf(stderr, "[tvmrt] weights_hugepage is not supported, ignored\n");
+#endif
+  }
+  uint8_t *data = (uint8_t *)base + header.data_offset;
+  if (cfg->weights_verify &&
+      weights_crc32(data, header.data_size) != header.crc32) {
+    fprintf(stderr, "[tvmrt] weights file %s is corrupted (crc32 mismatch)\n",
+            path);
+    munmap(base, (size_t)st.st_size);
+    return NULL;
+  }
+  return data;
+}
+
+// 常量区（首次调用时映射；失败返回 NULL，下次调用重试）
+static uint8_t *tvmrt_const_workspace(void) {
+  uint8_t *weights = __atomic_load_n(&g_weights, __ATOMIC_ACQUIRE);
+  if (weights)
+    return weights;
+  pthread_mutex_lock(&g_weights_lock);
+  if (!g_weights)
+    __atomic_store_n(&g_weights, weights_map(tvmrt_config()), __ATOMIC_RELEASE);
+  weights = g_weights;
+  pthread_mutex_unlock(&g_weights_lock);
+  return weights;
+}
+
+#else
+
+static uint8_t *tvmrt_const_workspace(void) { return global_const_workspace; }
+
+#endif
+
+// ============ 线程放置（CPU 亲和性） ============
+// 配置项 affinity 决定 Worker 与 Scheduler 线程绑定到哪些逻辑 CPU（仅 Linux）：
+//   none    不绑定（默认）
+//   cores   每个物理核一个逻辑 CPU（避开 SMT 兄弟线程）
+//   l3      同 cores，但限制在启动线程所在的 L3 共享域内
+//   numa    同 cores，但限制在启动线程所在的 NUMA 节点内
+//   0,2,4-7 显式 CPU 列表
+// 拓扑读自 /sys/devices/system/{cpu,node}，并与进程允许的 CPU 集合取交集。
+// Worker i 绑定到放置序列的第 i % count 个 CPU，Scheduler 线程绑定到整个放置集合；
+// 启动线程池时在 stderr 报告实际放置
+
+#define TVMRT_MAX_CPUS 1024
+
+typedef struct {
+  int count;
+  int cpus[TVMRT_MAX_CPUS]; // 按放置顺序排列的逻辑 CPU
+} CpuPlacement;
+
+static CpuPlacement g_placement;
+
+// 解析 "0-3,8,10-11" 形式的 CPU 列表，返回个数
+static int parse_cpu_list(const char *s, int *cpus, int max) {
+  int count = 0;
+  while (*s) {
+    char *end;
+    long first = strtol(s, &end, 10);
+    if (end == s)
       break;
+    long last = first;
+    s = end;
+    if (*s == '-') {
+      last = strtol(s + 1, &end, 10);
+      s = end;
+    }
+    for (long c = first; c <= last && count < max; c++) {
+      if (c >= 0 && c < TVMRT_MAX_CPUS)
+        cpus[count++] = (int)c;
+    }
+    while (*s == ',' || *s == ' ' || *s == '\n')
+      s++;
   }
+  return count;
+}
 
-  // D. 发送终止信号给所有 Workers
-  for (int i = 0; i < ctx->num_workers; i++) {
-    queue_push(&ctx->ready_queue, -1); // -1 作为终止信号
+// 读取 sysfs 中的 CPU 列表文件，不存在时返回 -1
+static int read_cpu_list(const char *path, int *cpus, int max) {
+  FILE *f = fopen(path, "r");
+  if (!f)
+    return -1;
+  char buf[4096];
+  size_t n = fread(buf, 1, sizeof(buf) - 1, f);
+  fclose(f);
+  buf[n] = '\0';
+  return parse_cpu_list(buf, cpus, max);
+}
+
+static int cpu_list_contains(const int *cpus, int count, int cpu) {
+  for (int i = 0; i < count; i++) {
+    if (cpus[i] == cpu)
+      return 1;
   }
+  return 0;
+}
 
-  return NULL;
+#ifdef __linux__
+
+// 放置域：启动线程所在 CPU 的 L3 共享域 / NUMA 节点，读取失败时返回 -1（不限制）
+static int placement_domain(const char *policy, int anchor, int *cpus, int max) {
+  char path[128];
+  if (strcmp(policy, "l3") == 0) {
+    snprintf(path, sizeof(path),
+             "/sys/devices/system/cpu/cpu%d/cache/index3/shared_cpu_list", anchor);
+    return read_cpu_list(path, cpus, max);
+  }
+  for (int node = 0; node < 256; node++) {
+    snprintf(path, sizeof(path), "/sys/devices/system/node/node%d/cpulist", node);
+    int count = read_cpu_list(path, cpus, max);
+    if (count > 0 && cpu_list_contains(cpus, count, anchor))
+      return count;
+  }
+  return -1;
 }
 
-// ============ 运行时初始化 ============
+static void placement_build(const char *policy, CpuPlacement *pl) {
+  static int domain[TVMRT_MAX_CPUS];
+  static int siblings[TVMRT_MAX_CPUS];
+  pl->count = 0;
+  if (!policy[0] || strcmp(policy, "none") == 0)
+    return;
+  int explicit_list = policy[0] >= '0' && policy[0] <= '9';
+  if (!explicit_list && strcmp(policy, "cores") != 0 && strcmp(policy, "l3") != 0 &&
+      strcmp(policy, "numa") != 0) {
+    fprintf(stderr, "[tvmrt] unknown affinity policy: %s\n", policy);
+    return;
+  }
 
-static void init_runtime_context(RuntimeContext *ctx, uint8_t *cws, uint8_t *ws,
-                                 SchedulableEntity *entities, int num_workers) {
-  ctx->total_ops = OP_COUNT;
-  ctx->cws = cws;
-  ctx->ws = ws;
-  ctx->entities = entities;
-  ctx->num_workers = num_workers;
-  ctx->completed_ops = 0;
-  ctx->error = 0;
+  cpu_set_t allowed;
+  if (sched_getaffinity(0, sizeof(allowed), &allowed) != 0)
+    return;
 
-  // 分配并初始化运行时状态
-  ctx->states = (RuntimeState *)malloc(sizeof(RuntimeState) * OP_COUNT);
-  for (int i = 0; i < OP_COUNT; i++) {
-    ctx->states[i].current_indegree = g_initial_indegrees[i];
+  if (explicit_list) {
+    // 显式列表同样与允许集合取交集并去重，丢弃的 CPU 在 stderr 报告
+    int n = parse_cpu_list(policy, domain, TVMRT_MAX_CPUS);
+    char dropped[256];
+    size_t len = 0;
+    dropped[0] = '\0';
+    for (int i = 0; i < n; i++) {
+      int cpu = domain[i];
+      if (cpu < CPU_SETSIZE && CPU_ISSET(cpu, &allowed) &&
+          !cpu_list_contains(pl->cpus, pl->count, cpu)) {
+        pl->cpus[pl->count++] = cpu;
+      } else if (len < sizeof(dropped)) {
+        len += snprintf(dropped + len, sizeof(dropped) - len, "%s%d", len ? "," : "", cpu);
+      }
+    }
+    if (len > 0)
+      fprintf(stderr, "[tvmrt] affinity: dropped CPUs not allowed or duplicated: %s\n",
+              dropped);
+    return;
+  }
+  int anchor = sched_getcpu();
+  int domain_count = -1;
+  if (strcmp(policy, "cores") != 0 && anchor >= 0)
+    domain_count = placement_domain(policy, anchor, domain, TVMRT_MAX_CPUS);
+
+  for (int cpu = 0; cpu < TVMRT_MAX_CPUS && cpu < CPU_SETSIZE; cpu++) {
+    if (!CPU_ISSET(cpu, &allowed))
+      continue;
+    if (domain_count > 0 && !cpu_list_contains(domain, domain_count, cpu))
+      continue;
+    // 物理核内编号最小的允许 CPU 代表该核
+    char path[128];
+    snprintf(path, sizeof(path),
+             "/sys/devices/system/cpu/cpu%d/topology/thread_siblings_list", cpu);
+    int n = read_cpu_list(path, siblings, TVMRT_MAX_CPUS);
+    int first = cpu;
+    for (int i = 0; i < n; i++) {
+      if (siblings[i] < first && CPU_ISSET(siblings[i], &allowed))
+        first = siblings[i];
+    }
+    if (first == cpu)
+      pl->cpus[pl->count++] = cpu;
+  }
+}
+
+#else
+
+static void placement_build(const char *policy, CpuPlacement *pl) {
+  pl->count = 0;
+  if (policy[0] && strcmp(policy, "none") != 0)
+    fprintf(stderr, "[tvmrt] affinity is only supported on Linux, ignored\n");
+}
+
+#endif
+
+// 按放置创建线程（cpus 为空时不绑定）；绑定失败（CPU 不可用）时不绑定重试
+static int placement_thread_create(pthread_t *thread, void *(*fn)(void *),
+                                   void *arg, const int *cpus, int count) {
+  pthread_attr_t attr;
+  pthread_attr_init(&attr);
+#ifdef __linux__
+  if (count > 0) {
+    cpu_set_t set;
+    CPU_ZERO(&set);
+    for (int i = 0; i < count; i++) {
+      if (cpus[i] < CPU_SETSIZE)
+        CPU_SET(cpus[i], &set);
+    }
+    pthread_attr_setaffinity_np(&attr, sizeof(set), &set);
+  }
+#endif
+  int ret = pthread_create(thread, &attr, fn, arg);
+  pthread_attr_destroy(&attr);
+  if (ret != 0 && count > 0) {
+    fprintf(stderr, "[tvmrt] failed to pin thread, running unpinned\n");
+    ret = pthread_create(thread, NULL, fn, arg);
   }
+  return ret;
+}
+
+static const int *placement_worker_cpu(const CpuPlacement *pl, int worker) {
+  return pl->count > 0 ? &pl->cpus[worker % pl->count] : NULL;
+}
+
+static void placement_report(const char *policy, const CpuPlacement *pl,
+                             int num_workers, int has_scheduler) {
+  if (!policy[0] || strcmp(policy, "none") == 0)
+    return;
+  if (pl->count == 0) {
+    fprintf(stderr, "[tvmrt] affinity %s: no usable CPUs, threads unpinned\n",
+            policy);
+    return;
+  }
+  fprintf(stderr, "[tvmrt] affinity %s:", policy);
+  for (int i = 0; i < num_workers; i++) {
+    fprintf(stderr, " w%d->%d", i, *placement_worker_cpu(pl, i));
+  }
+  if (has_scheduler) {
+    fprintf(stderr, " scheduler->");
+    for (int i = 0; i < pl->count; i++) {
+      fprintf(stderr, "%s%d", i ? "," : "", pl->cpus[i]);
+    }
+  }
+  fprintf(stderr, "%s\n",
+          num_workers > pl->count ? " (workers share CPUs)" : "");
+}
+
+TVM_DLL void tvmrt_shutdown(void);
+
+// 线程池实际使用的 Worker 数与调度模式（参数 <= 0 / < 0 时沿用运行时配置）。
+// static 模式的离线调度表按 TVMRT_STATIC_WORKERS 生成，显式请求的其他 Worker 数
+// 被忽略，warn 时在 stderr 提示
+static int pool_resolve(int num_workers, int *sched_mode, int warn) {
+  const TvmrtConfig *cfg = tvmrt_config();
+  int requested = num_workers > 0 ? num_workers : cfg->num_workers;
+  if (num_workers <= 0)
+    num_workers = config_pool_workers(cfg);
+  if (*sched_mode < 0)
+    *sched_mode = cfg->sched_mode;
+
+#ifdef TVMRT_STATIC_WORKERS
+  if (*sched_mode == TVMRT_SCHED_STATIC) {
+    if (warn && requested > 0 && requested != TVMRT_STATIC_WORKERS)
+      fprintf(stderr,
+              "[tvmrt] static mode runs the offline schedule on %d workers, "
+              "requested %d ignored\n",
+              TVMRT_STATIC_WORKERS, requested);
+    num_workers = TVMRT_STATIC_WORKERS;
+  }
+#else
+  (void)requested;
+  (void)warn;
+#endif
+  return num_workers;
+}
+
+// 调用者持有 g_pool_lock 且线程池未启动
+static int pool_start_locked(int num_workers, int sched_mode) {
+  const TvmrtConfig *cfg = tvmrt_config();
+  num_workers = pool_resolve(num_workers, &sched_mode, 1);
+
+  RuntimeContext *ctx = &g_pool.ctx;
+  ctx->total_ops = OP_COUNT;
+  ctx->num_workers = num_workers;
+  ctx->mode = (TvmrtSchedMode)sched_mode;
+  ctx->ready_policy = cfg->ready_policy;
+  g_wait_spin = cfg->wait_spin;
+  g_wait_yield = cfg->wait_yield;
 
-  // 初始化队列
   queue_init(&ctx->ready_queue);
   queue_init(&ctx->complete_queue);
-
-  // 初始化锁
+  queue_init(&ctx->inject_queue);
+  if (ctx->ready_policy == TVMRT_READY_PRIORITY) {
+    ctx->ready_queue.priority = ctx->priorities;
+    ctx->ready_queue.run_order = ctx->run_order;
+  }
   pthread_mutex_init(&ctx->indegree_lock, NULL);
+  for (int s = 0; s < TVMRT_MAX_INFLIGHT; s++) {
+    ctx->runs[s].in_use = 0;
+  }
 
-  // 将初始入度为 0 的算子推入 Ready Queue
+  // 初始算子按 priority 降序派发
+  ctx->initial_count = 0;
   for (int i = 0; i < OP_COUNT; i++) {
-    if (ctx->states[i].current_indegree == 0) {
-      queue_push(&ctx->ready_queue, i);
+    ctx->priorities[i] = g_entity_templates[i].config.priority;
+    if (g_initial_indegrees[i] == 0) {
+      int j = ctx->initial_count++;
+      if (ctx->ready_policy == TVMRT_READY_PRIORITY) {
+        while (j > 0 && ctx->priorities[ctx->initial_ops[j - 1]] <
+                            ctx->priorities[i]) {
+          ctx->initial_ops[j] = ctx->initial_ops[j - 1];
+          j--;
+        }
+      }
+      ctx->initial_ops[j] = i;
+    }
+  }
+
+  ctx->deques = NULL;
+  ctx->ready_count = 0;
+  ctx->idle_waiters = 0;
+  ctx->stop = 0;
+  ctx->static_submitted = 0;
+  pthread_mutex_init(&ctx->idle_lock, NULL);
+  pthread_cond_init(&ctx->idle_cond, NULL);
+
+  g_pool.workers = (pthread_t *)malloc(sizeof(pthread_t) * num_workers);
+  g_pool.worker_args = (WorkerArg *)calloc(num_workers, sizeof(WorkerArg));
+
+  int alloc_failed = 0;
+  for (int i = 0; i < num_workers && TVMRT_SCRATCH_ARENA_SIZE > 0; i++) {
+    if (posix_memalign((void **)&g_pool.worker_args[i].scratch, 64,
+                       TVMRT_SCRATCH_ARENA_SIZE) != 0) {
+      g_pool.worker_args[i].scratch = NULL;
+      alloc_failed = 1;
+    }
+  }
+  if (ctx->mode == TVMRT_SCHED_WORK_STEALING &&
+      posix_memalign((void **)&ctx->deques, 64,
+                     sizeof(WsDeque) * num_workers) != 0) {
+    ctx->deques = NULL;
+    alloc_failed = 1;
+  }
+  if (alloc_failed) {
+    for (int i = 0; i < num_workers; i++) {
+      free(g_pool.worker_args[i].scratch);
+    }
+    free(ctx->deques);
+    ctx->deques = NULL;
+    free(g_pool.workers);
+    free(g_pool.worker_args);
+    return -1;
+  }
+
+  void *(*worker_entry)(void *) = worker_loop;
+  if (ctx->mode == TVMRT_SCHED_WORK_STEALING) {
+    for (int i = 0; i < num_workers; i++) {
+      ws_deque_init(&ctx->deques[i]);
     }
+    worker_entry = ws_worker_loop;
+#ifdef TVMRT_STATIC_WORKERS
+  } else if (ctx->mode == TVMRT_SCHED_STATIC) {
+    worker_entry = static_worker_loop;
+#endif
+  }
+
+  placement_build(cfg->affinity, &g_placement);
+  int has_scheduler = ctx->mode == TVMRT_SCHED_CLOSED_LOOP;
+  placement_report(cfg->affinity, &g_placement, num_workers, has_scheduler);
+  if (has_scheduler) {
+    placement_thread_create(&g_pool.sched_thread, scheduler_loop, ctx,
+                            g_placement.cpus, g_placement.count);
+  }
+
+  for (int i = 0; i < num_workers; i++) {
+    g_pool.worker_args[i].ctx = ctx;
+    g_pool.worker_args[i].worker_id = i;
+    placement_thread_create(&g_pool.workers[i], worker_entry,
+                            &g_pool.worker_args[i],
+                            placement_worker_cpu(&g_placement, i),
+                            g_placement.count > 0 ? 1 : 0);
+  }
+
+  g_pool.initialized = 1;
+  if (!g_atexit_registered) {
+    atexit(tvmrt_shutdown);
+    g_atexit_registered = 1;
+  }
+  return 0;
+}
+
+// 启动 num_workers 个 Worker 线程（闭环模式另加一个 Scheduler 线程），
+// 已启动时直接返回；切换模式需先 tvmrt_shutdown
+// num_workers <= 0 时取运行时配置的 num_workers（tvmrt.conf / TVMRT_NUM_WORKERS，
+// 串行时回退到 OMP_NUM_THREADS）
+// sched_mode < 0 时取运行时配置的 sched_mode（closed_loop / work_stealing / static）
+// 静态调度模式的 Worker 数固定为离线调度时的 TVMRT_STATIC_WORKERS（请求其他数目时
+// 在 stderr 提示并忽略；实际数目见 tvmrt_num_workers）
+TVM_DLL int32_t tvmrt_init(int num_workers, int sched_mode) {
+  pthread_mutex_lock(&g_pool_lock);
+  int ret = 0;
+  if (!g_pool.initialized) {
+    ret = pool_start_locked(num_workers, sched_mode);
   }
+  pthread_mutex_unlock(&g_pool_lock);
+  return ret;
 }
 
-static void cleanup_runtime_context(RuntimeContext *ctx) {
+// 等待进行中的推理结束后停止并回收线程池（未启动时为空操作）；
+// 下一次推理重新读取运行时配置
+TVM_DLL void tvmrt_shutdown(void) {
+  pthread_mutex_lock(&g_pool_lock);
+  while (g_pool.stopping) {
+    pthread_cond_wait(&g_slot_cond, &g_pool_lock);
+  }
+  if (!g_pool.initialized) {
+    tvmrt_config_invalidate(); // 串行模式没有线程池，同样重新读取配置
+    pthread_mutex_unlock(&g_pool_lock);
+    return;
+  }
+  g_pool.stopping = 1;
+  while (g_pool.active_runs > 0) {
+    pthread_cond_wait(&g_slot_cond, &g_pool_lock);
+  }
+
+  RuntimeContext *ctx = &g_pool.ctx;
+  if (ctx->mode != TVMRT_SCHED_CLOSED_LOOP) {
+    pthread_mutex_lock(&ctx->idle_lock);
+    __atomic_store_n(&ctx->stop, 1, __ATOMIC_RELEASE);
+    pthread_cond_broadcast(&ctx->idle_cond);
+    pthread_mutex_unlock(&ctx->idle_lock);
+  } else {
+    queue_push(&ctx->complete_queue, -1);
+    for (int i = 0; i < ctx->num_workers; i++) {
+      queue_push(&ctx->ready_queue, -1); // -1 作为终止信号
+    }
+    pthread_join(g_pool.sched_thread, NULL);
+  }
+
+  for (int i = 0; i < ctx->num_workers; i++) {
+    pthread_join(g_pool.workers[i], NULL);
+  }
+
   queue_destroy(&ctx->ready_queue);
   queue_destroy(&ctx->complete_queue);
+  queue_destroy(&ctx->inject_queue);
   pthread_mutex_destroy(&ctx->indegree_lock);
-  free(ctx->states);
-}
-
-// ============ DAG 调度运行入口 ============
+  pthread_mutex_destroy(&ctx->idle_lock);
+  pthread_cond_destroy(&ctx->idle_cond);
+  free(ctx->deques);
+  ctx->deques = NULL;
+  for (int i = 0; i < ctx->num_workers; i++) {
+    free(g_pool.worker_args[i].scratch);
+  }
+  free(g_pool.workers);
+  free(g_pool.worker_args);
+  g_pool.workers = NULL;
+  g_pool.worker_args = NULL;
+  g_pool.initialized = 0;
+  g_pool.stopping = 0;
+  tvmrt_config_invalidate();
 
-static int tvmrt_run_dag(uint8_t *cws, uint8_t *ws,
-                         SchedulableEntity entities[]) {
-  int num_workers = 0;
-  const char *env = getenv("TVMRT_NUM_WORKERS");
-  if (!env)
-    env = getenv("OMP_NUM_THREADS");
-  num_workers = env ? atoi(env) : 3;
-  if (num_workers < 1)
-    num_workers = 1;
+  pthread_cond_broadcast(&g_slot_cond);
+  pthread_mutex_unlock(&g_pool_lock);
+}
 
-  RuntimeContext ctx;
-  init_runtime_context(&ctx, cws, ws, entities, num_workers);
+// 占用一个空闲推理槽位（首次调用时惰性启动线程池，之后复用）；
+// 槽位已满时 block 非 0 则等待（背压），否则返回 TVMRT_BUSY；启动失败返回 -1
+static int run_acquire_slot(int block) {
+  pthread_mutex_lock(&g_pool_lock);
+  while (g_pool.stopping || (g_pool.initialized &&
+                             g_pool.active_runs == TVMRT_MAX_INFLIGHT)) {
+    if (!block) {
+      pthread_mutex_unlock(&g_pool_lock);
+      return TVMRT_BUSY;
+    }
+    pthread_cond_wait(&g_slot_cond, &g_pool_lock);
+  }
+  if (!g_pool.initialized && pool_start_locked(0, -1) != 0) {
+    pthread_mutex_unlock(&g_pool_lock);
+    return -1;
+  }
+  int slot = 0;
+  while (g_pool.ctx.runs[slot].in_use) {
+    slot++;
+  }
+  g_pool.ctx.runs[slot].in_use = 1;
+  g_pool.ctx.run_order[slot] = g_pool.next_order++;
+  g_pool.active_runs++;
+  pthread_mutex_unlock(&g_pool_lock);
+  return slot;
+}
 
-  // 启动 Scheduler 线程
-  pthread_t sched_thread;
-  pthread_create(&sched_thread, NULL, scheduler_loop, &ctx);
+static void run_release_slot(int slot) {
+  pthread_mutex_lock(&g_pool_lock);
+  g_pool.ctx.runs[slot].in_use = 0;
+  g_pool.active_runs--;
+  pthread_cond_broadcast(&g_slot_cond);
+  pthread_mutex_unlock(&g_pool_lock);
+}
 
-  // 启动 Worker 线程
-  pthread_t *workers = (pthread_t *)malloc(sizeof(pthread_t) * num_workers);
-  WorkerArg *worker_args = (WorkerArg *)malloc(sizeof(WorkerArg) * num_workers);
+// ============ DAG 调度运行入口 ============
 
-  for (int i = 0; i < num_workers; i++) {
-    worker_args[i].ctx = &ctx;
-    worker_args[i].worker_id = i;
-    pthread_create(&workers[i], NULL, worker_loop, &worker_args[i]);
+// 提交一次推理：占用槽位并派发初始算子后立即返回，全部算子完成时在运行时
+// 线程中调用 on_done(on_done_arg, error)
+static int tvmrt_dag_submit(uint8_t *cws, uint8_t *ws,
+                            SchedulableEntity entities[], int32_t trace_run_id,
+                            RunDoneFn on_done, void *on_done_arg, int block) {
+  int slot = run_acquire_slot(block);
+  if (slot < 0) {
+    return slot;
   }
+  RuntimeContext *ctx = &g_pool.ctx;
+  RunState *run = &ctx->runs[slot];
 
-  // 等待完成
-  pthread_join(sched_thread, NULL);
-  for (int i = 0; i < num_workers; i++) {
-    pthread_join(workers[i], NULL);
+  // 绑定本次推理的工作空间，并重置入度表
+  run->cws = cws;
+  run->ws = ws;
+  run->entities = entities;
+  run->completed_ops = 0;
+  run->error = 0;
+  run->on_done = on_done;
+  run->on_done_arg = on_done_arg;
+  run->trace_run_id = trace_run_id;
+  for (int i = 0; i < OP_COUNT; i++) {
+    run->states[i].current_indegree = g_initial_indegrees[i];
   }
 
-  int error = ctx.error;
+  for (int i = 0; i < ctx->initial_count; i++) {
+    TRACE_MARK_READY(TASK_ID(slot, ctx->initial_ops[i]));
+  }
 
-  cleanup_runtime_context(&ctx);
-  free(workers);
-  free(worker_args);
+  if (ctx->mode == TVMRT_SCHED_WORK_STEALING) {
+    // 初始任务由 Worker 从 inject_queue 领取
+    __atomic_fetch_add(&ctx->ready_count, ctx->initial_count,
+                       __ATOMIC_SEQ_CST);
+    for (int i = 0; i < ctx->initial_count; i++) {
+      queue_push(&ctx->inject_queue, TASK_ID(slot, ctx->initial_ops[i]));
+    }
+    ws_wake_idle(ctx, ctx->initial_count);
+  } else if (ctx->mode == TVMRT_SCHED_STATIC) {
+    // 各 Worker 按自己的序列执行，只需发布本次推理
+    pthread_mutex_lock(&ctx->idle_lock);
+    ctx->static_ring[ctx->static_submitted % TVMRT_MAX_INFLIGHT] = slot;
+    ctx->static_submitted++;
+    pthread_cond_broadcast(&ctx->idle_cond);
+    pthread_mutex_unlock(&ctx->idle_lock);
+  } else {
+    // 将初始入度为 0 的算子推入 Ready Queue
+    for (int i = 0; i < ctx->initial_count; i++) {
+      queue_push(&ctx->ready_queue, TASK_ID(slot, ctx->initial_ops[i]));
+    }
+  }
+  return 0;
+}
 
-  return error;
+static int tvmrt_run_dag(uint8_t *cws, uint8_t *ws,
+                         SchedulableEntity entities[], int32_t trace_run_id) {
+  RunWaiter waiter;
+  run_waiter_init(&waiter);
+  int ret = tvmrt_dag_submit(cws, ws, entities, trace_run_id, run_waiter_done,
+                             &waiter, 1);
+  if (ret == 0) {
+    ret = run_waiter_wait(&waiter);
+  }
+  run_waiter_destroy(&waiter);
+  return ret;
 }
 
 // ============ 串行执行路径（兼容模式）============
 
+// scratch 为 NULL 时使用共享的 g_serial_scratch（加锁）
 static int tvmrt_run_serial(uint8_t *cws, uint8_t *ws,
-                            SchedulableEntity entities[]) {
-  for (int i = 0; i < OP_COUNT; i++) {
+                            SchedulableEntity entities[], uint8_t *scratch,
+                            int32_t trace_run_id) {
+#if TVMRT_SCRATCH_ARENA_SIZE > 0
+  int shared_scratch = scratch == NULL;
+  if (shared_scratch) {
+    pthread_mutex_lock(&g_serial_lock);
+    scratch = g_serial_scratch;
+  }
+  uint8_t *kernel_ws = scratch;
+#else
+  (void)scratch;
+  uint8_t *kernel_ws = ws;
+#endif
+  int ret = 0;
+  for (int i = 0; i < OP_COUNT && ret == 0; i++) {
     SchedulableEntity *entity = &entities[i];
-    int ret = entity->kernel(entity->inputs, entity->outputs, cws, ws);
-    if (ret != 0)
-      return ret;
+    TRACE_BEGIN(trace_start);
+    ret = entity->kernel(entity->inputs, entity->outputs, cws, kernel_ws);
+    TRACE_SPAN(i, 0, trace_run_id, trace_start);
   }
-  return 0;
+#if TVMRT_SCRATCH_ARENA_SIZE > 0
+  if (shared_scratch)
+    pthread_mutex_unlock(&g_serial_lock);
+#endif
+  return ret;
 }
 
 // ============ 统一运行时入口 ============
 
-static int tvmrt_run(uint8_t *cws, uint8_t *ws, SchedulableEntity entities[]) {
-  const char *env = getenv("TVMRT_NUM_WORKERS");
-  int num_workers = env ? atoi(env) : 0; // 默认串行模式
+// num_workers=0（默认）表示串行模式；static 模式总按离线调度表的
+// TVMRT_STATIC_WORKERS 个 Worker 运行，不看 num_workers
+static int tvmrt_serial_mode(void) {
+  const TvmrtConfig *cfg = tvmrt_config();
+#ifdef TVMRT_STATIC_WORKERS
+  if (cfg->sched_mode == TVMRT_SCHED_STATIC)
+    return 0;
+#endif
+  return cfg->num_workers == 0;
+}
+
+// 推理实际使用的 Worker 数：串行模式为 0，线程池已启动时为其线程数，
+// 否则为下一次推理启动线程池时的线程数（static 模式恒为 TVMRT_STATIC_WORKERS）
+TVM_DLL int32_t tvmrt_num_workers(void) {
+  if (tvmrt_serial_mode())
+    return 0;
+  pthread_mutex_lock(&g_pool_lock);
+  int sched_mode = -1;
+  int num_workers = g_pool.initialized ? g_pool.ctx.num_workers
+                                       : pool_resolve(0, &sched_mode, 0);
+  pthread_mutex_unlock(&g_pool_lock);
+  return num_workers;
+}
+
+// 实际采用的调度模式 / 就绪派发顺序：线程池已启动时取其设置，否则取运行时配置
+// （tvmrt.conf 与 TVMRT_* 环境变量合并后的结果）
+TVM_DLL const char *tvmrt_sched_mode_name(void) {
+  static const char *const names[] = {"closed_loop", "work_stealing", "static"};
+  pthread_mutex_lock(&g_pool_lock);
+  int mode = g_pool.initialized ? (int)g_pool.ctx.mode
+                                : (int)tvmrt_config()->sched_mode;
+  pthread_mutex_unlock(&g_pool_lock);
+  return names[mode];
+}
+
+TVM_DLL const char *tvmrt_ready_policy_name(void) {
+  static const char *const names[] = {"priority", "fifo"};
+  pthread_mutex_lock(&g_pool_lock);
+  int policy = g_pool.initialized ? (int)g_pool.ctx.ready_policy
+                                  : (int)tvmrt_config()->ready_policy;
+  pthread_mutex_unlock(&g_pool_lock);
+  return names[policy];
+}
 
-  // TVMRT_NUM_WORKERS=0 表示串行模式
-  if (num_workers == 0) {
-    return tvmrt_run_serial(cws, ws, entities);
+static int tvmrt_run(uint8_t *cws, uint8_t *ws, SchedulableEntity entities[],
+                     uint8_t *serial_scratch) {
+  int32_t trace_run_id = TRACE_NEXT_RUN();
+  TRACE_BEGIN(trace_start);
+
+  int ret;
+  if (tvmrt_serial_mode()) {
+    ret = tvmrt_run_serial(cws, ws, entities, serial_scratch, trace_run_id);
   } else {
-    return tvmrt_run_dag(cws, ws, entities);
+    ret = tvmrt_run_dag(cws, ws, entities, trace_run_id);
+  }
+
+  TRACE_SPAN(TRACE_RUN_OP, 0, trace_run_id, trace_start);
+  return ret;
+}
+
+// ============ 推理上下文 ============
+// 每个上下文持有独立的 workspace（TVMRT_WORKSPACE_SIZE）、输入/输出缓冲区
+// 与绑定到它们的实体表，不同线程可同时对不同上下文调用 tvmrt_context_run，
+// 共享同一线程池（至多 TVMRT_MAX_INFLIGHT 次推理同时进行，其余等待槽位）。
+// 也可用 tvmrt_context_submit 异步提交：每个上下文同一时刻至多一个进行中的
+// 推理，多个上下文轮流提交即构成有界请求队列（槽位即队列容量）
+
+typedef struct TvmrtContext TvmrtContext;
+
+// 异步推理完成回调：DAG 模式下在运行时线程中调用；串行模式下在提交者线程中、
+// tvmrt_context_submit 返回之前同步调用（此时不可获取提交者已持有的锁）。
+// 应尽快返回，不可对同一上下文再次提交
+typedef void (*TvmrtDoneCallback)(TvmrtContext *ctx, int32_t status,
+                                  void *user_data);
+
+struct TvmrtContext {
+  uint8_t *cws; // 常量区（tvmrt_const_workspace）
+  uint8_t *ws;
+  float *input;
+  float *output;
+  float *own_input; // 上下文自行分配的缓冲区
+  float *own_output;
+  uint8_t *serial_scratch; // 串行模式下的私有 scratch arena
+  SchedulableEntity entities[OP_COUNT];
+
+  // 异步推理状态（waiter.lock 保护 in_flight）
+  RunWaiter waiter;
+  int in_flight;
+  TvmrtDoneCallback callback;
+  void *user_data;
+  int32_t trace_run_id;
+  int64_t trace_start;
+};
+
+static void *tvmrt_aligned_alloc(size_t size) {
+  void *ptr = NULL;
+  if (size == 0 || posix_memalign(&ptr, 64, size) != 0)
+    return NULL;
+  return ptr;
+}
+
+TVM_DLL int32_t tvmrt_context_wait(TvmrtContext *c);
+
+// 销毁上下文（先等待进行中的异步推理）
+TVM_DLL void tvmrt_context_destroy(TvmrtContext *c) {
+  if (!c)
+    return;
+  tvmrt_context_wait(c);
+  run_waiter_destroy(&c->waiter);
+  free(c->ws);
+  free(c->own_input);
+  free(c->own_output);
+  free(c->serial_scratch);
+  free(c);
+}
+
+// 创建推理上下文，失败（内存不足 / 常量权重加载失败）返回 NULL
+TVM_DLL TvmrtContext *tvmrt_context_create(void) {
+  TvmrtContext *c = (TvmrtContext *)calloc(1, sizeof(TvmrtContext));
+  if (!c)
+    return NULL;
+  run_waiter_init(&c->waiter);
+  c->waiter.done = 1; // 无进行中的推理
+  c->cws = tvmrt_const_workspace();
+  c->ws = (uint8_t *)tvmrt_aligned_alloc(TVMRT_WORKSPACE_SIZE);
+  c->own_input = (float *)tvmrt_aligned_alloc(TVMRT_INPUT_SIZE * sizeof(float));
+  c->own_output =
+      (float *)tvmrt_aligned_alloc(TVMRT_OUTPUT_SIZE * sizeof(float));
+  int failed = !c->cws || !c->ws || !c->own_input || !c->own_output;
+#if TVMRT_SCRATCH_ARENA_SIZE > 0
+  c->serial_scratch = (uint8_t *)tvmrt_aligned_alloc(TVMRT_SCRATCH_ARENA_SIZE);
+  failed = failed || !c->serial_scratch;
+#endif
+  if (failed) {
+    tvmrt_context_destroy(c);
+    return NULL;
+  }
+  memset(c->own_input, 0, TVMRT_INPUT_SIZE * sizeof(float));
+  memset(c->own_output, 0, TVMRT_OUTPUT_SIZE * sizeof(float));
+  c->input = c->own_input;
+  c->output = c->own_output;
+  tvmrt_bind_entities(c->entities, c->ws, c->input, c->output);
+  return c;
+}
+
+// 模型输入/输出的 float 数（供动态加载共享库的调用方校验缓冲区）
+TVM_DLL int64_t tvmrt_input_size(void) { return TVMRT_INPUT_SIZE; }
+TVM_DLL int64_t tvmrt_output_size(void) { return TVMRT_OUTPUT_SIZE; }
+
+// 模型输入（TVMRT_INPUT_SIZE 个 float）
+TVM_DLL float *tvmrt_context_input(TvmrtContext *c) { return c->input; }
+
+// 模型输出（TVMRT_OUTPUT_SIZE 个 float）
+TVM_DLL float *tvmrt_context_output(TvmrtContext *c) { return c->output; }
+
+// 改用调用者提供的输入/输出缓冲区（避免拷贝），NULL 表示恢复为上下文自有缓冲区
+TVM_DLL void tvmrt_context_set_io(TvmrtContext *c, float *input,
+                                  float *output) {
+  c->input = input ? input : c->own_input;
+  c->output = output ? output : c->own_output;
+  tvmrt_bind_entities(c->entities, c->ws, c->input, c->output);
+}
+
+static void context_on_done(void *arg, int32_t error) {
+  TvmrtContext *c = (TvmrtContext *)arg;
+  TRACE_SPAN(TRACE_RUN_OP, 0, c->trace_run_id, c->trace_start);
+  if (c->callback) {
+    c->callback(c, error, c->user_data);
+  }
+  pthread_mutex_lock(&c->waiter.lock);
+  c->in_flight = 0;
+  c->waiter.error = error;
+  c->waiter.done = 1;
+  pthread_cond_broadcast(&c->waiter.cond);
+  pthread_mutex_unlock(&c->waiter.lock);
+}
+
+static int32_t context_submit(TvmrtContext *c, float *input, float *output,
+                              TvmrtDoneCallback callback, void *user_data,
+                              int block) {
+  pthread_mutex_lock(&c->waiter.lock);
+  if (c->in_flight) {
+    pthread_mutex_unlock(&c->waiter.lock);
+    return TVMRT_BUSY;
+  }
+  c->in_flight = 1;
+  c->waiter.done = 0;
+  pthread_mutex_unlock(&c->waiter.lock);
+
+  if (input || output) {
+    tvmrt_context_set_io(c, input ? input : c->input,
+                         output ? output : c->output);
+  }
+  c->callback = callback;
+  c->user_data = user_data;
+  c->trace_run_id = TRACE_NEXT_RUN();
+  c->trace_start = TRACE_NOW();
+
+  if (tvmrt_serial_mode()) {
+    // 串行模式没有 Worker，在调用线程中同步执行完毕后返回
+    context_on_done(c, tvmrt_run_serial(c->cws, c->ws, c->entities,
+                                        c->serial_scratch, c->trace_run_id));
+    return 0;
+  }
+
+  int ret = tvmrt_dag_submit(c->cws, c->ws, c->entities, c->trace_run_id,
+                             context_on_done, c, block);
+  if (ret != 0) {
+    pthread_mutex_lock(&c->waiter.lock);
+    c->in_flight = 0;
+    c->waiter.done = 1;
+    pthread_mutex_unlock(&c->waiter.lock);
+  }
+  return ret;
+}
+
+// 异步提交一次推理后立即返回（input/output 为 NULL 时沿用当前缓冲区）；
+// 所有槽位都被占用时阻塞等待（背压）。上下文已有进行中的推理时返回 TVMRT_BUSY。
+// callback 可为 NULL，完成后用 tvmrt_context_wait / tvmrt_context_poll 获取结果。
+// 串行模式（num_workers = 0）没有 Worker：在调用线程中执行完整次推理，
+// callback 也在本函数返回前于调用线程中调用
+TVM_DLL int32_t tvmrt_context_submit(TvmrtContext *c, float *input,
+                                     float *output, TvmrtDoneCallback callback,
+                                     void *user_data) {
+  return context_submit(c, input, output, callback, user_data, 1);
+}
+
+// 同 tvmrt_context_submit，但槽位已满时不等待，返回 TVMRT_BUSY
+TVM_DLL int32_t tvmrt_context_try_submit(TvmrtContext *c, float *input,
+                                         float *output,
+                                         TvmrtDoneCallback callback,
+                                         void *user_data) {
+  return context_submit(c, input, output, callback, user_data, 0);
+}
+
+// 等待上下文上进行中的推理完成，返回其状态（无进行中的推理时返回上一次的状态）
+TVM_DLL int32_t tvmrt_context_wait(TvmrtContext *c) {
+  return run_waiter_wait(&c->waiter);
+}
+
+// 非阻塞查询：推理已完成（或未提交）返回 1，仍在进行中返回 0
+TVM_DLL int32_t tvmrt_context_poll(TvmrtContext *c) {
+  pthread_mutex_lock(&c->waiter.lock);
+  int32_t done = c->waiter.done;
+  pthread_mutex_unlock(&c->waiter.lock);
+  return done;
+}
+
+// 在上下文上同步执行一次推理（调度模式与 Worker 数同 tvmgen_default_run）
+TVM_DLL int32_t tvmrt_context_run(TvmrtContext *c) {
+  int32_t ret = context_submit(c, NULL, NULL, NULL, NULL, 1);
+  if (ret != 0) {
+    return ret;
   }
+  return tvmrt_context_wait(c);
 }
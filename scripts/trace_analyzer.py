@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+执行追踪分析脚本 - 解释并行模式为什么不能线性加速
+
+读取运行时导出的 Chrome trace（make TRACE=1 构建，TVMRT_TRACE_FILE 指定路径），
+结合 dag_schedule_generated.c 中的 DAG 表，对单次推理给出：
+1. 实际 makespan 与理想 makespan（关键路径下界 / 总工作量 ÷ Worker 数）
+2. 实际关键路径（从最后结束的算子沿“最后放行它的前驱”回溯）
+3. 每个线程的利用率与空闲时间
+4. 每条依赖边的调度延迟（前驱结束 -> 后继就绪 -> 后继开始）
+5. 独占时间最长的算子
+
+使用方法:
+    python3 scripts/trace_analyzer.py TRACE_JSON [--dag FILE] [--run N] [--top N]
+                                      [--csv FILE] [--edges-csv FILE] [--costs-out FILE]
+
+选项:
+    --dag FILE        DAG 表（默认项目根目录下的 dag_schedule_generated.c）
+    --run N           分析第 N 次推理（默认最后一次，预热后的数据更稳定）
+    --top N           报告中列出的算子数量（默认 10）
+    --csv FILE        每个算子一行的 CSV（默认 trace_ops.csv）
+    --edges-csv FILE  每条依赖边一行的 CSV（可选）
+    --costs-out FILE  写出实测代价 JSON，可直接用于 operator_staticizer.py --op-costs
+"""
+
+import re
+import os
+import sys
+import csv
+import json
+import argparse
+from dataclasses import dataclass
+from typing import List, Dict, Tuple
+
+from operator_staticizer import DAGInfo, compute_bottom_levels, critical_path
+
+# ============================================================
+# 数据结构定义
+# ============================================================
+
+@dataclass
+class OpTiming:
+    """单个算子在一次推理中的时间（us，相对 trace 起点）"""
+    op_id: int
+    name: str
+    tid: int
+    ready: float
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def queue_wait(self) -> float:
+        return self.start - self.ready
+
+
+@dataclass
+class EdgeLatency:
+    """依赖边 pred -> succ 的调度延迟（us）"""
+    pred: int
+    succ: int
+    notify: float      # pred 结束 -> succ 就绪
+    dispatch: float    # pred 结束 -> succ 开始
+    enabling: bool     # pred 是否为最后放行 succ 的前驱
+
+
+# ============================================================
+# 输入解析
+# ============================================================
+
+def parse_dag_tables(path: str) -> DAGInfo:
+    """从 dag_schedule_generated.c 还原 DAG（后继表 + 初始入度）"""
+    with open(path, 'r') as f:
+        content = f.read()
+
+    successors: Dict[int, set] = {}
+    for match in re.finditer(r'g_successors_(\d+)\[\]\s*=\s*\{([^}]*)\}', content):
+        op_id = int(match.group(1))
+        succs = [int(x) for x in match.group(2).split(',') if x.strip()]
+        successors[op_id] = {s for s in succs if s >= 0}
+    if not successors:
+        raise ValueError(f"{path} 中没有找到 g_successors_* 表")
+
+    num_ops = max(successors) + 1
+    predecessors = {i: set() for i in range(num_ops)}
+    for op_id, succs in successors.items():
+        for s in succs:
+            predecessors[s].add(op_id)
+    for i in range(num_ops):
+        successors.setdefault(i, set())
+
+    return DAGInfo(
+        num_ops=num_ops,
+        predecessors=predecessors,
+        successors=successors,
+        indegrees={i: len(predecessors[i]) for i in range(num_ops)},
+    )
+
+
+def load_trace(path: str) -> Tuple[Dict[int, Dict[int, OpTiming]], Dict[int, Tuple[float, float]]]:
+    """
+    读取 Chrome trace，按推理轮次分组
+
+    Returns:
+        (runs, spans): runs[run_id][op_id] -> OpTiming，spans[run_id] -> (开始, 结束)
+    """
+    with open(path, 'r') as f:
+        trace = json.load(f)
+    events = trace['traceEvents'] if isinstance(trace, dict) else trace
+
+    runs: Dict[int, Dict[int, OpTiming]] = {}
+    spans: Dict[int, Tuple[float, float]] = {}
+    for ev in events:
+        if ev.get('ph') != 'X':
+            continue
+        args = ev.get('args', {})
+        run_id = args.get('run', 0)
+        start = float(ev['ts'])
+        end = start + float(ev['dur'])
+        op_id = args.get('op_id', -1)
+        if op_id < 0:
+            spans[run_id] = (start, end)
+            continue
+        runs.setdefault(run_id, {})[op_id] = OpTiming(
+            op_id=op_id, name=ev['name'], tid=ev['tid'],
+            ready=start - float(args.get('queue_wait_us', 0.0)),
+            start=start, end=end,
+        )
+    return runs, spans
+
+
+# ============================================================
+# 分析
+# ============================================================
+
+def compute_edge_latencies(dag: DAGInfo, ops: Dict[int, OpTiming]) -> List[EdgeLatency]:
+    """所有两端都有记录的依赖边的延迟"""
+    edges = []
+    for succ in range(dag.num_ops):
+        if succ not in ops:
+            continue
+        preds = [p for p in dag.predecessors[succ] if p in ops]
+        if not preds:
+            continue
+        last = max(preds, key=lambda p: ops[p].end)
+        for p in sorted(preds):
+            edges.append(EdgeLatency(
+                pred=p, succ=succ,
+                notify=ops[succ].ready - ops[p].end,
+                dispatch=ops[succ].start - ops[p].end,
+                enabling=(p == last),
+            ))
+    return edges
+
+
+def realized_critical_path(dag: DAGInfo, ops: Dict[int, OpTiming]) -> List[int]:
+    """从最后结束的算子回溯：每一步取结束最晚（即放行当前算子）的前驱"""
+    if not ops:
+        return []
+    path = [max(ops, key=lambda i: ops[i].end)]
+    while True:
+        preds = [p for p in dag.predecessors[path[-1]] if p in ops]
+        if not preds:
+            break
+        path.append(max(preds, key=lambda p: ops[p].end))
+    path.reverse()
+    return path
+
+
+def thread_utilization(ops: Dict[int, OpTiming]) -> Dict[int, Tuple[float, int]]:
+    """每个线程的 (忙碌时间, 执行算子数)"""
+    busy: Dict[int, Tuple[float, int]] = {}
+    for op in ops.values():
+        t, n = busy.get(op.tid, (0.0, 0))
+        busy[op.tid] = (t + op.duration, n + 1)
+    return busy
+
+
+def measured_costs(dag: DAGInfo, ops: Dict[int, OpTiming]) -> List[float]:
+    return [ops[i].duration if i in ops else 0.0 for i in range(dag.num_ops)]
+
+
+# ============================================================
+# 输出
+# ============================================================
+
+def write_ops_csv(path: str, ops: Dict[int, OpTiming],
+                  edges: List[EdgeLatency], realized: List[int], ideal: List[int]):
+    enabling = {e.succ: e for e in edges if e.enabling}
+    realized_set, ideal_set = set(realized), set(ideal)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['op_id', 'name', 'tid', 'ready_us', 'start_us', 'end_us',
+                         'duration_us', 'queue_wait_us', 'enabling_pred',
+                         'dispatch_latency_us', 'on_realized_critical_path',
+                         'on_ideal_critical_path'])
+        for i in sorted(ops):
+            op = ops[i]
+            edge = enabling.get(i)
+            writer.writerow([
+                i, op.name, op.tid,
+                f"{op.ready:.3f}", f"{op.start:.3f}", f"{op.end:.3f}",
+                f"{op.duration:.3f}", f"{op.queue_wait:.3f}",
+                edge.pred if edge else -1,
+                f"{edge.dispatch:.3f}" if edge else '',
+                int(i in realized_set), int(i in ideal_set),
+            ])
+
+
+def write_edges_csv(path: str, edges: List[EdgeLatency]):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['pred', 'succ', 'notify_us', 'dispatch_us', 'enabling'])
+        for e in edges:
+            writer.writerow([e.pred, e.succ, f"{e.notify:.3f}", f"{e.dispatch:.3f}", int(e.enabling)])
+
+
+def write_costs_json(path: str, dag: DAGInfo, ops: Dict[int, OpTiming]):
+    """格式同 op_cost_generated.json 的 ops[].id/cost，代价单位为 us"""
+    report = {
+        'op_count': dag.num_ops,
+        'unit': 'us',
+        'ops': [
+            {'id': i, 'name': ops[i].name if i in ops else '', 'cost': round(ops[i].duration, 3) if i in ops else 0.0}
+            for i in range(dag.num_ops)
+        ],
+    }
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='执行追踪分析')
+    parser.add_argument('trace', help='运行时导出的 Chrome trace JSON')
+    parser.add_argument('--dag', help='DAG 表（默认 dag_schedule_generated.c）')
+    parser.add_argument('--run', type=int, help='分析的推理轮次（默认最后一次）')
+    parser.add_argument('--top', type=int, default=10, help='列出的算子数量')
+    parser.add_argument('--csv', default='trace_ops.csv', help='每算子 CSV 输出路径')
+    parser.add_argument('--edges-csv', help='每条依赖边 CSV 输出路径')
+    parser.add_argument('--costs-out', help='实测代价 JSON 输出路径（用于 --op-costs）')
+    args = parser.parse_args()
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    dag_path = args.dag or os.path.join(project_root, 'dag_schedule_generated.c')
+
+    dag = parse_dag_tables(dag_path)
+    runs, spans = load_trace(args.trace)
+    if not runs:
+        print(f"错误: {args.trace} 中没有算子事件（运行时是否以 TRACE=1 构建？）")
+        return 1
+
+    run_id = args.run if args.run is not None else max(runs)
+    if run_id not in runs:
+        print(f"错误: trace 中没有第 {run_id} 次推理（可选: {sorted(runs)}）")
+        return 1
+    ops = runs[run_id]
+    if len(ops) != dag.num_ops:
+        print(f"[trace_analyzer] 警告: 第 {run_id} 次推理只记录了 {len(ops)}/{dag.num_ops} 个算子"
+              f"（环形缓冲区溢出或推理失败）")
+
+    begin, end = spans.get(run_id, (min(o.ready for o in ops.values()), max(o.end for o in ops.values())))
+    makespan = end - begin
+    tids = sorted({o.tid for o in ops.values()})
+    num_threads = len(tids)
+
+    costs = measured_costs(dag, ops)
+    total_work = sum(costs)
+    ideal_path = critical_path(dag, costs)
+    cp_length = max(compute_bottom_levels(dag, costs), default=0.0)
+    ideal = max(cp_length, total_work / num_threads)
+    realized = realized_critical_path(dag, ops)
+    edges = compute_edge_latencies(dag, ops)
+    enabling_edges = [e for e in edges if e.enabling]
+
+    print(f"[trace_analyzer] trace: {args.trace}")
+    print(f"[trace_analyzer] DAG: {dag_path} ({dag.num_ops} 个算子)")
+    print(f"[trace_analyzer] 推理轮次: {run_id}（共 {len(runs)} 次），执行线程: {num_threads}")
+
+    print("\n== Makespan ==")
+    print(f"  实际 makespan:          {makespan / 1000:10.3f} ms")
+    print(f"  总工作量（串行和）:     {total_work / 1000:10.3f} ms")
+    print(f"  关键路径下界:           {cp_length / 1000:10.3f} ms  ({len(ideal_path)} 个算子)")
+    print(f"  理想 makespan ({num_threads} 线程):  {ideal / 1000:10.3f} ms")
+    print(f"  可用并行度 (work/cp):   {total_work / cp_length if cp_length else 0:10.2f}")
+    print(f"  实际加速比 (work/span): {total_work / makespan if makespan else 0:10.2f}")
+    print(f"  调度效率 (理想/实际):   {ideal / makespan * 100 if makespan else 0:9.1f}%")
+
+    print("\n== 实际关键路径 ==")
+    path_exec = sum(ops[i].duration for i in realized)
+    path_gap = (ops[realized[-1]].end - ops[realized[0]].start - path_exec) if realized else 0.0
+    head_gap = ops[realized[0]].start - begin if realized else 0.0
+    tail_gap = end - ops[realized[-1]].end if realized else 0.0
+    print(f"  {len(realized)} 个算子，执行 {path_exec / 1000:.3f} ms，"
+          f"路径内等待 {path_gap / 1000:.3f} ms，首尾开销 {(head_gap + tail_gap) / 1000:.3f} ms")
+    shared = len(set(realized) & set(ideal_path))
+    print(f"  与理想关键路径重合 {shared}/{len(realized)} 个算子")
+
+    print("\n== 线程利用率 ==")
+    busy = thread_utilization(ops)
+    for tid in tids:
+        t, n = busy[tid]
+        label = 'caller' if tid == 0 else f'worker {tid - 1}'
+        print(f"  {label:<10} 忙碌 {t / 1000:9.3f} ms  空闲 {(makespan - t) / 1000:9.3f} ms  "
+              f"利用率 {t / makespan * 100 if makespan else 0:5.1f}%  算子 {n}")
+
+    print("\n== 调度延迟（放行边：前驱结束 -> 后继开始）==")
+    if enabling_edges:
+        latencies = sorted(e.dispatch for e in enabling_edges)
+        notify = sorted(e.notify for e in enabling_edges)
+        mid = len(latencies) // 2
+        print(f"  边数 {len(enabling_edges)}，中位数 {latencies[mid]:.1f} us，"
+              f"最大 {latencies[-1]:.1f} us，合计 {sum(latencies) / 1000:.3f} ms")
+        print(f"  其中就绪通知（前驱结束 -> 后继就绪）中位数 {notify[mid]:.1f} us，"
+              f"合计 {sum(notify) / 1000:.3f} ms")
+        realized_edges = set(zip(realized, realized[1:]))
+        on_path = [e for e in enabling_edges if (e.pred, e.succ) in realized_edges]
+        print(f"  关键路径上的调度延迟合计 {sum(e.dispatch for e in on_path) / 1000:.3f} ms")
+        worst = sorted(enabling_edges, key=lambda e: -e.dispatch)[:args.top]
+        for e in worst:
+            print(f"    {e.pred:3d} -> {e.succ:3d}  {e.dispatch:9.1f} us  {ops[e.succ].name}")
+    else:
+        print("  (无依赖边)")
+
+    print(f"\n== 独占时间 Top {args.top} ==")
+    for i in sorted(ops, key=lambda i: -ops[i].duration)[:args.top]:
+        op = ops[i]
+        print(f"  {i:3d}  {op.duration / 1000:9.3f} ms  {op.duration / total_work * 100 if total_work else 0:5.1f}%  "
+              f"{'*' if i in realized else ' '} {op.name}")
+    print("  (* 表示位于实际关键路径上)")
+
+    write_ops_csv(args.csv, ops, edges, realized, ideal_path)
+    print(f"\n    -> {args.csv}")
+    if args.edges_csv:
+        write_edges_csv(args.edges_csv, edges)
+        print(f"    -> {args.edges_csv}")
+    if args.costs_out:
+        write_costs_json(args.costs_out, dag, ops)
+        print(f"    -> {args.costs_out}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,1848 @@
+// tvm target: c -keys=cpu
+#define TVM_DLL
+#define TVM_EXPORTS
+#include <stdint.h>
+#include <math.h>
+#include <stdbool.h>
+
+// ============ 算子实现 (15 个内核) ============
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_concatenate_5(float* p0, float* p0_1, float* p1, float* p2, float* concatenate_ext, uint8_t* global_const_workspace_92_var, uint8_t* global_workspace_93_var) {
+  for (int32_t j = 0; j < 102400; ++j) {
+    concatenate_ext[j] = p0[j];
+  }
+  for (int32_t j_1 = 0; j_1 < 102400; ++j_1) {
+    concatenate_ext[(j_1 + 102400)] = p1[j_1];
+  }
+  for (int32_t j_2 = 0; j_2 < 102400; ++j_2) {
+    concatenate_ext[(j_2 + 204800)] = p2[j_2];
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_concatenate_9(float* p0, float* p1, float* concatenate_ext, uint8_t* global_const_workspace_152_var, uint8_t* global_workspace_153_var) {
+  for (int32_t j = 0; j < 51200; ++j) {
+    concatenate_ext[j] = p0[j];
+  }
+  for (int32_t j_1 = 0; j_1 < 102400; ++j_1) {
+    concatenate_ext[(j_1 + 51200)] = p1[j_1];
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_3(float* p0, float* T_add, uint8_t* global_const_workspace_148_var, uint8_t* global_workspace_149_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_51_let = (&(global_const_workspace_148_var[12766400]));
+  void* fused_constant_51_let = (&(global_const_workspace_148_var[12562496]));
+  for (int32_t ax0_ax1_fused_ax2_outer_fused = 0; ax0_ax1_fused_ax2_outer_fused < 800; ++ax0_ax1_fused_ax2_outer_fused) {
+    void* conv2d_NCHWc_global_let = (&(global_workspace_149_var[0]));
+    for (int32_t ow_c_outer = 0; ow_c_outer < 2; ++ow_c_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[((ow_c_outer * 80) + oc_block_c_init)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_1) + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_2) + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_3) + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_4) + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_5) + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_6) + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_7) + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_8) + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_9) + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_10) + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_11) + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_12) + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_13) + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_14) + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_15) + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_16) + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_17) + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_18) + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_19) + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 20; ++ic_outer) {
+        for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+          for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+            int32_t cse_var_2 = (ow_c_outer * 80);
+            int32_t cse_var_1 = (cse_var_2 + oc_block_c);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_1] = (((float*)conv2d_NCHWc_global_let)[cse_var_1] + (p0[((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_2) + ic_inner)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c)]));
+          }
+          for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+            int32_t cse_var_4 = (ow_c_outer * 80);
+            int32_t cse_var_3 = ((cse_var_4 + oc_block_c_1) + 4);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_4) + ic_inner) + 4)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+          }
+          for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+            int32_t cse_var_6 = (ow_c_outer * 80);
+            int32_t cse_var_5 = ((cse_var_6 + oc_block_c_2) + 8);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_6) + ic_inner) + 8)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+          }
+          for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+            int32_t cse_var_8 = (ow_c_outer * 80);
+            int32_t cse_var_7 = ((cse_var_8 + oc_block_c_3) + 12);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_8) + ic_inner) + 12)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+          }
+          for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+            int32_t cse_var_10 = (ow_c_outer * 80);
+            int32_t cse_var_9 = ((cse_var_10 + oc_block_c_4) + 16);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_10) + ic_inner) + 16)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+          }
+          for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+            int32_t cse_var_12 = (ow_c_outer * 80);
+            int32_t cse_var_11 = ((cse_var_12 + oc_block_c_5) + 20);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_12) + ic_inner) + 20)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+          }
+          for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+            int32_t cse_var_14 = (ow_c_outer * 80);
+            int32_t cse_var_13 = ((cse_var_14 + oc_block_c_6) + 24);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_14) + ic_inner) + 24)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+          }
+          for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+            int32_t cse_var_16 = (ow_c_outer * 80);
+            int32_t cse_var_15 = ((cse_var_16 + oc_block_c_7) + 28);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_16) + ic_inner) + 28)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+          }
+          for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+            int32_t cse_var_18 = (ow_c_outer * 80);
+            int32_t cse_var_17 = ((cse_var_18 + oc_block_c_8) + 32);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_18) + ic_inner) + 32)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+          }
+          for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+            int32_t cse_var_20 = (ow_c_outer * 80);
+            int32_t cse_var_19 = ((cse_var_20 + oc_block_c_9) + 36);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_20) + ic_inner) + 36)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+          }
+          for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+            int32_t cse_var_22 = (ow_c_outer * 80);
+            int32_t cse_var_21 = ((cse_var_22 + oc_block_c_10) + 40);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_22) + ic_inner) + 40)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+          }
+          for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+            int32_t cse_var_24 = (ow_c_outer * 80);
+            int32_t cse_var_23 = ((cse_var_24 + oc_block_c_11) + 44);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_23] = (((float*)conv2d_NCHWc_global_let)[cse_var_23] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_24) + ic_inner) + 44)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+          }
+          for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+            int32_t cse_var_26 = (ow_c_outer * 80);
+            int32_t cse_var_25 = ((cse_var_26 + oc_block_c_12) + 48);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_25] = (((float*)conv2d_NCHWc_global_let)[cse_var_25] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_26) + ic_inner) + 48)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+          }
+          for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+            int32_t cse_var_28 = (ow_c_outer * 80);
+            int32_t cse_var_27 = ((cse_var_28 + oc_block_c_13) + 52);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_27] = (((float*)conv2d_NCHWc_global_let)[cse_var_27] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_28) + ic_inner) + 52)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+          }
+          for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+            int32_t cse_var_30 = (ow_c_outer * 80);
+            int32_t cse_var_29 = ((cse_var_30 + oc_block_c_14) + 56);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_29] = (((float*)conv2d_NCHWc_global_let)[cse_var_29] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_30) + ic_inner) + 56)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+          }
+          for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+            int32_t cse_var_32 = (ow_c_outer * 80);
+            int32_t cse_var_31 = ((cse_var_32 + oc_block_c_15) + 60);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_31] = (((float*)conv2d_NCHWc_global_let)[cse_var_31] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_32) + ic_inner) + 60)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+          }
+          for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+            int32_t cse_var_34 = (ow_c_outer * 80);
+            int32_t cse_var_33 = ((cse_var_34 + oc_block_c_16) + 64);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_33] = (((float*)conv2d_NCHWc_global_let)[cse_var_33] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_34) + ic_inner) + 64)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+          }
+          for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+            int32_t cse_var_36 = (ow_c_outer * 80);
+            int32_t cse_var_35 = ((cse_var_36 + oc_block_c_17) + 68);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_35] = (((float*)conv2d_NCHWc_global_let)[cse_var_35] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_36) + ic_inner) + 68)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+          }
+          for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+            int32_t cse_var_38 = (ow_c_outer * 80);
+            int32_t cse_var_37 = ((cse_var_38 + oc_block_c_18) + 72);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_37] = (((float*)conv2d_NCHWc_global_let)[cse_var_37] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_38) + ic_inner) + 72)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+          }
+          for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+            int32_t cse_var_40 = (ow_c_outer * 80);
+            int32_t cse_var_39 = ((cse_var_40 + oc_block_c_19) + 76);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_39] = (((float*)conv2d_NCHWc_global_let)[cse_var_39] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_40) + ic_inner) + 76)] * ((float*)fused_constant_51_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 320) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+          }
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 2; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_42 = (ax3_outer * 80);
+          int32_t cse_var_41 = (ax3_inner * 4);
+          T_add[((((ax0_ax1_fused_ax2_outer_fused * 160) + cse_var_42) + cse_var_41) + ax4)] = (((float*)conv2d_NCHWc_global_let)[((cse_var_42 + cse_var_41) + ax4)] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_51_let)[(((ax0_ax1_fused_ax2_outer_fused / 40) * 4) + ax4)]);
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1(float* p0, float* T_multiply, uint8_t* global_const_workspace_6_var, uint8_t* global_workspace_7_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_1_let = (&(global_const_workspace_6_var[12775232]));
+  void* fused_constant_1_let = (&(global_const_workspace_6_var[12638272]));
+  void* data_pad_let = (&(global_workspace_7_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 1284; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 321; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 321);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((1 <= cse_var_2) && (1 <= i3))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 321) * 409600) + (cse_var_2 * 1280)) + cse_var_1) + i4) - 1284)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 1284) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 1280; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_7_var[6594624]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_7_var[6597184]));
+    for (int32_t ow_outer = 0; ow_outer < 8; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 4; ++ic_outer) {
+        for (int32_t kh = 0; kh < 3; ++kh) {
+          for (int32_t kw = 0; kw < 3; ++kw) {
+            for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+              for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+                ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+              }
+              for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+                int32_t cse_var_3 = (oc_block_c_1 + 4);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+              }
+              for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+                int32_t cse_var_4 = (oc_block_c_2 + 8);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+              }
+              for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+                int32_t cse_var_5 = (oc_block_c_3 + 12);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+              }
+              for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+                int32_t cse_var_6 = (oc_block_c_4 + 16);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+              }
+              for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+                int32_t cse_var_7 = (oc_block_c_5 + 20);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+              }
+              for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+                int32_t cse_var_8 = (oc_block_c_6 + 24);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+              }
+              for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+                int32_t cse_var_9 = (oc_block_c_7 + 28);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+              }
+              for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+                int32_t cse_var_10 = (oc_block_c_8 + 32);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+              }
+              for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+                int32_t cse_var_11 = (oc_block_c_9 + 36);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+              }
+              for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+                int32_t cse_var_12 = (oc_block_c_10 + 40);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 80)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+              }
+              for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+                int32_t cse_var_13 = (oc_block_c_11 + 44);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 88)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+              }
+              for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+                int32_t cse_var_14 = (oc_block_c_12 + 48);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 96)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+              }
+              for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+                int32_t cse_var_15 = (oc_block_c_13 + 52);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 104)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+              }
+              for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+                int32_t cse_var_16 = (oc_block_c_14 + 56);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 112)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+              }
+              for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+                int32_t cse_var_17 = (oc_block_c_15 + 60);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 120)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+              }
+              for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+                int32_t cse_var_18 = (oc_block_c_16 + 64);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 128)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+              }
+              for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+                int32_t cse_var_19 = (oc_block_c_17 + 68);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 136)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+              }
+              for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+                int32_t cse_var_20 = (oc_block_c_18 + 72);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 144)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+              }
+              for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+                int32_t cse_var_21 = (oc_block_c_19 + 76);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 152)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+              }
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_22 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_22) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_22 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 8; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_26 = (ax3_outer * 80);
+          int32_t cse_var_25 = (ax3_inner * 4);
+          int32_t cse_var_24 = (((ax0_ax1_fused_ax2_fused / 160) * 4) + ax4);
+          int32_t cse_var_23 = ((cse_var_26 + cse_var_25) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_fused * 640) + cse_var_26) + cse_var_25) + ax4)] = ((((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_1_let)[cse_var_24]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_1_let)[cse_var_24]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_34(float* p0, float* T_multiply, uint8_t* global_const_workspace_126_var, uint8_t* global_workspace_127_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_42_let = (&(global_const_workspace_126_var[12760832]));
+  void* fused_constant_42_let = (&(global_const_workspace_126_var[11729920]));
+  for (int32_t ax0_ax1_fused_ax2_outer_fused = 0; ax0_ax1_fused_ax2_outer_fused < 1280; ++ax0_ax1_fused_ax2_outer_fused) {
+    void* conv2d_NCHWc_global_let = (&(global_workspace_127_var[0]));
+    for (int32_t ow_c_outer = 0; ow_c_outer < 2; ++ow_c_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[((ow_c_outer * 80) + oc_block_c_init)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_1) + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_2) + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_3) + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_4) + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_5) + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_6) + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_7) + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_8) + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_9) + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_10) + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_11) + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_12) + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_13) + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_14) + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_15) + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_16) + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_17) + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_18) + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_19) + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 48; ++ic_outer) {
+        for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+          for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+            int32_t cse_var_2 = (ow_c_outer * 80);
+            int32_t cse_var_1 = (cse_var_2 + oc_block_c);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_1] = (((float*)conv2d_NCHWc_global_let)[cse_var_1] + (p0[((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_2) + ic_inner)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c)]));
+          }
+          for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+            int32_t cse_var_4 = (ow_c_outer * 80);
+            int32_t cse_var_3 = ((cse_var_4 + oc_block_c_1) + 4);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_4) + ic_inner) + 4)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+          }
+          for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+            int32_t cse_var_6 = (ow_c_outer * 80);
+            int32_t cse_var_5 = ((cse_var_6 + oc_block_c_2) + 8);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_6) + ic_inner) + 8)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+          }
+          for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+            int32_t cse_var_8 = (ow_c_outer * 80);
+            int32_t cse_var_7 = ((cse_var_8 + oc_block_c_3) + 12);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_8) + ic_inner) + 12)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+          }
+          for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+            int32_t cse_var_10 = (ow_c_outer * 80);
+            int32_t cse_var_9 = ((cse_var_10 + oc_block_c_4) + 16);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_10) + ic_inner) + 16)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+          }
+          for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+            int32_t cse_var_12 = (ow_c_outer * 80);
+            int32_t cse_var_11 = ((cse_var_12 + oc_block_c_5) + 20);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_12) + ic_inner) + 20)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+          }
+          for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+            int32_t cse_var_14 = (ow_c_outer * 80);
+            int32_t cse_var_13 = ((cse_var_14 + oc_block_c_6) + 24);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_14) + ic_inner) + 24)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+          }
+          for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+            int32_t cse_var_16 = (ow_c_outer * 80);
+            int32_t cse_var_15 = ((cse_var_16 + oc_block_c_7) + 28);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_16) + ic_inner) + 28)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+          }
+          for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+            int32_t cse_var_18 = (ow_c_outer * 80);
+            int32_t cse_var_17 = ((cse_var_18 + oc_block_c_8) + 32);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_18) + ic_inner) + 32)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+          }
+          for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+            int32_t cse_var_20 = (ow_c_outer * 80);
+            int32_t cse_var_19 = ((cse_var_20 + oc_block_c_9) + 36);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_20) + ic_inner) + 36)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+          }
+          for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+            int32_t cse_var_22 = (ow_c_outer * 80);
+            int32_t cse_var_21 = ((cse_var_22 + oc_block_c_10) + 40);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_22) + ic_inner) + 40)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+          }
+          for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+            int32_t cse_var_24 = (ow_c_outer * 80);
+            int32_t cse_var_23 = ((cse_var_24 + oc_block_c_11) + 44);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_23] = (((float*)conv2d_NCHWc_global_let)[cse_var_23] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_24) + ic_inner) + 44)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+          }
+          for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+            int32_t cse_var_26 = (ow_c_outer * 80);
+            int32_t cse_var_25 = ((cse_var_26 + oc_block_c_12) + 48);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_25] = (((float*)conv2d_NCHWc_global_let)[cse_var_25] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_26) + ic_inner) + 48)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+          }
+          for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+            int32_t cse_var_28 = (ow_c_outer * 80);
+            int32_t cse_var_27 = ((cse_var_28 + oc_block_c_13) + 52);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_27] = (((float*)conv2d_NCHWc_global_let)[cse_var_27] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_28) + ic_inner) + 52)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+          }
+          for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+            int32_t cse_var_30 = (ow_c_outer * 80);
+            int32_t cse_var_29 = ((cse_var_30 + oc_block_c_14) + 56);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_29] = (((float*)conv2d_NCHWc_global_let)[cse_var_29] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_30) + ic_inner) + 56)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+          }
+          for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+            int32_t cse_var_32 = (ow_c_outer * 80);
+            int32_t cse_var_31 = ((cse_var_32 + oc_block_c_15) + 60);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_31] = (((float*)conv2d_NCHWc_global_let)[cse_var_31] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_32) + ic_inner) + 60)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+          }
+          for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+            int32_t cse_var_34 = (ow_c_outer * 80);
+            int32_t cse_var_33 = ((cse_var_34 + oc_block_c_16) + 64);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_33] = (((float*)conv2d_NCHWc_global_let)[cse_var_33] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_34) + ic_inner) + 64)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+          }
+          for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+            int32_t cse_var_36 = (ow_c_outer * 80);
+            int32_t cse_var_35 = ((cse_var_36 + oc_block_c_17) + 68);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_35] = (((float*)conv2d_NCHWc_global_let)[cse_var_35] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_36) + ic_inner) + 68)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+          }
+          for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+            int32_t cse_var_38 = (ow_c_outer * 80);
+            int32_t cse_var_37 = ((cse_var_38 + oc_block_c_18) + 72);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_37] = (((float*)conv2d_NCHWc_global_let)[cse_var_37] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_38) + ic_inner) + 72)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+          }
+          for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+            int32_t cse_var_40 = (ow_c_outer * 80);
+            int32_t cse_var_39 = ((cse_var_40 + oc_block_c_19) + 76);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_39] = (((float*)conv2d_NCHWc_global_let)[cse_var_39] + (p0[(((((ic_outer * 6400) + ((ax0_ax1_fused_ax2_outer_fused % 40) * 160)) + cse_var_40) + ic_inner) + 76)] * ((float*)fused_constant_42_let)[(((((ax0_ax1_fused_ax2_outer_fused / 40) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+          }
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 2; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_44 = (ax3_outer * 80);
+          int32_t cse_var_43 = (ax3_inner * 4);
+          int32_t cse_var_42 = (((ax0_ax1_fused_ax2_outer_fused / 40) * 4) + ax4);
+          int32_t cse_var_41 = ((cse_var_44 + cse_var_43) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_outer_fused * 160) + cse_var_44) + cse_var_43) + ax4)] = ((((float*)conv2d_NCHWc_global_let)[cse_var_41] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_42_let)[cse_var_42]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_global_let)[cse_var_41] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_42_let)[cse_var_42]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_44(float* p0, float* T_multiply, uint8_t* global_const_workspace_158_var, uint8_t* global_workspace_159_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_54_let = (&(global_const_workspace_158_var[12759296]));
+  void* fused_constant_54_let = (&(global_const_workspace_158_var[3096576]));
+  void* data_pad_let = (&(global_workspace_159_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 704; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 22; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 22);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 21)) && (1 <= i3)) && (i3 < 21))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 22) * 1600) + (cse_var_2 * 80)) + cse_var_1) + i4) - 84)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 88) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_global_let = (&(global_workspace_159_var[247808]));
+    for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+      ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+    }
+    for (int32_t ic_outer = 0; ic_outer < 32; ++ic_outer) {
+      for (int32_t kh = 0; kh < 3; ++kh) {
+        for (int32_t kw = 0; kw < 3; ++kw) {
+          for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+            for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+              ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[(((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+            }
+            for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+              int32_t cse_var_3 = (oc_block_c_1 + 4);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+            }
+            for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+              int32_t cse_var_4 = (oc_block_c_2 + 8);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+            }
+            for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+              int32_t cse_var_5 = (oc_block_c_3 + 12);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+            }
+            for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+              int32_t cse_var_6 = (oc_block_c_4 + 16);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+            }
+            for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+              int32_t cse_var_7 = (oc_block_c_5 + 20);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+            }
+            for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+              int32_t cse_var_8 = (oc_block_c_6 + 24);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+            }
+            for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+              int32_t cse_var_9 = (oc_block_c_7 + 28);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+            }
+            for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+              int32_t cse_var_10 = (oc_block_c_8 + 32);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+            }
+            for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+              int32_t cse_var_11 = (oc_block_c_9 + 36);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+            }
+            for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+              int32_t cse_var_12 = (oc_block_c_10 + 40);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+            }
+            for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+              int32_t cse_var_13 = (oc_block_c_11 + 44);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+            }
+            for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+              int32_t cse_var_14 = (oc_block_c_12 + 48);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+            }
+            for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+              int32_t cse_var_15 = (oc_block_c_13 + 52);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+            }
+            for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+              int32_t cse_var_16 = (oc_block_c_14 + 56);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+            }
+            for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+              int32_t cse_var_17 = (oc_block_c_15 + 60);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+            }
+            for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+              int32_t cse_var_18 = (oc_block_c_16 + 64);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+            }
+            for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+              int32_t cse_var_19 = (oc_block_c_17 + 68);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+            }
+            for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+              int32_t cse_var_20 = (oc_block_c_18 + 72);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+            }
+            for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+              int32_t cse_var_21 = (oc_block_c_19 + 76);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_54_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 4608) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+            }
+          }
+        }
+      }
+    }
+    for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+      for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+        int32_t cse_var_24 = (ax3_inner * 4);
+        int32_t cse_var_23 = (cse_var_24 + ax4);
+        int32_t cse_var_22 = (((ax0_ax1_fused_ax2_fused / 20) * 4) + ax4);
+        T_multiply[(((ax0_ax1_fused_ax2_fused * 80) + cse_var_24) + ax4)] = ((((float*)conv2d_NCHWc_global_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_54_let)[cse_var_22]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_global_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_54_let)[cse_var_22]))))));
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_47(float* p0, float* T_multiply, uint8_t* global_const_workspace_166_var, uint8_t* global_workspace_167_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_57_let = (&(global_const_workspace_166_var[12769344]));
+  void* fused_constant_57_let = (&(global_const_workspace_166_var[1916928]));
+  void* data_pad_let = (&(global_workspace_167_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 1408; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 22; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 22);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 21)) && (1 <= i3)) && (i3 < 21))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 22) * 1600) + (cse_var_2 * 80)) + cse_var_1) + i4) - 84)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 88) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 320; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_global_let = (&(global_workspace_167_var[495616]));
+    for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+      ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+    }
+    for (int32_t ic_outer = 0; ic_outer < 64; ++ic_outer) {
+      for (int32_t kh = 0; kh < 3; ++kh) {
+        for (int32_t kw = 0; kw < 3; ++kw) {
+          for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+            for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+              ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[(((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+            }
+            for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+              int32_t cse_var_3 = (oc_block_c_1 + 4);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+            }
+            for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+              int32_t cse_var_4 = (oc_block_c_2 + 8);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+            }
+            for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+              int32_t cse_var_5 = (oc_block_c_3 + 12);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+            }
+            for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+              int32_t cse_var_6 = (oc_block_c_4 + 16);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+            }
+            for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+              int32_t cse_var_7 = (oc_block_c_5 + 20);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+            }
+            for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+              int32_t cse_var_8 = (oc_block_c_6 + 24);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+            }
+            for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+              int32_t cse_var_9 = (oc_block_c_7 + 28);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+            }
+            for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+              int32_t cse_var_10 = (oc_block_c_8 + 32);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+            }
+            for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+              int32_t cse_var_11 = (oc_block_c_9 + 36);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+            }
+            for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+              int32_t cse_var_12 = (oc_block_c_10 + 40);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+            }
+            for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+              int32_t cse_var_13 = (oc_block_c_11 + 44);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+            }
+            for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+              int32_t cse_var_14 = (oc_block_c_12 + 48);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+            }
+            for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+              int32_t cse_var_15 = (oc_block_c_13 + 52);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+            }
+            for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+              int32_t cse_var_16 = (oc_block_c_14 + 56);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+            }
+            for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+              int32_t cse_var_17 = (oc_block_c_15 + 60);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+            }
+            for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+              int32_t cse_var_18 = (oc_block_c_16 + 64);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+            }
+            for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+              int32_t cse_var_19 = (oc_block_c_17 + 68);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+            }
+            for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+              int32_t cse_var_20 = (oc_block_c_18 + 72);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+            }
+            for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+              int32_t cse_var_21 = (oc_block_c_19 + 76);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_57_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 9216) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+            }
+          }
+        }
+      }
+    }
+    for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+      for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+        int32_t cse_var_24 = (ax3_inner * 4);
+        int32_t cse_var_23 = (cse_var_24 + ax4);
+        int32_t cse_var_22 = (((ax0_ax1_fused_ax2_fused / 20) * 4) + ax4);
+        T_multiply[(((ax0_ax1_fused_ax2_fused * 80) + cse_var_24) + ax4)] = ((((float*)conv2d_NCHWc_global_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_57_let)[cse_var_22]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_global_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_57_let)[cse_var_22]))))));
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_7(float* p0, float* T_multiply, uint8_t* global_const_workspace_26_var, uint8_t* global_workspace_27_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_8_let = (&(global_const_workspace_26_var[12774336]));
+  void* fused_constant_8_let = (&(global_const_workspace_26_var[12286208]));
+  void* data_pad_let = (&(global_workspace_27_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 656; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 82; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 82);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 81)) && (1 <= i3)) && (i3 < 81))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 82) * 25600) + (cse_var_2 * 320)) + cse_var_1) + i4) - 324)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 328) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_27_var[860672]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_27_var[861952]));
+    for (int32_t ow_outer = 0; ow_outer < 4; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 8; ++ic_outer) {
+        for (int32_t kh = 0; kh < 3; ++kh) {
+          for (int32_t kw = 0; kw < 3; ++kw) {
+            for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+              for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+                ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+              }
+              for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+                int32_t cse_var_3 = (oc_block_c_1 + 4);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+              }
+              for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+                int32_t cse_var_4 = (oc_block_c_2 + 8);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+              }
+              for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+                int32_t cse_var_5 = (oc_block_c_3 + 12);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+              }
+              for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+                int32_t cse_var_6 = (oc_block_c_4 + 16);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+              }
+              for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+                int32_t cse_var_7 = (oc_block_c_5 + 20);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+              }
+              for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+                int32_t cse_var_8 = (oc_block_c_6 + 24);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+              }
+              for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+                int32_t cse_var_9 = (oc_block_c_7 + 28);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+              }
+              for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+                int32_t cse_var_10 = (oc_block_c_8 + 32);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+              }
+              for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+                int32_t cse_var_11 = (oc_block_c_9 + 36);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+              }
+              for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+                int32_t cse_var_12 = (oc_block_c_10 + 40);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+              }
+              for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+                int32_t cse_var_13 = (oc_block_c_11 + 44);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+              }
+              for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+                int32_t cse_var_14 = (oc_block_c_12 + 48);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+              }
+              for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+                int32_t cse_var_15 = (oc_block_c_13 + 52);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+              }
+              for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+                int32_t cse_var_16 = (oc_block_c_14 + 56);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+              }
+              for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+                int32_t cse_var_17 = (oc_block_c_15 + 60);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+              }
+              for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+                int32_t cse_var_18 = (oc_block_c_16 + 64);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+              }
+              for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+                int32_t cse_var_19 = (oc_block_c_17 + 68);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+              }
+              for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+                int32_t cse_var_20 = (oc_block_c_18 + 72);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+              }
+              for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+                int32_t cse_var_21 = (oc_block_c_19 + 76);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_8_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+              }
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_22 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_22) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_22 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 4; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_26 = (ax3_outer * 80);
+          int32_t cse_var_25 = (ax3_inner * 4);
+          int32_t cse_var_24 = (((ax0_ax1_fused_ax2_fused / 80) * 4) + ax4);
+          int32_t cse_var_23 = ((cse_var_26 + cse_var_25) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_fused * 320) + cse_var_26) + cse_var_25) + ax4)] = ((((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_8_let)[cse_var_24]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_8_let)[cse_var_24]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_8(float* p0, float* T_multiply, uint8_t* global_const_workspace_30_var, uint8_t* global_workspace_31_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_10_let = (&(global_const_workspace_30_var[12775104]));
+  void* fused_constant_10_let = (&(global_const_workspace_30_var[12433664]));
+  void* data_pad_let = (&(global_workspace_31_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 656; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 82; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 82);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 81)) && (1 <= i3)) && (i3 < 81))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 82) * 25600) + (cse_var_2 * 320)) + cse_var_1) + i4) - 324)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 328) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_31_var[860672]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_31_var[861952]));
+    for (int32_t ow_outer = 0; ow_outer < 4; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 8; ++ic_outer) {
+        for (int32_t kh = 0; kh < 3; ++kh) {
+          for (int32_t kw = 0; kw < 3; ++kw) {
+            for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+              for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+                ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+              }
+              for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+                int32_t cse_var_3 = (oc_block_c_1 + 4);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+              }
+              for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+                int32_t cse_var_4 = (oc_block_c_2 + 8);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+              }
+              for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+                int32_t cse_var_5 = (oc_block_c_3 + 12);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+              }
+              for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+                int32_t cse_var_6 = (oc_block_c_4 + 16);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+              }
+              for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+                int32_t cse_var_7 = (oc_block_c_5 + 20);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+              }
+              for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+                int32_t cse_var_8 = (oc_block_c_6 + 24);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+              }
+              for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+                int32_t cse_var_9 = (oc_block_c_7 + 28);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+              }
+              for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+                int32_t cse_var_10 = (oc_block_c_8 + 32);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+              }
+              for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+                int32_t cse_var_11 = (oc_block_c_9 + 36);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+              }
+              for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+                int32_t cse_var_12 = (oc_block_c_10 + 40);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+              }
+              for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+                int32_t cse_var_13 = (oc_block_c_11 + 44);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+              }
+              for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+                int32_t cse_var_14 = (oc_block_c_12 + 48);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+              }
+              for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+                int32_t cse_var_15 = (oc_block_c_13 + 52);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+              }
+              for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+                int32_t cse_var_16 = (oc_block_c_14 + 56);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+              }
+              for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+                int32_t cse_var_17 = (oc_block_c_15 + 60);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+              }
+              for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+                int32_t cse_var_18 = (oc_block_c_16 + 64);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+              }
+              for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+                int32_t cse_var_19 = (oc_block_c_17 + 68);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+              }
+              for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+                int32_t cse_var_20 = (oc_block_c_18 + 72);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+              }
+              for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+                int32_t cse_var_21 = (oc_block_c_19 + 76);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_10_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+              }
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_22 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_22) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_22 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 4; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_26 = (ax3_outer * 80);
+          int32_t cse_var_25 = (ax3_inner * 4);
+          int32_t cse_var_24 = (((ax0_ax1_fused_ax2_fused / 80) * 4) + ax4);
+          int32_t cse_var_23 = ((cse_var_26 + cse_var_25) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_fused * 320) + cse_var_26) + cse_var_25) + ax4)] = ((((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_10_let)[cse_var_24]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_10_let)[cse_var_24]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_1(float* p0, float* p1, float* T_add, uint8_t* global_const_workspace_28_var, uint8_t* global_workspace_29_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_9_let = (&(global_const_workspace_28_var[12774208]));
+  void* fused_constant_9_let = (&(global_const_workspace_28_var[12249344]));
+  void* data_pad_let = (&(global_workspace_29_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 656; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 82; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 82);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 81)) && (1 <= i3)) && (i3 < 81))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 82) * 25600) + (cse_var_2 * 320)) + cse_var_1) + i4) - 324)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 328) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_29_var[860672]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_29_var[861952]));
+    for (int32_t ow_outer = 0; ow_outer < 4; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 8; ++ic_outer) {
+        for (int32_t kh = 0; kh < 3; ++kh) {
+          for (int32_t kw = 0; kw < 3; ++kw) {
+            for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+              for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+                ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+              }
+              for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+                int32_t cse_var_3 = (oc_block_c_1 + 4);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+              }
+              for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+                int32_t cse_var_4 = (oc_block_c_2 + 8);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+              }
+              for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+                int32_t cse_var_5 = (oc_block_c_3 + 12);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+              }
+              for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+                int32_t cse_var_6 = (oc_block_c_4 + 16);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+              }
+              for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+                int32_t cse_var_7 = (oc_block_c_5 + 20);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+              }
+              for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+                int32_t cse_var_8 = (oc_block_c_6 + 24);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+              }
+              for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+                int32_t cse_var_9 = (oc_block_c_7 + 28);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+              }
+              for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+                int32_t cse_var_10 = (oc_block_c_8 + 32);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+              }
+              for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+                int32_t cse_var_11 = (oc_block_c_9 + 36);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+              }
+              for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+                int32_t cse_var_12 = (oc_block_c_10 + 40);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+              }
+              for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+                int32_t cse_var_13 = (oc_block_c_11 + 44);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+              }
+              for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+                int32_t cse_var_14 = (oc_block_c_12 + 48);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+              }
+              for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+                int32_t cse_var_15 = (oc_block_c_13 + 52);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+              }
+              for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+                int32_t cse_var_16 = (oc_block_c_14 + 56);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+              }
+              for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+                int32_t cse_var_17 = (oc_block_c_15 + 60);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+              }
+              for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+                int32_t cse_var_18 = (oc_block_c_16 + 64);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+              }
+              for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+                int32_t cse_var_19 = (oc_block_c_17 + 68);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+              }
+              for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+                int32_t cse_var_20 = (oc_block_c_18 + 72);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+              }
+              for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+                int32_t cse_var_21 = (oc_block_c_19 + 76);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_9_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 1152) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+              }
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_22 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_22) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_22 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 4; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_27 = (ax3_outer * 80);
+          int32_t cse_var_26 = (ax3_inner * 4);
+          int32_t cse_var_25 = (((ax0_ax1_fused_ax2_fused / 80) * 4) + ax4);
+          int32_t cse_var_24 = ((cse_var_27 + cse_var_26) + ax4);
+          int32_t cse_var_23 = ((((ax0_ax1_fused_ax2_fused * 320) + cse_var_27) + cse_var_26) + ax4);
+          T_add[cse_var_23] = (p1[cse_var_23] + ((((float*)conv2d_NCHWc_let)[cse_var_24] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_9_let)[cse_var_25]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_24] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_9_let)[cse_var_25])))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_max_pool2d(float* p0, float* pool_max, uint8_t* global_const_workspace_72_var, uint8_t* global_workspace_73_var) {
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    for (int32_t ax3 = 0; ax3 < 20; ++ax3) {
+      for (int32_t ax4_init = 0; ax4_init < 4; ++ax4_init) {
+        pool_max[(((ax0_ax1_fused_ax2_fused * 80) + (ax3 * 4)) + ax4_init)] = -3.402823e+38f;
+      }
+      for (int32_t rv0_rv1_fused = 0; rv0_rv1_fused < 25; ++rv0_rv1_fused) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_7 = (rv0_rv1_fused % 5);
+          int32_t cse_var_6 = (rv0_rv1_fused / 5);
+          int32_t cse_var_5 = (ax0_ax1_fused_ax2_fused * 80);
+          int32_t cse_var_4 = (ax3 * 4);
+          int32_t cse_var_3 = (ax3 + cse_var_7);
+          int32_t cse_var_2 = (cse_var_6 + (ax0_ax1_fused_ax2_fused % 20));
+          int32_t cse_var_1 = ((cse_var_5 + cse_var_4) + ax4);
+          float v_ = pool_max[cse_var_1];
+          float condval;
+          if (((((2 <= cse_var_2) && (cse_var_2 < 22)) && (2 <= cse_var_3)) && (cse_var_3 < 22))) {
+            condval = p0[((((((cse_var_6 * 80) + cse_var_5) + cse_var_4) + (cse_var_7 * 4)) + ax4) - 168)];
+          } else {
+            condval = -3.402823e+38f;
+          }
+          pool_max[cse_var_1] = ((v_) > (condval) ? (v_) : (condval));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_reshape_transpose(float* p0, float* p0_1, float* T_transpose, uint8_t* global_const_workspace_180_var, uint8_t* global_workspace_181_var) {
+  for (int32_t ax0_ax1_fused = 0; ax0_ax1_fused < 8400; ++ax0_ax1_fused) {
+    for (int32_t ax2 = 0; ax2 < 4; ++ax2) {
+      for (int32_t ax3_inner = 0; ax3_inner < 16; ++ax3_inner) {
+        T_transpose[(((ax0_ax1_fused * 64) + (ax2 * 16)) + ax3_inner)] = p0[(((ax2 * 134400) + (ax3_inner * 8400)) + ax0_ax1_fused)];
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_split(float* p0, float* T_split, float* T_split_1, uint8_t* global_const_workspace_10_var, uint8_t* global_workspace_11_var) {
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    for (int32_t ax3 = 0; ax3 < 160; ++ax3) {
+      for (int32_t ax4_inner = 0; ax4_inner < 4; ++ax4_inner) {
+        int32_t cse_var_1 = (((ax0_ax1_fused_ax2_fused * 640) + (ax3 * 4)) + ax4_inner);
+        T_split[cse_var_1] = p0[cse_var_1];
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused_1 = 0; ax0_ax1_fused_ax2_fused_1 < 640; ++ax0_ax1_fused_ax2_fused_1) {
+    for (int32_t ax3_1 = 0; ax3_1 < 160; ++ax3_1) {
+      for (int32_t ax4_inner_1 = 0; ax4_inner_1 < 4; ++ax4_inner_1) {
+        int32_t cse_var_2 = (((ax0_ax1_fused_ax2_fused_1 * 640) + (ax3_1 * 4)) + ax4_inner_1);
+        T_split_1[cse_var_2] = p0[(cse_var_2 + 409600)];
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_split_3(float* p0, float* T_split, float* T_split_1, uint8_t* global_const_workspace_60_var, uint8_t* global_workspace_61_var) {
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    for (int32_t ax3 = 0; ax3 < 20; ++ax3) {
+      for (int32_t ax4_inner = 0; ax4_inner < 4; ++ax4_inner) {
+        int32_t cse_var_1 = (((ax0_ax1_fused_ax2_fused * 80) + (ax3 * 4)) + ax4_inner);
+        T_split[cse_var_1] = p0[cse_var_1];
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused_1 = 0; ax0_ax1_fused_ax2_fused_1 < 640; ++ax0_ax1_fused_ax2_fused_1) {
+    for (int32_t ax3_1 = 0; ax3_1 < 20; ++ax3_1) {
+      for (int32_t ax4_inner_1 = 0; ax4_inner_1 < 4; ++ax4_inner_1) {
+        int32_t cse_var_2 = (((ax0_ax1_fused_ax2_fused_1 * 80) + (ax3_1 * 4)) + ax4_inner_1);
+        T_split_1[cse_var_2] = p0[(cse_var_2 + 51200)];
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_1_tiled(float* p0, float* T_multiply, uint8_t* global_const_workspace_6_var, uint8_t* global_workspace_7_var, int32_t tile_begin, int32_t tile_end) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_1_let = (&(global_const_workspace_6_var[12775232]));
+  void* fused_constant_1_let = (&(global_const_workspace_6_var[12638272]));
+  void* data_pad_let = (&(global_workspace_7_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 1284; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 321; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 321);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((1 <= cse_var_2) && (1 <= i3))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 321) * 409600) + (cse_var_2 * 1280)) + cse_var_1) + i4) - 1284)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 1284) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = tile_begin; ax0_ax1_fused_ax2_fused < tile_end; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_7_var[6594624]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_7_var[6597184]));
+    for (int32_t ow_outer = 0; ow_outer < 8; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 4; ++ic_outer) {
+        for (int32_t kh = 0; kh < 3; ++kh) {
+          for (int32_t kw = 0; kw < 3; ++kw) {
+            for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+              for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+                ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+              }
+              for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+                int32_t cse_var_3 = (oc_block_c_1 + 4);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+              }
+              for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+                int32_t cse_var_4 = (oc_block_c_2 + 8);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+              }
+              for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+                int32_t cse_var_5 = (oc_block_c_3 + 12);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+              }
+              for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+                int32_t cse_var_6 = (oc_block_c_4 + 16);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+              }
+              for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+                int32_t cse_var_7 = (oc_block_c_5 + 20);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+              }
+              for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+                int32_t cse_var_8 = (oc_block_c_6 + 24);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+              }
+              for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+                int32_t cse_var_9 = (oc_block_c_7 + 28);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+              }
+              for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+                int32_t cse_var_10 = (oc_block_c_8 + 32);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+              }
+              for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+                int32_t cse_var_11 = (oc_block_c_9 + 36);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+              }
+              for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+                int32_t cse_var_12 = (oc_block_c_10 + 40);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 80)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+              }
+              for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+                int32_t cse_var_13 = (oc_block_c_11 + 44);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 88)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+              }
+              for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+                int32_t cse_var_14 = (oc_block_c_12 + 48);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 96)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+              }
+              for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+                int32_t cse_var_15 = (oc_block_c_13 + 52);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 104)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+              }
+              for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+                int32_t cse_var_16 = (oc_block_c_14 + 56);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 112)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+              }
+              for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+                int32_t cse_var_17 = (oc_block_c_15 + 60);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 120)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+              }
+              for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+                int32_t cse_var_18 = (oc_block_c_16 + 64);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 128)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+              }
+              for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+                int32_t cse_var_19 = (oc_block_c_17 + 68);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 136)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+              }
+              for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+                int32_t cse_var_20 = (oc_block_c_18 + 72);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 144)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+              }
+              for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+                int32_t cse_var_21 = (oc_block_c_19 + 76);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[(((((((ic_outer * 412164) + ((ax0_ax1_fused_ax2_fused % 160) * 2568)) + (kh * 1284)) + (ow_outer * 160)) + (kw * 4)) + ic_inner) + 152)] * ((float*)fused_constant_1_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+              }
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_22 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_22) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_22 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 8; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_26 = (ax3_outer * 80);
+          int32_t cse_var_25 = (ax3_inner * 4);
+          int32_t cse_var_24 = (((ax0_ax1_fused_ax2_fused / 160) * 4) + ax4);
+          int32_t cse_var_23 = ((cse_var_26 + cse_var_25) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_fused * 640) + cse_var_26) + cse_var_25) + ax4)] = ((((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_1_let)[cse_var_24]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_1_let)[cse_var_24]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
@@ -0,0 +1,1879 @@
+// tvm target: c -keys=cpu
+#define TVM_DLL
+#define TVM_EXPORTS
+#include <stdint.h>
+#include <math.h>
+#include <stdbool.h>
+
+// ============ 算子实现 (15 个内核) ============
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_concatenate_2(float* p0, float* p0_1, float* p1, float* p2, float* p3, float* concatenate_ext, uint8_t* global_const_workspace_52_var, uint8_t* global_workspace_53_var) {
+  for (int32_t j = 0; j < 102400; ++j) {
+    concatenate_ext[j] = p0[j];
+  }
+  for (int32_t j_1 = 0; j_1 < 102400; ++j_1) {
+    concatenate_ext[(j_1 + 102400)] = p1[j_1];
+  }
+  for (int32_t j_2 = 0; j_2 < 102400; ++j_2) {
+    concatenate_ext[(j_2 + 204800)] = p2[j_2];
+  }
+  for (int32_t j_3 = 0; j_3 < 102400; ++j_3) {
+    concatenate_ext[(j_3 + 307200)] = p3[j_3];
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_concatenate_3(float* p0, float* p0_1, float* p1, float* p2, float* concatenate_ext, uint8_t* global_const_workspace_66_var, uint8_t* global_workspace_67_var) {
+  for (int32_t j = 0; j < 51200; ++j) {
+    concatenate_ext[j] = p0[j];
+  }
+  for (int32_t j_1 = 0; j_1 < 51200; ++j_1) {
+    concatenate_ext[(j_1 + 51200)] = p1[j_1];
+  }
+  for (int32_t j_2 = 0; j_2 < 51200; ++j_2) {
+    concatenate_ext[(j_2 + 102400)] = p2[j_2];
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_concatenate_6(float* p0, float* p0_1, float* p1, float* p2, float* concatenate_ext, uint8_t* global_const_workspace_106_var, uint8_t* global_workspace_107_var) {
+  for (int32_t j = 0; j < 204800; ++j) {
+    concatenate_ext[j] = p0[j];
+  }
+  for (int32_t j_1 = 0; j_1 < 204800; ++j_1) {
+    concatenate_ext[(j_1 + 204800)] = p1[j_1];
+  }
+  for (int32_t j_2 = 0; j_2 < 204800; ++j_2) {
+    concatenate_ext[(j_2 + 409600)] = p2[j_2];
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_concatenate_layout_transform_reshape_concatenate_layout_transform_reshape__7c5ad37d2665c07f_(float* p0, float* p1, float* p2, float* p3, float* p4, float* p5, float* T_split, float* T_split_1, uint8_t* global_const_workspace_178_var, uint8_t* global_workspace_179_var) {
+  void* concatenate_ext_let = (&(global_workspace_179_var[0]));
+  void* T_reshape_let = (&(global_workspace_179_var[4838400]));
+  void* T_reshape_let_1 = (&(global_workspace_179_var[8524800]));
+  void* T_reshape_let_2 = (&(global_workspace_179_var[9446400]));
+  for (int32_t j = 0; j < 409600; ++j) {
+    ((float*)concatenate_ext_let)[j] = p0[j];
+  }
+  for (int32_t j_1 = 0; j_1 < 512000; ++j_1) {
+    ((float*)concatenate_ext_let)[(j_1 + 409600)] = p1[j_1];
+  }
+  for (int32_t ax1 = 0; ax1 < 144; ++ax1) {
+    for (int32_t ax2 = 0; ax2 < 6400; ++ax2) {
+      ((float*)T_reshape_let)[((ax1 * 6400) + ax2)] = ((float*)concatenate_ext_let)[((((ax1 >> 2) * 25600) + (ax2 * 4)) + (ax1 & 3))];
+    }
+  }
+  for (int32_t j_2 = 0; j_2 < 102400; ++j_2) {
+    ((float*)concatenate_ext_let)[j_2] = p2[j_2];
+  }
+  for (int32_t j_3 = 0; j_3 < 128000; ++j_3) {
+    ((float*)concatenate_ext_let)[(j_3 + 102400)] = p3[j_3];
+  }
+  for (int32_t ax1_1 = 0; ax1_1 < 144; ++ax1_1) {
+    for (int32_t ax2_1 = 0; ax2_1 < 1600; ++ax2_1) {
+      ((float*)T_reshape_let_1)[((ax1_1 * 1600) + ax2_1)] = ((float*)concatenate_ext_let)[((((ax1_1 >> 2) * 6400) + (ax2_1 * 4)) + (ax1_1 & 3))];
+    }
+  }
+  for (int32_t j_4 = 0; j_4 < 25600; ++j_4) {
+    ((float*)concatenate_ext_let)[j_4] = p4[j_4];
+  }
+  for (int32_t j_5 = 0; j_5 < 32000; ++j_5) {
+    ((float*)concatenate_ext_let)[(j_5 + 25600)] = p5[j_5];
+  }
+  for (int32_t ax1_2 = 0; ax1_2 < 144; ++ax1_2) {
+    for (int32_t ax2_2 = 0; ax2_2 < 400; ++ax2_2) {
+      ((float*)T_reshape_let_2)[((ax1_2 * 400) + ax2_2)] = ((float*)concatenate_ext_let)[((((ax1_2 >> 2) * 1600) + (ax2_2 * 4)) + (ax1_2 & 3))];
+    }
+  }
+  for (int32_t inn = 0; inn < 144; ++inn) {
+    for (int32_t j_6 = 0; j_6 < 6400; ++j_6) {
+      ((float*)concatenate_ext_let)[((inn * 8400) + j_6)] = ((float*)T_reshape_let)[((inn * 6400) + j_6)];
+    }
+    for (int32_t j_7 = 0; j_7 < 1600; ++j_7) {
+      ((float*)concatenate_ext_let)[(((inn * 8400) + j_7) + 6400)] = ((float*)T_reshape_let_1)[((inn * 1600) + j_7)];
+    }
+    for (int32_t j_8 = 0; j_8 < 400; ++j_8) {
+      ((float*)concatenate_ext_let)[(((inn * 8400) + j_8) + 8000)] = ((float*)T_reshape_let_2)[((inn * 400) + j_8)];
+    }
+  }
+  for (int32_t ax0_ax1_fused = 0; ax0_ax1_fused < 64; ++ax0_ax1_fused) {
+    for (int32_t ax2_outer = 0; ax2_outer < 525; ++ax2_outer) {
+      for (int32_t ax2_inner = 0; ax2_inner < 16; ++ax2_inner) {
+        int32_t cse_var_1 = (((ax0_ax1_fused * 8400) + (ax2_outer * 16)) + ax2_inner);
+        T_split[cse_var_1] = ((float*)concatenate_ext_let)[cse_var_1];
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_1 = 0; ax0_ax1_fused_1 < 80; ++ax0_ax1_fused_1) {
+    for (int32_t ax2_outer_1 = 0; ax2_outer_1 < 525; ++ax2_outer_1) {
+      for (int32_t ax2_inner_1 = 0; ax2_inner_1 < 16; ++ax2_inner_1) {
+        int32_t cse_var_2 = (((ax0_ax1_fused_1 * 8400) + (ax2_outer_1 * 16)) + ax2_inner_1);
+        T_split_1[cse_var_2] = ((float*)concatenate_ext_let)[(cse_var_2 + 537600)];
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply(float* p0, float* T_multiply, uint8_t* global_const_workspace_4_var, uint8_t* global_workspace_5_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_let = (&(global_const_workspace_4_var[12775488]));
+  void* fused_constant_let = (&(global_const_workspace_4_var[12750912]));
+  void* data_pad_let = (&(global_workspace_5_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 641; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 641; ++i3) {
+      for (int32_t i4 = 0; i4 < 3; ++i4) {
+        int32_t cse_var_1 = (i3 * 3);
+        float condval;
+        if (((1 <= i0_i1_fused_i2_fused) && (1 <= i3))) {
+          condval = p0[((((i0_i1_fused_i2_fused * 1920) + cse_var_1) + i4) - 1923)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 1923) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 1280; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_5_var[4930624]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_5_var[4935744]));
+    for (int32_t ow_outer = 0; ow_outer < 16; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t kh = 0; kh < 3; ++kh) {
+        for (int32_t kw = 0; kw < 3; ++kw) {
+          for (int32_t ic_inner = 0; ic_inner < 3; ++ic_inner) {
+            for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+              ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c)]));
+            }
+            for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+              int32_t cse_var_2 = (oc_block_c_1 + 4);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_2] = (((float*)conv2d_NCHWc_global_let)[cse_var_2] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 6)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_1)]));
+            }
+            for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+              int32_t cse_var_3 = (oc_block_c_2 + 8);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 12)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_2)]));
+            }
+            for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+              int32_t cse_var_4 = (oc_block_c_3 + 12);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 18)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_3)]));
+            }
+            for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+              int32_t cse_var_5 = (oc_block_c_4 + 16);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 24)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_4)]));
+            }
+            for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+              int32_t cse_var_6 = (oc_block_c_5 + 20);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 30)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_5)]));
+            }
+            for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+              int32_t cse_var_7 = (oc_block_c_6 + 24);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 36)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_6)]));
+            }
+            for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+              int32_t cse_var_8 = (oc_block_c_7 + 28);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 42)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_7)]));
+            }
+            for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+              int32_t cse_var_9 = (oc_block_c_8 + 32);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 48)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_8)]));
+            }
+            for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+              int32_t cse_var_10 = (oc_block_c_9 + 36);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 54)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_9)]));
+            }
+            for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+              int32_t cse_var_11 = (oc_block_c_10 + 40);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 60)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_10)]));
+            }
+            for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+              int32_t cse_var_12 = (oc_block_c_11 + 44);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 66)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_11)]));
+            }
+            for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+              int32_t cse_var_13 = (oc_block_c_12 + 48);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 72)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_12)]));
+            }
+            for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+              int32_t cse_var_14 = (oc_block_c_13 + 52);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 78)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_13)]));
+            }
+            for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+              int32_t cse_var_15 = (oc_block_c_14 + 56);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 84)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_14)]));
+            }
+            for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+              int32_t cse_var_16 = (oc_block_c_15 + 60);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 90)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_15)]));
+            }
+            for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+              int32_t cse_var_17 = (oc_block_c_16 + 64);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 96)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_16)]));
+            }
+            for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+              int32_t cse_var_18 = (oc_block_c_17 + 68);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 102)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_17)]));
+            }
+            for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+              int32_t cse_var_19 = (oc_block_c_18 + 72);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 108)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_18)]));
+            }
+            for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+              int32_t cse_var_20 = (oc_block_c_19 + 76);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ax0_ax1_fused_ax2_fused % 320) * 3846) + (kh * 1923)) + (ow_outer * 120)) + (kw * 3)) + ic_inner) + 114)] * ((float*)fused_constant_let)[((((((ax0_ax1_fused_ax2_fused / 320) * 108) + (kh * 36)) + (kw * 12)) + (ic_inner * 4)) + oc_block_c_19)]));
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_21 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_21) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_21 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 16; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_25 = (ax3_outer * 80);
+          int32_t cse_var_24 = (ax3_inner * 4);
+          int32_t cse_var_23 = (((ax0_ax1_fused_ax2_fused / 320) * 4) + ax4);
+          int32_t cse_var_22 = ((cse_var_25 + cse_var_24) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_fused * 1280) + cse_var_25) + cse_var_24) + ax4)] = ((((float*)conv2d_NCHWc_let)[cse_var_22] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_let)[cse_var_23]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_22] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_let)[cse_var_23]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_13(float* p0, float* T_multiply, uint8_t* global_const_workspace_48_var, uint8_t* global_workspace_49_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_17_let = (&(global_const_workspace_48_var[12773184]));
+  void* fused_constant_17_let = (&(global_const_workspace_48_var[10927104]));
+  void* data_pad_let = (&(global_workspace_49_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 672; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 42; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 42);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 41)) && (1 <= i3)) && (i3 < 41))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 42) * 6400) + (cse_var_2 * 160)) + cse_var_1) + i4) - 164)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 168) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_49_var[451584]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_49_var[452224]));
+    for (int32_t ow_outer = 0; ow_outer < 2; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 16; ++ic_outer) {
+        for (int32_t kh = 0; kh < 3; ++kh) {
+          for (int32_t kw = 0; kw < 3; ++kw) {
+            for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+              for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+                ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+              }
+              for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+                int32_t cse_var_3 = (oc_block_c_1 + 4);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+              }
+              for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+                int32_t cse_var_4 = (oc_block_c_2 + 8);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+              }
+              for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+                int32_t cse_var_5 = (oc_block_c_3 + 12);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+              }
+              for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+                int32_t cse_var_6 = (oc_block_c_4 + 16);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+              }
+              for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+                int32_t cse_var_7 = (oc_block_c_5 + 20);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+              }
+              for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+                int32_t cse_var_8 = (oc_block_c_6 + 24);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+              }
+              for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+                int32_t cse_var_9 = (oc_block_c_7 + 28);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+              }
+              for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+                int32_t cse_var_10 = (oc_block_c_8 + 32);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+              }
+              for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+                int32_t cse_var_11 = (oc_block_c_9 + 36);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+              }
+              for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+                int32_t cse_var_12 = (oc_block_c_10 + 40);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+              }
+              for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+                int32_t cse_var_13 = (oc_block_c_11 + 44);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+              }
+              for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+                int32_t cse_var_14 = (oc_block_c_12 + 48);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+              }
+              for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+                int32_t cse_var_15 = (oc_block_c_13 + 52);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+              }
+              for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+                int32_t cse_var_16 = (oc_block_c_14 + 56);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+              }
+              for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+                int32_t cse_var_17 = (oc_block_c_15 + 60);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+              }
+              for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+                int32_t cse_var_18 = (oc_block_c_16 + 64);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+              }
+              for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+                int32_t cse_var_19 = (oc_block_c_17 + 68);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+              }
+              for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+                int32_t cse_var_20 = (oc_block_c_18 + 72);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+              }
+              for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+                int32_t cse_var_21 = (oc_block_c_19 + 76);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_17_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+              }
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_22 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_22) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_22 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 2; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_26 = (ax3_outer * 80);
+          int32_t cse_var_25 = (ax3_inner * 4);
+          int32_t cse_var_24 = (((ax0_ax1_fused_ax2_fused / 40) * 4) + ax4);
+          int32_t cse_var_23 = ((cse_var_26 + cse_var_25) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_fused * 160) + cse_var_26) + cse_var_25) + ax4)] = ((((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_17_let)[cse_var_24]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_17_let)[cse_var_24]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_16(float* p0, float* T_multiply, uint8_t* global_const_workspace_58_var, uint8_t* global_workspace_59_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_21_let = (&(global_const_workspace_58_var[12756736]));
+  void* fused_constant_21_let = (&(global_const_workspace_58_var[8118272]));
+  for (int32_t ax0_ax1_fused_ax2_outer_fused = 0; ax0_ax1_fused_ax2_outer_fused < 1280; ++ax0_ax1_fused_ax2_outer_fused) {
+    void* conv2d_NCHWc_global_let = (&(global_workspace_59_var[0]));
+    for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+      ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+    }
+    for (int32_t ic_outer = 0; ic_outer < 64; ++ic_outer) {
+      for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+        for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+          ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (p0[(((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c)]));
+        }
+        for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+          int32_t cse_var_1 = (oc_block_c_1 + 4);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_1] = (((float*)conv2d_NCHWc_global_let)[cse_var_1] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 4)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+        }
+        for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+          int32_t cse_var_2 = (oc_block_c_2 + 8);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_2] = (((float*)conv2d_NCHWc_global_let)[cse_var_2] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 8)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+        }
+        for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+          int32_t cse_var_3 = (oc_block_c_3 + 12);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 12)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+        }
+        for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+          int32_t cse_var_4 = (oc_block_c_4 + 16);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 16)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+        }
+        for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+          int32_t cse_var_5 = (oc_block_c_5 + 20);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 20)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+        }
+        for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+          int32_t cse_var_6 = (oc_block_c_6 + 24);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 24)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+        }
+        for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+          int32_t cse_var_7 = (oc_block_c_7 + 28);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 28)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+        }
+        for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+          int32_t cse_var_8 = (oc_block_c_8 + 32);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 32)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+        }
+        for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+          int32_t cse_var_9 = (oc_block_c_9 + 36);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 36)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+        }
+        for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+          int32_t cse_var_10 = (oc_block_c_10 + 40);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 40)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+        }
+        for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+          int32_t cse_var_11 = (oc_block_c_11 + 44);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 44)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+        }
+        for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+          int32_t cse_var_12 = (oc_block_c_12 + 48);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 48)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+        }
+        for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+          int32_t cse_var_13 = (oc_block_c_13 + 52);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 52)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+        }
+        for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+          int32_t cse_var_14 = (oc_block_c_14 + 56);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 56)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+        }
+        for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+          int32_t cse_var_15 = (oc_block_c_15 + 60);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 60)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+        }
+        for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+          int32_t cse_var_16 = (oc_block_c_16 + 64);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 64)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+        }
+        for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+          int32_t cse_var_17 = (oc_block_c_17 + 68);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 68)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+        }
+        for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+          int32_t cse_var_18 = (oc_block_c_18 + 72);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 72)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+        }
+        for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+          int32_t cse_var_19 = (oc_block_c_19 + 76);
+          ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (p0[((((ic_outer * 1600) + ((ax0_ax1_fused_ax2_outer_fused % 20) * 80)) + ic_inner) + 76)] * ((float*)fused_constant_21_let)[(((((ax0_ax1_fused_ax2_outer_fused / 20) * 1024) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+        }
+      }
+    }
+    for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+      for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+        int32_t cse_var_22 = (ax3_inner * 4);
+        int32_t cse_var_21 = (cse_var_22 + ax4);
+        int32_t cse_var_20 = (((ax0_ax1_fused_ax2_outer_fused / 20) * 4) + ax4);
+        T_multiply[(((ax0_ax1_fused_ax2_outer_fused * 80) + cse_var_22) + ax4)] = ((((float*)conv2d_NCHWc_global_let)[cse_var_21] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_21_let)[cse_var_20]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_global_let)[cse_var_21] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_21_let)[cse_var_20]))))));
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_25(float* p0, float* T_multiply, uint8_t* global_const_workspace_98_var, uint8_t* global_workspace_99_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_31_let = (&(global_const_workspace_98_var[12772160]));
+  void* fused_constant_31_let = (&(global_const_workspace_98_var[12200192]));
+  for (int32_t ax0_ax1_fused_ax2_outer_fused = 0; ax0_ax1_fused_ax2_outer_fused < 1280; ++ax0_ax1_fused_ax2_outer_fused) {
+    void* conv2d_NCHWc_global_let = (&(global_workspace_99_var[0]));
+    for (int32_t ow_c_outer = 0; ow_c_outer < 4; ++ow_c_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[((ow_c_outer * 80) + oc_block_c_init)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_1) + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_2) + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_3) + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_4) + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_5) + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_6) + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_7) + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_8) + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_9) + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_10) + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_11) + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_12) + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_13) + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_14) + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_15) + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_16) + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_17) + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_18) + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(((ow_c_outer * 80) + oc_block_c_init_19) + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 48; ++ic_outer) {
+        for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+          for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+            int32_t cse_var_2 = (ow_c_outer * 80);
+            int32_t cse_var_1 = (cse_var_2 + oc_block_c);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_1] = (((float*)conv2d_NCHWc_global_let)[cse_var_1] + (p0[((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_2) + ic_inner)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c)]));
+          }
+          for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+            int32_t cse_var_4 = (ow_c_outer * 80);
+            int32_t cse_var_3 = ((cse_var_4 + oc_block_c_1) + 4);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_4) + ic_inner) + 4)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+          }
+          for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+            int32_t cse_var_6 = (ow_c_outer * 80);
+            int32_t cse_var_5 = ((cse_var_6 + oc_block_c_2) + 8);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_6) + ic_inner) + 8)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+          }
+          for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+            int32_t cse_var_8 = (ow_c_outer * 80);
+            int32_t cse_var_7 = ((cse_var_8 + oc_block_c_3) + 12);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_8) + ic_inner) + 12)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+          }
+          for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+            int32_t cse_var_10 = (ow_c_outer * 80);
+            int32_t cse_var_9 = ((cse_var_10 + oc_block_c_4) + 16);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_10) + ic_inner) + 16)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+          }
+          for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+            int32_t cse_var_12 = (ow_c_outer * 80);
+            int32_t cse_var_11 = ((cse_var_12 + oc_block_c_5) + 20);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_12) + ic_inner) + 20)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+          }
+          for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+            int32_t cse_var_14 = (ow_c_outer * 80);
+            int32_t cse_var_13 = ((cse_var_14 + oc_block_c_6) + 24);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_14) + ic_inner) + 24)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+          }
+          for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+            int32_t cse_var_16 = (ow_c_outer * 80);
+            int32_t cse_var_15 = ((cse_var_16 + oc_block_c_7) + 28);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_16) + ic_inner) + 28)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+          }
+          for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+            int32_t cse_var_18 = (ow_c_outer * 80);
+            int32_t cse_var_17 = ((cse_var_18 + oc_block_c_8) + 32);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_18) + ic_inner) + 32)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+          }
+          for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+            int32_t cse_var_20 = (ow_c_outer * 80);
+            int32_t cse_var_19 = ((cse_var_20 + oc_block_c_9) + 36);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_20) + ic_inner) + 36)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+          }
+          for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+            int32_t cse_var_22 = (ow_c_outer * 80);
+            int32_t cse_var_21 = ((cse_var_22 + oc_block_c_10) + 40);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_22) + ic_inner) + 40)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+          }
+          for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+            int32_t cse_var_24 = (ow_c_outer * 80);
+            int32_t cse_var_23 = ((cse_var_24 + oc_block_c_11) + 44);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_23] = (((float*)conv2d_NCHWc_global_let)[cse_var_23] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_24) + ic_inner) + 44)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+          }
+          for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+            int32_t cse_var_26 = (ow_c_outer * 80);
+            int32_t cse_var_25 = ((cse_var_26 + oc_block_c_12) + 48);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_25] = (((float*)conv2d_NCHWc_global_let)[cse_var_25] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_26) + ic_inner) + 48)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+          }
+          for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+            int32_t cse_var_28 = (ow_c_outer * 80);
+            int32_t cse_var_27 = ((cse_var_28 + oc_block_c_13) + 52);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_27] = (((float*)conv2d_NCHWc_global_let)[cse_var_27] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_28) + ic_inner) + 52)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+          }
+          for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+            int32_t cse_var_30 = (ow_c_outer * 80);
+            int32_t cse_var_29 = ((cse_var_30 + oc_block_c_14) + 56);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_29] = (((float*)conv2d_NCHWc_global_let)[cse_var_29] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_30) + ic_inner) + 56)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+          }
+          for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+            int32_t cse_var_32 = (ow_c_outer * 80);
+            int32_t cse_var_31 = ((cse_var_32 + oc_block_c_15) + 60);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_31] = (((float*)conv2d_NCHWc_global_let)[cse_var_31] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_32) + ic_inner) + 60)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+          }
+          for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+            int32_t cse_var_34 = (ow_c_outer * 80);
+            int32_t cse_var_33 = ((cse_var_34 + oc_block_c_16) + 64);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_33] = (((float*)conv2d_NCHWc_global_let)[cse_var_33] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_34) + ic_inner) + 64)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+          }
+          for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+            int32_t cse_var_36 = (ow_c_outer * 80);
+            int32_t cse_var_35 = ((cse_var_36 + oc_block_c_17) + 68);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_35] = (((float*)conv2d_NCHWc_global_let)[cse_var_35] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_36) + ic_inner) + 68)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+          }
+          for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+            int32_t cse_var_38 = (ow_c_outer * 80);
+            int32_t cse_var_37 = ((cse_var_38 + oc_block_c_18) + 72);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_37] = (((float*)conv2d_NCHWc_global_let)[cse_var_37] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_38) + ic_inner) + 72)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+          }
+          for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+            int32_t cse_var_40 = (ow_c_outer * 80);
+            int32_t cse_var_39 = ((cse_var_40 + oc_block_c_19) + 76);
+            ((float*)conv2d_NCHWc_global_let)[cse_var_39] = (((float*)conv2d_NCHWc_global_let)[cse_var_39] + (p0[(((((ic_outer * 25600) + ((ax0_ax1_fused_ax2_outer_fused % 80) * 320)) + cse_var_40) + ic_inner) + 76)] * ((float*)fused_constant_31_let)[(((((ax0_ax1_fused_ax2_outer_fused / 80) * 768) + (ic_outer * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+          }
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 4; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_44 = (ax3_outer * 80);
+          int32_t cse_var_43 = (ax3_inner * 4);
+          int32_t cse_var_42 = (((ax0_ax1_fused_ax2_outer_fused / 80) * 4) + ax4);
+          int32_t cse_var_41 = ((cse_var_44 + cse_var_43) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_outer_fused * 320) + cse_var_44) + cse_var_43) + ax4)] = ((((float*)conv2d_NCHWc_global_let)[cse_var_41] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_31_let)[cse_var_42]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_global_let)[cse_var_41] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_31_let)[cse_var_42]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_3(float* p0, float* T_multiply, uint8_t* global_const_workspace_12_var, uint8_t* global_workspace_13_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_3_let = (&(global_const_workspace_12_var[12775424]));
+  void* fused_constant_3_let = (&(global_const_workspace_12_var[12731456]));
+  void* data_pad_let = (&(global_workspace_13_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 648; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 162; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 162);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 161)) && (1 <= i3)) && (i3 < 161))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 162) * 102400) + (cse_var_2 * 640)) + cse_var_1) + i4) - 644)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 648) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_13_var[1679616]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_13_var[1682176]));
+    for (int32_t ow_outer = 0; ow_outer < 8; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 4; ++ic_outer) {
+        for (int32_t kh = 0; kh < 3; ++kh) {
+          for (int32_t kw = 0; kw < 3; ++kw) {
+            for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+              for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+                ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+              }
+              for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+                int32_t cse_var_3 = (oc_block_c_1 + 4);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+              }
+              for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+                int32_t cse_var_4 = (oc_block_c_2 + 8);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+              }
+              for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+                int32_t cse_var_5 = (oc_block_c_3 + 12);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+              }
+              for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+                int32_t cse_var_6 = (oc_block_c_4 + 16);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+              }
+              for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+                int32_t cse_var_7 = (oc_block_c_5 + 20);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+              }
+              for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+                int32_t cse_var_8 = (oc_block_c_6 + 24);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+              }
+              for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+                int32_t cse_var_9 = (oc_block_c_7 + 28);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+              }
+              for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+                int32_t cse_var_10 = (oc_block_c_8 + 32);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+              }
+              for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+                int32_t cse_var_11 = (oc_block_c_9 + 36);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+              }
+              for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+                int32_t cse_var_12 = (oc_block_c_10 + 40);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+              }
+              for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+                int32_t cse_var_13 = (oc_block_c_11 + 44);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+              }
+              for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+                int32_t cse_var_14 = (oc_block_c_12 + 48);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+              }
+              for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+                int32_t cse_var_15 = (oc_block_c_13 + 52);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+              }
+              for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+                int32_t cse_var_16 = (oc_block_c_14 + 56);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+              }
+              for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+                int32_t cse_var_17 = (oc_block_c_15 + 60);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+              }
+              for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+                int32_t cse_var_18 = (oc_block_c_16 + 64);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+              }
+              for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+                int32_t cse_var_19 = (oc_block_c_17 + 68);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+              }
+              for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+                int32_t cse_var_20 = (oc_block_c_18 + 72);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+              }
+              for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+                int32_t cse_var_21 = (oc_block_c_19 + 76);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[(((((((ic_outer * 104976) + (kh * 648)) + ((ax0_ax1_fused_ax2_fused % 160) * 648)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_3_let)[(((((((ax0_ax1_fused_ax2_fused / 160) * 576) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+              }
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_22 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_22) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_22 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 8; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_26 = (ax3_outer * 80);
+          int32_t cse_var_25 = (ax3_inner * 4);
+          int32_t cse_var_24 = (((ax0_ax1_fused_ax2_fused / 160) * 4) + ax4);
+          int32_t cse_var_23 = ((cse_var_26 + cse_var_25) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_fused * 640) + cse_var_26) + cse_var_25) + ax4)] = ((((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_3_let)[cse_var_24]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_3_let)[cse_var_24]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30(float* p0, float* T_multiply, uint8_t* global_const_workspace_112_var, uint8_t* global_workspace_113_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_36_let = (&(global_const_workspace_112_var[12771392]));
+  void* fused_constant_36_let = (&(global_const_workspace_112_var[10189824]));
+  void* data_pad_let = (&(global_workspace_113_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 1312; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 82; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 82);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 81)) && (1 <= i3)) && (i3 < 81))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 82) * 25600) + (cse_var_2 * 320)) + cse_var_1) + i4) - 324)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 328) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 1280; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_113_var[1721344]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_113_var[1722624]));
+    for (int32_t ow_outer = 0; ow_outer < 4; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 16; ++ic_outer) {
+        for (int32_t kh = 0; kh < 3; ++kh) {
+          for (int32_t kw = 0; kw < 3; ++kw) {
+            for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+              for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+                ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+              }
+              for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+                int32_t cse_var_3 = (oc_block_c_1 + 4);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+              }
+              for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+                int32_t cse_var_4 = (oc_block_c_2 + 8);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+              }
+              for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+                int32_t cse_var_5 = (oc_block_c_3 + 12);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+              }
+              for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+                int32_t cse_var_6 = (oc_block_c_4 + 16);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+              }
+              for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+                int32_t cse_var_7 = (oc_block_c_5 + 20);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+              }
+              for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+                int32_t cse_var_8 = (oc_block_c_6 + 24);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+              }
+              for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+                int32_t cse_var_9 = (oc_block_c_7 + 28);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+              }
+              for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+                int32_t cse_var_10 = (oc_block_c_8 + 32);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+              }
+              for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+                int32_t cse_var_11 = (oc_block_c_9 + 36);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+              }
+              for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+                int32_t cse_var_12 = (oc_block_c_10 + 40);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+              }
+              for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+                int32_t cse_var_13 = (oc_block_c_11 + 44);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+              }
+              for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+                int32_t cse_var_14 = (oc_block_c_12 + 48);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+              }
+              for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+                int32_t cse_var_15 = (oc_block_c_13 + 52);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+              }
+              for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+                int32_t cse_var_16 = (oc_block_c_14 + 56);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+              }
+              for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+                int32_t cse_var_17 = (oc_block_c_15 + 60);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+              }
+              for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+                int32_t cse_var_18 = (oc_block_c_16 + 64);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+              }
+              for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+                int32_t cse_var_19 = (oc_block_c_17 + 68);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+              }
+              for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+                int32_t cse_var_20 = (oc_block_c_18 + 72);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+              }
+              for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+                int32_t cse_var_21 = (oc_block_c_19 + 76);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+              }
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_22 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_22) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_22 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 4; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_26 = (ax3_outer * 80);
+          int32_t cse_var_25 = (ax3_inner * 4);
+          int32_t cse_var_24 = (((ax0_ax1_fused_ax2_fused / 80) * 4) + ax4);
+          int32_t cse_var_23 = ((cse_var_26 + cse_var_25) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_fused * 320) + cse_var_26) + cse_var_25) + ax4)] = ((((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_36_let)[cse_var_24]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_36_let)[cse_var_24]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_50(float* p0, float* T_multiply, uint8_t* global_const_workspace_174_var, uint8_t* global_workspace_175_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_61_let = (&(global_const_workspace_174_var[12765760]));
+  void* fused_constant_61_let = (&(global_const_workspace_174_var[8380416]));
+  void* data_pad_let = (&(global_workspace_175_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 440; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 22; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 22);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 21)) && (1 <= i3)) && (i3 < 21))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 22) * 1600) + (cse_var_2 * 80)) + cse_var_1) + i4) - 84)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 88) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 400; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_global_let = (&(global_workspace_175_var[154880]));
+    for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+      ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+    }
+    for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+      ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+    }
+    for (int32_t ic_outer = 0; ic_outer < 20; ++ic_outer) {
+      for (int32_t kh = 0; kh < 3; ++kh) {
+        for (int32_t kw = 0; kw < 3; ++kw) {
+          for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+            for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+              ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[(((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+            }
+            for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+              int32_t cse_var_3 = (oc_block_c_1 + 4);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+            }
+            for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+              int32_t cse_var_4 = (oc_block_c_2 + 8);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+            }
+            for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+              int32_t cse_var_5 = (oc_block_c_3 + 12);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+            }
+            for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+              int32_t cse_var_6 = (oc_block_c_4 + 16);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+            }
+            for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+              int32_t cse_var_7 = (oc_block_c_5 + 20);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+            }
+            for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+              int32_t cse_var_8 = (oc_block_c_6 + 24);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+            }
+            for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+              int32_t cse_var_9 = (oc_block_c_7 + 28);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+            }
+            for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+              int32_t cse_var_10 = (oc_block_c_8 + 32);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+            }
+            for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+              int32_t cse_var_11 = (oc_block_c_9 + 36);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+            }
+            for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+              int32_t cse_var_12 = (oc_block_c_10 + 40);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+            }
+            for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+              int32_t cse_var_13 = (oc_block_c_11 + 44);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+            }
+            for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+              int32_t cse_var_14 = (oc_block_c_12 + 48);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+            }
+            for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+              int32_t cse_var_15 = (oc_block_c_13 + 52);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+            }
+            for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+              int32_t cse_var_16 = (oc_block_c_14 + 56);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+            }
+            for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+              int32_t cse_var_17 = (oc_block_c_15 + 60);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+            }
+            for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+              int32_t cse_var_18 = (oc_block_c_16 + 64);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+            }
+            for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+              int32_t cse_var_19 = (oc_block_c_17 + 68);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+            }
+            for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+              int32_t cse_var_20 = (oc_block_c_18 + 72);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+            }
+            for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+              int32_t cse_var_21 = (oc_block_c_19 + 76);
+              ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[((((((ic_outer * 1936) + (kh * 88)) + ((ax0_ax1_fused_ax2_fused % 20) * 88)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_61_let)[(((((((ax0_ax1_fused_ax2_fused / 20) * 2880) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+            }
+          }
+        }
+      }
+    }
+    for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+      for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+        int32_t cse_var_24 = (ax3_inner * 4);
+        int32_t cse_var_23 = (cse_var_24 + ax4);
+        int32_t cse_var_22 = (((ax0_ax1_fused_ax2_fused / 20) * 4) + ax4);
+        T_multiply[(((ax0_ax1_fused_ax2_fused * 80) + cse_var_24) + ax4)] = ((((float*)conv2d_NCHWc_global_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_61_let)[cse_var_22]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_global_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_61_let)[cse_var_22]))))));
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_add_3(float* p0, float* p1, float* T_add, uint8_t* global_const_workspace_46_var, uint8_t* global_workspace_47_var) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_16_let = (&(global_const_workspace_46_var[12773440]));
+  void* fused_constant_16_let = (&(global_const_workspace_46_var[11074560]));
+  void* data_pad_let = (&(global_workspace_47_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 672; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 42; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 42);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 41)) && (1 <= i3)) && (i3 < 41))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 42) * 6400) + (cse_var_2 * 160)) + cse_var_1) + i4) - 164)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 168) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_47_var[451584]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_47_var[452224]));
+    for (int32_t ow_outer = 0; ow_outer < 2; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 16; ++ic_outer) {
+        for (int32_t kh = 0; kh < 3; ++kh) {
+          for (int32_t kw = 0; kw < 3; ++kw) {
+            for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+              for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+                ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+              }
+              for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+                int32_t cse_var_3 = (oc_block_c_1 + 4);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+              }
+              for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+                int32_t cse_var_4 = (oc_block_c_2 + 8);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+              }
+              for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+                int32_t cse_var_5 = (oc_block_c_3 + 12);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+              }
+              for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+                int32_t cse_var_6 = (oc_block_c_4 + 16);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+              }
+              for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+                int32_t cse_var_7 = (oc_block_c_5 + 20);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+              }
+              for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+                int32_t cse_var_8 = (oc_block_c_6 + 24);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+              }
+              for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+                int32_t cse_var_9 = (oc_block_c_7 + 28);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+              }
+              for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+                int32_t cse_var_10 = (oc_block_c_8 + 32);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+              }
+              for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+                int32_t cse_var_11 = (oc_block_c_9 + 36);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+              }
+              for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+                int32_t cse_var_12 = (oc_block_c_10 + 40);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+              }
+              for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+                int32_t cse_var_13 = (oc_block_c_11 + 44);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+              }
+              for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+                int32_t cse_var_14 = (oc_block_c_12 + 48);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+              }
+              for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+                int32_t cse_var_15 = (oc_block_c_13 + 52);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+              }
+              for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+                int32_t cse_var_16 = (oc_block_c_14 + 56);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+              }
+              for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+                int32_t cse_var_17 = (oc_block_c_15 + 60);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+              }
+              for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+                int32_t cse_var_18 = (oc_block_c_16 + 64);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+              }
+              for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+                int32_t cse_var_19 = (oc_block_c_17 + 68);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+              }
+              for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+                int32_t cse_var_20 = (oc_block_c_18 + 72);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+              }
+              for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+                int32_t cse_var_21 = (oc_block_c_19 + 76);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[(((((((ic_outer * 7056) + (kh * 168)) + ((ax0_ax1_fused_ax2_fused % 40) * 168)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_16_let)[(((((((ax0_ax1_fused_ax2_fused / 40) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+              }
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_22 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_22) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_22 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 2; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_27 = (ax3_outer * 80);
+          int32_t cse_var_26 = (ax3_inner * 4);
+          int32_t cse_var_25 = (((ax0_ax1_fused_ax2_fused / 40) * 4) + ax4);
+          int32_t cse_var_24 = ((cse_var_27 + cse_var_26) + ax4);
+          int32_t cse_var_23 = ((((ax0_ax1_fused_ax2_fused * 160) + cse_var_27) + cse_var_26) + ax4);
+          T_add[cse_var_23] = (p1[cse_var_23] + ((((float*)conv2d_NCHWc_let)[cse_var_24] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_16_let)[cse_var_25]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_24] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_16_let)[cse_var_25])))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_split_2(float* p0, float* T_split, float* T_split_1, uint8_t* global_const_workspace_42_var, uint8_t* global_workspace_43_var) {
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    for (int32_t ax3 = 0; ax3 < 40; ++ax3) {
+      for (int32_t ax4_inner = 0; ax4_inner < 4; ++ax4_inner) {
+        int32_t cse_var_1 = (((ax0_ax1_fused_ax2_fused * 160) + (ax3 * 4)) + ax4_inner);
+        T_split[cse_var_1] = p0[cse_var_1];
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused_1 = 0; ax0_ax1_fused_ax2_fused_1 < 640; ++ax0_ax1_fused_ax2_fused_1) {
+    for (int32_t ax3_1 = 0; ax3_1 < 40; ++ax3_1) {
+      for (int32_t ax4_inner_1 = 0; ax4_inner_1 < 4; ++ax4_inner_1) {
+        int32_t cse_var_2 = (((ax0_ax1_fused_ax2_fused_1 * 160) + (ax3_1 * 4)) + ax4_inner_1);
+        T_split_1[cse_var_2] = p0[(cse_var_2 + 102400)];
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_split_6(float* p0, float* T_split, float* T_split_1, uint8_t* global_const_workspace_128_var, uint8_t* global_workspace_129_var) {
+  for (int32_t ax0_ax1_fused_ax2_fused = 0; ax0_ax1_fused_ax2_fused < 640; ++ax0_ax1_fused_ax2_fused) {
+    for (int32_t ax3 = 0; ax3 < 40; ++ax3) {
+      for (int32_t ax4_inner = 0; ax4_inner < 4; ++ax4_inner) {
+        int32_t cse_var_1 = (((ax0_ax1_fused_ax2_fused * 160) + (ax3 * 4)) + ax4_inner);
+        T_split[cse_var_1] = p0[cse_var_1];
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused_1 = 0; ax0_ax1_fused_ax2_fused_1 < 640; ++ax0_ax1_fused_ax2_fused_1) {
+    for (int32_t ax3_1 = 0; ax3_1 < 40; ++ax3_1) {
+      for (int32_t ax4_inner_1 = 0; ax4_inner_1 < 4; ++ax4_inner_1) {
+        int32_t cse_var_2 = (((ax0_ax1_fused_ax2_fused_1 * 160) + (ax3_1 * 4)) + ax4_inner_1);
+        T_split_1[cse_var_2] = p0[(cse_var_2 + 102400)];
+      }
+    }
+  }
+  return 0;
+}
+
+#ifdef __cplusplus
+extern "C"
+#endif
+TVM_DLL int32_t tvmgen_default_fused_nn_contrib_conv2d_NCHWc_add_sigmoid_multiply_30_tiled(float* p0, float* T_multiply, uint8_t* global_const_workspace_112_var, uint8_t* global_workspace_113_var, int32_t tile_begin, int32_t tile_end) {
+  void* fused_nn_contrib_conv2d_NCHWc_constant_36_let = (&(global_const_workspace_112_var[12771392]));
+  void* fused_constant_36_let = (&(global_const_workspace_112_var[10189824]));
+  void* data_pad_let = (&(global_workspace_113_var[0]));
+  for (int32_t i0_i1_fused_i2_fused = 0; i0_i1_fused_i2_fused < 1312; ++i0_i1_fused_i2_fused) {
+    for (int32_t i3 = 0; i3 < 82; ++i3) {
+      for (int32_t i4 = 0; i4 < 4; ++i4) {
+        int32_t cse_var_2 = (i0_i1_fused_i2_fused % 82);
+        int32_t cse_var_1 = (i3 * 4);
+        float condval;
+        if (((((1 <= cse_var_2) && (cse_var_2 < 81)) && (1 <= i3)) && (i3 < 81))) {
+          condval = p0[((((((i0_i1_fused_i2_fused / 82) * 25600) + (cse_var_2 * 320)) + cse_var_1) + i4) - 324)];
+        } else {
+          condval = 0.000000e+00f;
+        }
+        ((float*)data_pad_let)[(((i0_i1_fused_i2_fused * 328) + cse_var_1) + i4)] = condval;
+      }
+    }
+  }
+  for (int32_t ax0_ax1_fused_ax2_fused = tile_begin; ax0_ax1_fused_ax2_fused < tile_end; ++ax0_ax1_fused_ax2_fused) {
+    void* conv2d_NCHWc_let = (&(global_workspace_113_var[1721344]));
+    void* conv2d_NCHWc_global_let = (&(global_workspace_113_var[1722624]));
+    for (int32_t ow_outer = 0; ow_outer < 4; ++ow_outer) {
+      for (int32_t oc_block_c_init = 0; oc_block_c_init < 4; ++oc_block_c_init) {
+        ((float*)conv2d_NCHWc_global_let)[oc_block_c_init] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_1 = 0; oc_block_c_init_1 < 4; ++oc_block_c_init_1) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_1 + 4)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_2 = 0; oc_block_c_init_2 < 4; ++oc_block_c_init_2) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_2 + 8)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_3 = 0; oc_block_c_init_3 < 4; ++oc_block_c_init_3) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_3 + 12)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_4 = 0; oc_block_c_init_4 < 4; ++oc_block_c_init_4) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_4 + 16)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_5 = 0; oc_block_c_init_5 < 4; ++oc_block_c_init_5) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_5 + 20)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_6 = 0; oc_block_c_init_6 < 4; ++oc_block_c_init_6) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_6 + 24)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_7 = 0; oc_block_c_init_7 < 4; ++oc_block_c_init_7) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_7 + 28)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_8 = 0; oc_block_c_init_8 < 4; ++oc_block_c_init_8) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_8 + 32)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_9 = 0; oc_block_c_init_9 < 4; ++oc_block_c_init_9) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_9 + 36)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_10 = 0; oc_block_c_init_10 < 4; ++oc_block_c_init_10) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_10 + 40)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_11 = 0; oc_block_c_init_11 < 4; ++oc_block_c_init_11) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_11 + 44)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_12 = 0; oc_block_c_init_12 < 4; ++oc_block_c_init_12) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_12 + 48)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_13 = 0; oc_block_c_init_13 < 4; ++oc_block_c_init_13) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_13 + 52)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_14 = 0; oc_block_c_init_14 < 4; ++oc_block_c_init_14) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_14 + 56)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_15 = 0; oc_block_c_init_15 < 4; ++oc_block_c_init_15) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_15 + 60)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_16 = 0; oc_block_c_init_16 < 4; ++oc_block_c_init_16) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_16 + 64)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_17 = 0; oc_block_c_init_17 < 4; ++oc_block_c_init_17) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_17 + 68)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_18 = 0; oc_block_c_init_18 < 4; ++oc_block_c_init_18) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_18 + 72)] = 0.000000e+00f;
+      }
+      for (int32_t oc_block_c_init_19 = 0; oc_block_c_init_19 < 4; ++oc_block_c_init_19) {
+        ((float*)conv2d_NCHWc_global_let)[(oc_block_c_init_19 + 76)] = 0.000000e+00f;
+      }
+      for (int32_t ic_outer = 0; ic_outer < 16; ++ic_outer) {
+        for (int32_t kh = 0; kh < 3; ++kh) {
+          for (int32_t kw = 0; kw < 3; ++kw) {
+            for (int32_t ic_inner = 0; ic_inner < 4; ++ic_inner) {
+              for (int32_t oc_block_c = 0; oc_block_c < 4; ++oc_block_c) {
+                ((float*)conv2d_NCHWc_global_let)[oc_block_c] = (((float*)conv2d_NCHWc_global_let)[oc_block_c] + (((float*)data_pad_let)[((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c)]));
+              }
+              for (int32_t oc_block_c_1 = 0; oc_block_c_1 < 4; ++oc_block_c_1) {
+                int32_t cse_var_3 = (oc_block_c_1 + 4);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_3] = (((float*)conv2d_NCHWc_global_let)[cse_var_3] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 4)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_1)]));
+              }
+              for (int32_t oc_block_c_2 = 0; oc_block_c_2 < 4; ++oc_block_c_2) {
+                int32_t cse_var_4 = (oc_block_c_2 + 8);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_4] = (((float*)conv2d_NCHWc_global_let)[cse_var_4] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 8)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_2)]));
+              }
+              for (int32_t oc_block_c_3 = 0; oc_block_c_3 < 4; ++oc_block_c_3) {
+                int32_t cse_var_5 = (oc_block_c_3 + 12);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_5] = (((float*)conv2d_NCHWc_global_let)[cse_var_5] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 12)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_3)]));
+              }
+              for (int32_t oc_block_c_4 = 0; oc_block_c_4 < 4; ++oc_block_c_4) {
+                int32_t cse_var_6 = (oc_block_c_4 + 16);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_6] = (((float*)conv2d_NCHWc_global_let)[cse_var_6] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 16)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_4)]));
+              }
+              for (int32_t oc_block_c_5 = 0; oc_block_c_5 < 4; ++oc_block_c_5) {
+                int32_t cse_var_7 = (oc_block_c_5 + 20);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_7] = (((float*)conv2d_NCHWc_global_let)[cse_var_7] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 20)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_5)]));
+              }
+              for (int32_t oc_block_c_6 = 0; oc_block_c_6 < 4; ++oc_block_c_6) {
+                int32_t cse_var_8 = (oc_block_c_6 + 24);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_8] = (((float*)conv2d_NCHWc_global_let)[cse_var_8] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 24)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_6)]));
+              }
+              for (int32_t oc_block_c_7 = 0; oc_block_c_7 < 4; ++oc_block_c_7) {
+                int32_t cse_var_9 = (oc_block_c_7 + 28);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_9] = (((float*)conv2d_NCHWc_global_let)[cse_var_9] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 28)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_7)]));
+              }
+              for (int32_t oc_block_c_8 = 0; oc_block_c_8 < 4; ++oc_block_c_8) {
+                int32_t cse_var_10 = (oc_block_c_8 + 32);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_10] = (((float*)conv2d_NCHWc_global_let)[cse_var_10] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 32)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_8)]));
+              }
+              for (int32_t oc_block_c_9 = 0; oc_block_c_9 < 4; ++oc_block_c_9) {
+                int32_t cse_var_11 = (oc_block_c_9 + 36);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_11] = (((float*)conv2d_NCHWc_global_let)[cse_var_11] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 36)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_9)]));
+              }
+              for (int32_t oc_block_c_10 = 0; oc_block_c_10 < 4; ++oc_block_c_10) {
+                int32_t cse_var_12 = (oc_block_c_10 + 40);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_12] = (((float*)conv2d_NCHWc_global_let)[cse_var_12] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 40)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_10)]));
+              }
+              for (int32_t oc_block_c_11 = 0; oc_block_c_11 < 4; ++oc_block_c_11) {
+                int32_t cse_var_13 = (oc_block_c_11 + 44);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_13] = (((float*)conv2d_NCHWc_global_let)[cse_var_13] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 44)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_11)]));
+              }
+              for (int32_t oc_block_c_12 = 0; oc_block_c_12 < 4; ++oc_block_c_12) {
+                int32_t cse_var_14 = (oc_block_c_12 + 48);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_14] = (((float*)conv2d_NCHWc_global_let)[cse_var_14] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 48)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_12)]));
+              }
+              for (int32_t oc_block_c_13 = 0; oc_block_c_13 < 4; ++oc_block_c_13) {
+                int32_t cse_var_15 = (oc_block_c_13 + 52);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_15] = (((float*)conv2d_NCHWc_global_let)[cse_var_15] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 52)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_13)]));
+              }
+              for (int32_t oc_block_c_14 = 0; oc_block_c_14 < 4; ++oc_block_c_14) {
+                int32_t cse_var_16 = (oc_block_c_14 + 56);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_16] = (((float*)conv2d_NCHWc_global_let)[cse_var_16] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 56)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_14)]));
+              }
+              for (int32_t oc_block_c_15 = 0; oc_block_c_15 < 4; ++oc_block_c_15) {
+                int32_t cse_var_17 = (oc_block_c_15 + 60);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_17] = (((float*)conv2d_NCHWc_global_let)[cse_var_17] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 60)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_15)]));
+              }
+              for (int32_t oc_block_c_16 = 0; oc_block_c_16 < 4; ++oc_block_c_16) {
+                int32_t cse_var_18 = (oc_block_c_16 + 64);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_18] = (((float*)conv2d_NCHWc_global_let)[cse_var_18] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 64)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_16)]));
+              }
+              for (int32_t oc_block_c_17 = 0; oc_block_c_17 < 4; ++oc_block_c_17) {
+                int32_t cse_var_19 = (oc_block_c_17 + 68);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_19] = (((float*)conv2d_NCHWc_global_let)[cse_var_19] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 68)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_17)]));
+              }
+              for (int32_t oc_block_c_18 = 0; oc_block_c_18 < 4; ++oc_block_c_18) {
+                int32_t cse_var_20 = (oc_block_c_18 + 72);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_20] = (((float*)conv2d_NCHWc_global_let)[cse_var_20] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 72)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_18)]));
+              }
+              for (int32_t oc_block_c_19 = 0; oc_block_c_19 < 4; ++oc_block_c_19) {
+                int32_t cse_var_21 = (oc_block_c_19 + 76);
+                ((float*)conv2d_NCHWc_global_let)[cse_var_21] = (((float*)conv2d_NCHWc_global_let)[cse_var_21] + (((float*)data_pad_let)[(((((((ic_outer * 26896) + (kh * 328)) + ((ax0_ax1_fused_ax2_fused % 80) * 328)) + (ow_outer * 80)) + (kw * 4)) + ic_inner) + 76)] * ((float*)fused_constant_36_let)[(((((((ax0_ax1_fused_ax2_fused / 80) * 2304) + (ic_outer * 144)) + (kh * 48)) + (kw * 16)) + (ic_inner * 4)) + oc_block_c_19)]));
+              }
+            }
+          }
+        }
+      }
+      for (int32_t ow_inner = 0; ow_inner < 20; ++ow_inner) {
+        for (int32_t oc_block = 0; oc_block < 4; ++oc_block) {
+          int32_t cse_var_22 = (ow_inner * 4);
+          ((float*)conv2d_NCHWc_let)[(((ow_outer * 80) + cse_var_22) + oc_block)] = ((float*)conv2d_NCHWc_global_let)[(cse_var_22 + oc_block)];
+        }
+      }
+    }
+    for (int32_t ax3_outer = 0; ax3_outer < 4; ++ax3_outer) {
+      for (int32_t ax3_inner = 0; ax3_inner < 20; ++ax3_inner) {
+        for (int32_t ax4 = 0; ax4 < 4; ++ax4) {
+          int32_t cse_var_26 = (ax3_outer * 80);
+          int32_t cse_var_25 = (ax3_inner * 4);
+          int32_t cse_var_24 = (((ax0_ax1_fused_ax2_fused / 80) * 4) + ax4);
+          int32_t cse_var_23 = ((cse_var_26 + cse_var_25) + ax4);
+          T_multiply[((((ax0_ax1_fused_ax2_fused * 320) + cse_var_26) + cse_var_25) + ax4)] = ((((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_36_let)[cse_var_24]) * (1.000000e+00f / (1.000000e+00f + expf((0.000000e+00f - (((float*)conv2d_NCHWc_let)[cse_var_23] + ((float*)fused_nn_contrib_conv2d_NCHWc_constant_36_let)[cse_var_24]))))));
+        }
+      }
+    }
+  }
+  return 0;
+}
@@ -1,10 +1,21 @@
 /**
- * 自动生成的测试入口文件
+ * 自动生成的测试入口文件（基准测试驱动）
  * 模型: yolov8n
  * 输入大小: 1228800 floats (4800.0 KB)
- * 输出大小: 2714985 floats (10605.4 KB)
+ * 输出大小: 705600 floats (2756.2 KB)
+ *
+ * 用法: yolov8n_test [-n 迭代次数] [-w 预热次数] [-s 0,1,2,4] [-c 并发流数]
+ *                        [-q 流水线深度] [-i random|zero] [-j result.json] [-v]
+ *   -s  依次以给定 Worker 数运行（0 = 串行），未指定时沿用运行时配置（tvmrt.conf / TVMRT_NUM_WORKERS）
+ *   -c  多路并发：每路一个线程 + 独立推理上下文（tvmrt_context_*），共享线程池，
+ *       延迟统计汇总所有路，吞吐为总推理次数 / 墙钟时间
+ *   -q  单线程异步流水线：深度 D 个上下文轮流 tvmrt_context_submit / wait，
+ *       延迟为提交到完成回调的时间
+ *   计时使用 CLOCK_MONOTONIC 墙钟时间；CPU 时间（clock()，所有线程之和）仅用于计算 CPU 利用率
  */
 
+#include <math.h>
+#include <pthread.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <stdint.h>
@@ -22,6 +33,47 @@ struct tvmgen_default_outputs {
 
 // 模型运行函数声明
 int32_t tvmgen_default_run(struct tvmgen_default_inputs*, struct tvmgen_default_outputs*);
+// 关闭 Worker 线程池（扫描时用于切换 Worker 数）
+void tvmrt_shutdown(void);
+// 推理实际使用的 Worker 数（串行为 0；static 模式固定为离线调度的 Worker 数）
+int32_t tvmrt_num_workers(void);
+// 实际采用的调度模式 / 就绪派发顺序（含 tvmrt.conf 中的设置）
+const char* tvmrt_sched_mode_name(void);
+const char* tvmrt_ready_policy_name(void);
+
+// 自适应等待各阶段命中次数（调整 TVMRT_WAIT_SPIN / TVMRT_WAIT_YIELD 用）
+typedef struct {
+    uint64_t immediate, spin, yield, block;
+} TvmrtWaitStats;
+void tvmrt_get_wait_stats(TvmrtWaitStats* stats);
+void tvmrt_reset_wait_stats(void);
+
+// 推理上下文（多路并发）
+typedef struct TvmrtContext TvmrtContext;
+TvmrtContext* tvmrt_context_create(void);
+void tvmrt_context_destroy(TvmrtContext* ctx);
+float* tvmrt_context_input(TvmrtContext* ctx);
+float* tvmrt_context_output(TvmrtContext* ctx);
+int32_t tvmrt_context_run(TvmrtContext* ctx);
+typedef void (*TvmrtDoneCallback)(TvmrtContext* ctx, int32_t status, void* user_data);
+int32_t tvmrt_context_submit(TvmrtContext* ctx, float* input, float* output,
+                             TvmrtDoneCallback callback, void* user_data);
+int32_t tvmrt_context_wait(TvmrtContext* ctx);
+
+#define MAX_SWEEP 32
+#define MAX_STREAMS 64
+
+typedef struct {
+    int workers;          // 实际使用的 Worker 数（tvmrt_num_workers，0 表示串行）
+    int streams;          // 并发推理流数
+    int depth;            // 异步流水线深度（1 表示同步）
+    int iterations;
+    double min, mean, p50, p90, p99, max, stddev;  // ms
+    double throughput;    // 推理次数 / 秒
+    double cpu_util;      // CPU 时间 / 墙钟时间
+    double checksum;
+    TvmrtWaitStats waits; // 本配置（含预热）的等待阶段统计
+} BenchResult;
 
 // 打印前 N 个元素
 void print_first_elements(const char* name, float* data, int count) {
@@ -31,69 +83,418 @@ void print_first_elements(const char* name, float* data, int count) {
     }
 }
 
+static double now_ms(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec * 1000.0 + ts.tv_nsec / 1e6;
+}
+
+static int compare_double(const void* a, const void* b) {
+    double x = *(const double*)a, y = *(const double*)b;
+    return (x > y) - (x < y);
+}
+
+// nearest-rank 分位数（samples 已升序）
+static double percentile(const double* samples, int n, double p) {
+    int rank = (int)ceil(p / 100.0 * n);
+    if (rank < 1) rank = 1;
+    if (rank > n) rank = n;
+    return samples[rank - 1];
+}
+
+// 固定种子的伪随机输入 [0, 1)，避免全 0 输入掩盖数据相关的性能差异
+static void fill_random(float* data, int count) {
+    uint32_t state = 0x12345678u;
+    for (int i = 0; i < count; i++) {
+        state = state * 1664525u + 1013904223u;
+        data[i] = (float)(state >> 8) / 16777216.0f;
+    }
+}
+
+static double output_checksum(const float* data, int count) {
+    double sum = 0.0;
+    for (int i = 0; i < count; i++) {
+        sum += data[i];
+    }
+    return sum;
+}
+
+// 计算延迟统计（samples 原地排序）与吞吐
+static void summarize(double* samples, int count, double wall_total, double cpu_total,
+                      BenchResult* r) {
+    double sum = 0.0;
+    for (int i = 0; i < count; i++) sum += samples[i];
+    r->mean = sum / count;
+    double var = 0.0;
+    for (int i = 0; i < count; i++) var += (samples[i] - r->mean) * (samples[i] - r->mean);
+    r->stddev = sqrt(var / count);
+
+    qsort(samples, count, sizeof(double), compare_double);
+    r->iterations = count;
+    r->min = samples[0];
+    r->p50 = percentile(samples, count, 50.0);
+    r->p90 = percentile(samples, count, 90.0);
+    r->p99 = percentile(samples, count, 99.0);
+    r->max = samples[count - 1];
+    r->throughput = wall_total > 0 ? count * 1000.0 / wall_total : 0.0;
+    r->cpu_util = wall_total > 0 ? cpu_total / wall_total : 0.0;
+}
+
+static int run_bench(struct tvmgen_default_inputs* inputs, struct tvmgen_default_outputs* outputs,
+                     int warmup, int iterations, int verbose, double* samples, BenchResult* r) {
+    for (int i = 0; i < warmup; i++) {
+        int ret = tvmgen_default_run(inputs, outputs);
+        if (ret != 0) {
+            fprintf(stderr, "Warmup %d failed with error: %d\n", i + 1, ret);
+            return ret;
+        }
+    }
+
+    clock_t cpu_start = clock();
+    double wall_start = now_ms();
+    for (int i = 0; i < iterations; i++) {
+        double start = now_ms();
+        int ret = tvmgen_default_run(inputs, outputs);
+        samples[i] = now_ms() - start;
+        if (ret != 0) {
+            fprintf(stderr, "Inference %d failed with error: %d\n", i + 1, ret);
+            return ret;
+        }
+        if (verbose) {
+            printf("  Iteration %d: %.2f ms\n", i + 1, samples[i]);
+        }
+    }
+    double wall_total = now_ms() - wall_start;
+    double cpu_total = (double)(clock() - cpu_start) / CLOCKS_PER_SEC * 1000.0;
+
+    summarize(samples, iterations, wall_total, cpu_total, r);
+    r->checksum = output_checksum((const float*)outputs->output, 705600);
+    return 0;
+}
+
+typedef struct {
+    TvmrtContext* ctx;
+    int warmup;
+    int iterations;
+    double* samples;
+    int ret;
+} StreamArg;
+
+static void* stream_loop(void* arg) {
+    StreamArg* sa = (StreamArg*)arg;
+    for (int i = 0; i < sa->warmup + sa->iterations; i++) {
+        double start = now_ms();
+        int ret = tvmrt_context_run(sa->ctx);
+        if (ret != 0) {
+            sa->ret = ret;
+            return NULL;
+        }
+        if (i >= sa->warmup) {
+            sa->samples[i - sa->warmup] = now_ms() - start;
+        }
+    }
+    return NULL;
+}
+
+// 多路并发：每路独立上下文（同一输入），各路输出须一致
+static int run_streams(int streams, const float* input, int warmup, int iterations,
+                       double* samples, BenchResult* r) {
+    TvmrtContext* ctxs[MAX_STREAMS] = { NULL };
+    StreamArg args[MAX_STREAMS];
+    pthread_t threads[MAX_STREAMS];
+    int ret = 0;
+    for (int c = 0; c < streams; c++) {
+        ctxs[c] = tvmrt_context_create();
+        if (!ctxs[c]) {
+            fprintf(stderr, "Failed to create context %d\n", c);
+            ret = 1;
+            goto cleanup;
+        }
+        memcpy(tvmrt_context_input(ctxs[c]), input, 1228800 * sizeof(float));
+        args[c] = (StreamArg){ ctxs[c], warmup, iterations, samples + (size_t)c * iterations, 0 };
+    }
+
+    clock_t cpu_start = clock();
+    double wall_start = now_ms();
+    for (int c = 0; c < streams; c++) {
+        pthread_create(&threads[c], NULL, stream_loop, &args[c]);
+    }
+    for (int c = 0; c < streams; c++) {
+        pthread_join(threads[c], NULL);
+    }
+    double wall_total = now_ms() - wall_start;
+    double cpu_total = (double)(clock() - cpu_start) / CLOCKS_PER_SEC * 1000.0;
+
+    for (int c = 0; c < streams; c++) {
+        if (args[c].ret != 0) {
+            fprintf(stderr, "Stream %d failed with error: %d\n", c, args[c].ret);
+            ret = args[c].ret;
+            goto cleanup;
+        }
+    }
+
+    summarize(samples, streams * iterations, wall_total, cpu_total, r);
+    r->iterations = iterations;
+    r->checksum = output_checksum(tvmrt_context_output(ctxs[0]), 705600);
+    for (int c = 1; c < streams; c++) {
+        double checksum = output_checksum(tvmrt_context_output(ctxs[c]), 705600);
+        if (checksum != r->checksum) {
+            fprintf(stderr, "Stream %d output mismatch: %.9g vs %.9g\n", c, checksum, r->checksum);
+            ret = 1;
+        }
+    }
+
+cleanup:
+    for (int c = 0; c < streams; c++) {
+        tvmrt_context_destroy(ctxs[c]);
+    }
+    return ret;
+}
+
+typedef struct {
+    double submit_ms;
+    double done_ms;
+} PendingFrame;
+
+static void frame_done(TvmrtContext* ctx, int32_t status, void* user_data) {
+    (void)ctx;
+    (void)status;
+    ((PendingFrame*)user_data)->done_ms = now_ms();
+}
+
+// 单线程异步流水线：第 i 帧提交到上下文 i % depth，提交前先回收该上下文的上一帧
+static int run_pipeline(int depth, const float* input, int warmup, int iterations,
+                        double* samples, BenchResult* r) {
+    TvmrtContext* ctxs[MAX_STREAMS] = { NULL };
+    PendingFrame frames[MAX_STREAMS];
+    int ret = 0;
+    for (int c = 0; c < depth; c++) {
+        ctxs[c] = tvmrt_context_create();
+        if (!ctxs[c]) {
+            fprintf(stderr, "Failed to create context %d\n", c);
+            ret = 1;
+            goto cleanup;
+        }
+        memcpy(tvmrt_context_input(ctxs[c]), input, 1228800 * sizeof(float));
+    }
+    for (int i = 0; i < warmup && ret == 0; i++) {
+        ret = tvmrt_context_run(ctxs[0]);
+    }
+    if (ret != 0) {
+        fprintf(stderr, "Warmup failed with error: %d\n", ret);
+        goto cleanup;
+    }
+
+    clock_t cpu_start = clock();
+    double wall_start = now_ms();
+    for (int i = 0; i < iterations + depth; i++) {
+        int c = i % depth;
+        if (i >= depth && i - depth < iterations) {
+            ret = tvmrt_context_wait(ctxs[c]);
+            if (ret != 0) {
+                fprintf(stderr, "Inference %d failed with error: %d\n", i - depth + 1, ret);
+                goto cleanup;
+            }
+            samples[i - depth] = frames[c].done_ms - frames[c].submit_ms;
+        }
+        if (i < iterations) {
+            frames[c].submit_ms = now_ms();
+            ret = tvmrt_context_submit(ctxs[c], NULL, NULL, frame_done, &frames[c]);
+            if (ret != 0) {
+                fprintf(stderr, "Submit %d failed with error: %d\n", i + 1, ret);
+                goto cleanup;
+            }
+        }
+    }
+    double wall_total = now_ms() - wall_start;
+    double cpu_total = (double)(clock() - cpu_start) / CLOCKS_PER_SEC * 1000.0;
+
+    summarize(samples, iterations, wall_total, cpu_total, r);
+    r->checksum = output_checksum(tvmrt_context_output(ctxs[0]), 705600);
+    for (int c = 1; c < depth && c < iterations; c++) {
+        double checksum = output_checksum(tvmrt_context_output(ctxs[c]), 705600);
+        if (checksum != r->checksum) {
+            fprintf(stderr, "Context %d output mismatch: %.9g vs %.9g\n", c, checksum, r->checksum);
+            ret = 1;
+        }
+    }
+
+cleanup:
+    for (int c = 0; c < depth; c++) {
+        tvmrt_context_destroy(ctxs[c]);
+    }
+    return ret;
+}
+
+static void write_json(const char* path, const char* input_mode, int warmup,
+                       const BenchResult* results, int count) {
+    FILE* f = fopen(path, "w");
+    if (!f) {
+        fprintf(stderr, "Failed to open %s\n", path);
+        return;
+    }
+    fprintf(f, "{\n");
+    fprintf(f, "  \"model\": \"yolov8n\",\n");
+    fprintf(f, "  \"input\": \"%s\",\n", input_mode);
+    fprintf(f, "  \"sched_mode\": \"%s\",\n", tvmrt_sched_mode_name());
+    fprintf(f, "  \"ready_policy\": \"%s\",\n", tvmrt_ready_policy_name());
+    fprintf(f, "  \"warmup\": %d,\n", warmup);
+    fprintf(f, "  \"results\": [\n");
+    for (int i = 0; i < count; i++) {
+        const BenchResult* r = &results[i];
+        fprintf(f, "    {\"workers\": %d, \"streams\": %d, \"depth\": %d, "
+                   "\"iterations\": %d, "
+                   "\"latency_ms\": {\"min\": %.4f, \"mean\": %.4f, \"p50\": %.4f, "
+                   "\"p90\": %.4f, \"p99\": %.4f, \"max\": %.4f, \"stddev\": %.4f}, "
+                   "\"throughput_fps\": %.4f, \"cpu_util\": %.3f, \"checksum\": %.9g, "
+                   "\"waits\": {\"immediate\": %llu, \"spin\": %llu, \"yield\": %llu, \"block\": %llu}}%s\n",
+                r->workers, r->streams, r->depth, r->iterations, r->min, r->mean, r->p50, r->p90, r->p99, r->max,
+                r->stddev, r->throughput, r->cpu_util, r->checksum,
+                (unsigned long long)r->waits.immediate, (unsigned long long)r->waits.spin,
+                (unsigned long long)r->waits.yield, (unsigned long long)r->waits.block,
+                i + 1 < count ? "," : "");
+    }
+    fprintf(f, "  ]\n}\n");
+    fclose(f);
+}
+
 int main(int argc, char* argv[]) {
     // 解析命令行参数
-    int iterations = 1;
+    int iterations = 10;
+    int warmup = 2;
+    int verbose = 0;
+    const char* input_mode = "random";
+    const char* json_path = NULL;
+    int streams = 1;
+    int depth = 1;
+    int sweep[MAX_SWEEP];
+    int sweep_count = 0;
     for (int i = 1; i < argc; i++) {
         if (strcmp(argv[i], "-n") == 0 && i + 1 < argc) {
             iterations = atoi(argv[++i]);
+        } else if (strcmp(argv[i], "-w") == 0 && i + 1 < argc) {
+            warmup = atoi(argv[++i]);
+        } else if (strcmp(argv[i], "-i") == 0 && i + 1 < argc) {
+            input_mode = argv[++i];
+        } else if (strcmp(argv[i], "-j") == 0 && i + 1 < argc) {
+            json_path = argv[++i];
+        } else if (strcmp(argv[i], "-s") == 0 && i + 1 < argc) {
+            for (char* tok = strtok(argv[++i], ","); tok && sweep_count < MAX_SWEEP; tok = strtok(NULL, ",")) {
+                sweep[sweep_count++] = atoi(tok);
+            }
+        } else if (strcmp(argv[i], "-c") == 0 && i + 1 < argc) {
+            streams = atoi(argv[++i]);
+        } else if (strcmp(argv[i], "-q") == 0 && i + 1 < argc) {
+            depth = atoi(argv[++i]);
+        } else if (strcmp(argv[i], "-v") == 0) {
+            verbose = 1;
+        } else {
+            fprintf(stderr, "Usage: %s [-n iters] [-w warmup] [-s 0,1,2,4] [-c streams] [-q depth] [-i random|zero] [-j out.json] [-v]\n", argv[0]);
+            return 1;
         }
     }
+    if (iterations < 1) iterations = 1;
+    if (warmup < 0) warmup = 0;
+    if (streams < 1) streams = 1;
+    if (streams > MAX_STREAMS) streams = MAX_STREAMS;
+    if (depth < 1) depth = 1;
+    if (depth > MAX_STREAMS) depth = MAX_STREAMS;
+    if (sweep_count == 0) {
+        sweep[sweep_count++] = -1;
+    }
 
-    // 分配输入内存（全0）
+    // 分配输入内存
     float* input = (float*)calloc(1228800, sizeof(float));
     if (!input) {
         fprintf(stderr, "Failed to allocate input memory\n");
         return 1;
     }
+    if (strcmp(input_mode, "zero") != 0) {
+        input_mode = "random";
+        fill_random(input, 1228800);
+    }
 
     // 分配输出内存
-    float* output = (float*)calloc(2714985, sizeof(float));
-    if (!output) {
+    float* output = (float*)calloc(705600, sizeof(float));
+    double* samples = (double*)malloc((size_t)streams * iterations * sizeof(double));
+    if (!output || !samples) {
         fprintf(stderr, "Failed to allocate output memory\n");
         free(input);
+        free(output);
+        free(samples);
         return 1;
     }
 
     struct tvmgen_default_inputs inputs = { .images = input };
     struct tvmgen_default_outputs outputs = { .output = output };
 
-    printf("=== yolov8n Test ===\n");
-    printf("Input size: 1228800 floats (4800.0 KB)\n");
-    printf("Output size: 2714985 floats (10605.4 KB)\n");
-    printf("Iterations: %d\n", iterations);
-
-    printf("\nRunning inference...\n");
-    double total_time = 0.0;
-
-    for (int i = 0; i < iterations; i++) {
-        clock_t start = clock();
-        int ret = tvmgen_default_run(&inputs, &outputs);
-        clock_t end = clock();
-        double elapsed = (double)(end - start) / CLOCKS_PER_SEC * 1000.0;
-        total_time += elapsed;
+    printf("=== yolov8n Benchmark ===\n");
+    printf("Input size: 1228800 floats (4800.0 KB), input: %s\n", input_mode);
+    printf("Output size: 705600 floats (2756.2 KB)\n");
+    printf("Warmup: %d, Iterations: %d, Streams: %d, Pipeline depth: %d\n",
+           warmup, iterations, streams, depth);
 
+    BenchResult results[MAX_SWEEP];
+    int ret = 0;
+    for (int s = 0; s < sweep_count; s++) {
+        BenchResult* r = &results[s];
+        r->streams = streams;
+        r->depth = depth;
+        if (sweep[s] >= 0) {
+            // 切换 Worker 数：更新环境变量并关闭旧线程池，下一次推理按新配置重建
+            char buf[16];
+            snprintf(buf, sizeof(buf), "%d", sweep[s]);
+            setenv("TVMRT_NUM_WORKERS", buf, 1);
+            tvmrt_shutdown();
+        }
+        tvmrt_reset_wait_stats();
+        // 记录运行时实际采用的 Worker 数（static 模式不随 -s 变化）
+        r->workers = tvmrt_num_workers();
+        if (r->workers == 0) {
+            printf("\nRunning inference (serial)...\n");
+        } else {
+            printf("\nRunning inference (%d workers)...\n", r->workers);
+        }
+        if (depth > 1) {
+            ret = run_pipeline(depth, input, warmup, iterations, samples, r);
+        } else if (streams > 1) {
+            ret = run_streams(streams, input, warmup, iterations, samples, r);
+        } else {
+            ret = run_bench(&inputs, &outputs, warmup, iterations, verbose, samples, r);
+        }
         if (ret != 0) {
-            fprintf(stderr, "Inference %d failed with error: %d\n", i + 1, ret);
-            free(input);
-            free(output);
-            return ret;
+            break;
         }
-        printf("  Iteration %d: %.2f ms\n", i + 1, elapsed);
+        tvmrt_get_wait_stats(&r->waits);
+        printf("  latency ms: min %.2f  mean %.2f  p50 %.2f  p90 %.2f  p99 %.2f  max %.2f  (stddev %.2f)\n",
+               r->min, r->mean, r->p50, r->p90, r->p99, r->max, r->stddev);
+        printf("  throughput: %.2f FPS, CPU utilization: %.2f, checksum: %.9g\n",
+               r->throughput, r->cpu_util, r->checksum);
+        printf("  waits: immediate %llu, spin %llu, yield %llu, block %llu\n",
+               (unsigned long long)r->waits.immediate, (unsigned long long)r->waits.spin,
+               (unsigned long long)r->waits.yield, (unsigned long long)r->waits.block);
     }
 
-    double avg_time = total_time / iterations;
-    printf("\n=== Results ===\n");
-    printf("Total time: %.2f ms\n", total_time);
-    printf("Average time: %.2f ms\n", avg_time);
-    printf("FPS: %.1f\n", 1000.0 / avg_time);
+    if (ret == 0) {
+        printf("\n=== Results ===\n");
+        printf("%8s %10s %10s %10s %10s %10s\n", "workers", "p50(ms)", "p90(ms)", "p99(ms)", "FPS", "speedup");
+        for (int s = 0; s < sweep_count; s++) {
+            const BenchResult* r = &results[s];
+            printf("%8d %10.2f %10.2f %10.2f %10.2f %9.2fx\n", r->workers, r->p50, r->p90, r->p99,
+                   r->throughput, r->p50 > 0 ? results[0].p50 / r->p50 : 0.0);
+        }
+        if (json_path) {
+            write_json(json_path, input_mode, warmup, results, sweep_count);
+            printf("JSON: %s\n", json_path);
+        }
 
-    // 打印前20个输出元素
-    print_first_elements("Output", output, 20);
+        // 打印前20个输出元素
+        print_first_elements("Output", output, 20);
+        printf("\nTest completed successfully!\n");
+    }
 
     free(input);
     free(output);
-
-    printf("\nTest completed successfully!\n");
-    return 0;
+    free(samples);
+    return ret;
 }